@@ -0,0 +1,123 @@
+"""Benchmark of asynchronous repositories backed by `motor` and by native
+`pymongo` asynchronous API on the same workload.
+
+Every operation (`add`, `get`, `update`, `delete`) is measured sequentially
+(per-operation latency) and with `concurrency` operations in flight
+(throughput). Requires running MongoDB, `MONGO_URI` environment variable is
+used to connect (`mongodb://localhost:27017/` by default).
+
+Run from the repository root::
+
+    python -m benchmarks.async_drivers
+
+"""
+import asyncio
+import os
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
+
+from mongorepo import RepositoryConfig, async_repository
+
+MONGO_URI = os.environ.get('MONGO_URI', 'mongodb://localhost:27017/')
+
+
+@dataclass
+class User:
+    id: str
+    name: str
+    age: int
+
+
+def make_repository(collection: Any) -> Any:
+    @async_repository(config=RepositoryConfig(entity_type=User, collection=collection))
+    class UserRepository:
+        ...
+
+    return UserRepository()
+
+
+async def measure(
+    operation: Callable[[int], Awaitable[Any]], number: int, concurrency: int,
+) -> dict[str, float]:
+    latencies: list[float] = []
+    for i in range(number):
+        start = time.perf_counter()
+        await operation(i)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for batch_start in range(0, number, concurrency):
+        await asyncio.gather(
+            *(operation(i) for i in range(batch_start, min(batch_start + concurrency, number))),
+        )
+    elapsed = time.perf_counter() - start
+
+    return {
+        'p50_us': statistics.median(latencies) * 1e6,
+        'p99_us': statistics.quantiles(latencies, n=100)[98] * 1e6,
+        'ops_per_second': number / elapsed,
+    }
+
+
+async def run_driver(repo: Any, number: int, concurrency: int) -> dict[str, dict[str, float]]:
+    await repo.add(User(id='warmup', name='warmup', age=0))
+
+    async def add(i: int) -> Any:
+        return await repo.add(User(id=str(i), name=f'user {i}', age=i))
+
+    async def get(i: int) -> Any:
+        return await repo.get(id=str(i))
+
+    async def update(i: int) -> Any:
+        return await repo.update(User(id=str(i), name=f'user {i}', age=i + 1), id=str(i))
+
+    async def delete(i: int) -> Any:
+        return await repo.delete(id=str(i))
+
+    results: dict[str, dict[str, float]] = {}
+    for name, operation in (('add', add), ('get', get), ('update', update), ('delete', delete)):
+        results[name] = await measure(operation, number, concurrency)
+    return results
+
+
+async def run(number: int = 2_000, concurrency: int = 100) -> list[dict[str, Any]]:
+    """Returns latency and throughput of every operation for both drivers."""
+    motor_client: AsyncIOMotorClient = AsyncIOMotorClient(MONGO_URI)
+    pymongo_client: AsyncMongoClient = AsyncMongoClient(MONGO_URI)
+    drivers = {
+        'motor': motor_client['mongorepo_benchmarks']['motor_users'],
+        'pymongo': pymongo_client['mongorepo_benchmarks']['pymongo_users'],
+    }
+    results: list[dict[str, Any]] = []
+    try:
+        for driver, collection in drivers.items():
+            await collection.drop()
+            await collection.create_index('id')
+            for operation, stats in (
+                await run_driver(make_repository(collection), number, concurrency)
+            ).items():
+                results.append({'driver': driver, 'operation': operation, **stats})
+            await collection.drop()
+    finally:
+        motor_client.close()
+        await pymongo_client.close()
+    return results
+
+
+def main() -> None:
+    results = asyncio.run(run())
+    print(f'{"operation":<10}{"driver":<10}{"p50 us":>10}{"p99 us":>10}{"ops/s":>12}')
+    for r in sorted(results, key=lambda r: r['operation']):
+        print(
+            f'{r["operation"]:<10}{r["driver"]:<10}{r["p50_us"]:>10.1f}'
+            f'{r["p99_us"]:>10.1f}{r["ops_per_second"]:>12.0f}',
+        )
+
+
+if __name__ == '__main__':
+    main()
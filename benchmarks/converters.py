@@ -0,0 +1,145 @@
+"""Micro-benchmark of document to entity converters.
+
+Compares :func:`mongorepo.get_converter` with the converters it returned before
+decoding plans were compiled (reproduced below by `legacy_get_converter`).
+
+Run from the repository root::
+
+    python -m benchmarks.converters
+
+"""
+import timeit
+from dataclasses import dataclass, field, is_dataclass
+from typing import Any, Callable
+
+from mongorepo import get_converter
+from mongorepo.utils.type_hints import get_entity_type_hints, has_entity_fields
+
+
+def legacy_convert(data: dict[str, Any], dataclass_type: type, id_field: str | None = None) -> Any:
+    """Converter that resolves type hints for every document and nested
+    value."""
+    def convert(data: dict[str, Any], dataclass_type: type, as_dataclass: bool = True) -> Any:
+        type_hints = get_entity_type_hints(dataclass_type)
+        result = {}
+        for key, value in data.items():
+            is_dtcls = is_dataclass(h := type_hints[key])
+
+            if is_dtcls and isinstance(value, list):
+                result[key] = [convert(v, h, True) for v in value]
+            elif is_dtcls:
+                result[key] = convert(value, h, True)
+            else:
+                result[key] = value
+
+        return dataclass_type(**result) if as_dataclass else result
+
+    result = {}
+    if id_field is not None:
+        result[id_field] = str(data.pop('_id'))
+    else:
+        data.pop('_id') if data.get('_id', None) else ...
+
+    result.update(convert(data, dataclass_type, False))
+    return dataclass_type(**result)
+
+
+def legacy_flat_convert(data: dict[str, Any], entity_type: type) -> Any:
+    data.pop('_id') if data.get('_id', None) else ...
+    return entity_type(**data)
+
+
+def legacy_get_converter(entity_type: type) -> Callable[[dict[str, Any], type], Any]:
+    return legacy_convert if has_entity_fields(entity_type) else legacy_flat_convert
+
+
+@dataclass
+class Flat:
+    id: str
+    name: str
+    age: int
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Address:
+    city: str
+    street: str
+
+
+@dataclass
+class Nested:
+    id: str
+    name: str
+    address: Address
+
+
+@dataclass
+class Item:
+    sku: str
+    quantity: int
+
+
+@dataclass
+class WithList:
+    id: str
+    owner: Address
+    items: list[Item] = field(default_factory=list)
+
+
+CASES: dict[str, tuple[type, Callable[[], dict[str, Any]]]] = {
+    'flat': (
+        Flat, lambda: {'_id': 'oid', 'id': '1', 'name': 'admin', 'age': 30, 'tags': ['a', 'b']},
+    ),
+    'nested': (
+        Nested,
+        lambda: {
+            '_id': 'oid', 'id': '1', 'name': 'admin',
+            'address': {'city': 'Kyiv', 'street': 'Khreshchatyk'},
+        },
+    ),
+    'list_of_entities': (
+        WithList,
+        lambda: {
+            '_id': 'oid', 'id': '1', 'owner': {'city': 'Kyiv', 'street': 'Khreshchatyk'},
+            'items': [{'sku': str(i), 'quantity': i} for i in range(20)],
+        },
+    ),
+}
+
+
+def run(number: int = 20_000, repeat: int = 5) -> list[dict[str, Any]]:
+    """Returns best time per document in microseconds for every case."""
+    results: list[dict[str, Any]] = []
+    for case, (entity_type, make_document) in CASES.items():
+        compiled = get_converter(entity_type)
+        legacy = legacy_get_converter(entity_type)
+        documents = [make_document() for _ in range(number)]
+        assert compiled(make_document(), entity_type) == legacy(make_document(), entity_type)
+
+        for name, converter in (('legacy', legacy), ('compiled', compiled)):
+            best = min(
+                timeit.repeat(
+                    stmt='for d in docs: convert(dict(d), entity_type)',
+                    globals={'docs': documents, 'convert': converter, 'entity_type': entity_type},
+                    number=1,
+                    repeat=repeat,
+                ),
+            )
+            results.append({
+                'case': case, 'converter': name, 'us_per_document': best / number * 1e6,
+            })
+    return results
+
+
+def main() -> None:
+    results = run()
+    legacy = {r['case']: r['us_per_document'] for r in results if r['converter'] == 'legacy'}
+    print(f'{"case":<18}{"converter":<10}{"us/doc":>10}{"speedup":>10}')
+    for r in results:
+        speedup = legacy[r['case']] / r['us_per_document']
+        print(f'{r["case"]:<18}{r["converter"]:<10}{r["us_per_document"]:>10.2f}{speedup:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
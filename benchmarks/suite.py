@@ -0,0 +1,397 @@
+"""Benchmark suite of mongorepo hot paths.
+
+Measures class setup of `repository` and `implement`, argument binding of
+methods generated by `implement`, entity conversion of flat, nested and
+list-of-entity documents, modifier overhead and end-to-end synchronous and
+asynchronous method calls. End-to-end calls run against in-memory collections
+(:mod:`mongorepo.memory`) and, with `--mongo-uri`, against MongoDB too.
+
+Results are printed as a table, `--json` writes them as JSON. With
+`--baseline` results are compared with a previous JSON file and the suite
+exits with status 1 if any benchmark is slower than the baseline by more than
+`--tolerance`, so regressions can be gated in CI.
+
+Run from the repository root::
+
+    python -m benchmarks.suite --json results.json
+    python -m benchmarks.suite --baseline results.json --tolerance 0.25
+    python -m benchmarks.suite --mongo-uri mongodb://localhost:27017/
+
+"""
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable
+
+from benchmarks.converters import CASES
+from mongorepo import (
+    RepositoryConfig,
+    async_repository,
+    get_converter,
+    repository,
+)
+from mongorepo.implement import (
+    AddMethod,
+    DeleteMethod,
+    GetListMethod,
+    GetMethod,
+    UpdateMethod,
+    implement,
+)
+from mongorepo.memory import AsyncMemoryCollection, MemoryCollection
+from mongorepo.modifiers.base import ModifierAfter, ModifierBefore
+
+SAMPLES = 100
+"""Calls are timed in `SAMPLES` batches, percentiles are computed over
+per-call latencies of the batches."""
+
+
+@dataclass
+class Result:
+    group: str
+    benchmark: str
+    backend: str
+    number: int
+    mean_us: float
+    p50_us: float
+    p99_us: float
+    ops_per_second: float
+
+
+@dataclass
+class Item:
+    sku: str
+    quantity: int
+
+
+@dataclass
+class Order:
+    id: str
+    customer: str
+    total: int
+    items: list[Item] = field(default_factory=list)
+
+
+class OrderRepository:
+    def get(self, id: str) -> Order | None:  # noqa: A002
+        ...
+
+    def add(self, order: Order) -> None:
+        ...
+
+    def update(self, order: Order, id: str) -> Order | None:  # noqa: A002
+        ...
+
+    def get_list(self, offset: int = 0, limit: int = 20) -> list[Order]:
+        ...
+
+    def delete(self, id: str) -> bool:  # noqa: A002
+        ...
+
+
+class NoopBefore(ModifierBefore):
+    def modify(self, **kwargs: Any) -> dict[str, Any]:
+        return kwargs
+
+
+class NoopAfter(ModifierAfter):
+    def modify(self, data: Any) -> Any:
+        return data
+
+
+def make_order(i: int, items: int = 3) -> Order:
+    return Order(
+        id=str(i),
+        customer=f'customer {i}',
+        total=i,
+        items=[Item(sku=f'{i}-{j}', quantity=j) for j in range(items)],
+    )
+
+
+def _result(group: str, benchmark: str, backend: str, number: int, batches: list[float]) -> Result:
+    per_call = sorted(t / (number / len(batches)) * 1e6 for t in batches)
+    total = sum(batches)
+    return Result(
+        group=group,
+        benchmark=benchmark,
+        backend=backend,
+        number=number,
+        mean_us=total / number * 1e6,
+        p50_us=statistics.median(per_call),
+        p99_us=per_call[min(len(per_call) - 1, int(len(per_call) * 0.99))],
+        ops_per_second=number / total,
+    )
+
+
+def measure(
+    group: str, benchmark: str, func: Callable[[int], Any], number: int, backend: str = '-',
+) -> Result:
+    """Calls `func(i)` `number` times, `i` is the call index."""
+    batch = max(1, number // SAMPLES)
+    batches: list[float] = []
+    for start in range(0, batch * (number // batch), batch):
+        begin = time.perf_counter()
+        for i in range(start, start + batch):
+            func(i)
+        batches.append(time.perf_counter() - begin)
+    return _result(group, benchmark, backend, batch * len(batches), batches)
+
+
+async def measure_async(
+    group: str,
+    benchmark: str,
+    func: Callable[[int], Awaitable[Any]],
+    number: int,
+    backend: str = '-',
+) -> Result:
+    batch = max(1, number // SAMPLES)
+    batches: list[float] = []
+    for start in range(0, batch * (number // batch), batch):
+        begin = time.perf_counter()
+        for i in range(start, start + batch):
+            await func(i)
+        batches.append(time.perf_counter() - begin)
+    return _result(group, benchmark, backend, batch * len(batches), batches)
+
+
+def make_repository(collection: Any) -> Any:
+    @repository(config=RepositoryConfig(entity_type=Order, collection=collection))
+    class Repository:
+        ...
+
+    return Repository()
+
+
+def make_async_repository(collection: Any) -> Any:
+    @async_repository(config=RepositoryConfig(entity_type=Order, collection=collection))
+    class Repository:
+        ...
+
+    return Repository()
+
+
+def make_implemented(collection: Any, modifiers: bool = False) -> Any:
+    get_modifiers: list[Any] = [NoopBefore(), NoopAfter()] if modifiers else []
+
+    @implement(
+        GetMethod(OrderRepository.get, filters=['id'], modifiers=get_modifiers),
+        AddMethod(OrderRepository.add, entity='order'),
+        UpdateMethod(OrderRepository.update, entity='order', filters=['id']),
+        GetListMethod(OrderRepository.get_list, filters=[], offset='offset', limit='limit'),
+        DeleteMethod(OrderRepository.delete, filters=['id']),
+        config=RepositoryConfig(entity_type=Order, collection=collection),
+    )
+    class Repository:
+        ...
+
+    return Repository()
+
+
+def bench_setup(number: int) -> list[Result]:
+    number = max(1, number // 20)
+    return [
+        measure('setup', 'repository', lambda i: make_repository(MemoryCollection()), number),
+        measure('setup', 'implement', lambda i: make_implemented(MemoryCollection()), number),
+    ]
+
+
+def bench_binding(number: int) -> list[Result]:
+    repo = make_implemented(MemoryCollection())
+    get_binder = type(repo).get.mongorepo_binder
+    update_binder = type(repo).update.mongorepo_binder
+    order = make_order(0)
+    return [
+        measure('binding', 'get', lambda i: get_binder.bind((), {'id': '1'}), number),
+        measure('binding', 'update', lambda i: update_binder.bind((order, '1'), {}), number),
+    ]
+
+
+def bench_conversion(number: int) -> list[Result]:
+    results: list[Result] = []
+    for case, (entity_type, make_document) in CASES.items():
+        converter: Callable[..., Any] = get_converter(entity_type)
+        documents = [make_document() for _ in range(number)]
+        results.append(measure(
+            'conversion', case, lambda i: converter(documents[i], entity_type), number,
+        ))
+    return results
+
+
+def bench_modifiers(number: int) -> list[Result]:
+    results: list[Result] = []
+    for name, modifiers in (('get', False), ('get_with_modifiers', True)):
+        repo = make_implemented(MemoryCollection(), modifiers=modifiers)
+        repo.add(make_order(1))
+        results.append(measure('modifiers', name, lambda i: repo.get('1'), number))
+    return results
+
+
+def bench_sync(collection: Any, backend: str, number: int) -> list[Result]:
+    repo = make_repository(collection)
+    return [
+        measure('sync', 'add', lambda i: repo.add(make_order(i)), number, backend),
+        measure('sync', 'get', lambda i: repo.get(id=str(i)), number, backend),
+        measure(
+            'sync', 'update', lambda i: repo.update(make_order(i, items=4), id=str(i)),
+            number, backend,
+        ),
+        measure(
+            'sync', 'get_list', lambda i: repo.get_list(offset=i % 100, limit=20),
+            number, backend,
+        ),
+        measure('sync', 'delete', lambda i: repo.delete(id=str(i)), number, backend),
+    ]
+
+
+async def bench_async(collection: Any, backend: str, number: int) -> list[Result]:
+    repo = make_async_repository(collection)
+
+    async def add(i: int) -> Any:
+        return await repo.add(make_order(i))
+
+    async def get(i: int) -> Any:
+        return await repo.get(id=str(i))
+
+    async def update(i: int) -> Any:
+        return await repo.update(make_order(i, items=4), id=str(i))
+
+    async def get_list(i: int) -> Any:
+        return await repo.get_list(offset=i % 100, limit=20)
+
+    async def delete(i: int) -> Any:
+        return await repo.delete(id=str(i))
+
+    return [
+        await measure_async('async', name, operation, number, backend)
+        for name, operation in (
+            ('add', add), ('get', get), ('update', update), ('get_list', get_list),
+            ('delete', delete),
+        )
+    ]
+
+
+def make_memory_collection() -> MemoryCollection:
+    collection = MemoryCollection('orders')
+    collection.create_index('id')
+    return collection
+
+
+def run_mongo(uri: str, number: int) -> list[Result]:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from pymongo import MongoClient
+
+    client: MongoClient = MongoClient(uri)
+    collection = client['mongorepo_benchmarks']['orders']
+    collection.drop()
+    collection.create_index('id')
+    try:
+        results = bench_sync(collection, 'mongod', number)
+    finally:
+        collection.drop()
+        client.close()
+
+    async def run_async() -> list[Result]:
+        async_client: AsyncIOMotorClient = AsyncIOMotorClient(uri)
+        collection = async_client['mongorepo_benchmarks']['orders']
+        await collection.drop()
+        await collection.create_index('id')
+        try:
+            return await bench_async(collection, 'mongod', number)
+        finally:
+            await collection.drop()
+            async_client.close()
+
+    return results + asyncio.run(run_async())
+
+
+def run(number: int = 10_000, mongo_uri: str | None = None) -> list[Result]:
+    """Runs every benchmark, each one makes about `number` calls (setup
+    benchmarks make `number / 20`)."""
+    results = [
+        *bench_setup(number),
+        *bench_binding(number),
+        *bench_conversion(number),
+        *bench_modifiers(number),
+        *bench_sync(make_memory_collection(), 'memory', number),
+        *asyncio.run(bench_async(
+            AsyncMemoryCollection(collection=make_memory_collection()), 'memory', number,
+        )),
+    ]
+    if mongo_uri is not None:
+        results.extend(run_mongo(mongo_uri, max(1, number // 10)))
+    return results
+
+
+def _key(result: dict[str, Any]) -> tuple[str, str, str]:
+    return result['group'], result['benchmark'], result['backend']
+
+
+def compare(
+    results: list[Result], baseline: dict[str, Any], tolerance: float,
+) -> list[tuple[Result, float]]:
+    """Returns results whose mean latency exceeds the baseline by more than
+    `tolerance` (fraction) with their ratio to the baseline."""
+    previous = {_key(r): r['mean_us'] for r in baseline['results']}
+    regressions: list[tuple[Result, float]] = []
+    for result in results:
+        base = previous.get(_key(asdict(result)), None)
+        if base and result.mean_us > base * (1 + tolerance):
+            regressions.append((result, result.mean_us / base))
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--number', type=int, default=10_000, help='calls per benchmark')
+    parser.add_argument('--mongo-uri', default=None, help='also run end-to-end calls on MongoDB')
+    parser.add_argument('--json', default=None, help='write results to this file')
+    parser.add_argument('--baseline', default=None, help='JSON results to compare with')
+    parser.add_argument(
+        '--tolerance', type=float, default=0.25,
+        help='allowed slowdown relative to the baseline (default 0.25)',
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.number, args.mongo_uri)
+    print(
+        f'{"group":<12}{"benchmark":<20}{"backend":<9}{"mean us":>10}{"p50 us":>10}'
+        f'{"p99 us":>10}{"ops/s":>12}',
+    )
+    for r in results:
+        print(
+            f'{r.group:<12}{r.benchmark:<20}{r.backend:<9}{r.mean_us:>10.2f}{r.p50_us:>10.2f}'
+            f'{r.p99_us:>10.2f}{r.ops_per_second:>12.0f}',
+        )
+
+    if args.json is not None:
+        with open(args.json, 'w') as f:
+            json.dump(
+                {
+                    'python': platform.python_version(),
+                    'number': args.number,
+                    'results': [asdict(r) for r in results],
+                },
+                f,
+                indent=2,
+            )
+
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for result, ratio in regressions:
+            print(
+                f'Regression: {result.group}/{result.benchmark}/{result.backend} '
+                f'is {ratio:.2f}x slower than the baseline', file=sys.stderr,
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,16 +1,64 @@
 from . import exceptions
 from .decorators import async_mongo_repository as async_repository
 from .decorators import mongo_repository as repository
-from .types import Entity, MethodAccess, RepositoryConfig
+from .types import (
+    BatchInsert,
+    BatchInsertResult,
+    BulkIncrementResult,
+    Coalescing,
+    Entity,
+    FindOptions,
+    Index,
+    IndexDrift,
+    Keyset,
+    ListAppend,
+    ListBuckets,
+    MethodAccess,
+    Page,
+    Projection,
+    RepositoryConfig,
+    WriteBehind,
+)
 from .utils.dataclass_converters import get_converter
+from .utils.find_options import find_options_context
+from .utils.index_advisor import async_suggest_indexes, suggest_indexes
 from .utils.mongo_collection import provide_collection
+from .utils.mongo_indexes import (
+    async_ensure_indexes,
+    async_index_drift,
+    ensure_indexes,
+    index_drift,
+)
 from .utils.mongo_session import session_context, set_session, unset_session
+from .utils.write_behind import async_flush_counters, flush_counters
 
 __all__ = [
     'RepositoryConfig',
     'Entity',
     'provide_collection',
     'MethodAccess',
+    'Keyset',
+    'ListAppend',
+    'ListBuckets',
+    'Page',
+    'Projection',
+    'Coalescing',
+    'BatchInsert',
+    'BatchInsertResult',
+    'BulkIncrementResult',
+    'FindOptions',
+    'find_options_context',
+    'Index',
+    'IndexDrift',
+    'ensure_indexes',
+    'async_ensure_indexes',
+    'index_drift',
+    'async_index_drift',
+    'suggest_indexes',
+    'async_suggest_indexes',
+    'WriteBehind',
+    'flush_counters',
+    'async_flush_counters',
     'get_converter',
     'set_session',
     'unset_session',
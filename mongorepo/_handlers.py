@@ -1,50 +1,70 @@
 from dataclasses import asdict
-from typing import Any, Iterable
+from typing import Any, Iterable, Mapping
 
-from motor.motor_asyncio import (
-    AsyncIOMotorClientSession,
-    AsyncIOMotorCollection,
-)
 from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
 
 from mongorepo._methods.impl import (
     AddBatchMethod,
     AddMethod,
+    AppendBucketListMethod,
     AppendListMethod,
+    DeleteManyMethod,
     DeleteMethod,
     GetAllMethod,
+    GetBucketListValuesMethod,
     GetListMethod,
     GetListValuesMethod,
     GetMethod,
+    GetPageMethod,
     IncrementIntegerFieldMethod,
+    IncrementManyMethod,
+    PopBucketListMethod,
     PopListMethod,
+    RemoveBucketListMethod,
     RemoveListMethod,
     UpdateMethod,
 )
 from mongorepo._methods.impl_async import (
     AddBatchMethodAsync,
     AddMethodAsync,
+    AppendBucketListMethodAsync,
     AppendListMethodAsync,
+    DeleteManyMethodAsync,
     DeleteMethodAsync,
     GetAllMethodAsync,
+    GetBucketListValuesMethodAsync,
     GetListMethodAsync,
     GetListValuesMethodAsync,
     GetMethodAsync,
+    GetPageMethodAsync,
     IncrementIntegerFieldMethodAsync,
+    IncrementManyMethodAsync,
+    PopBucketListMethodAsync,
     PopListMethodAsync,
+    RemoveBucketListMethodAsync,
     RemoveListMethodAsync,
     UpdateMethodAsync,
 )
 from mongorepo.types import (
+    AsyncCollectionType,
+    AsyncSessionType,
+    BatchInsert,
+    Coalescing,
     CollectionProvider,
     Field,
+    Keyset,
+    ListAppend,
+    ListBuckets,
     MongorepoDict,
+    Projection,
     RepositoryConfig,
+    WriteBehind,
     get_method_access_prefix,
 )
 from mongorepo.utils.dataclass_converters import get_converter
 from mongorepo.utils.field_factory import build_validated_field
+from mongorepo.utils.instrumentation import instrument_methods
 from mongorepo.utils.mongorepo_dict import get_or_create_mongorepo_dict
 from mongorepo.utils.type_hints import (
     check_valid_field_type,
@@ -58,13 +78,18 @@ def _handle_mongo_repository(
     config: RepositoryConfig,
     add: bool,
     get: bool,
-    add_batch: bool,
+    add_batch: bool | BatchInsert,
     get_all: bool,
     update: bool,
     delete: bool,
     get_list: bool,
-    list_fields: Iterable[str] | None,
+    list_fields: Iterable[str] | Mapping[str, ListAppend | ListBuckets] | None,
     integer_fields: Iterable[str] | None,
+    get_page: bool | Keyset = False,
+    delete_many: bool = False,
+    projections: Mapping[str, Projection] | None = None,
+    write_behind: WriteBehind | None = None,
+    return_incremented: bool = False,
 ) -> type:
     validate_repository_config_converters(config)
     prefix = get_method_access_prefix(
@@ -74,6 +99,11 @@ def _handle_mongo_repository(
     config.to_document_converter = config.to_document_converter or asdict
     config.to_entity_converter = config.to_entity_converter or get_converter(config.entity_type)
     entity_type_hints = get_entity_type_hints(config.entity_type)
+    # Buckets of bucketed list fields are deleted together with entity documents
+    list_buckets: list[tuple[Field, ListBuckets]] = [
+        (Field(name=field), options) for field, options in list_fields.items()
+        if isinstance(options, ListBuckets)
+    ] if isinstance(list_fields, Mapping) else []
 
     __mongorepo__: MongorepoDict[ClientSession, Collection[Any]] = get_or_create_mongorepo_dict(
         cls,
@@ -91,7 +121,10 @@ def _handle_mongo_repository(
     if add_batch:
         key = f'{prefix}add_batch'
         add_batch_method = AddBatchMethod(
-            config.entity_type, cls, to_document_converter=config.to_document_converter,
+            config.entity_type,
+            cls,
+            to_document_converter=config.to_document_converter,
+            batch=add_batch if isinstance(add_batch, BatchInsert) else None,
         )
         __mongorepo__['methods'][key] = add_batch_method
         setattr(cls, key, __mongorepo__['methods'][key])
@@ -116,11 +149,30 @@ def _handle_mongo_repository(
         )
         __mongorepo__['methods'][key] = get_list_method
         setattr(cls, key, __mongorepo__['methods'][key])
+    if get_page:
+        key = f'{prefix}get_page'
+        get_page_method = GetPageMethod(
+            config.entity_type,
+            cls,
+            to_entity_converter=config.to_entity_converter,
+            keyset=get_page if isinstance(get_page, Keyset) else None,
+        )
+        __mongorepo__['methods'][key] = get_page_method
+        setattr(cls, key, __mongorepo__['methods'][key])
     if delete:
         key = f'{prefix}delete'
-        delete_method: DeleteMethod = DeleteMethod(config.entity_type, cls)
+        delete_method: DeleteMethod = DeleteMethod(
+            config.entity_type, cls, list_buckets=list_buckets,
+        )
         __mongorepo__['methods'][key] = delete_method
         setattr(cls, key, __mongorepo__['methods'][key])
+    if delete_many:
+        key = f'{prefix}delete_many'
+        delete_many_method: DeleteManyMethod = DeleteManyMethod(
+            config.entity_type, cls, list_buckets=list_buckets,
+        )
+        __mongorepo__['methods'][key] = delete_many_method
+        setattr(cls, key, __mongorepo__['methods'][key])
     if update:
         key = f'{prefix}update'
         update_method = UpdateMethod(
@@ -137,9 +189,30 @@ def _handle_mongo_repository(
             check_valid_field_type(field, config.entity_type, list)
             target_field: Field = Field(name=field)
             build_validated_field(target_field, entity_type_hints[target_field.name], config)
+            options = list_fields.get(field) if isinstance(list_fields, Mapping) else None
+
+            if isinstance(options, ListBuckets):
+                bucket_methods: dict[str, Any] = {
+                    '__append': AppendBucketListMethod(
+                        config.entity_type, owner=cls, target_field=target_field, buckets=options,
+                    ),
+                    '__remove': RemoveBucketListMethod(
+                        config.entity_type, owner=cls, target_field=target_field, buckets=options,
+                    ),
+                    '__pop': PopBucketListMethod(
+                        config.entity_type, owner=cls, target_field=target_field, buckets=options,
+                    ),
+                    '__list': GetBucketListValuesMethod(
+                        config.entity_type, owner=cls, target_field=target_field, buckets=options,
+                    ),
+                }
+                for suffix, method in bucket_methods.items():
+                    __mongorepo__['methods'][k := f'{prefix}{field}{suffix}'] = method
+                    setattr(cls, k, __mongorepo__['methods'][k])
+                continue
 
             append_method: AppendListMethod = AppendListMethod(
-                config.entity_type, owner=cls, target_field=target_field,
+                config.entity_type, owner=cls, target_field=target_field, append=options,
             )
             __mongorepo__['methods'][k := f'{prefix}{field}__append'] = append_method
             setattr(cls, k, __mongorepo__['methods'][k])
@@ -163,6 +236,7 @@ def _handle_mongo_repository(
             setattr(cls, k, __mongorepo__['methods'][k])
 
     if integer_fields:
+        incremented_fields: list[str] = []
         for field in integer_fields:
             check_valid_field_type(field, config.entity_type, int)
 
@@ -171,17 +245,58 @@ def _handle_mongo_repository(
 
             increment_method: IncrementIntegerFieldMethod = IncrementIntegerFieldMethod(
                 config.entity_type, cls, target_field=target_field, weight=1,
+                write_behind=write_behind,
+                return_value=return_incremented,
             )
             __mongorepo__['methods'][k := f'{prefix}incr__{field}'] = increment_method
             setattr(cls, k, __mongorepo__['methods'][k])
 
             decrement_method: IncrementIntegerFieldMethod = IncrementIntegerFieldMethod(
                 config.entity_type, cls, target_field=target_field, weight=-1,
+                write_behind=write_behind,
+                return_value=return_incremented,
             )
             __mongorepo__['methods'][k := f'{prefix}decr__{field}'] = decrement_method
             setattr(cls, k, __mongorepo__['methods'][k])
+            incremented_fields.append(field)
+
+        increment_many_method: IncrementManyMethod = IncrementManyMethod(
+            config.entity_type, cls, fields=incremented_fields,
+        )
+        __mongorepo__['methods'][k := f'{prefix}incr_many'] = increment_many_method
+        setattr(cls, k, __mongorepo__['methods'][k])
+
+    if projections:
+        for name, projection in projections.items():
+            get_projected_method = GetMethod(
+                config.entity_type,
+                cls,
+                to_entity_converter=config.to_entity_converter,
+                projection=projection,
+            )
+            __mongorepo__['methods'][k := f'{prefix}get__{name}'] = get_projected_method
+            setattr(cls, k, __mongorepo__['methods'][k])
+
+            get_list_projected_method = GetListMethod(
+                config.entity_type,
+                cls,
+                to_entity_converter=config.to_entity_converter,
+                projection=projection,
+            )
+            __mongorepo__['methods'][k := f'{prefix}get_list__{name}'] = get_list_projected_method
+            setattr(cls, k, __mongorepo__['methods'][k])
+
+            get_all_projected_method = GetAllMethod(
+                config.entity_type,
+                cls,
+                to_entity_converter=config.to_entity_converter,
+                projection=projection,
+            )
+            __mongorepo__['methods'][k := f'{prefix}get_all__{name}'] = get_all_projected_method
+            setattr(cls, k, __mongorepo__['methods'][k])
 
     cls.__mongorepo__ = __mongorepo__
+    instrument_methods(cls, __mongorepo__)
 
     return cls
 
@@ -189,15 +304,20 @@ def _handle_mongo_repository(
 def _handle_async_mongo_repository(
     cls,
     config: RepositoryConfig,
-    add: bool,
-    add_batch: bool,
-    get: bool,
+    add: bool | Coalescing,
+    add_batch: bool | BatchInsert,
+    get: bool | Coalescing,
     get_all: bool,
     get_list: bool,
     update: bool,
     delete: bool,
     integer_fields: Iterable[str] | None,
-    list_fields: Iterable[str] | None,
+    list_fields: Iterable[str] | Mapping[str, ListAppend | ListBuckets] | None,
+    get_page: bool | Keyset = False,
+    delete_many: bool = False,
+    projections: Mapping[str, Projection] | None = None,
+    write_behind: WriteBehind | None = None,
+    return_incremented: bool = False,
 ) -> type:
     """Calls for functions that set different async methods and attributes to
     the class."""
@@ -210,8 +330,13 @@ def _handle_async_mongo_repository(
     config.to_document_converter = config.to_document_converter or asdict
     config.to_entity_converter = config.to_entity_converter or get_converter(config.entity_type)
     entity_type_hints = get_entity_type_hints(config.entity_type)
+    # Buckets of bucketed list fields are deleted together with entity documents
+    list_buckets: list[tuple[Field, ListBuckets]] = [
+        (Field(name=field), options) for field, options in list_fields.items()
+        if isinstance(options, ListBuckets)
+    ] if isinstance(list_fields, Mapping) else []
 
-    __mongorepo__: MongorepoDict[AsyncIOMotorClientSession, AsyncIOMotorCollection] = get_or_create_mongorepo_dict(  # noqa
+    __mongorepo__: MongorepoDict[AsyncSessionType, AsyncCollectionType] = get_or_create_mongorepo_dict(  # noqa
         cls,
         CollectionProvider(obj=cls, collection=config.collection),
         config,
@@ -223,6 +348,7 @@ def _handle_async_mongo_repository(
             config.entity_type,
             owner=cls,
             to_document_converter=config.to_document_converter,
+            coalescing=add if isinstance(add, Coalescing) else None,
         )
         __mongorepo__['methods'][key] = add_method
         setattr(cls, key, __mongorepo__['methods'][key])
@@ -232,6 +358,7 @@ def _handle_async_mongo_repository(
             config.entity_type,
             owner=cls,
             to_entity_converter=config.to_entity_converter,
+            coalescing=get if isinstance(get, Coalescing) else None,
         )
         __mongorepo__['methods'][key] = get_method
         setattr(cls, key, __mongorepo__['methods'][key])
@@ -239,7 +366,9 @@ def _handle_async_mongo_repository(
         key = f'{prefix}add_batch'
         add_batch_method = AddBatchMethodAsync(
             config.entity_type,
-            cls, to_document_converter=config.to_document_converter,
+            cls,
+            to_document_converter=config.to_document_converter,
+            batch=add_batch if isinstance(add_batch, BatchInsert) else None,
         )
         __mongorepo__['methods'][key] = add_batch_method
         setattr(cls, key, __mongorepo__['methods'][key])
@@ -253,11 +382,30 @@ def _handle_async_mongo_repository(
         get_list_method = GetListMethodAsync(config.entity_type, cls, config.to_entity_converter)
         __mongorepo__['methods'][key] = get_list_method
         setattr(cls, key, __mongorepo__['methods'][key])
+    if get_page:
+        key = f'{prefix}get_page'
+        get_page_method = GetPageMethodAsync(
+            config.entity_type,
+            cls,
+            to_entity_converter=config.to_entity_converter,
+            keyset=get_page if isinstance(get_page, Keyset) else None,
+        )
+        __mongorepo__['methods'][key] = get_page_method
+        setattr(cls, key, __mongorepo__['methods'][key])
     if delete:
         key = f'{prefix}delete'
-        delete_method: DeleteMethodAsync = DeleteMethodAsync(config.entity_type, cls)
+        delete_method: DeleteMethodAsync = DeleteMethodAsync(
+            config.entity_type, cls, list_buckets=list_buckets,
+        )
         __mongorepo__['methods'][key] = delete_method
         setattr(cls, key, __mongorepo__['methods'][key])
+    if delete_many:
+        key = f'{prefix}delete_many'
+        delete_many_method: DeleteManyMethodAsync = DeleteManyMethodAsync(
+            config.entity_type, cls, list_buckets=list_buckets,
+        )
+        __mongorepo__['methods'][key] = delete_many_method
+        setattr(cls, key, __mongorepo__['methods'][key])
     if update:
         key = f'{prefix}update'
         update_method = UpdateMethodAsync(
@@ -275,9 +423,30 @@ def _handle_async_mongo_repository(
 
             target_field: Field = Field(name=field)
             build_validated_field(target_field, entity_type_hints[target_field.name], config)
+            options = list_fields.get(field) if isinstance(list_fields, Mapping) else None
+
+            if isinstance(options, ListBuckets):
+                bucket_methods: dict[str, Any] = {
+                    '__append': AppendBucketListMethodAsync(
+                        config.entity_type, owner=cls, target_field=target_field, buckets=options,
+                    ),
+                    '__remove': RemoveBucketListMethodAsync(
+                        config.entity_type, owner=cls, target_field=target_field, buckets=options,
+                    ),
+                    '__pop': PopBucketListMethodAsync(
+                        config.entity_type, owner=cls, target_field=target_field, buckets=options,
+                    ),
+                    '__list': GetBucketListValuesMethodAsync(
+                        config.entity_type, owner=cls, target_field=target_field, buckets=options,
+                    ),
+                }
+                for suffix, method in bucket_methods.items():
+                    __mongorepo__['methods'][k := f'{prefix}{field}{suffix}'] = method
+                    setattr(cls, k, __mongorepo__['methods'][k])
+                continue
 
             append_method: AppendListMethodAsync = AppendListMethodAsync(
-                config.entity_type, owner=cls, target_field=target_field,
+                config.entity_type, owner=cls, target_field=target_field, append=options,
             )
             __mongorepo__['methods'][k := f'{prefix}{field}__append'] = append_method
             setattr(cls, k, __mongorepo__['methods'][k])
@@ -301,6 +470,7 @@ def _handle_async_mongo_repository(
             setattr(cls, k, __mongorepo__['methods'][k])
 
     if integer_fields:
+        incremented_fields: list[str] = []
         for field in integer_fields:
             check_valid_field_type(field, config.entity_type, int)
 
@@ -309,16 +479,57 @@ def _handle_async_mongo_repository(
 
             increment_method: IncrementIntegerFieldMethodAsync = IncrementIntegerFieldMethodAsync(
                 config.entity_type, cls, target_field=target_field, weight=1,
+                write_behind=write_behind,
+                return_value=return_incremented,
             )
             __mongorepo__['methods'][k := f'{prefix}incr__{field}'] = increment_method
             setattr(cls, k, __mongorepo__['methods'][k])
 
             decrement_method: IncrementIntegerFieldMethodAsync = IncrementIntegerFieldMethodAsync(
                 config.entity_type, cls, target_field=target_field, weight=-1,
+                write_behind=write_behind,
+                return_value=return_incremented,
             )
             __mongorepo__['methods'][k := f'{prefix}decr__{field}'] = decrement_method
             setattr(cls, k, __mongorepo__['methods'][k])
+            incremented_fields.append(field)
+
+        increment_many_method: IncrementManyMethodAsync = IncrementManyMethodAsync(
+            config.entity_type, cls, fields=incremented_fields,
+        )
+        __mongorepo__['methods'][k := f'{prefix}incr_many'] = increment_many_method
+        setattr(cls, k, __mongorepo__['methods'][k])
+
+    if projections:
+        for name, projection in projections.items():
+            get_projected_method = GetMethodAsync(
+                config.entity_type,
+                cls,
+                to_entity_converter=config.to_entity_converter,
+                projection=projection,
+            )
+            __mongorepo__['methods'][k := f'{prefix}get__{name}'] = get_projected_method
+            setattr(cls, k, __mongorepo__['methods'][k])
+
+            get_list_projected_method = GetListMethodAsync(
+                config.entity_type,
+                cls,
+                to_entity_converter=config.to_entity_converter,
+                projection=projection,
+            )
+            __mongorepo__['methods'][k := f'{prefix}get_list__{name}'] = get_list_projected_method
+            setattr(cls, k, __mongorepo__['methods'][k])
+
+            get_all_projected_method = GetAllMethodAsync(
+                config.entity_type,
+                cls,
+                to_entity_converter=config.to_entity_converter,
+                projection=projection,
+            )
+            __mongorepo__['methods'][k := f'{prefix}get_all__{name}'] = get_all_projected_method
+            setattr(cls, k, __mongorepo__['methods'][k])
 
     cls.__mongorepo__ = __mongorepo__
+    instrument_methods(cls, __mongorepo__)
 
     return cls
@@ -1,16 +1,82 @@
-from typing import Any, Generator, Literal
+from functools import partial
+from typing import Any, Generator, Iterable, Literal
 
 from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError, PyMongoError
 from pymongo.results import InsertManyResult, UpdateResult
 
+from mongorepo.exceptions import MongorepoException
 from mongorepo.modifiers.base import ModifierAfter, ModifierBefore
 from mongorepo.types import (
+    BatchInsert,
+    BatchInsertResult,
+    BulkIncrementResult,
     Field,
+    FindOptions,
     HasMongorepoDict,
+    Keyset,
+    ListAppend,
+    ListBuckets,
+    Page,
+    Projection,
     ToDocumentConverter,
     ToEntityConverter,
+    WriteBehind,
 )
+from mongorepo.utils.batch_insert import insert_chunks
+from mongorepo.utils.bulk_increment import (
+    MAX_WRITE_BATCH_SIZE,
+    Increments,
+    add_bulk_result,
+    get_bulk_error,
+    iter_increment_chunks,
+)
+from mongorepo.utils.change_tracking import (
+    get_snapshots,
+    get_update,
+    track_entities,
+)
+from mongorepo.utils.find_options import get_find_options
+from mongorepo.utils.list_append import get_append_update
+from mongorepo.utils.list_buckets import (
+    BUCKETS_INDEX,
+    COUNT,
+    ITEMS,
+    PARENT,
+    SEQ,
+    get_append_bucket_update,
+    get_bucket_page,
+    get_bucket_page_query,
+    get_buckets_collection,
+    get_empty_buckets_filter,
+    get_last_bucket_query,
+    get_length,
+    get_next_bucket,
+    get_pop_query,
+    get_remove_query,
+    get_remove_requests,
+    get_tail_query,
+)
+from mongorepo.utils.mongo_cache import (
+    clear_cache,
+    decode_document,
+    encode_document,
+    get_cache,
+    get_cache_key,
+)
+from mongorepo.utils.mongo_session import get_session
+from mongorepo.utils.pagination import (
+    encode_page_token,
+    get_page_query,
+    get_sort,
+)
+from mongorepo.utils.projection import get_projection_converter
+from mongorepo.utils.query_filters import compile_filters
+from mongorepo.utils.write_behind import CounterBuffer, buffer_increment
+
+# Default of `value` of append methods, `None` can be appended
+_NO_VALUE: Any = object()
 
 
 class AddMethod[T]:
@@ -37,7 +103,8 @@ class AddMethod[T]:
         for modifier_before in self.modifiers_before:
             entity = modifier_before.modify(entity)
 
-        collection.insert_one(self.to_document_converter(entity), session=self.session)
+        collection.insert_one(self.to_document_converter(entity), session=get_session(self))
+        clear_cache(self, ids=())
 
         for modifier_after in self.modifiers_after:
             entity = modifier_after.modify(entity)
@@ -53,6 +120,7 @@ class AddBatchMethod[T]:
         to_document_converter: ToDocumentConverter[T],
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
         session: ClientSession | None = None,
+        batch: BatchInsert | None = None,
         **kwargs,
     ) -> None:
         self.entity_type = entity_type
@@ -61,17 +129,37 @@ class AddBatchMethod[T]:
         self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
         self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
         self.to_document_converter = to_document_converter
+        self.batch = batch
         self.kwargs = kwargs
 
-    def __call__(self, entity_list: list[T]) -> InsertManyResult:
+    def __call__(self, entity_list: Iterable[T]) -> InsertManyResult | BatchInsertResult:
         collection: Collection = self.owner.__mongorepo__['collection_provider'].provide()
 
         for modifier_before in self.modifiers_before:
             entity_list = modifier_before.modify(entity_list)
 
-        result = collection.insert_many(
-            [self.to_document_converter(d) for d in entity_list], session=self.session,
-        )
+        session = get_session(self)
+        if self.batch is not None:
+            try:
+                batch_result = insert_chunks(
+                    entity_list,
+                    self.to_document_converter,
+                    partial(collection.insert_many, ordered=self.batch.ordered, session=session),
+                    self.batch,
+                )
+            finally:
+                clear_cache(self, ids=())
+            for modifier_after in self.modifiers_after:
+                batch_result = modifier_after.modify(batch_result)
+            return batch_result
+
+        try:
+            result = collection.insert_many(
+                [self.to_document_converter(d) for d in entity_list], session=session,
+            )
+        finally:
+            # Some documents could be inserted even if insertion failed
+            clear_cache(self, ids=())
 
         for modifier_after in self.modifiers_after:
             result = modifier_after.modify(result)
@@ -87,12 +175,18 @@ class GetAllMethod[T]:
         to_entity_converter: ToEntityConverter[T],
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
         session: ClientSession | None = None,
+        projection: Projection | None = None,
+        find_options: FindOptions | None = None,
         **kwargs,
     ) -> None:
         self.entity_type = entity_type
         self.owner = owner
         self.session = session
-        self.to_entity_converter = to_entity_converter
+        self.to_entity_converter = to_entity_converter if projection is None else (
+            get_projection_converter(projection)
+        )
+        self.projection = projection.spec if projection is not None else None
+        self.find_options = find_options
         self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
         self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
         self.kwargs = kwargs
@@ -103,9 +197,16 @@ class GetAllMethod[T]:
         for modifier_before in self.modifiers_before:
             filters = modifier_before.modify(**filters)
 
-        cursor = collection.find(filters)
+        filters = compile_filters(self, filters)
+        # Partial entities are never tracked
+        snapshots = get_snapshots(self) if self.projection is None else None
+        cursor = collection.find(
+            filters, self.projection, session=get_session(self), **get_find_options(self),
+        )
         for data in cursor:
             entity = self.to_entity_converter(data, self.entity_type)
+            if snapshots is not None:
+                snapshots.track(entity)
 
             for modifier_after in self.modifiers_after:
                 entity = modifier_after.modify(entity)
@@ -121,6 +222,8 @@ class GetListMethod[T]:
         to_entity_converter: ToEntityConverter[T],
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
         session: ClientSession | None = None,
+        projection: Projection | None = None,
+        find_options: FindOptions | None = None,
         **kwargs,
     ) -> None:
         self.entity_type = entity_type
@@ -129,7 +232,11 @@ class GetListMethod[T]:
         self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
         self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
         self.kwargs = kwargs
-        self.to_entity_converter = to_entity_converter
+        self.to_entity_converter = to_entity_converter if projection is None else (
+            get_projection_converter(projection)
+        )
+        self.projection = projection.spec if projection is not None else None
+        self.find_options = find_options
 
     def __call__(self, offset: int = 0, limit: int = 20, **filters: Any) -> list[T]:
         collection: Collection = self.owner.__mongorepo__['collection_provider'].provide()
@@ -137,8 +244,16 @@ class GetListMethod[T]:
         for modifier_before in self.modifiers_before:
             offset, limit, filters = modifier_before.modify(offset, limit, **filters)
 
-        cursor = collection.find(filter=filters).skip(offset).limit(limit)
+        filters = compile_filters(self, filters)
+        cursor = collection.find(
+            filter=filters,
+            projection=self.projection,
+            session=get_session(self),
+            **get_find_options(self),
+        ).skip(offset).limit(limit)
         result = [self.to_entity_converter(doc, self.entity_type) for doc in cursor]
+        if self.projection is None:
+            track_entities(self, result)
 
         for modifier_after in self.modifiers_after:
             result = modifier_after.modify(result)
@@ -146,20 +261,85 @@ class GetListMethod[T]:
         return result
 
 
-class GetMethod[T]:
+class GetPageMethod[T]:
     def __init__(
         self,
         entity_type: type[T],
         owner: HasMongorepoDict[ClientSession, Collection],
         to_entity_converter: ToEntityConverter[T],
+        keyset: Keyset | None = None,
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
         session: ClientSession | None = None,
+        find_options: FindOptions | None = None,
         **kwargs,
     ) -> None:
         self.entity_type = entity_type
         self.owner = owner
         self.session = session
+        self.keyset = keyset or Keyset()
+        self.sort = get_sort(self.keyset)
+        self.find_options = find_options
+        self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
+        self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
+        self.kwargs = kwargs
         self.to_entity_converter = to_entity_converter
+
+    def __call__(self, limit: int = 20, token: str | None = None, **filters: Any) -> Page[T]:
+        collection: Collection = self.owner.__mongorepo__['collection_provider'].provide()
+
+        for modifier_before in self.modifiers_before:
+            limit, token, filters = modifier_before.modify(limit, token, **filters)
+
+        if limit < 0:
+            # `limit + 1` of zero or less would not limit the cursor at all
+            raise MongorepoException(message=f'Page limit cannot be negative, got {limit}')
+        filters = compile_filters(self, filters)
+        # One extra document shows whether the next page exists
+        documents = list(
+            collection.find(
+                get_page_query(self.keyset, filters, token),
+                sort=self.sort,
+                limit=limit + 1,
+                session=get_session(self),
+                **get_find_options(self, sort=False),
+            ),
+        )
+        has_next = len(documents) > limit
+        documents = documents[:limit]
+        next_token = encode_page_token(
+            self.keyset, documents[-1],
+        ) if has_next and documents else None
+
+        result = Page(
+            items=[self.to_entity_converter(doc, self.entity_type) for doc in documents],
+            next_token=next_token,
+        )
+        track_entities(self, result.items)
+
+        for modifier_after in self.modifiers_after:
+            result = modifier_after.modify(result)
+
+        return result
+
+
+class GetMethod[T]:
+    def __init__(
+        self,
+        entity_type: type[T],
+        owner: HasMongorepoDict[ClientSession, Collection],
+        to_entity_converter: ToEntityConverter[T],
+        modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
+        session: ClientSession | None = None,
+        projection: Projection | None = None,
+        **kwargs,
+    ) -> None:
+        self.entity_type = entity_type
+        self.owner = owner
+        self.session = session
+        self.to_entity_converter = to_entity_converter if projection is None else (
+            get_projection_converter(projection)
+        )
+        self.projection = projection.spec if projection is not None else None
         self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
         self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
         self.kwargs = kwargs
@@ -170,8 +350,24 @@ class GetMethod[T]:
         for modifier_before in self.modifiers_before:
             filters = modifier_before.modify(**filters)
 
-        result = collection.find_one(filters)
+        filters = compile_filters(self, filters)
+        session = get_session(self)
+        # Reads in a session may see uncommitted changes, they are never cached
+        cache = get_cache(self) if session is None else None
+        key = get_cache_key(filters, self.projection) if cache is not None else None
+        if cache is not None and key is not None:
+            generation = cache.generation
+            hit, data = cache.get(key)
+            if hit:
+                result = decode_document(data, collection)
+            else:
+                result = collection.find_one(filters, self.projection)
+                cache.set(key, encode_document(result, collection), generation)
+        else:
+            result = collection.find_one(filters, self.projection, session=session)
         entity = self.to_entity_converter(result, self.entity_type) if result else None
+        if entity is not None and self.projection is None:
+            track_entities(self, (entity,))
 
         for modifier_after in self.modifiers_after:
             entity = modifier_after.modify(entity)
@@ -186,11 +382,13 @@ class DeleteMethod[T]:
         owner: HasMongorepoDict[ClientSession, Collection],
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
         session: ClientSession | None = None,
+        list_buckets: Iterable[tuple[Field, ListBuckets]] = (),
         **kwargs,
     ) -> None:
         self.entity_type = entity_type
         self.owner = owner
         self.session = session
+        self.list_buckets = list(list_buckets)
         self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
         self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
         self.kwargs = kwargs
@@ -201,7 +399,18 @@ class DeleteMethod[T]:
         for modifier_before in self.modifiers_before:
             filters = modifier_before.modify(**filters)
 
-        deleted = collection.find_one_and_delete(filters, session=self.session)
+        filters = compile_filters(self, filters)
+        if not self.modifiers_after and not self.list_buckets:
+            result = collection.delete_one(filters, session=get_session(self))
+            clear_cache(self, filters)
+            return result.deleted_count > 0
+
+        # Modifiers after receive the deleted document and buckets are deleted by its `_id`,
+        # so it is fetched only for them
+        deleted = collection.find_one_and_delete(filters, session=get_session(self))
+        clear_cache(self, ids=[deleted['_id']] if deleted else ())
+        if deleted is not None:
+            _delete_buckets(self, collection, [deleted['_id']])
 
         for modifier_after in self.modifiers_after:
             deleted = modifier_after.modify(deleted)
@@ -209,6 +418,64 @@ class DeleteMethod[T]:
         return True if deleted else False
 
 
+class DeleteManyMethod[T]:
+    def __init__(
+        self,
+        entity_type: type[T],
+        owner: HasMongorepoDict[ClientSession, Collection],
+        modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
+        session: ClientSession | None = None,
+        list_buckets: Iterable[tuple[Field, ListBuckets]] = (),
+        **kwargs,
+    ) -> None:
+        self.entity_type = entity_type
+        self.owner = owner
+        self.session = session
+        self.list_buckets = list(list_buckets)
+        self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
+        self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
+        self.kwargs = kwargs
+
+    def __call__(self, **filters: Any) -> int:
+        collection: Collection = self.owner.__mongorepo__['collection_provider'].provide()
+
+        for modifier_before in self.modifiers_before:
+            filters = modifier_before.modify(**filters)
+
+        filters = compile_filters(self, filters)
+        if not self.list_buckets:
+            result = collection.delete_many(filters, session=get_session(self))
+            clear_cache(self, filters)
+            deleted_count = result.deleted_count
+        else:
+            # Documents are deleted by `_id`, so buckets are deleted only for deleted documents
+            ids = [
+                document['_id'] for document in
+                collection.find(filters, {'_id': 1}, session=get_session(self))
+            ]
+            deleted_count = 0
+            if ids:
+                result = collection.delete_many({'_id': {'$in': ids}}, session=get_session(self))
+                clear_cache(self, ids=ids)
+                _delete_buckets(self, collection, ids)
+                deleted_count = result.deleted_count
+
+        for modifier_after in self.modifiers_after:
+            deleted_count = modifier_after.modify(deleted_count)
+
+        return deleted_count
+
+
+def _delete_buckets(
+    method: DeleteMethod | DeleteManyMethod, collection: Collection, ids: list[Any],
+) -> None:
+    """Deletes buckets of bucketed list fields of deleted documents"""
+    for field, options in method.list_buckets:
+        get_buckets_collection(collection, options, field).delete_many(
+            {PARENT: {'$in': ids}}, session=get_session(method),
+        )
+
+
 class UpdateMethod[T]:
     def __init__(
         self,
@@ -229,23 +496,42 @@ class UpdateMethod[T]:
         self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
         self.kwargs = kwargs
 
-    def __call__(self, entity: T, **filters: Any) -> T | None:
+    def __call__(
+        self, entity: T, update_fields: Iterable[str] | None = None, **filters: Any,
+    ) -> T | None:
         collection: Collection = self.owner.__mongorepo__['collection_provider'].provide()
 
         for modifier_before in self.modifiers_before:
             entity, filters = modifier_before.modify(entity, **filters)
 
-        data: dict[str, dict[str, Any]] = {'$set': {}}
-        for field, value in self.to_document_converter(entity).items():
-            data['$set'][field] = value
-        updated_document: dict[str, Any] | None = collection.find_one_and_update(
-            filter=filters, update=data, return_document=True, session=self.session,
+        filters = compile_filters(self, filters)
+        document = self.to_document_converter(entity)
+        snapshots = get_snapshots(self)
+        data = get_update(
+            document,
+            snapshot=snapshots.get(entity) if snapshots is not None else None,
+            update_fields=update_fields,
         )
+        updated_document: dict[str, Any] | None
+        if data:
+            updated_document = collection.find_one_and_update(
+                filter=filters, update=data, return_document=True, session=get_session(self),
+            )
+            clear_cache(self, ids=[updated_document['_id']] if updated_document else ())
+        else:
+            # Nothing changed since the entity was loaded
+            updated_document = collection.find_one(filters, session=get_session(self))
 
         result = self.to_entity_converter(
             updated_document, self.entity_type,
         ) if updated_document else None
 
+        if snapshots is not None and result is not None:
+            # Fields that were not in `update_fields` may differ from the stored ones
+            if update_fields is None:
+                snapshots.track(entity, document)
+            snapshots.track(result)
+
         for modifier_after in self.modifiers_after:
             result = modifier_after.modify(result)
 
@@ -278,11 +564,13 @@ class UpdateListFieldMethod[T]:
         for modifier_before in self.modifiers_before:
             value, filters = modifier_before.modify(value, **filters)
 
+        filters = compile_filters(self, filters)
         res = collection.update_one(
             filter=filters,
             update={self.action: {self.target_field.name: self.target_field.to_document(value)}},
-            session=self.session,
+            session=get_session(self),
         )
+        clear_cache(self, filters)
 
         for modifier_aftert in self.modifiers_after:
             res = modifier_aftert.modify(res)
@@ -298,6 +586,7 @@ class AppendListMethod[T](UpdateListFieldMethod[T]):
         target_field: Field,
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
         session: ClientSession | None = None,
+        append: ListAppend | None = None,
         **kwargs,
     ) -> None:
         super().__init__(
@@ -309,9 +598,35 @@ class AppendListMethod[T](UpdateListFieldMethod[T]):
             session=session,
             **kwargs,
         )
+        self.append = append
 
-    def __call__(self, value: Any, **filters: Any) -> UpdateResult:
-        return super().__call__(value, **filters)
+    def __call__(
+        self, value: Any = _NO_VALUE, values: Iterable[Any] | None = None, **filters: Any,
+    ) -> UpdateResult:
+        if (value is _NO_VALUE) == (values is None):
+            raise MongorepoException(message='Pass either value or values to append')
+        if values is None and self.append is None:
+            return super().__call__(value, **filters)
+
+        collection: Collection = self.owner.__mongorepo__['collection_provider'].provide()
+        # Modifiers receive the argument the method was called with, as without `append` options
+        argument = values if values is not None else value
+        for modifier_before in self.modifiers_before:
+            argument, filters = modifier_before.modify(argument, **filters)
+        items = argument if values is not None else [argument]
+
+        filters = compile_filters(self, filters)
+        res = collection.update_one(
+            filter=filters,
+            update=get_append_update(self.target_field, items, self.append),
+            session=get_session(self),
+        )
+        clear_cache(self, filters)
+
+        for modifier_after in self.modifiers_after:
+            res = modifier_after.modify(res)
+
+        return res
 
 
 class RemoveListMethod[T](UpdateListFieldMethod[T]):
@@ -364,8 +679,11 @@ class GetListValuesMethod[T]:
         for modifier_before in self.modifiers_before:
             offset, limit, filters = modifier_before.modify(offset, limit, **filters)
 
+        filters = compile_filters(self, filters)
         document = collection.find_one(
-            filters, {self.target_field.name: {'$slice': [offset, limit]}},
+            filters,
+            {self.target_field.name: {'$slice': [offset, limit]}},
+            session=get_session(self),
         )
         if document is None:
             result = None
@@ -402,9 +720,11 @@ class PopListMethod[T]:
         for modifier_before in self.modifiers_before:
             filters = modifier_before.modify(**filters)
 
+        filters = compile_filters(self, filters)
         document = collection.find_one_and_update(
-            filter=filters, update={'$pop': {self.target_field.name: 1}}, session=self.session,
+            filter=filters, update={'$pop': {self.target_field.name: 1}}, session=get_session(self),
         )
+        clear_cache(self, ids=[document['_id']] if document else ())
         if document is None:
             result = None
         else:
@@ -416,6 +736,185 @@ class PopListMethod[T]:
         return result
 
 
+class _BucketListMethod[T]:
+    """Base of methods of list fields stored in buckets, see
+    :class:`mongorepo.types.ListBuckets`."""
+
+    def __init__(
+        self,
+        entity_type: type[T],
+        owner: HasMongorepoDict[ClientSession, Collection],
+        target_field: Field,
+        buckets: ListBuckets,
+        modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
+        session: ClientSession | None = None,
+        **kwargs,
+    ) -> None:
+        self.entity_type = entity_type
+        self.owner = owner
+        self.target_field = target_field
+        self.buckets = buckets
+        self.session = session
+        self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
+        self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
+        self.kwargs = kwargs
+        self._indexed: Any = None
+
+    def _get_parent_id(self, collection: Collection, filters: dict[str, Any]) -> Any:
+        document = collection.find_one(filters, {'_id': 1}, session=get_session(self))
+        return document['_id'] if document is not None else None
+
+    def _get_buckets(self, collection: Collection) -> Collection:
+        buckets = get_buckets_collection(collection, self.buckets, self.target_field)
+        if self._indexed is None or self._indexed != buckets:
+            buckets.create_index(BUCKETS_INDEX, unique=True)
+            self._indexed = buckets
+        return buckets
+
+
+class AppendBucketListMethod[T](_BucketListMethod[T]):
+    def __call__(
+        self, value: Any = _NO_VALUE, values: Iterable[Any] | None = None, **filters: Any,
+    ) -> UpdateResult | None:
+        if (value is _NO_VALUE) == (values is None):
+            raise MongorepoException(message='Pass either value or values to append')
+        collection: Collection = self.owner.__mongorepo__['collection_provider'].provide()
+        items = values if values is not None else [value]
+
+        for modifier_before in self.modifiers_before:
+            items, filters = modifier_before.modify(items, **filters)
+
+        filters = compile_filters(self, filters)
+        result: UpdateResult | None = None
+        if (parent_id := self._get_parent_id(collection, filters)) is not None:
+            buckets = self._get_buckets(collection)
+            documents = self.target_field.to_documents(items)
+            size, start = self.buckets.bucket_size, 0
+            while start < len(documents):
+                last_bucket = buckets.find_one(
+                    **get_last_bucket_query(parent_id), session=get_session(self),
+                )
+                seq, free = get_next_bucket(last_bucket, size)
+                chunk = documents[start:start + free]
+                try:
+                    result = buckets.update_one(
+                        **get_append_bucket_update(parent_id, seq, size, chunk),
+                        session=get_session(self),
+                    )
+                except DuplicateKeyError:
+                    # Concurrent append filled the bucket, find the last bucket again
+                    continue
+                start += len(chunk)
+
+        for modifier_after in self.modifiers_after:
+            result = modifier_after.modify(result)
+
+        return result
+
+
+class RemoveBucketListMethod[T](_BucketListMethod[T]):
+    """Removes all elements equal to `value` and returns their number, buckets
+    from the first one that holds `value` to the end of the list are
+    rewritten with one `bulk_write`, so all buckets but the last one stay
+    full. The rewrite is not atomic with concurrent writes of the same list."""
+
+    def __call__(self, value: Any, **filters: Any) -> int | None:
+        collection: Collection = self.owner.__mongorepo__['collection_provider'].provide()
+
+        for modifier_before in self.modifiers_before:
+            value, filters = modifier_before.modify(value, **filters)
+
+        filters = compile_filters(self, filters)
+        result: int | None = None
+        if (parent_id := self._get_parent_id(collection, filters)) is not None:
+            buckets = self._get_buckets(collection)
+            document = self.target_field.to_document(value)
+            result = 0
+            first = buckets.find_one(
+                **get_remove_query(parent_id, document), session=get_session(self),
+            )
+            if first is not None:
+                tail = buckets.find(
+                    **get_tail_query(parent_id, first[SEQ]), session=get_session(self),
+                )
+                result, requests = get_remove_requests(
+                    tail, document, self.buckets.bucket_size,
+                )
+                buckets.bulk_write(requests, session=get_session(self))
+
+        for modifier_after in self.modifiers_after:
+            result = modifier_after.modify(result)
+
+        return result
+
+
+class GetBucketListValuesMethod[T](_BucketListMethod[T]):
+    def __call__(
+        self, offset: int = 0, limit: int = 20, **filters: Any,
+    ) -> list[T] | list[Any] | None:
+        collection: Collection = self.owner.__mongorepo__['collection_provider'].provide()
+
+        for modifier_before in self.modifiers_before:
+            offset, limit, filters = modifier_before.modify(offset, limit, **filters)
+
+        filters = compile_filters(self, filters)
+        result: list[Any] | None = None
+        if (parent_id := self._get_parent_id(collection, filters)) is not None:
+            buckets = self._get_buckets(collection)
+            size = self.buckets.bucket_size
+            if offset < 0:
+                # Same as `$slice`, negative offset is counted from the end of the list
+                last_bucket = buckets.find_one(
+                    **get_last_bucket_query(parent_id), session=get_session(self),
+                )
+                offset = max(get_length(last_bucket, size) + offset, 0)
+            result = []
+            if limit > 0:
+                page = buckets.find(
+                    **get_bucket_page_query(parent_id, offset, limit, size),
+                    session=get_session(self),
+                )
+                result = [
+                    self.target_field.to_value(doc)
+                    for doc in get_bucket_page(page, offset, limit, size)
+                ]
+
+        for modifier_after in self.modifiers_after:
+            result = modifier_after.modify(result)
+
+        return result
+
+
+class PopBucketListMethod[T](_BucketListMethod[T]):
+    def __call__(self, **filters: Any) -> T | Any:
+        collection: Collection = self.owner.__mongorepo__['collection_provider'].provide()
+
+        for modifier_before in self.modifiers_before:
+            filters = modifier_before.modify(**filters)
+
+        filters = compile_filters(self, filters)
+        result = None
+        if (parent_id := self._get_parent_id(collection, filters)) is not None:
+            buckets = self._get_buckets(collection)
+            bucket = buckets.find_one_and_update(
+                **get_pop_query(parent_id), session=get_session(self),
+            )
+            if bucket is not None:
+                if bucket[COUNT] == 1:
+                    # Empty buckets are removed together with ones a failed pop left behind,
+                    # lookups of the last bucket skip them until then
+                    buckets.delete_many(
+                        get_empty_buckets_filter(parent_id, bucket[SEQ]),
+                        session=get_session(self),
+                    )
+                result = self.target_field.to_value(bucket[ITEMS][-1])
+
+        for modifier_after in self.modifiers_after:
+            result = modifier_after.modify(result)
+
+        return result
+
+
 class IncrementIntegerFieldMethod[T]:
     def __init__(
         self,
@@ -425,28 +924,103 @@ class IncrementIntegerFieldMethod[T]:
         weight: int = 1,
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
         session: ClientSession | None = None,
+        write_behind: WriteBehind | None = None,
+        return_value: bool = False,
         **kwargs,
     ) -> None:
+        self.entity_type = entity_type
         self.target_field = target_field
         self.owner = owner
         self.weight = weight
         self.session = session
+        if write_behind is not None and return_value:
+            raise MongorepoException(
+                message='Increments buffered with write_behind cannot return new values',
+            )
+        self.write_behind = write_behind
+        self.return_value = return_value
         self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
         self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
         self.kwargs = kwargs
 
-    def __call__(self, weight: int | None = None, **filters) -> UpdateResult:
+    def __call__(self, weight: int | None = None, **filters) -> UpdateResult | int | None:
         collection: Collection = self.owner.__mongorepo__['collection_provider'].provide()
 
         for modifier_before in self.modifiers_before:
             weight, filters = modifier_before.modify(weight, **filters)
 
+        filters = compile_filters(self, filters)
         w = weight if weight is not None else self.weight
-        result = collection.update_one(
-            filter=filters, update={'$inc': {self.target_field.name: w}}, session=self.session,
-        )
+        result: UpdateResult | int | None = None
+        if self.return_value:
+            # Only the counter is projected, the new value comes back in the same round trip
+            document = collection.find_one_and_update(
+                filter=filters,
+                update={'$inc': {self.target_field.name: w}},
+                projection={self.target_field.name: 1, '_id': 0},
+                return_document=True,
+                session=get_session(self),
+            )
+            clear_cache(self, filters)
+            result = document[self.target_field.name] if document is not None else None
+        elif self.write_behind is None or not buffer_increment(
+            self, CounterBuffer, self.write_behind, filters, self.target_field.name, w,
+        ):
+            result = collection.update_one(
+                filter=filters,
+                update={'$inc': {self.target_field.name: w}},
+                session=get_session(self),
+            )
+            clear_cache(self, filters)
 
         for modifier_aftert in self.modifiers_after:
             result = modifier_aftert.modify(result)
 
         return result
+
+
+class IncrementManyMethod[T]:
+    def __init__(
+        self,
+        entity_type: type[T],
+        owner: HasMongorepoDict[ClientSession, Collection],
+        fields: Iterable[str],
+        chunk_size: int = MAX_WRITE_BATCH_SIZE,
+        modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
+        session: ClientSession | None = None,
+        **kwargs,
+    ) -> None:
+        self.entity_type = entity_type
+        self.owner = owner
+        self.fields = frozenset(fields)
+        self.chunk_size = chunk_size
+        self.session = session
+        self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
+        self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
+        self.kwargs = kwargs
+
+    def __call__(self, increments: Increments, by: str | None = None) -> BulkIncrementResult:
+        collection: Collection = self.owner.__mongorepo__['collection_provider'].provide()
+
+        for modifier_before in self.modifiers_before:
+            increments, by = modifier_before.modify(increments, by)
+
+        result = BulkIncrementResult()
+        try:
+            for chunk in iter_increment_chunks(
+                self, increments, by, self.fields, self.chunk_size,
+            ):
+                try:
+                    bulk_result = collection.bulk_write(
+                        chunk, ordered=False, session=get_session(self),
+                    )
+                except PyMongoError as e:
+                    raise get_bulk_error(result, e) from e
+                add_bulk_result(result, bulk_result)
+        finally:
+            clear_cache(self)
+
+        for modifier_after in self.modifiers_after:
+            result = modifier_after.modify(result)
+
+        return result
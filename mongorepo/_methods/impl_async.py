@@ -1,25 +1,103 @@
-from typing import Any, AsyncGenerator, Literal
+import asyncio
+from dataclasses import replace
+from functools import partial
+from typing import Any, AsyncGenerator, AsyncIterable, Iterable, Literal
 
-from motor.motor_asyncio import (
-    AsyncIOMotorClientSession,
-    AsyncIOMotorCollection,
-)
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
 from pymongo.results import InsertManyResult, UpdateResult
 
+from mongorepo.exceptions import MongorepoException
 from mongorepo.modifiers.base import ModifierAfter, ModifierBefore
-from mongorepo.types.base import ToDocumentConverter, ToEntityConverter
+from mongorepo.types.base import (
+    AsyncCollectionType,
+    AsyncSessionType,
+    ToDocumentConverter,
+    ToEntityConverter,
+)
+from mongorepo.types.batch import (
+    BatchInsert,
+    BatchInsertResult,
+    BulkIncrementResult,
+)
+from mongorepo.types.coalescing import Coalescing
 from mongorepo.types.field import Field
+from mongorepo.types.find_options import FindOptions
+from mongorepo.types.list_append import ListAppend
+from mongorepo.types.list_buckets import ListBuckets
 from mongorepo.types.mongorepo_dict import HasMongorepoDict
+from mongorepo.types.pagination import Keyset, Page
+from mongorepo.types.projection import Projection
+from mongorepo.types.write_behind import WriteBehind
+from mongorepo.utils.batch_insert import insert_chunks_async
+from mongorepo.utils.bulk_increment import (
+    MAX_WRITE_BATCH_SIZE,
+    Increments,
+    add_bulk_result,
+    get_bulk_error,
+    iter_increment_chunks,
+)
+from mongorepo.utils.change_tracking import (
+    get_snapshots,
+    get_update,
+    track_entities,
+)
+from mongorepo.utils.coalescing import (
+    Coalescer,
+    get_bulk_write_errors,
+    get_lookup_key,
+    get_matched_lookups,
+)
+from mongorepo.utils.find_options import get_find_options
+from mongorepo.utils.list_append import get_append_update
+from mongorepo.utils.list_buckets import (
+    BUCKETS_INDEX,
+    COUNT,
+    ITEMS,
+    PARENT,
+    SEQ,
+    get_append_bucket_update,
+    get_bucket_page,
+    get_bucket_page_query,
+    get_buckets_collection,
+    get_empty_buckets_filter,
+    get_last_bucket_query,
+    get_length,
+    get_next_bucket,
+    get_pop_query,
+    get_remove_query,
+    get_remove_requests,
+    get_tail_query,
+)
+from mongorepo.utils.mongo_cache import (
+    clear_cache,
+    decode_document,
+    encode_document,
+    get_cache,
+    get_cache_key,
+)
+from mongorepo.utils.mongo_session import get_session
+from mongorepo.utils.pagination import (
+    encode_page_token,
+    get_page_query,
+    get_sort,
+)
+from mongorepo.utils.projection import get_projection_converter
+from mongorepo.utils.query_filters import compile_filters
+from mongorepo.utils.write_behind import AsyncCounterBuffer, buffer_increment
+
+# Default of `value` of append methods, `None` can be appended
+_NO_VALUE: Any = object()
 
 
 class AddMethodAsync[T]:
     def __init__(
         self,
         entity_type: type[T],
-        owner: HasMongorepoDict[AsyncIOMotorClientSession, AsyncIOMotorCollection],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
         to_document_converter: ToDocumentConverter[T],
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
-        session: AsyncIOMotorClientSession | None = None,
+        session: AsyncSessionType | None = None,
+        coalescing: Coalescing | None = None,
         **kwargs,
     ) -> None:
         self.entity_type = entity_type
@@ -28,15 +106,34 @@ class AddMethodAsync[T]:
         self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
         self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
         self.to_document_converter = to_document_converter
+        self.coalescer: Coalescer[dict[str, Any], None] | None = Coalescer(
+            self._insert_many, coalescing,
+        ) if coalescing else None
         self.kwargs = kwargs
 
+    async def _insert_many(self, documents: list[dict[str, Any]]) -> list[None | BaseException]:
+        collection = self.owner.__mongorepo__['collection_provider'].provide()
+        try:
+            await collection.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            return get_bulk_write_errors(e.details, len(documents))
+        finally:
+            clear_cache(self, ids=())
+        return [None] * len(documents)
+
     async def __call__(self, entity: T) -> T:
         collection = self.owner.__mongorepo__['collection_provider'].provide()
 
         for modifier_before in self.modifiers_before:
             entity = modifier_before.modify(entity=entity)
 
-        await collection.insert_one({**self.to_document_converter(entity)}, session=self.session)
+        document = {**self.to_document_converter(entity)}
+        session = get_session(self)
+        if self.coalescer is None or session is not None:
+            await collection.insert_one(document, session=session)
+            clear_cache(self, ids=())
+        else:
+            await self.coalescer.submit(document)
 
         for modifier_after in self.modifiers_after:
             entity = modifier_after.modify(entity)
@@ -48,10 +145,11 @@ class AddBatchMethodAsync[T]:
     def __init__(
         self,
         entity_type: type[T],
-        owner: HasMongorepoDict[AsyncIOMotorClientSession, AsyncIOMotorCollection],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
         to_document_converter: ToDocumentConverter[T],
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
-        session: AsyncIOMotorClientSession | None = None,
+        session: AsyncSessionType | None = None,
+        batch: BatchInsert | None = None,
         **kwargs,
     ) -> None:
         self.entity_type = entity_type
@@ -60,17 +158,41 @@ class AddBatchMethodAsync[T]:
         self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
         self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
         self.to_document_converter = to_document_converter
+        self.batch = batch
         self.kwargs = kwargs
 
-    async def __call__(self, entity_list: list[T]) -> InsertManyResult:
+    async def __call__(
+        self, entity_list: Iterable[T] | AsyncIterable[T],
+    ) -> InsertManyResult | BatchInsertResult:
         collection = self.owner.__mongorepo__['collection_provider'].provide()
 
         for modifier_before in self.modifiers_before:
             entity_list = modifier_before.modify(entity_list=entity_list)
 
-        result = await collection.insert_many(
-            [self.to_document_converter(d) for d in entity_list], session=self.session,
-        )
+        session = get_session(self)
+        if self.batch is not None:
+            try:
+                batch_result = await insert_chunks_async(
+                    entity_list,
+                    self.to_document_converter,
+                    partial(collection.insert_many, ordered=self.batch.ordered, session=session),
+                    # Operations of a session cannot run concurrently
+                    self.batch if session is None else replace(self.batch, concurrency=1),
+                )
+            finally:
+                clear_cache(self, ids=())
+            for modifier_after in self.modifiers_after:
+                batch_result = modifier_after.modify(batch_result)
+            return batch_result
+
+        try:
+            result = await collection.insert_many(
+                [self.to_document_converter(d) for d in entity_list],  # type: ignore[union-attr]
+                session=session,
+            )
+        finally:
+            # Some documents could be inserted even if insertion failed
+            clear_cache(self, ids=())
 
         for modifier_after in self.modifiers_after:
             result = modifier_after.modify(result)
@@ -82,10 +204,12 @@ class GetAllMethodAsync[T]:
     def __init__(
         self,
         entity_type: type[T],
-        owner: HasMongorepoDict[AsyncIOMotorClientSession, AsyncIOMotorCollection],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
         to_entity_converter: ToEntityConverter[T],
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
-        session: AsyncIOMotorClientSession | None = None,
+        session: AsyncSessionType | None = None,
+        projection: Projection | None = None,
+        find_options: FindOptions | None = None,
         **kwargs,
     ) -> None:
         self.entity_type = entity_type
@@ -93,7 +217,11 @@ class GetAllMethodAsync[T]:
         self.session = session
         self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
         self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
-        self.to_entity = to_entity_converter
+        self.to_entity = to_entity_converter if projection is None else (
+            get_projection_converter(projection)
+        )
+        self.projection = projection.spec if projection is not None else None
+        self.find_options = find_options
         self.kwargs = kwargs
 
     async def __call__(self, **filters: Any) -> AsyncGenerator[T, None]:
@@ -102,9 +230,16 @@ class GetAllMethodAsync[T]:
         for modifier_before in self.modifiers_before:
             filters = modifier_before.modify(**filters)
 
-        cursor = collection.find(filters)
+        filters = compile_filters(self, filters)
+        # Partial entities are never tracked
+        snapshots = get_snapshots(self) if self.projection is None else None
+        cursor = collection.find(
+            filters, self.projection, session=get_session(self), **get_find_options(self),
+        )
         async for data in cursor:
             entity = self.to_entity(data, self.entity_type)
+            if snapshots is not None:
+                snapshots.track(entity)
 
             for modifier_after in self.modifiers_after:
                 entity = modifier_after.modify(entity)
@@ -116,10 +251,12 @@ class GetListMethodAsync[T]:
     def __init__(
         self,
         entity_type: type[T],
-        owner: HasMongorepoDict[AsyncIOMotorClientSession, AsyncIOMotorCollection],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
         to_entity_converter: ToEntityConverter[T],
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
-        session: AsyncIOMotorClientSession | None = None,
+        session: AsyncSessionType | None = None,
+        projection: Projection | None = None,
+        find_options: FindOptions | None = None,
         **kwargs,
     ) -> None:
         self.entity_type = entity_type
@@ -127,7 +264,11 @@ class GetListMethodAsync[T]:
         self.session = session
         self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
         self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
-        self.to_entity = to_entity_converter
+        self.to_entity = to_entity_converter if projection is None else (
+            get_projection_converter(projection)
+        )
+        self.projection = projection.spec if projection is not None else None
+        self.find_options = find_options
         self.kwargs = kwargs
 
     async def __call__(self, offset: int = 0, limit: int = 20, **filters: Any) -> list[T]:
@@ -138,8 +279,76 @@ class GetListMethodAsync[T]:
                 offset, limit, **filters,
             )
 
-        cursor = collection.find(filter=filters).skip(offset).limit(limit)
+        filters = compile_filters(self, filters)
+        cursor = collection.find(
+            filter=filters,
+            projection=self.projection,
+            session=get_session(self),
+            **get_find_options(self),
+        ).skip(offset).limit(limit)
         result = [self.to_entity(doc, self.entity_type) async for doc in cursor]
+        if self.projection is None:
+            track_entities(self, result)
+
+        for modifier_after in self.modifiers_after:
+            result = modifier_after.modify(result)
+
+        return result
+
+
+class GetPageMethodAsync[T]:
+    def __init__(
+        self,
+        entity_type: type[T],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
+        to_entity_converter: ToEntityConverter[T],
+        keyset: Keyset | None = None,
+        modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
+        session: AsyncSessionType | None = None,
+        find_options: FindOptions | None = None,
+        **kwargs,
+    ) -> None:
+        self.entity_type = entity_type
+        self.owner = owner
+        self.session = session
+        self.keyset = keyset or Keyset()
+        self.sort = get_sort(self.keyset)
+        self.find_options = find_options
+        self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
+        self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
+        self.kwargs = kwargs
+        self.to_entity_converter = to_entity_converter
+
+    async def __call__(self, limit: int = 20, token: str | None = None, **filters: Any) -> Page[T]:
+        collection = self.owner.__mongorepo__['collection_provider'].provide()
+
+        for modifier_before in self.modifiers_before:
+            limit, token, filters = modifier_before.modify(limit, token, **filters)
+
+        if limit < 0:
+            # `limit + 1` of zero or less would not limit the cursor at all
+            raise MongorepoException(message=f'Page limit cannot be negative, got {limit}')
+        filters = compile_filters(self, filters)
+        # One extra document shows whether the next page exists
+        cursor = collection.find(
+            get_page_query(self.keyset, filters, token),
+            sort=self.sort,
+            limit=limit + 1,
+            session=get_session(self),
+            **get_find_options(self, sort=False),
+        )
+        documents = [doc async for doc in cursor]
+        has_next = len(documents) > limit
+        documents = documents[:limit]
+        next_token = encode_page_token(
+            self.keyset, documents[-1],
+        ) if has_next and documents else None
+
+        result = Page(
+            items=[self.to_entity_converter(doc, self.entity_type) for doc in documents],
+            next_token=next_token,
+        )
+        track_entities(self, result.items)
 
         for modifier_after in self.modifiers_after:
             result = modifier_after.modify(result)
@@ -151,10 +360,12 @@ class GetMethodAsync[T]:
     def __init__(
         self,
         entity_type: type[T],
-        owner: HasMongorepoDict[AsyncIOMotorClientSession, AsyncIOMotorCollection],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
         to_entity_converter: ToEntityConverter[T],
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
-        session: AsyncIOMotorClientSession | None = None,
+        session: AsyncSessionType | None = None,
+        coalescing: Coalescing | None = None,
+        projection: Projection | None = None,
         **kwargs,
     ) -> None:
         self.entity_type = entity_type
@@ -162,17 +373,87 @@ class GetMethodAsync[T]:
         self.session = session
         self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
         self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
-        self.to_entity = to_entity_converter
+        self.to_entity = to_entity_converter if projection is None else (
+            get_projection_converter(projection)
+        )
+        self.projection = projection.spec if projection is not None else None
+        self.coalescing = coalescing
+        # One coalescer per filter field, lookups by different fields cannot share a query
+        self.coalescers: dict[str, Coalescer[Any, dict[str, Any] | None]] = {}
+        # Lookups that are queued or in progress, identical lookups share the same result
+        self.lookups: dict[tuple[str, Any], asyncio.Future[dict[str, Any] | None]] = {}
         self.kwargs = kwargs
 
+    async def _find_many(
+        self, field: str, values: list[Any],
+    ) -> list[dict[str, Any] | None | BaseException]:
+        collection = self.owner.__mongorepo__['collection_provider'].provide()
+        documents: dict[Any, dict[str, Any]] = {}
+        lookups = set(values)
+        query = {field: {'$in': list(lookups)}}
+        projection = self.projection
+        if projection is not None and projection.get(field, 0) != 1:
+            # Lookup field is needed to match documents with lookups
+            projection = {**projection, field: 1}
+        async for document in collection.find(query, projection):
+            for value in get_matched_lookups(document.get(field), lookups):
+                # Keep the first matching document as `find_one` would
+                documents.setdefault(value, document)
+        if projection is not self.projection:
+            for document in documents.values():
+                # Document of an array field may be matched by several lookups
+                document.pop(field, None)
+        return [documents.get(value, None) for value in values]
+
+    async def _find_one_coalesced(self, field: str, value: Any) -> dict[str, Any] | None:
+        key = (field, value)
+        future = self.lookups.get(key, None)
+        if future is None or future.get_loop() is not asyncio.get_running_loop():
+            if (coalescer := self.coalescers.get(field, None)) is None:
+                coalescer = self.coalescers[field] = Coalescer(
+                    partial(self._find_many, field), self.coalescing,  # type: ignore[arg-type]
+                )
+            future = self.lookups[key] = coalescer.submit(value)
+            future.add_done_callback(lambda _: self.lookups.pop(key, None))
+        # Cancellation of one caller must not cancel the lookup shared with others
+        document = await asyncio.shield(future)
+        # Converters may modify documents
+        return None if document is None else dict(document)
+
+    async def _find_one(
+        self,
+        collection: AsyncCollectionType,
+        filters: dict[str, Any],
+        session: AsyncSessionType | None,
+    ) -> dict[str, Any] | None:
+        if self.coalescing and session is None and (key := get_lookup_key(filters)):
+            return await self._find_one_coalesced(*key)
+        return await collection.find_one(filters, self.projection, session=session)
+
     async def __call__(self, **filters: Any) -> T | None:
         collection = self.owner.__mongorepo__['collection_provider'].provide()
 
         for modifier_before in self.modifiers_before:
             filters = modifier_before.modify(**filters)
 
-        result = await collection.find_one(filters)
+        filters = compile_filters(self, filters)
+        session = get_session(self)
+        # Reads in a session may see uncommitted changes, they are never cached
+        cache = get_cache(self) if session is None else None
+        cache_key = get_cache_key(filters, self.projection) if cache is not None else None
+        if cache is not None and cache_key is not None:
+            generation = cache.generation
+            hit, data = cache.get(cache_key)
+            if hit:
+                result = decode_document(data, collection)
+            else:
+                result = await self._find_one(collection, filters, session)
+                cache.set(cache_key, encode_document(result, collection), generation)
+        else:
+            result = await self._find_one(collection, filters, session)
         entity = self.to_entity(result, self.entity_type) if result else None
+        if entity is not None and self.projection is None:
+            track_entities(self, (entity,))
 
         for modifier_after in self.modifiers_after:
             entity = modifier_after.modify(entity)
@@ -184,14 +465,16 @@ class DeleteMethodAsync[T]:
     def __init__(
         self,
         entity_type: type[T],
-        owner: HasMongorepoDict[AsyncIOMotorClientSession, AsyncIOMotorCollection],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
-        session: AsyncIOMotorClientSession | None = None,
+        session: AsyncSessionType | None = None,
+        list_buckets: Iterable[tuple[Field, ListBuckets]] = (),
         **kwargs,
     ) -> None:
         self.entity_type = entity_type
         self.owner = owner
         self.session = session
+        self.list_buckets = list(list_buckets)
         self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
         self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
         self.kwargs = kwargs
@@ -202,7 +485,18 @@ class DeleteMethodAsync[T]:
         for modifier_before in self.modifiers_before:
             filters = modifier_before.modify(**filters)
 
-        deleted = await collection.find_one_and_delete(filters, session=self.session)
+        filters = compile_filters(self, filters)
+        if not self.modifiers_after and not self.list_buckets:
+            result = await collection.delete_one(filters, session=get_session(self))
+            clear_cache(self, filters)
+            return result.deleted_count > 0
+
+        # Modifiers after receive the deleted document and buckets are deleted by its `_id`,
+        # so it is fetched only for them
+        deleted = await collection.find_one_and_delete(filters, session=get_session(self))
+        clear_cache(self, ids=[deleted['_id']] if deleted else ())
+        if deleted is not None:
+            await _delete_buckets(self, collection, [deleted['_id']])
 
         for modifier_after in self.modifiers_after:
             deleted = modifier_after.modify(deleted)
@@ -210,43 +504,125 @@ class DeleteMethodAsync[T]:
         return True if deleted else False
 
 
+class DeleteManyMethodAsync[T]:
+    def __init__(
+        self,
+        entity_type: type[T],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
+        modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
+        session: AsyncSessionType | None = None,
+        list_buckets: Iterable[tuple[Field, ListBuckets]] = (),
+        **kwargs,
+    ) -> None:
+        self.entity_type = entity_type
+        self.owner = owner
+        self.session = session
+        self.list_buckets = list(list_buckets)
+        self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
+        self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
+        self.kwargs = kwargs
+
+    async def __call__(self, **filters: Any) -> int:
+        collection = self.owner.__mongorepo__['collection_provider'].provide()
+
+        for modifier_before in self.modifiers_before:
+            filters = modifier_before.modify(**filters)
+
+        filters = compile_filters(self, filters)
+        if not self.list_buckets:
+            result = await collection.delete_many(filters, session=get_session(self))
+            clear_cache(self, filters)
+            deleted_count = result.deleted_count
+        else:
+            # Documents are deleted by `_id`, so buckets are deleted only for deleted documents
+            ids = [
+                document['_id'] async for document in
+                collection.find(filters, {'_id': 1}, session=get_session(self))
+            ]
+            deleted_count = 0
+            if ids:
+                result = await collection.delete_many(
+                    {'_id': {'$in': ids}}, session=get_session(self),
+                )
+                clear_cache(self, ids=ids)
+                await _delete_buckets(self, collection, ids)
+                deleted_count = result.deleted_count
+
+        for modifier_after in self.modifiers_after:
+            deleted_count = modifier_after.modify(deleted_count)
+
+        return deleted_count
+
+
+async def _delete_buckets(
+    method: DeleteMethodAsync | DeleteManyMethodAsync,
+    collection: AsyncCollectionType,
+    ids: list[Any],
+) -> None:
+    """Deletes buckets of bucketed list fields of deleted documents"""
+    for field, options in method.list_buckets:
+        await get_buckets_collection(collection, options, field).delete_many(
+            {PARENT: {'$in': ids}}, session=get_session(method),
+        )
+
+
 class UpdateMethodAsync[T]:
     def __init__(
         self,
         entity_type: type[T],
-        owner: HasMongorepoDict[AsyncIOMotorClientSession, AsyncIOMotorCollection],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
         to_entity_converter: ToEntityConverter[T],
         to_document_converter: ToDocumentConverter[T],
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
+        session: AsyncSessionType | None = None,
         **kwargs,
     ) -> None:
         self.entity_type = entity_type
         self.owner = owner
-        self.session: AsyncIOMotorClientSession | None = None
+        self.session = session
         self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
         self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
         self.to_document_converter = to_document_converter
         self.to_entity_converter = to_entity_converter
         self.kwargs = kwargs
 
-    async def __call__(self, entity: T, **filters: Any) -> T | None:
+    async def __call__(
+        self, entity: T, update_fields: Iterable[str] | None = None, **filters: Any,
+    ) -> T | None:
         collection = self.owner.__mongorepo__['collection_provider'].provide()
 
         for modifier_before in self.modifiers_before:
             entity, filters = modifier_before.modify(entity=entity, **filters)
 
-        data: dict[str, dict[str, Any]] = {'$set': {}}
-        for field, value in self.to_document_converter(entity).items():
-            data['$set'][field] = value
-
-        updated_document: dict[str, Any] | None = await collection.find_one_and_update(
-            filter=filters, update=data, return_document=True, session=self.session,
+        filters = compile_filters(self, filters)
+        document = self.to_document_converter(entity)
+        snapshots = get_snapshots(self)
+        data = get_update(
+            document,
+            snapshot=snapshots.get(entity) if snapshots is not None else None,
+            update_fields=update_fields,
         )
 
+        updated_document: dict[str, Any] | None
+        if data:
+            updated_document = await collection.find_one_and_update(
+                filter=filters, update=data, return_document=True, session=get_session(self),
+            )
+            clear_cache(self, ids=[updated_document['_id']] if updated_document else ())
+        else:
+            # Nothing changed since the entity was loaded
+            updated_document = await collection.find_one(filters, session=get_session(self))
+
         result = self.to_entity_converter(
             updated_document, self.entity_type,
         ) if updated_document else None
 
+        if snapshots is not None and result is not None:
+            # Fields that were not in `update_fields` may differ from the stored ones
+            if update_fields is None:
+                snapshots.track(entity, document)
+            snapshots.track(result)
+
         for modifier_after in self.modifiers_after:
             result = modifier_after.modify(result)
 
@@ -257,11 +633,11 @@ class UpdateListFieldMethodAsync[T]:
     def __init__(
         self,
         entity_type: type[T],
-        owner: HasMongorepoDict[AsyncIOMotorClientSession, AsyncIOMotorCollection],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
         target_field: Field,
         action: Literal['$push', '$pull'],
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
-        session: AsyncIOMotorClientSession | None = None,
+        session: AsyncSessionType | None = None,
         **kwargs,
     ) -> None:
         self.entity_type = entity_type
@@ -279,11 +655,13 @@ class UpdateListFieldMethodAsync[T]:
         for modifier_before in self.modifiers_before:
             value, filters = modifier_before.modify(value, **filters)
 
+        filters = compile_filters(self, filters)
         res = await collection.update_one(
             filter=filters,
             update={self.action: {self.target_field.name: self.target_field.to_document(value)}},
-            session=self.session,
+            session=get_session(self),
         )
+        clear_cache(self, filters)
 
         for modifier_aftert in self.modifiers_after:
             res = modifier_aftert.modify(res)
@@ -295,10 +673,11 @@ class AppendListMethodAsync[T](UpdateListFieldMethodAsync[T]):
     def __init__(
         self,
         entity_type: type[T],
-        owner: HasMongorepoDict[AsyncIOMotorClientSession, AsyncIOMotorCollection],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
         target_field: Field,
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
-        session: AsyncIOMotorClientSession | None = None,
+        session: AsyncSessionType | None = None,
+        append: ListAppend | None = None,
         **kwargs,
     ) -> None:
         super().__init__(
@@ -310,19 +689,45 @@ class AppendListMethodAsync[T](UpdateListFieldMethodAsync[T]):
             session=session,
             **kwargs,
         )
+        self.append = append
 
-    async def __call__(self, value: Any, **filters: Any) -> UpdateResult:
-        return await super().__call__(value, **filters)
+    async def __call__(
+        self, value: Any = _NO_VALUE, values: Iterable[Any] | None = None, **filters: Any,
+    ) -> UpdateResult:
+        if (value is _NO_VALUE) == (values is None):
+            raise MongorepoException(message='Pass either value or values to append')
+        if values is None and self.append is None:
+            return await super().__call__(value, **filters)
+
+        collection = self.owner.__mongorepo__['collection_provider'].provide()
+        # Modifiers receive the argument the method was called with, as without `append` options
+        argument = values if values is not None else value
+        for modifier_before in self.modifiers_before:
+            argument, filters = modifier_before.modify(argument, **filters)
+        items = argument if values is not None else [argument]
+
+        filters = compile_filters(self, filters)
+        res = await collection.update_one(
+            filter=filters,
+            update=get_append_update(self.target_field, items, self.append),
+            session=get_session(self),
+        )
+        clear_cache(self, filters)
+
+        for modifier_after in self.modifiers_after:
+            res = modifier_after.modify(res)
+
+        return res
 
 
 class RemoveListMethodAsync[T](UpdateListFieldMethodAsync[T]):
     def __init__(
         self,
         entity_type: type[T],
-        owner: HasMongorepoDict[AsyncIOMotorClientSession, AsyncIOMotorCollection],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
         target_field: Field,
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
-        session: AsyncIOMotorClientSession | None = None,
+        session: AsyncSessionType | None = None,
         **kwargs,
     ) -> None:
         super().__init__(
@@ -343,10 +748,10 @@ class GetListValuesMethodAsync[T]:
     def __init__(
         self,
         entity_type: type[T],
-        owner: HasMongorepoDict[AsyncIOMotorClientSession, AsyncIOMotorCollection],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
         target_field: Field,
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
-        session: AsyncIOMotorClientSession | None = None,
+        session: AsyncSessionType | None = None,
         **kwargs,
     ) -> None:
         self.entity_type = entity_type
@@ -367,8 +772,11 @@ class GetListValuesMethodAsync[T]:
                 offset, limit, **filters,
             )
 
+        filters = compile_filters(self, filters)
         document = await collection.find_one(
-            filters, {self.target_field.name: {'$slice': [offset, limit]}},
+            filters,
+            {self.target_field.name: {'$slice': [offset, limit]}},
+            session=get_session(self),
         )
         if document is None:
             result = None
@@ -388,10 +796,10 @@ class PopListMethodAsync[T]:
     def __init__(
         self,
         entity_type: type[T],
-        owner: HasMongorepoDict[AsyncIOMotorClientSession, AsyncIOMotorCollection],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
         target_field: Field,
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
-        session: AsyncIOMotorClientSession | None = None,
+        session: AsyncSessionType | None = None,
         **kwargs,
     ) -> None:
         self.entity_type = entity_type
@@ -409,9 +817,11 @@ class PopListMethodAsync[T]:
         for modifier_before in self.modifiers_before:
             filters = modifier_before.modify(**filters)
 
+        filters = compile_filters(self, filters)
         document = await collection.find_one_and_update(
-            filter=filters, update={'$pop': {self.target_field.name: 1}}, session=self.session,
+            filter=filters, update={'$pop': {self.target_field.name: 1}}, session=get_session(self),
         )
+        clear_cache(self, ids=[document['_id']] if document else ())
         if document is None:
             result = None
         else:
@@ -423,37 +833,297 @@ class PopListMethodAsync[T]:
         return result
 
 
+class _BucketListMethodAsync[T]:
+    """Base of methods of list fields stored in buckets, see
+    :class:`mongorepo.types.ListBuckets`."""
+
+    def __init__(
+        self,
+        entity_type: type[T],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
+        target_field: Field,
+        buckets: ListBuckets,
+        modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
+        session: AsyncSessionType | None = None,
+        **kwargs,
+    ) -> None:
+        self.entity_type = entity_type
+        self.owner = owner
+        self.target_field = target_field
+        self.buckets = buckets
+        self.session = session
+        self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
+        self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
+        self.kwargs = kwargs
+        self._indexed: Any = None
+
+    async def _get_parent_id(
+        self, collection: AsyncCollectionType, filters: dict[str, Any],
+    ) -> Any:
+        document = await collection.find_one(filters, {'_id': 1}, session=get_session(self))
+        return document['_id'] if document is not None else None
+
+    async def _get_buckets(self, collection: AsyncCollectionType) -> AsyncCollectionType:
+        buckets = get_buckets_collection(collection, self.buckets, self.target_field)
+        if self._indexed is None or self._indexed != buckets:
+            await buckets.create_index(BUCKETS_INDEX, unique=True)
+            self._indexed = buckets
+        return buckets
+
+
+class AppendBucketListMethodAsync[T](_BucketListMethodAsync[T]):
+    async def __call__(
+        self, value: Any = _NO_VALUE, values: Iterable[Any] | None = None, **filters: Any,
+    ) -> UpdateResult | None:
+        if (value is _NO_VALUE) == (values is None):
+            raise MongorepoException(message='Pass either value or values to append')
+        collection = self.owner.__mongorepo__['collection_provider'].provide()
+        items = values if values is not None else [value]
+
+        for modifier_before in self.modifiers_before:
+            items, filters = modifier_before.modify(items, **filters)
+
+        filters = compile_filters(self, filters)
+        result: UpdateResult | None = None
+        if (parent_id := await self._get_parent_id(collection, filters)) is not None:
+            buckets = await self._get_buckets(collection)
+            documents = self.target_field.to_documents(items)
+            size, start = self.buckets.bucket_size, 0
+            while start < len(documents):
+                last_bucket = await buckets.find_one(
+                    **get_last_bucket_query(parent_id), session=get_session(self),
+                )
+                seq, free = get_next_bucket(last_bucket, size)
+                chunk = documents[start:start + free]
+                try:
+                    result = await buckets.update_one(
+                        **get_append_bucket_update(parent_id, seq, size, chunk),
+                        session=get_session(self),
+                    )
+                except DuplicateKeyError:
+                    # Concurrent append filled the bucket, find the last bucket again
+                    continue
+                start += len(chunk)
+
+        for modifier_after in self.modifiers_after:
+            result = modifier_after.modify(result)
+
+        return result
+
+
+class RemoveBucketListMethodAsync[T](_BucketListMethodAsync[T]):
+    """Removes all elements equal to `value` and returns their number, buckets
+    from the first one that holds `value` to the end of the list are
+    rewritten with one `bulk_write`, so all buckets but the last one stay
+    full. The rewrite is not atomic with concurrent writes of the same list."""
+
+    async def __call__(self, value: Any, **filters: Any) -> int | None:
+        collection = self.owner.__mongorepo__['collection_provider'].provide()
+
+        for modifier_before in self.modifiers_before:
+            value, filters = modifier_before.modify(value, **filters)
+
+        filters = compile_filters(self, filters)
+        result: int | None = None
+        if (parent_id := await self._get_parent_id(collection, filters)) is not None:
+            buckets = await self._get_buckets(collection)
+            document = self.target_field.to_document(value)
+            result = 0
+            first = await buckets.find_one(
+                **get_remove_query(parent_id, document), session=get_session(self),
+            )
+            if first is not None:
+                tail = [
+                    bucket async for bucket in buckets.find(
+                        **get_tail_query(parent_id, first[SEQ]), session=get_session(self),
+                    )
+                ]
+                result, requests = get_remove_requests(
+                    tail, document, self.buckets.bucket_size,
+                )
+                await buckets.bulk_write(requests, session=get_session(self))
+
+        for modifier_after in self.modifiers_after:
+            result = modifier_after.modify(result)
+
+        return result
+
+
+class GetBucketListValuesMethodAsync[T](_BucketListMethodAsync[T]):
+    async def __call__(
+        self, offset: int = 0, limit: int = 20, **filters: Any,
+    ) -> list[T] | list[Any] | None:
+        collection = self.owner.__mongorepo__['collection_provider'].provide()
+
+        for modifier_before in self.modifiers_before:
+            offset, limit, filters = modifier_before.modify(offset, limit, **filters)
+
+        filters = compile_filters(self, filters)
+        result: list[Any] | None = None
+        if (parent_id := await self._get_parent_id(collection, filters)) is not None:
+            buckets = await self._get_buckets(collection)
+            size = self.buckets.bucket_size
+            if offset < 0:
+                # Same as `$slice`, negative offset is counted from the end of the list
+                last_bucket = await buckets.find_one(
+                    **get_last_bucket_query(parent_id), session=get_session(self),
+                )
+                offset = max(get_length(last_bucket, size) + offset, 0)
+            result = []
+            if limit > 0:
+                page = [
+                    bucket async for bucket in buckets.find(
+                        **get_bucket_page_query(parent_id, offset, limit, size),
+                        session=get_session(self),
+                    )
+                ]
+                result = [
+                    self.target_field.to_value(doc)
+                    for doc in get_bucket_page(page, offset, limit, size)
+                ]
+
+        for modifier_after in self.modifiers_after:
+            result = modifier_after.modify(result)
+
+        return result
+
+
+class PopBucketListMethodAsync[T](_BucketListMethodAsync[T]):
+    async def __call__(self, **filters: Any) -> T | Any:
+        collection = self.owner.__mongorepo__['collection_provider'].provide()
+
+        for modifier_before in self.modifiers_before:
+            filters = modifier_before.modify(**filters)
+
+        filters = compile_filters(self, filters)
+        result = None
+        if (parent_id := await self._get_parent_id(collection, filters)) is not None:
+            buckets = await self._get_buckets(collection)
+            bucket = await buckets.find_one_and_update(
+                **get_pop_query(parent_id), session=get_session(self),
+            )
+            if bucket is not None:
+                if bucket[COUNT] == 1:
+                    # Empty buckets are removed together with ones a failed pop left behind,
+                    # lookups of the last bucket skip them until then
+                    await buckets.delete_many(
+                        get_empty_buckets_filter(parent_id, bucket[SEQ]),
+                        session=get_session(self),
+                    )
+                result = self.target_field.to_value(bucket[ITEMS][-1])
+
+        for modifier_after in self.modifiers_after:
+            result = modifier_after.modify(result)
+
+        return result
+
+
 class IncrementIntegerFieldMethodAsync[T]:
     def __init__(
         self,
         entity_type: type[T],
-        owner: HasMongorepoDict[AsyncIOMotorClientSession, AsyncIOMotorCollection],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
         target_field: Field,
         weight: int = 1,
         modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
-        session: AsyncIOMotorClientSession | None = None,
+        session: AsyncSessionType | None = None,
+        write_behind: WriteBehind | None = None,
+        return_value: bool = False,
         **kwargs,
     ) -> None:
+        self.entity_type = entity_type
         self.target_field = target_field
         self.owner = owner
         self.weight = weight
         self.session = session
+        if write_behind is not None and return_value:
+            raise MongorepoException(
+                message='Increments buffered with write_behind cannot return new values',
+            )
+        self.write_behind = write_behind
+        self.return_value = return_value
         self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
         self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
         self.kwargs = kwargs
 
-    async def __call__(self, weight: int | None = None, **filters) -> UpdateResult:
+    async def __call__(self, weight: int | None = None, **filters) -> UpdateResult | int | None:
         collection = self.owner.__mongorepo__['collection_provider'].provide()
 
         for modifier_before in self.modifiers_before:
             weight, filters = modifier_before.modify(weight, **filters)
 
+        filters = compile_filters(self, filters)
         w = weight if weight is not None else self.weight
-        result = await collection.update_one(
-            filter=filters, update={'$inc': {self.target_field.name: w}}, session=self.session,
-        )
+        result: UpdateResult | int | None = None
+        if self.return_value:
+            # Only the counter is projected, the new value comes back in the same round trip
+            document = await collection.find_one_and_update(
+                filter=filters,
+                update={'$inc': {self.target_field.name: w}},
+                projection={self.target_field.name: 1, '_id': 0},
+                return_document=True,
+                session=get_session(self),
+            )
+            clear_cache(self, filters)
+            result = document[self.target_field.name] if document is not None else None
+        elif self.write_behind is None or not buffer_increment(
+            self, AsyncCounterBuffer, self.write_behind, filters, self.target_field.name, w,
+        ):
+            result = await collection.update_one(
+                filter=filters,
+                update={'$inc': {self.target_field.name: w}},
+                session=get_session(self),
+            )
+            clear_cache(self, filters)
 
         for modifier_aftert in self.modifiers_after:
             result = modifier_aftert.modify(result)
 
         return result
+
+
+class IncrementManyMethodAsync[T]:
+    def __init__(
+        self,
+        entity_type: type[T],
+        owner: HasMongorepoDict[AsyncSessionType, AsyncCollectionType],
+        fields: Iterable[str],
+        chunk_size: int = MAX_WRITE_BATCH_SIZE,
+        modifiers: tuple[ModifierBefore | ModifierAfter, ...] = (),
+        session: AsyncSessionType | None = None,
+        **kwargs,
+    ) -> None:
+        self.entity_type = entity_type
+        self.owner = owner
+        self.fields = frozenset(fields)
+        self.chunk_size = chunk_size
+        self.session = session
+        self.modifiers_after = [m for m in modifiers if isinstance(m, ModifierAfter)]
+        self.modifiers_before = [m for m in modifiers if isinstance(m, ModifierBefore)]
+        self.kwargs = kwargs
+
+    async def __call__(self, increments: Increments, by: str | None = None) -> BulkIncrementResult:
+        collection = self.owner.__mongorepo__['collection_provider'].provide()
+
+        for modifier_before in self.modifiers_before:
+            increments, by = modifier_before.modify(increments, by)
+
+        result = BulkIncrementResult()
+        try:
+            for chunk in iter_increment_chunks(
+                self, increments, by, self.fields, self.chunk_size,
+            ):
+                try:
+                    bulk_result = await collection.bulk_write(
+                        chunk, ordered=False, session=get_session(self),
+                    )
+                except PyMongoError as e:
+                    raise get_bulk_error(result, e) from e
+                add_bulk_result(result, bulk_result)
+        finally:
+            clear_cache(self)
+
+        for modifier_after in self.modifiers_after:
+            result = modifier_after.modify(result)
+
+        return result
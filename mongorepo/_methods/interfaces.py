@@ -5,8 +5,12 @@ from mongorepo.types.base import Dataclass, SessionType
 if t.TYPE_CHECKING:
     from pymongo.results import InsertManyResult, UpdateResult
 
+    from mongorepo.types.batch import BatchInsertResult
+    from mongorepo.types.pagination import Page
+
 
 class MongorepoMethod(t.Protocol[SessionType]):
+    owner: t.Any
     session: SessionType | None
 
 
@@ -31,12 +35,16 @@ class IAddMethodAsync[T: Dataclass](t.Protocol):
 
 
 class IAddBatchMethod[T: Dataclass](t.Protocol):
-    def __call__(self, entity_list: list[T]) -> 'InsertManyResult':
+    def __call__(
+        self, entity_list: t.Iterable[T],
+    ) -> 'InsertManyResult | BatchInsertResult':
         ...
 
 
 class IAddBatchMethodAsync[T: Dataclass](t.Protocol):
-    async def __call__(self, entity_list: list[T]) -> 'InsertManyResult':
+    async def __call__(
+        self, entity_list: t.Iterable[T] | t.AsyncIterable[T],
+    ) -> 'InsertManyResult | BatchInsertResult':
         ...
 
 
@@ -60,6 +68,18 @@ class IGetListMethodAsync[T: Dataclass](t.Protocol):
         ...
 
 
+class IGetPageMethod[T: Dataclass](t.Protocol):
+    def __call__(self, limit: int = 20, token: str | None = None, **filters: t.Any) -> 'Page[T]':
+        ...
+
+
+class IGetPageMethodAsync[T: Dataclass](t.Protocol):
+    async def __call__(
+        self, limit: int = 20, token: str | None = None, **filters: t.Any,
+    ) -> 'Page[T]':
+        ...
+
+
 class IDeleteMethod(t.Protocol):
     def __call__(self, **filters: t.Any) -> bool:
         ...
@@ -70,13 +90,27 @@ class IDeleteMethodAsync(t.Protocol):
         ...
 
 
+class IDeleteManyMethod(t.Protocol):
+    def __call__(self, **filters: t.Any) -> int:
+        ...
+
+
+class IDeleteManyMethodAsync(t.Protocol):
+    async def __call__(self, **filters: t.Any) -> int:
+        ...
+
+
 class IUpdateMethod[T: Dataclass](t.Protocol):
-    def __call__(self, entity: T, **filters: t.Any) -> T | None:
+    def __call__(
+        self, entity: T, update_fields: t.Iterable[str] | None = None, **filters: t.Any,
+    ) -> T | None:
         ...
 
 
 class IUpdateMethodAsync[T: Dataclass](t.Protocol):
-    async def __call__(self, entity: T, **filters: t.Any) -> T | None:
+    async def __call__(
+        self, entity: T, update_fields: t.Iterable[str] | None = None, **filters: t.Any,
+    ) -> T | None:
         ...
 
 
@@ -115,10 +149,10 @@ class IGetListValuesMethodAsync[T](t.Protocol):
 
 
 class IIncrementIntegerFieldMethod(t.Protocol):
-    def __call__(self, weight: int | None = None, **filters) -> 'UpdateResult':
+    def __call__(self, weight: int | None = None, **filters) -> 'UpdateResult | int | None':
         ...
 
 
 class IIncrementIntegerFieldMethodAsync(t.Protocol):
-    async def __call__(self, weight: int | None = None, **filters) -> 'UpdateResult':
+    async def __call__(self, weight: int | None = None, **filters) -> 'UpdateResult | int | None':
         ...
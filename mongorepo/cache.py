@@ -0,0 +1,106 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from mongorepo.types.cache import CacheStats
+
+
+class LRUCache:
+    """In-memory cache of mongorepo `get` methods with LRU eviction and
+    optional TTL.
+
+    Every write made through the repository (`add`, `update`, `delete`,
+    `incr__*`, `{field}__append`, ...) removes cached misses and cached
+    documents it may have modified, inserts keep cached documents (the cache
+    is cleared after transactions that wrote through the repository are
+    finished). Writes made by other processes become visible after `ttl`
+    seconds.
+    ### Usage example:
+    ```
+    @repository(
+        config=RepositoryConfig(
+            entity_type=User,
+            collection=users,
+            cache=LRUCache(max_size=10_000, ttl=30),
+        ),
+    )
+    class UserRepository:
+        ...
+
+    repo = UserRepository()
+    repo.get(username='admin')  # queries MongoDB
+    repo.get(username='admin')  # returns cached entity
+    print(repo.__mongorepo__['cache'].stats)  # CacheStats(hits=1, misses=1, ...)
+    ```
+
+    Use separate cache instance for every repository.
+
+    """
+
+    def __init__(
+        self, max_size: int = 1024, ttl: float | None = None, cache_missing: bool = True,
+    ) -> None:
+        """
+        Args:
+            max_size: maximum number of cached lookups.
+            ttl: time in seconds after which cached lookups expire, `None` means never.
+            cache_missing: cache lookups that did not find a document.
+
+        """
+        if max_size < 1:
+            raise ValueError('max_size must be positive')
+        self.max_size = max_size
+        self.ttl = ttl
+        self.cache_missing = cache_missing
+        self.stats = CacheStats()
+        self.generation = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return True, value
+                del self._entries[key]
+                self.stats.expirations += 1
+            self.stats.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, value: Any, generation: int) -> None:
+        if value is None and not self.cache_missing:
+            return
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            # Value was read before the cache was invalidated
+            if generation != self.generation:
+                return
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+            self.stats.invalidations += 1
+
+    def invalidate(self, match: Callable[[Any], bool]) -> None:
+        with self._lock:
+            stale = [
+                key for key, (value, _) in self._entries.items() if value is None or match(value)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.generation += 1
+            self.stats.invalidations += 1
@@ -1,23 +1,37 @@
-from typing import Callable, Iterable
+from typing import Callable, Iterable, Mapping
 
 from mongorepo._handlers import (
     _handle_async_mongo_repository,
     _handle_mongo_repository,
 )
-from mongorepo.types import RepositoryConfig
+from mongorepo.types import (
+    BatchInsert,
+    Coalescing,
+    Keyset,
+    ListAppend,
+    ListBuckets,
+    Projection,
+    RepositoryConfig,
+    WriteBehind,
+)
 
 
 def mongo_repository(
     config: RepositoryConfig,
     add: bool = True,
-    add_batch: bool = True,
+    add_batch: bool | BatchInsert = True,
     get: bool = True,
     get_all: bool = True,
     get_list: bool = True,
     update: bool = True,
     delete: bool = True,
     integer_fields: Iterable[str] | None = None,
-    list_fields: Iterable[str] | None = None,
+    list_fields: Iterable[str] | Mapping[str, ListAppend | ListBuckets] | None = None,
+    get_page: bool | Keyset = False,
+    delete_many: bool = False,
+    projections: Mapping[str, Projection] | None = None,
+    write_behind: WriteBehind | None = None,
+    return_incremented: bool = False,
 ) -> type | Callable:
     """Decorator for creating a synchronous MongoDB repository.
 
@@ -26,20 +40,57 @@ def mongo_repository(
 
     ## Parameters:
     - `add` (bool): Enables the `add` method to insert a document (default: True).
-    - `add_batch` (bool): Enables batch insertion of multiple documents (default: True).
+    - `add_batch` (bool | BatchInsert): Enables batch insertion of multiple documents. Pass
+      `BatchInsert` to accept any iterable of entities and insert it lazily by chunks,
+      the method then returns `BatchInsertResult` with inserted count and errors of failed
+      chunks (default: True).
     - `get` (bool): Enables retrieval of a single document by filters (default: True).
     - `get_list` (bool): Enables retrieval of multiple documents with pagination (default: True).
+    - `get_page` (bool | Keyset): Enables `get_page(limit, token, **filters)` that paginates
+      with keyset (cursor-based) pagination and returns `Page` of entities with continuation
+      token of the next page. Pass `Keyset` to change sort key, `_id` is used by default
+      (default: False).
     - `get_all` (bool): Enables retrieval of all documents (default: True).
-    - `update` (bool): Enables document updates (default: True).
+    - `update` (bool): Enables document updates, `update(entity, update_fields=None, **filters)`
+      updates only `update_fields` if they are passed (default: True).
     - `delete` (bool): Enables document deletion (default: True).
+    - `delete_many` (bool): Enables `delete_many(**filters)` that deletes all matching
+      documents and returns their number (default: False).
     - `integer_fields` (Iterable[str], optional): Fields that support atomic increment/decrement:
       - `increment__{field}`: Increments the field.
       - `decrement__{field}`: Decrements the field.
-    - `list_fields` (Iterable[str], optional): Fields treated as lists, enabling:
-      - `{field}__append`: Appends an item to the list.
+      - `incr_many(increments, by=None)`: Increments several fields of many documents with
+        `bulk_write` commands of `$inc` updates, `increments` are `(filters, {field: delta})`
+        pairs or, if `by` field is passed, a mapping of its values to `{field: delta}`.
+        Returns `BulkIncrementResult` with matched and modified counts, if a chunk fails
+        `BulkIncrementException` with the result of applied increments is raised.
+    - `write_behind` (WriteBehind, optional): Buffers increments of `integer_fields` in memory
+      and writes them with a single `bulk_write` per flush, see `WriteBehind` for flush
+      triggers and durability. Buffered calls return `None` (default: None).
+    - `return_incremented` (bool): `incr__{field}`/`decr__{field}` return the new value of the
+      field (or `None` if no document matched) instead of `UpdateResult`, the value is
+      returned by `find_one_and_update` in the same round trip. Cannot be combined with
+      `write_behind` (default: False).
+    - `list_fields` (Iterable[str] | Mapping[str, ListAppend | ListBuckets], optional):
+      Fields treated as lists, pass a mapping of fields to `ListAppend` to cap, sort or
+      deduplicate appended values, or to `ListBuckets` to store unbounded lists in bucket
+      documents of a side collection, deleted together with the entity document:
+      - `{field}__append`: Appends an item to the list, `{field}__append(values=[...])`
+        appends many items with one update.
       - `{field}__remove`: Removes an item from the list.
       - `{field}__pop`: Pops an item from the list.
       - `{field}__list`: Retrieves the list field values.
+    - `projections` (Mapping[str, Projection], optional): Named projections, only projected
+      fields are fetched from the server and documents are converted into lightweight
+      `Projection.entity_type` entities (or returned as dictionaries):
+      - `get__{name}`: Retrieves a single projected document by filters.
+      - `get_list__{name}`: Retrieves projected documents with pagination.
+      - `get_all__{name}`: Retrieves all projected documents.
+
+    ## Filters:
+    Keyword filters of all methods are field names, `__` separates nested fields and
+    operator suffixes (`gt`, `gte`, `lt`, `lte`, `ne`, `in`, `nin`, `all`, `exists`, `size`,
+    `regex`), e.g. `get_list(age__gte=18, address__city='Paris', tags__in=['a', 'b'])`.
 
     ## Example Usage:
     ```python
@@ -69,6 +120,11 @@ def mongo_repository(
             get=get,
             integer_fields=integer_fields,
             list_fields=list_fields,
+            get_page=get_page,
+            delete_many=delete_many,
+            projections=projections,
+            write_behind=write_behind,
+            return_incremented=return_incremented,
         )
 
     return wrapper
@@ -76,37 +132,85 @@ def mongo_repository(
 
 def async_mongo_repository(
     config: RepositoryConfig,
-    add: bool = True,
-    add_batch: bool = True,
-    get: bool = True,
+    add: bool | Coalescing = True,
+    add_batch: bool | BatchInsert = True,
+    get: bool | Coalescing = True,
     get_list: bool = True,
     get_all: bool = True,
     update: bool = True,
     delete: bool = True,
     integer_fields: list[str] | None = None,
-    list_fields: list[str] | None = None,
+    list_fields: list[str] | Mapping[str, ListAppend | ListBuckets] | None = None,
+    get_page: bool | Keyset = False,
+    delete_many: bool = False,
+    projections: Mapping[str, Projection] | None = None,
+    write_behind: WriteBehind | None = None,
+    return_incremented: bool = False,
 ) -> type | Callable:
     """Decorator for creating an asynchronous MongoDB repository.
 
     This decorator enhances a class with common repository methods for handling
-    MongoDB collections using `motor`'s `AsyncIOMotorCollection`.
+    MongoDB collections using `motor`'s `AsyncIOMotorCollection` or `pymongo`'s native
+    `AsyncCollection` (`pymongo.AsyncMongoClient`).
 
     ## Parameters:
-    - `add` (bool): Enables the `add` method to insert a document (default: True).
-    - `add_batch` (bool): Enables batch insertion of multiple documents (default: True).
-    - `get` (bool): Enables retrieval of a single document by filters (default: True).
+    - `add` (bool | Coalescing): Enables the `add` method to insert a document. Pass
+      `Coalescing` to insert documents of concurrent `add` calls with a single unordered
+      `insert_many`, every call still raises its own error (default: True).
+    - `add_batch` (bool | BatchInsert): Enables batch insertion of multiple documents. Pass
+      `BatchInsert` to accept any iterable or asynchronous iterable of entities and insert
+      it lazily by chunks, up to `concurrency` chunks at once. The method then returns
+      `BatchInsertResult` with inserted count and errors of failed chunks (default: True).
+    - `get` (bool | Coalescing): Enables retrieval of a single document by filters. Pass
+      `Coalescing` to batch concurrent lookups by a single field (e.g. `get(id=...)`) into
+      one `find({field: {'$in': [...]}})`, identical concurrent lookups share one result
+      (default: True).
     - `get_list` (bool): Enables retrieval of multiple documents with pagination (default: True).
+    - `get_page` (bool | Keyset): Enables `get_page(limit, token, **filters)` that paginates
+      with keyset (cursor-based) pagination and returns `Page` of entities with continuation
+      token of the next page. Pass `Keyset` to change sort key, `_id` is used by default
+      (default: False).
     - `get_all` (bool): Enables retrieval of all documents (default: True).
-    - `update` (bool): Enables document updates (default: True).
+    - `update` (bool): Enables document updates, `update(entity, update_fields=None, **filters)`
+      updates only `update_fields` if they are passed (default: True).
     - `delete` (bool): Enables document deletion (default: True).
+    - `delete_many` (bool): Enables `delete_many(**filters)` that deletes all matching
+      documents and returns their number (default: False).
     - `integer_fields` (list[str], optional): Fields that support atomic increment/decrement:
       - `incr__{field}`: Increments the field.
       - `decr__{field}`: Decrements the field.
-    - `list_fields` (list[str], optional): Fields treated as lists, enabling:
-      - `{field}__append`: Appends an item to the list.
+      - `incr_many(increments, by=None)`: Increments several fields of many documents with
+        `bulk_write` commands of `$inc` updates, `increments` are `(filters, {field: delta})`
+        pairs or, if `by` field is passed, a mapping of its values to `{field: delta}`.
+        Returns `BulkIncrementResult` with matched and modified counts, if a chunk fails
+        `BulkIncrementException` with the result of applied increments is raised.
+    - `write_behind` (WriteBehind, optional): Buffers increments of `integer_fields` in memory
+      and writes them with a single `bulk_write` per flush, see `WriteBehind` for flush
+      triggers and durability. Buffered calls return `None` (default: None).
+    - `return_incremented` (bool): `incr__{field}`/`decr__{field}` return the new value of the
+      field (or `None` if no document matched) instead of `UpdateResult`, the value is
+      returned by `find_one_and_update` in the same round trip. Cannot be combined with
+      `write_behind` (default: False).
+    - `list_fields` (list[str] | Mapping[str, ListAppend | ListBuckets], optional):
+      Fields treated as lists, pass a mapping of fields to `ListAppend` to cap, sort or
+      deduplicate appended values, or to `ListBuckets` to store unbounded lists in bucket
+      documents of a side collection, deleted together with the entity document:
+      - `{field}__append`: Appends an item to the list, `{field}__append(values=[...])`
+        appends many items with one update.
       - `{field}__remove`: Removes an item from the list.
       - `{field}__pop`: Pops an item from the list.
       - `{field}__list`: Retrieves the list field values.
+    - `projections` (Mapping[str, Projection], optional): Named projections, only projected
+      fields are fetched from the server and documents are converted into lightweight
+      `Projection.entity_type` entities (or returned as dictionaries):
+      - `get__{name}`: Retrieves a single projected document by filters.
+      - `get_list__{name}`: Retrieves projected documents with pagination.
+      - `get_all__{name}`: Retrieves all projected documents.
+
+    ## Filters:
+    Keyword filters of all methods are field names, `__` separates nested fields and
+    operator suffixes (`gt`, `gte`, `lt`, `lte`, `ne`, `in`, `nin`, `all`, `exists`, `size`,
+    `regex`), e.g. `get_list(age__gte=18, address__city='Paris', tags__in=['a', 'b'])`.
 
     ## Example Usage:
     ```python
@@ -135,6 +239,11 @@ def async_mongo_repository(
             add_batch=add_batch,
             integer_fields=integer_fields,
             list_fields=list_fields,
+            get_page=get_page,
+            delete_many=delete_many,
+            projections=projections,
+            write_behind=write_behind,
+            return_incremented=return_incremented,
         )
 
     return wrapper
@@ -1,4 +1,7 @@
-from typing import NoReturn
+from typing import TYPE_CHECKING, NoReturn
+
+if TYPE_CHECKING:
+    from mongorepo.types.batch import BatchInsertResult, BulkIncrementResult
 
 
 def raise_exc(exc: Exception | type[Exception]) -> NoReturn:
@@ -94,3 +97,48 @@ class InvalidActionException(MongorepoException):
         return (
             self.message or f'Invalid method action: {self.action}\nValid are: {self.valid_actions}'
         )
+
+
+class InvalidPageTokenException(MongorepoException):
+    def __init__(self, token: str, message: str | None = None):
+        self.message = message
+        self.token = token
+
+    def __str__(self) -> str:
+        return self.message or f'Invalid page token: {self.token!r}'
+
+
+class InvalidFilterException(MongorepoException):
+    def __init__(self, filter_key: str, message: str | None = None):
+        self.message = message
+        self.filter_key = filter_key
+
+    def __str__(self) -> str:
+        return self.message or f'Invalid filter: {self.filter_key!r}'
+
+
+class BatchInsertException(MongorepoException):
+    def __init__(self, result: 'BatchInsertResult', message: str | None = None):
+        self.message = message
+        self.result = result
+
+    def __str__(self) -> str:
+        return self.message or (
+            f'Batch insert stopped after {self.result.chunk_count} chunks, '
+            f'{self.result.inserted_count} entities were inserted'
+        )
+
+
+class BulkIncrementException(MongorepoException):
+    """Raised when a chunk of `incr_many` fails, `result` counts the
+    increments that were applied before."""
+
+    def __init__(self, result: 'BulkIncrementResult', message: str | None = None):
+        self.message = message
+        self.result = result
+
+    def __str__(self) -> str:
+        return self.message or (
+            f'Bulk increment stopped at chunk {self.result.chunk_count}, '
+            f'{self.result.modified_count} documents were modified'
+        )
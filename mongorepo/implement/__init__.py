@@ -2,6 +2,7 @@ from .decorator import implement
 from .methods import (
     AddBatchMethod,
     AddMethod,
+    DeleteManyMethod,
     DeleteMethod,
     GetAllMethod,
     GetListMethod,
@@ -21,6 +22,7 @@ __all__ = [
     'AddBatchMethod',
     'AddMethod',
     'DeleteMethod',
+    'DeleteManyMethod',
     'GetAllMethod',
     'GetListMethod',
     'GetMethod',
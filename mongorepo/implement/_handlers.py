@@ -4,6 +4,7 @@ from mongorepo.types.collection_provider import CollectionProvider
 from mongorepo.types.repository_config import RepositoryConfig
 from mongorepo.utils.dataclass_converters import get_converter
 from mongorepo.utils.field_factory import build_validated_field
+from mongorepo.utils.instrumentation import instrument_methods
 from mongorepo.utils.mongorepo_dict import get_or_create_mongorepo_dict
 from mongorepo.utils.type_hints import get_entity_type_hints
 from mongorepo.utils.validations import validate_repository_config_converters
@@ -45,4 +46,5 @@ def _handle_implement_specific_methods[T: type](
         setattr(cls, method.name, __mongorepo__['methods'][method.name])
 
     setattr(cls, '__mongorepo__', __mongorepo__)
+    instrument_methods(cls, __mongorepo__)
     return cls
@@ -5,7 +5,6 @@ from typing import Any, Callable
 from mongorepo import exceptions
 from mongorepo.types import Dataclass, RepositoryConfig
 from mongorepo.utils.dataclass_converters import get_converter
-from mongorepo.utils.type_hints import get_function_default_values
 
 from .enums import MethodAction
 from .enums import ParameterEnum as MongorepoParameter
@@ -13,7 +12,7 @@ from .method_mapper_utils import (
     implement_mapper,
     initialize_callable_mongorepo_method,
 )
-from .methods import Method, SpecificFieldMethod, SpecificMethod
+from .methods import SpecificFieldMethod, SpecificMethod
 
 
 def _substitute_specific_method(
@@ -48,19 +47,17 @@ def _substitute_specific_method(
         to_entity_converter=to_entity_converter,
         to_document_converter=to_document_converter,
         modifiers=method.modifiers,
+        **method.options,
     )
 
+    binder = ArgumentBinder(method)
+    bind = binder.bind
+
     def func(self, *args, **kwargs) -> Any:
-        required_params = _manage_custom_params(
-            Method(source=method.source, **method.params), *args, **kwargs,
-        )
-        return callable_mongorepo_method(**required_params)
+        return callable_mongorepo_method(**bind(args, kwargs))
 
     async def async_func(self, *args, **kwargs) -> Any:
-        required_params = _manage_custom_params(
-            Method(source=method.source, **method.params), *args, **kwargs,
-        )
-        return await callable_mongorepo_method(**required_params)
+        return await callable_mongorepo_method(**bind(args, kwargs))
 
     if method.action == MethodAction.GET_ALL and is_async is True:
         new_method = func
@@ -69,55 +66,77 @@ def _substitute_specific_method(
 
     new_method.__annotations__ = method.source.__annotations__
     new_method.__name__ = method.name
+    # Used by instrumentation (see `mongorepo.utils.instrumentation`)
+    new_method.mongorepo_method = callable_mongorepo_method  # type: ignore[attr-defined]
+    new_method.mongorepo_binder = binder  # type: ignore[attr-defined]
 
     return new_method
 
 
-def _manage_custom_params(
-    method: Method,
-    *args,
-    **kwargs,
-) -> dict[str, Any]:
-    defaults = get_function_default_values(method.source)
-    result: dict[str, Any] = {}
-    filters: dict[str, Any] = {}
-    source_params_map: dict[str, Any] = {}
-    aliases: dict[str, Any] = method.params.get(MongorepoParameter.FILTER_ALIAS, {})  # type: ignore
-    i = 0
-
-    # Iterate over all names of the method's arguments
-    for source_param in method.get_source_params().keys():
-
-        # Parameter was passed as positional argument
-        if len(args) > i:
-            source_params_map[source_param] = args[i]
-            i += 1
-            continue
-
-        # Parameter was passed as keyword argument ?
-        elif source_param in kwargs:
-            source_params_map[source_param] = kwargs[source_param]
-
-        # If parameter was not passed check for defaults
-        elif defaults.get(source_param, None):
-            source_params_map[source_param] = defaults[source_param]
-
-        # Missing parameter
-        else:
-            raise exceptions.MongorepoException(
-                message=f'Cannot find value for {source_param} parameter, '
-                f'{method.name}() parameters: {method.params}',
-            )
-
-    for key, value in source_params_map.items():
-        # Check for filter
-        if method.params.get(key, None) == MongorepoParameter.FILTER:
-            filters[key] = value
-        # Check alias
-        elif (dto_field := aliases.get(key, None)) is not None:
-            filters[dto_field] = value
-        else:
-            result[method.params[key]] = value
-
-    result.update(filters)
-    return result
+class ArgumentBinder:
+    """Maps arguments of a source method call to parameters of mongorepo
+    method.
+
+    Binding plan (positional order, defaults and role of every parameter) is
+    computed once from the source method signature, so binding arguments does
+    not inspect the signature.
+
+    """
+
+    __slots__ = ('method', 'plan', 'defaults')
+
+    def __init__(self, method: SpecificMethod | SpecificFieldMethod) -> None:
+        self.method = method
+        aliases: dict[str, str] = method.params.get(  # type: ignore[assignment]
+            MongorepoParameter.FILTER_ALIAS, {},
+        )
+        source_params = dict(inspect.signature(method.source).parameters)
+        source_params.pop('self', None)
+
+        # Every item is (source parameter, mongorepo parameter, is filter), mongorepo parameter
+        # is None when the source parameter is not mapped to any role
+        plan: list[tuple[str, str | None, bool]] = []
+        for name in source_params:
+            if method.params.get(name, None) == MongorepoParameter.FILTER:
+                plan.append((name, name, True))
+            elif (entity_field := aliases.get(name, None)) is not None:
+                plan.append((name, entity_field, True))
+            else:
+                plan.append((name, method.params.get(name, None), False))
+
+        self.plan: tuple[tuple[str, str | None, bool], ...] = tuple(plan)
+        self.defaults: dict[str, Any] = {
+            p.name: p.default for p in source_params.values() if p.default is not p.empty
+        }
+
+    def bind(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        filters: dict[str, Any] = {}
+        args_count = len(args)
+
+        for i, (source_param, param, is_filter) in enumerate(self.plan):
+            # Parameter was passed as positional argument
+            if i < args_count:
+                value = args[i]
+            # Parameter was passed as keyword argument
+            elif source_param in kwargs:
+                value = kwargs[source_param]
+            # If parameter was not passed check for defaults
+            elif source_param in self.defaults:
+                value = self.defaults[source_param]
+            # Missing parameter
+            else:
+                raise exceptions.MongorepoException(
+                    message=f'Cannot find value for {source_param} parameter, '
+                    f'{self.method.name}() parameters: {self.method.params}',
+                )
+
+            if is_filter:
+                filters[param] = value  # type: ignore[index]
+            elif param is None:
+                raise KeyError(source_param)
+            else:
+                result[param] = value
+
+        result.update(filters)
+        return result
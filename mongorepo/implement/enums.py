@@ -10,6 +10,7 @@ class MethodAction(StrEnum):
     ADD = 'add'
     ADD_BATCH = 'add_batch'
     DELETE = 'delete'
+    DELETE_MANY = 'delete_many'
 
     INTEGER_INCREMENT = 'incr__'
     INTEGER_DECREMENT = 'decr__'
@@ -36,7 +37,10 @@ class ParameterEnum(StrEnum):
     LIMIT = 'limit'
     Entity = 'entity'
     VALUE = 'value'
+    VALUES = 'values'
     WEIGHT = 'weight'
+    TOKEN = 'token'
+    UPDATE_FIELDS = 'update_fields'
     FILTER_ALIAS = '__filter_alias'
 
 
@@ -46,6 +50,9 @@ LParameter = Literal[
     ParameterEnum.LIMIT,
     ParameterEnum.Entity,
     ParameterEnum.VALUE,
+    ParameterEnum.VALUES,
     ParameterEnum.WEIGHT,
+    ParameterEnum.TOKEN,
+    ParameterEnum.UPDATE_FIELDS,
     ParameterEnum.FILTER_ALIAS,
 ]
@@ -5,12 +5,15 @@ from mongorepo._methods.impl import AddBatchMethod as CallableAddBatchMethod
 from mongorepo._methods.impl import AddMethod as CallableAddMethod
 from mongorepo._methods.impl import \
     AppendListMethod as CallableAppendListMethod
+from mongorepo._methods.impl import \
+    DeleteManyMethod as CallableDeleteManyMethod
 from mongorepo._methods.impl import DeleteMethod as CallableDeleteMethod
 from mongorepo._methods.impl import GetAllMethod as CallableGetAllMethod
 from mongorepo._methods.impl import GetListMethod as CallableGetListMethod
 from mongorepo._methods.impl import \
     GetListValuesMethod as CallableGetListValuesMethod
 from mongorepo._methods.impl import GetMethod as CallableGetMethod
+from mongorepo._methods.impl import GetPageMethod as CallableGetPageMethod
 from mongorepo._methods.impl import \
     IncrementIntegerFieldMethod as CallableIncrementIntegerFieldMethod
 from mongorepo._methods.impl import PopListMethod as CallablePopListMethod
@@ -23,6 +26,8 @@ from mongorepo._methods.impl_async import \
     AddMethodAsync as CallableAddMethodAsync
 from mongorepo._methods.impl_async import \
     AppendListMethodAsync as CallableAppendListMethodAsync
+from mongorepo._methods.impl_async import \
+    DeleteManyMethodAsync as CallableDeleteManyMethodAsync
 from mongorepo._methods.impl_async import \
     DeleteMethodAsync as CallableDeleteMethodAsync
 from mongorepo._methods.impl_async import \
@@ -33,6 +38,8 @@ from mongorepo._methods.impl_async import \
     GetListValuesMethodAsync as CallableGetListValuesMethodAsync
 from mongorepo._methods.impl_async import \
     GetMethodAsync as CallableGetMethodAsync
+from mongorepo._methods.impl_async import \
+    GetPageMethodAsync as CallableGetPageMethodAsync
 from mongorepo._methods.impl_async import \
     IncrementIntegerFieldMethodAsync as \
     CallableIncrementIntegerFieldMethodAsync
@@ -45,6 +52,7 @@ from mongorepo._methods.impl_async import \
 from mongorepo.implement.methods import (
     AddBatchMethod,
     AddMethod,
+    DeleteManyMethod,
     DeleteMethod,
     GetAllMethod,
     GetListMethod,
@@ -69,6 +77,7 @@ def implement_mapper(specific_method: SpecificMethod) -> type:
         AddBatchMethod: (CallableAddBatchMethod, CallableAddBatchMethodAsync),
         AddMethod: (CallableAddMethod, CallableAddMethodAsync),
         DeleteMethod: (CallableDeleteMethod, CallableDeleteMethodAsync),
+        DeleteManyMethod: (CallableDeleteManyMethod, CallableDeleteManyMethodAsync),
         UpdateMethod: (CallableUpdateMethod, CallableUpdateMethodAsync),
         ListAppendMethod: (CallableAppendListMethod, CallableAppendListMethodAsync),
         ListRemoveMethod: (CallableRemoveListMethod, CallableRemoveListMethodAsync),
@@ -81,6 +90,11 @@ def implement_mapper(specific_method: SpecificMethod) -> type:
 
     method_type = type(specific_method)
 
+    if isinstance(specific_method, GetListMethod) and specific_method.keyset is not None:
+        return (
+            CallableGetPageMethodAsync if specific_method.is_async else CallableGetPageMethod
+        )
+
     if method_type not in method_mapping:
         raise exceptions.MongorepoException(
             f'Cannot map specific method {method_type} to mongorepo implementation',
@@ -104,10 +118,12 @@ def initialize_callable_mongorepo_method(
         CallableAddMethod, CallableAddMethodAsync,
         CallableGetMethod, CallableGetMethodAsync,
         CallableGetListMethod, CallableGetListMethodAsync,
+        CallableGetPageMethod, CallableGetPageMethodAsync,
         CallableAddBatchMethod, CallableAddBatchMethodAsync,
         CallableGetAllMethod, CallableGetAllMethodAsync,
         CallableUpdateMethod, CallableUpdateMethodAsync,
         CallableDeleteMethod, CallableDeleteMethodAsync,
+        CallableDeleteManyMethod, CallableDeleteManyMethodAsync,
     }
 
     field_methods = {
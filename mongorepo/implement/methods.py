@@ -1,9 +1,16 @@
 import inspect
 from typing import Any, Callable, Iterable, Protocol
 
+from mongorepo.exceptions import MongorepoException
 from mongorepo.modifiers.base import ModifierAfter, ModifierBefore
+from mongorepo.types.batch import BatchInsert
 from mongorepo.types.field import Field
 from mongorepo.types.field_alias import FieldAlias
+from mongorepo.types.find_options import FindOptions
+from mongorepo.types.list_append import ListAppend
+from mongorepo.types.pagination import Keyset
+from mongorepo.types.projection import Projection
+from mongorepo.types.write_behind import WriteBehind
 
 from .enums import LParameter, MethodAction, ParameterEnum
 
@@ -35,6 +42,7 @@ class SpecificMethod(Protocol):
         mongorepo.implement.methods.AddBatchMethod
         mongorepo.implement.methods.UpdateMethod
         mongorepo.implement.methods.DeleteMethod
+        mongorepo.implement.methods.DeleteManyMethod
 
         mongorepo.implement.methods.IncrementIntegerFieldMethod
 
@@ -47,6 +55,7 @@ class SpecificMethod(Protocol):
     name: str
     source: Callable
     params: dict[str, LParameter]
+    options: dict[str, Any]
     action: MethodAction
     modifiers: Modifiers
 
@@ -70,6 +79,8 @@ class Method:
     ) -> None:
         self.source: Callable = source
         self.params: dict[str, LParameter] = params
+        # Keyword arguments passed to mongorepo implementation of the method
+        self.options: dict[str, Any] = {}
         self.name: str = source.__name__
 
     def __repr__(self) -> str:
@@ -122,6 +133,8 @@ class GetMethod(Method):
     repo = MongoUserRepo()
     user = repo.get(id='123')
     ```
+    Pass `projection` (:class:`mongorepo.Projection`) to fetch only some fields and
+    return lightweight entity or dictionary instead of the repository entity.
 
     """
 
@@ -130,10 +143,13 @@ class GetMethod(Method):
         source: Callable,
         filters: list[FieldAlias | str],
         modifiers: Modifiers | None = None,
+        projection: Projection | None = None,
     ) -> None:
         super().__init__(source, **_manage_filters(filters))
         self.action = MethodAction.GET
         self.modifiers = modifiers or ()
+        if projection is not None:
+            self.options['projection'] = projection
 
 
 class AddMethod(Method):
@@ -212,7 +228,25 @@ class UpdateMethod(Method):
     print(updated_user.name)  # admin_1
     ```
     ## Note
-    * All fields of update model will be used to update record in DB
+    * All fields of update model will be used to update record in DB, unless `update_fields`
+      parameter is set or changes of entities are tracked (`RepositoryConfig.track_changes`)
+
+    ### Updating only some fields:
+    ```
+    class Repo(typing.Protocol):
+        def update_user(self, id: str, user: User, fields: list[str]) -> User:
+            ...
+
+    @implement(
+        UpdateMethod(Repo.update_user, filters=['id'], entity='user', update_fields='fields'),
+        ...
+    )
+    class MongoRepo:
+        ...
+
+    # only `name` field is sent to the database
+    repo.update_user(id='1', user=user, fields=['name'])
+    ```
 
     ### Example:
 
@@ -250,10 +284,12 @@ class UpdateMethod(Method):
         entity: str,
         filters: list[FieldAlias | str],
         modifiers: Modifiers | None = None,
+        update_fields: str | None = None,
     ) -> None:
-        super().__init__(
-            source, **{entity: 'entity'}, **_manage_filters(filters),  # type: ignore[arg-type]
-        )
+        params: dict[str, Any] = {entity: 'entity'}
+        if update_fields:
+            params[update_fields] = 'update_fields'
+        super().__init__(source, **params, **_manage_filters(filters))
         self.action = MethodAction.UPDATE
         self.modifiers = modifiers or []
 
@@ -294,6 +330,43 @@ class DeleteMethod(Method):
         self.modifiers = modifiers or []
 
 
+class DeleteManyMethod(Method):
+    """Class that represents mongorepo `delete_many` method, it deletes all
+    documents matching filters and returns their number.
+
+    ### Features
+    * Support modifiers
+    (:class:`mongorepo.modifiers.ModifierBefore`, :class:`mongorepo.modifiers.ModifierAfter`)
+    * Support :class:`FieldAlias`
+    * Support asynchronous functions
+    ## Usage example:
+
+    ```
+    class Repo(typing.Protocol):
+        # this method can be also asynchronous
+        def remove_users_from(self, company: str) -> int:
+            ...
+
+    @implement(DeleteManyMethod(Repo.remove_users_from, filters=['company']), ...)
+    class MongoRepo:
+        ...
+
+    repo = MongoRepo()
+    deleted_count: int = repo.remove_users_from(company='mongorepo')  # 3
+    ```
+
+    """
+    def __init__(
+        self,
+        source: Callable,
+        filters: list[FieldAlias | str],
+        modifiers: Modifiers | None = None,
+    ) -> None:
+        super().__init__(source, **_manage_filters(filters))
+        self.action = MethodAction.DELETE_MANY
+        self.modifiers = modifiers or []
+
+
 class GetListMethod(Method):
     """Class that represents mongorepo `get_list` method.
 
@@ -302,6 +375,10 @@ class GetListMethod(Method):
     (:class:`mongorepo.modifiers.ModifierBefore`, :class:`mongorepo.modifiers.ModifierAfter`)
     * Support :class:`FieldAlias`
     * Support asynchronous functions
+    * Support keyset (cursor-based) pagination
+    * Support projections (:class:`mongorepo.Projection`)
+    * Support find options (:class:`mongorepo.FindOptions`): sort, index hint, batch size
+    and server time limit
     ## Usage example:
     ```
     class BookRepo(typing.Protocol):
@@ -320,22 +397,75 @@ class GetListMethod(Method):
     books = repo.get_list_of_books(category='fiction')
     print(books)  # [Book(title='...', category='fiction'), Book(title='...', category='fiction')]
     ```
+    ## Keyset pagination:
+    Pass `keyset` to seek pages after the last document of the previous page instead of
+    skipping `offset` documents. Method returns :class:`mongorepo.types.Page` with
+    continuation token that should be passed to the parameter named by `token`.
+    ```
+    class BookRepo(typing.Protocol):
+        def get_books_page(self, category: str, limit: int, token: str | None = None) -> Page[Book]:
+            ...
+
+    @implement(
+        GetListMethod(
+            BookRepo.get_books_page,
+            filters=['category'],
+            limit='limit',
+            token='token',
+            keyset=Keyset(sort_key='published_at', descending=True),
+        ),
+        ...
+    )
+    class MongoRepo:
+        ...
+
+    page = repo.get_books_page(category='fiction', limit=10)
+    next_page = repo.get_books_page(category='fiction', limit=10, token=page.next_token)
+    ```
 
     """
     def __init__(
         self,
         source: Callable,
         filters: list[FieldAlias | str],
-        offset: str,
-        limit: str,
+        offset: str | None = None,
+        limit: str | None = None,
         modifiers: Modifiers | None = None,
+        keyset: Keyset | None = None,
+        token: str | None = None,
+        projection: Projection | None = None,
+        find_options: FindOptions | None = None,
     ) -> None:
-        super().__init__(
-            source, **{offset: 'offset', limit: 'limit'},  # type: ignore[arg-type]
-            **_manage_filters(filters),
-        )
+        if keyset is not None and projection is not None:
+            raise MongorepoException(
+                f'Keyset pagination of {source.__name__}() does not support projection',
+            )
+        if keyset is None and token is not None:
+            raise MongorepoException(
+                f'Cannot use "{token}" parameter as page token of {source.__name__}(): '
+                'keyset was not provided',
+            )
+        if keyset is not None and offset is not None:
+            raise MongorepoException(
+                f'Keyset pagination of {source.__name__}() does not support offset',
+            )
+        params: dict[str, Any] = {}
+        if offset:
+            params[offset] = 'offset'
+        if limit:
+            params[limit] = 'limit'
+        if token:
+            params[token] = 'token'
+        super().__init__(source, **params, **_manage_filters(filters))
         self.action = MethodAction.GET_LIST
         self.modifiers = modifiers or []
+        self.keyset = keyset
+        if keyset is not None:
+            self.options['keyset'] = keyset
+        if projection is not None:
+            self.options['projection'] = projection
+        if find_options is not None:
+            self.options['find_options'] = find_options
 
 
 class GetAllMethod(Method):
@@ -371,6 +501,10 @@ class GetAllMethod(Method):
     async for book in repo.get_all_books_async(category='fiction'):
         print(book)  # Book(title='...', category='fiction')
     ```
+    Pass `projection` (:class:`mongorepo.Projection`) to fetch only some fields and
+    return lightweight entities or dictionaries instead of repository entities,
+    `find_options` (:class:`mongorepo.FindOptions`) to set sort, index hint, cursor batch
+    size and server time limit of the method.
 
     """
 
@@ -379,10 +513,16 @@ class GetAllMethod(Method):
         source: Callable,
         filters: list[FieldAlias | str],
         modifiers: Modifiers | None = None,
+        projection: Projection | None = None,
+        find_options: FindOptions | None = None,
     ) -> None:
         super().__init__(source, **_manage_filters(filters))
         self.action = MethodAction.GET_ALL
         self.modifiers = modifiers or []
+        if projection is not None:
+            self.options['projection'] = projection
+        if find_options is not None:
+            self.options['find_options'] = find_options
 
 
 class AddBatchMethod(Method):
@@ -392,6 +532,11 @@ class AddBatchMethod(Method):
     * Support modifiers
     (:class:`mongorepo.modifiers.ModifierBefore`, :class:`mongorepo.modifiers.ModifierAfter`)
     * Support asynchronous functions
+    * Support streaming insertion by chunks
+
+    Pass `batch` to accept any iterable (and asynchronous iterable for asynchronous
+    methods) of entities, they are converted and inserted lazily by chunks of
+    `batch.chunk_size` and :class:`mongorepo.BatchInsertResult` is returned.
 
     ## Usage example:
     ```
@@ -410,6 +555,19 @@ class AddBatchMethod(Method):
         Book(title='2', category='romance'),
     ])
     ```
+    Streaming insertion:
+    ```
+    @implement(
+        AddBatchMethod(
+            BookRepo.import_books, entity_list='books', batch=BatchInsert(chunk_size=500),
+        ),
+    )
+    class MongoRepo:
+        ...
+
+    result = repo.import_books(Book(title=row[0]) for row in csv.reader(file))
+    print(result.inserted_count, result.errors)
+    ```
 
     """
 
@@ -418,10 +576,14 @@ class AddBatchMethod(Method):
         source: Callable,
         entity_list: str,
         modifiers: Modifiers | None = None,
+        batch: BatchInsert | None = None,
     ) -> None:
         super().__init__(source, **{entity_list: 'entity_list'})  # type: ignore[arg-type]
         self.action = MethodAction.ADD_BATCH
         self.modifiers = modifiers or []
+        self.batch = batch
+        if batch is not None:
+            self.options['batch'] = batch
 
 
 class ListAppendMethod(Method):
@@ -469,6 +631,10 @@ class ListAppendMethod(Method):
     print(cargo)  # Cargo(id='1', boxes=[Box(weight=5)])
     ```
 
+    With `many=True` the `value` parameter is an iterable of values appended
+    with one `$push` and `$each` update, pass `append=ListAppend(...)` to cap,
+    sort or deduplicate the array (see :class:`mongorepo.ListAppend`).
+
     """
 
     def __init__(
@@ -478,13 +644,19 @@ class ListAppendMethod(Method):
         value: str,
         filters: list[FieldAlias | str],
         modifiers: Modifiers | None = None,
+        many: bool = False,
+        append: ListAppend | None = None,
     ) -> None:
         super().__init__(
-            source, **{value: 'value'}, **_manage_filters(filters),  # type: ignore[arg-type]
+            source,
+            **{value: 'values' if many else 'value'},  # type: ignore[arg-type]
+            **_manage_filters(filters),  # type: ignore[arg-type]
         )
         self.target_field = field if isinstance(field, Field) else Field(field)
         self.action = MethodAction.LIST_APPEND
         self.modifiers = modifiers or []
+        if append is not None:
+            self.options['append'] = append
 
 
 class ListPopMethod(Method):
@@ -736,6 +908,11 @@ class IncrementIntegerFieldMethod(Method):
     print(repo.get(id='1'))  # Record(id='1', views=1001)
     ```
 
+    Pass `write_behind=WriteBehind()` to buffer increments in memory and write
+    them in batches, see :class:`mongorepo.WriteBehind`. Pass
+    `return_value=True` to return the new value of the field (`None` if no
+    document matched) in the same round trip, e.g. for sequence generators.
+
     """
 
     def __init__(
@@ -746,6 +923,8 @@ class IncrementIntegerFieldMethod(Method):
         weight: str | None = None,
         default_weight_value: int = 1,
         modifiers: Modifiers | None = None,
+        write_behind: WriteBehind | None = None,
+        return_value: bool = False,
     ) -> None:
         params = {} if weight is None else {weight: 'weight'}
         super().__init__(
@@ -755,3 +934,7 @@ class IncrementIntegerFieldMethod(Method):
         self.target_field = field if isinstance(field, Field) else Field(field)
         self.integer_weight = default_weight_value
         self.modifiers = modifiers or []
+        if write_behind is not None:
+            self.options['write_behind'] = write_behind
+        if return_value:
+            self.options['return_value'] = return_value
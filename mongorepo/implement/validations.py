@@ -1,17 +1,33 @@
 from typing import get_type_hints
 
+from mongorepo.exceptions import InvalidFilterException
 from mongorepo.implement.enums import ParameterEnum
 from mongorepo.implement.exceptions import FieldDoesNotExist
 from mongorepo.implement.methods import SpecificFieldMethod, SpecificMethod
+from mongorepo.utils.query_filters import FILTER_SEPARATOR, parse_filter_key
 from mongorepo.utils.type_hints import field_exists
 
 
+def _filter_exists(key: str, entity_type: type) -> bool:
+    """Checks whether `key` is a field of `entity` or a valid filter
+    expression (`field__gte`, `field__nested_field`, ...)"""
+    if field_exists(key, entity_type):
+        return True
+    if FILTER_SEPARATOR not in key:
+        return False
+    try:
+        parse_filter_key(key, entity_type)
+    except InvalidFilterException:
+        return False
+    return True
+
+
 def validate_specific_method_input_parameters(
     specific_method: SpecificMethod | SpecificFieldMethod, entity_type: type,
 ):
     for param_name, value in specific_method.params.items():
         # Validate name of field passed as filter
-        if value == ParameterEnum.FILTER.value and field_exists(param_name, entity_type) is False:
+        if value == ParameterEnum.FILTER.value and not _filter_exists(param_name, entity_type):
             raise FieldDoesNotExist(
                 param_name,
                 correct_fields=list(get_type_hints(entity_type).keys()),
@@ -20,7 +36,7 @@ def validate_specific_method_input_parameters(
         # Validate name of field passed as filter alias
         elif param_name == ParameterEnum.FILTER_ALIAS.value:
             for field in value.values():  # type: ignore[union-attr]
-                if field_exists(field, entity_type) is False:
+                if not _filter_exists(field, entity_type):
                     raise FieldDoesNotExist(
                         field,
                         correct_fields=list(get_type_hints(entity_type).keys()),
@@ -0,0 +1,1269 @@
+import datetime
+import re
+import threading
+import uuid
+from itertools import count, product
+from typing import Any, Iterable, Iterator, Mapping
+
+from bson import (
+    SON,
+    Binary,
+    Decimal128,
+    MaxKey,
+    MinKey,
+    ObjectId,
+    Regex,
+    Timestamp,
+)
+from pymongo import (
+    DeleteMany,
+    DeleteOne,
+    IndexModel,
+    InsertOne,
+    ReplaceOne,
+    UpdateMany,
+    UpdateOne,
+)
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+from pymongo.results import (
+    BulkWriteResult,
+    DeleteResult,
+    InsertManyResult,
+    InsertOneResult,
+    UpdateResult,
+)
+
+_MISSING = object()
+_INDEX_OPTIONS = ('unique', 'sparse', 'partialFilterExpression', 'expireAfterSeconds')
+
+
+def copy_document(value: Any) -> Any:
+    """Copies dictionaries and lists of a document, other values are
+    shared."""
+    if isinstance(value, dict):
+        return {k: copy_document(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_document(v) for v in value]
+    return value
+
+
+def _get_values(document: Any, path: list[str]) -> list[Any]:
+    """Returns values at dotted `path`, arrays on the path are traversed."""
+    if not path:
+        return [document]
+    key, rest = path[0], path[1:]
+    if isinstance(document, dict):
+        if key not in document:
+            return []
+        return _get_values(document[key], rest)
+    if isinstance(document, list):
+        if key.isdigit():
+            index = int(key)
+            return _get_values(document[index], rest) if index < len(document) else []
+        values: list[Any] = []
+        for item in document:
+            if isinstance(item, (dict, list)):
+                values.extend(_get_values(item, path))
+        return values
+    return []
+
+
+def _expand(values: list[Any]) -> list[Any]:
+    """Adds elements of array values, queries match them too."""
+    expanded = list(values)
+    for value in values:
+        if isinstance(value, list):
+            expanded.extend(value)
+    return expanded
+
+
+def _hashable(value: Any) -> bool:
+    return not isinstance(value, (dict, list, re.Pattern))
+
+
+def _type_key(value: Any) -> tuple[int, Any]:
+    """Returns `value` tagged with its type, `True == 1` in python, but
+    booleans and numbers are different types in MongoDB."""
+    if isinstance(value, bool):
+        return (1, value)
+    if isinstance(value, Decimal128):
+        return (2, value.to_decimal())
+    if isinstance(value, (int, float)):
+        return (2, value)
+    return (0, value)
+
+
+def _field_keys(document: Mapping[str, Any], path: str) -> list[Any]:
+    """Returns index keys of field `path` of `document`: elements of arrays
+    are indexed separately and missing fields are indexed as `None`."""
+    values = _get_values(document, path.split('.'))
+    if not values:
+        return [_type_key(None)]
+    return list(dict.fromkeys(_type_key(v) for v in _expand(values) if _hashable(v)))
+
+
+def _contains(array: list[Any], value: Any) -> bool:
+    key = _type_key(value)
+    return any(_type_key(item) == key for item in array)
+
+
+def _compare(a: Any, b: Any, operator: str) -> bool:
+    # Comparison operators match only values of the same BSON type bracket
+    (a_type, a), (b_type, b) = _sort_key(a), _sort_key(b)
+    if a_type != b_type:
+        return False
+    try:
+        if operator == '$gt':
+            return a > b
+        if operator == '$gte':
+            return a >= b
+        if operator == '$lt':
+            return a < b
+        return a <= b
+    except TypeError:
+        return False
+
+
+def _equals(values: list[Any], expected: Any) -> bool:
+    if not values:
+        return expected is None
+    return _contains(_expand(values), expected)
+
+
+def _is_operator_document(value: Any) -> bool:
+    return isinstance(value, dict) and bool(value) and all(
+        isinstance(k, str) and k.startswith('$') for k in value
+    )
+
+
+def _match_condition(values: list[Any], condition: Any) -> bool:
+    if not _is_operator_document(condition):
+        if isinstance(condition, re.Pattern):
+            return any(isinstance(v, str) and condition.search(v) for v in _expand(values))
+        return _equals(values, condition)
+
+    for operator, operand in condition.items():
+        if operator == '$eq':
+            matched = _equals(values, operand)
+        elif operator == '$ne':
+            matched = not _equals(values, operand)
+        elif operator in ('$gt', '$gte', '$lt', '$lte'):
+            matched = any(_compare(v, operand, operator) for v in _expand(values))
+        elif operator == '$in':
+            matched = any(_match_condition(values, item) for item in operand)
+        elif operator == '$nin':
+            matched = not any(_match_condition(values, item) for item in operand)
+        elif operator == '$exists':
+            matched = bool(values) == bool(operand)
+        elif operator == '$size':
+            matched = any(isinstance(v, list) and len(v) == operand for v in values)
+        elif operator == '$all':
+            matched = any(
+                isinstance(v, list) and all(_contains(v, item) for item in operand) for v in values
+            )
+        elif operator == '$regex':
+            flags = 0
+            for option in condition.get('$options', ''):
+                flags |= {'i': re.I, 'm': re.M, 's': re.S, 'x': re.X}.get(option, 0)
+            pattern = re.compile(operand, flags) if isinstance(operand, str) else operand
+            matched = any(isinstance(v, str) and pattern.search(v) for v in _expand(values))
+        elif operator == '$options':
+            continue
+        elif operator == '$elemMatch':
+            matched = any(
+                isinstance(v, list) and any(_match_element(item, operand) for item in v)
+                for v in values
+            )
+        elif operator == '$not':
+            matched = not _match_condition(values, operand)
+        else:
+            raise OperationFailure(f'unknown operator: {operator}', 2)
+        if not matched:
+            return False
+    return True
+
+
+def _match_element(element: Any, condition: Mapping[str, Any]) -> bool:
+    if _is_operator_document(condition):
+        return _match_condition([element], condition)
+    return isinstance(element, dict) and match(element, condition)
+
+
+def match(document: Mapping[str, Any], filters: Mapping[str, Any] | None) -> bool:
+    """Returns whether `document` matches query `filters`."""
+    if not filters:
+        return True
+    for key, condition in filters.items():
+        if key == '$and':
+            if not all(match(document, f) for f in condition):
+                return False
+        elif key == '$or':
+            if not any(match(document, f) for f in condition):
+                return False
+        elif key == '$nor':
+            if any(match(document, f) for f in condition):
+                return False
+        elif not _match_condition(_get_values(document, key.split('.')), condition):
+            return False
+    return True
+
+
+def _sort_key(value: Any) -> tuple[int, Any]:
+    # BSON comparison order of types, values of a type are compared by their BSON value
+    if isinstance(value, MinKey):
+        return (0, 0)
+    if value is _MISSING or value is None:
+        return (1, 0)
+    if isinstance(value, bool):
+        return (8, value)
+    if isinstance(value, (int, float)):
+        return (2, value)
+    if isinstance(value, Decimal128):
+        return (2, value.to_decimal())
+    if isinstance(value, str):
+        return (3, value)
+    if isinstance(value, dict):
+        return (4, tuple((k, _sort_key(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return (5, tuple(_sort_key(v) for v in value))
+    if isinstance(value, uuid.UUID):
+        value = Binary.from_uuid(value)
+    if isinstance(value, bytes):
+        # Binary data is ordered by length, subtype and bytes
+        return (6, (len(value), getattr(value, 'subtype', 0), bytes(value)))
+    if isinstance(value, ObjectId):
+        return (7, value.binary)
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return (9, value)
+    if isinstance(value, Timestamp):
+        return (10, (value.time, value.inc))
+    if isinstance(value, (re.Pattern, Regex)):
+        return (11, (value.pattern, str(value.flags)))
+    if isinstance(value, MaxKey):
+        return (13, 0)
+    return (12, repr(value))
+
+
+def _get_sort_value(document: Mapping[str, Any], path: str) -> Any:
+    values = _get_values(document, path.split('.'))
+    return values[0] if values else _MISSING
+
+
+def sort_documents(
+    documents: list[dict[str, Any]], sort: Iterable[tuple[str, Any]],
+) -> list[dict[str, Any]]:
+    for key, direction in reversed(list(sort)):
+        documents.sort(
+            key=lambda d: _sort_key(_get_sort_value(d, key)), reverse=direction in (-1, '-1'),
+        )
+    return documents
+
+
+def _normalize_sort(sort: Any) -> list[tuple[str, Any]]:
+    if sort is None:
+        return []
+    if isinstance(sort, str):
+        return [(sort, 1)]
+    if isinstance(sort, Mapping):
+        return list(sort.items())
+    return [(key, 1) if isinstance(key, str) else (key[0], key[1]) for key in sort]
+
+
+def _set_path(document: dict[str, Any], path: str, value: Any) -> None:
+    keys = path.split('.')
+    target: Any = document
+    for key in keys[:-1]:
+        if isinstance(target, list):
+            target = target[int(key)]
+            continue
+        target = target.setdefault(key, {})
+    if isinstance(target, list):
+        target[int(keys[-1])] = value
+    else:
+        target[keys[-1]] = value
+
+
+def _get_path(document: dict[str, Any], path: str, default: Any = _MISSING) -> Any:
+    target: Any = document
+    for key in path.split('.'):
+        if isinstance(target, dict) and key in target:
+            target = target[key]
+        elif isinstance(target, list) and key.isdigit() and int(key) < len(target):
+            target = target[int(key)]
+        else:
+            return default
+    return target
+
+
+def _unset_path(document: dict[str, Any], path: str) -> None:
+    *parents, key = path.split('.')
+    target = _get_path(document, '.'.join(parents)) if parents else document
+    if isinstance(target, dict):
+        target.pop(key, None)
+
+
+def _push(array: list[Any], value: Any) -> None:
+    if not _is_operator_document(value) or '$each' not in value:
+        array.append(value)
+        return
+    items = list(value['$each'])
+    position = value.get('$position', None)
+    if position is None:
+        array.extend(items)
+    else:
+        array[position:position] = items
+    if (sort := value.get('$sort', None)) is not None:
+        if isinstance(sort, Mapping):
+            sort_documents(array, sort.items())
+        else:
+            array.sort(key=_sort_key, reverse=sort == -1)
+    if (size := value.get('$slice', None)) is not None:
+        array[:] = array[:size] if size >= 0 else array[size:]
+
+
+def _apply_arithmetic(operator: str, current: Any, value: Any) -> Any:
+    if isinstance(current, Decimal128) or isinstance(value, Decimal128):
+        a, b = _type_key(current)[1], _type_key(value)[1]
+        return Decimal128(a + b if operator == '$inc' else a * b)
+    return current + value if operator == '$inc' else current * value
+
+
+def apply_update(
+    document: dict[str, Any], update: Mapping[str, Any], inserted: bool = False,
+) -> None:
+    """Applies update operators or replacement document `update` to
+    `document`."""
+    if not _is_operator_document(update):
+        replacement = {'_id': document['_id'], **copy_document(dict(update))}
+        document.clear()
+        document.update(replacement)
+        return
+
+    for operator, fields in update.items():
+        for path, value in fields.items():
+            if '$' in path:
+                raise OperationFailure(
+                    f'Positional update of {path} is not supported by MemoryCollection', 2,
+                )
+            current = _get_path(document, path)
+            if operator == '$set' or (operator == '$setOnInsert' and inserted):
+                _set_path(document, path, copy_document(value))
+            elif operator == '$setOnInsert':
+                continue
+            elif operator == '$unset':
+                _unset_path(document, path)
+            elif operator in ('$inc', '$mul'):
+                current = 0 if current is _MISSING else current
+                if not all(_type_key(v)[0] == 2 for v in (current, value)):
+                    raise OperationFailure(
+                        f'Cannot apply {operator} to a value of non-numeric type at {path}', 14,
+                    )
+                _set_path(document, path, _apply_arithmetic(operator, current, value))
+            elif operator in ('$min', '$max'):
+                # Values of different types are compared in BSON order
+                if current is _MISSING or (
+                    _sort_key(value) < _sort_key(current) if operator == '$min'
+                    else _sort_key(value) > _sort_key(current)
+                ):
+                    _set_path(document, path, copy_document(value))
+            elif operator in ('$push', '$addToSet', '$pull', '$pullAll', '$pop'):
+                if current is _MISSING:
+                    if operator not in ('$push', '$addToSet'):
+                        continue
+                    current = []
+                    _set_path(document, path, current)
+                if not isinstance(current, list):
+                    raise OperationFailure(
+                        f'Cannot apply {operator} to a non-array field {path}', 2,
+                    )
+                if operator == '$push':
+                    _push(current, copy_document(value))
+                elif operator == '$addToSet':
+                    items = value['$each'] if _is_operator_document(value) else [value]
+                    current.extend(
+                        item for item in copy_document(items) if not _contains(current, item)
+                    )
+                elif operator == '$pull':
+                    current[:] = [
+                        item for item in current if not (
+                            _match_element(item, value) if isinstance(value, dict)
+                            else _type_key(item) == _type_key(value)
+                        )
+                    ]
+                elif operator == '$pullAll':
+                    current[:] = [item for item in current if not _contains(value, item)]
+                elif current:
+                    current.pop(0 if value == -1 else -1)
+            else:
+                raise OperationFailure(f'Unknown modifier: {operator}', 9)
+
+
+def project(document: dict[str, Any], projection: Any) -> dict[str, Any]:
+    """Returns copy of `document` with `projection` applied."""
+    if not projection:
+        return copy_document(document)
+    if isinstance(projection, (list, tuple)):
+        projection = dict.fromkeys(projection, 1)
+
+    slices = {
+        k: v['$slice'] for k, v in projection.items() if isinstance(v, dict) and '$slice' in v
+    }
+    fields = {k: v for k, v in projection.items() if k not in slices}
+    include_id = fields.pop('_id', True)
+    inclusion = any(fields.values())
+
+    if inclusion:
+        result: dict[str, Any] = {}
+        for path in list(fields) + list(slices):
+            if (value := _get_path(document, path)) is not _MISSING:
+                _set_path(result, path, copy_document(value))
+    else:
+        result = copy_document(document)
+        for path in fields:
+            _unset_path(result, path)
+    if include_id and '_id' in document:
+        result['_id'] = document['_id']
+    elif not include_id:
+        result.pop('_id', None)
+
+    for path, size in slices.items():
+        array = _get_path(result, path)
+        if isinstance(array, list):
+            if isinstance(size, list):
+                skip, limit = size
+                array[:] = array[skip:][:limit]
+            else:
+                array[:] = array[:size] if size >= 0 else array[size:]
+    return result
+
+
+def _lookup_values(condition: Any) -> list[Any] | None:
+    """Returns values of equality or `$in` condition that can be looked up in
+    a hash index, `None` if the condition cannot use an index."""
+    if _is_operator_document(condition):
+        if condition.keys() == {'$eq'}:
+            values = [condition['$eq']]
+        elif condition.keys() == {'$in'}:
+            values = list(condition['$in'])
+        else:
+            return None
+    else:
+        values = [condition]
+    return values if all(_hashable(v) for v in values) else None
+
+
+class MemoryIndex:
+    """Hash index of :class:`MemoryCollection`, it serves equality and `$in`
+    conditions on all of its fields and enforces uniqueness."""
+
+    __slots__ = ('name', 'keys', 'options', 'unique', 'sparse', 'partial_filter', 'entries')
+
+    def __init__(self, name: str, keys: list[tuple[str, Any]], options: dict[str, Any]) -> None:
+        self.name = name
+        self.keys = keys
+        self.options = options
+        self.unique: bool = options.get('unique', False)
+        self.sparse: bool = options.get('sparse', False)
+        self.partial_filter: Mapping[str, Any] | None = options.get(
+            'partialFilterExpression', None,
+        )
+        self.entries: dict[tuple[Any, ...], dict[Any, None]] = {}
+
+    def document_keys(self, document: Mapping[str, Any]) -> list[tuple[Any, ...]]:
+        if self.partial_filter is not None and not match(document, self.partial_filter):
+            return []
+        if self.sparse and not any(_get_values(document, f.split('.')) for f, _ in self.keys):
+            return []
+        return list(product(*(_field_keys(document, field) for field, _ in self.keys)))
+
+    def add(self, document: Mapping[str, Any]) -> None:
+        for key in self.document_keys(document):
+            self.entries.setdefault(key, {})[document['_id']] = None
+
+    def remove(self, document: Mapping[str, Any]) -> None:
+        for key in self.document_keys(document):
+            if (ids := self.entries.get(key, None)) is not None:
+                ids.pop(document['_id'], None)
+                if not ids:
+                    del self.entries[key]
+
+    def find_conflict(self, document: Mapping[str, Any]) -> tuple[Any, ...] | None:
+        """Returns key of `document` that is used by another document if
+        index is unique."""
+        if not self.unique:
+            return None
+        for key in self.document_keys(document):
+            if any(i != document['_id'] for i in self.entries.get(key, ())):
+                return key
+        return None
+
+    def lookup(self, filters: Mapping[str, Any]) -> list[Any] | None:
+        """Returns ids of documents that may match `filters`, `None` if the
+        index cannot serve them."""
+        # Sparse and partial indexes do not contain every document
+        if self.sparse or self.partial_filter is not None:
+            return None
+        values: list[list[Any]] = []
+        for field, _ in self.keys:
+            if field not in filters or (field_values := _lookup_values(filters[field])) is None:
+                return None
+            values.append([_type_key(v) for v in field_values])
+        ids: dict[Any, None] = {}
+        for key in product(*values):
+            ids.update(self.entries.get(key, {}))
+        return list(ids)
+
+    def info(self) -> dict[str, Any]:
+        """Returns index in `list_indexes()` format."""
+        return {'v': 2, 'key': SON(self.keys), 'name': self.name, **self.options}
+
+
+class MemoryCursor:
+    """Cursor of :class:`MemoryCollection`, documents are matched when
+    iteration starts."""
+
+    def __init__(
+        self,
+        collection: 'MemoryCollection',
+        filters: Mapping[str, Any] | None,
+        projection: Any = None,
+        sort: Any = None,
+        skip: int = 0,
+        limit: int = 0,
+    ) -> None:
+        self.collection = collection
+        self.filters = filters
+        self.projection = projection
+        self._sort = _normalize_sort(sort)
+        self._skip = skip
+        self._limit = limit
+        self._iterator: Iterator[dict[str, Any]] | None = None
+
+    def sort(self, key_or_list: Any, direction: Any = None) -> 'MemoryCursor':
+        if direction is not None:
+            self._sort = [(key_or_list, direction)]
+        else:
+            self._sort = _normalize_sort(key_or_list)
+        return self
+
+    def skip(self, skip: int) -> 'MemoryCursor':
+        self._skip = skip
+        return self
+
+    def limit(self, limit: int) -> 'MemoryCursor':
+        self._limit = limit
+        return self
+
+    def batch_size(self, batch_size: int) -> 'MemoryCursor':
+        return self
+
+    def hint(self, index: Any) -> 'MemoryCursor':
+        return self
+
+    def max_time_ms(self, max_time_ms: int | None) -> 'MemoryCursor':
+        return self
+
+    def _documents(self) -> Iterator[dict[str, Any]]:
+        documents: Iterable[dict[str, Any]] = self.collection._find(self.filters)
+        if self._sort:
+            documents = sort_documents(list(documents), self._sort)
+        skipped = 0
+        returned = 0
+        for document in documents:
+            if skipped < self._skip:
+                skipped += 1
+                continue
+            if self._limit and returned >= abs(self._limit):
+                return
+            returned += 1
+            yield project(document, self.projection)
+
+    def __iter__(self) -> 'MemoryCursor':
+        return self
+
+    def __next__(self) -> dict[str, Any]:
+        if self._iterator is None:
+            self._iterator = self._documents()
+        return next(self._iterator)
+
+    def to_list(self, length: int | None = None) -> list[dict[str, Any]]:
+        documents = []
+        for document in self:
+            documents.append(document)
+            if length is not None and len(documents) >= length:
+                break
+        return documents
+
+    def close(self) -> None:
+        self._iterator = iter(())
+
+
+class _ListCursor(MemoryCursor):
+    """Cursor of documents that are not stored in the collection, e.g. of
+    `list_indexes()`."""
+
+    def __init__(self, collection: 'MemoryCollection', documents: list[dict[str, Any]]) -> None:
+        super().__init__(collection, None)
+        self.documents = documents
+
+    def _documents(self) -> Iterator[dict[str, Any]]:
+        yield from self.documents
+
+
+class MemoryCollection:
+    """In-memory collection that implements the part of
+    :class:`pymongo.collection.Collection` API used by mongorepo.
+
+    It can be used instead of a MongoDB collection in `RepositoryConfig`
+    and `provide_collection`, e.g. in tests, benchmarks or as a local store
+    of read-mostly reference data loaded from MongoDB.
+    ### Usage example:
+    ```
+    users = MemoryCollection('users')
+    users.create_index('email', unique=True)
+
+    @repository(config=RepositoryConfig(entity_type=User, collection=users))
+    class UserRepository:
+        ...
+
+    countries = MemoryCollection('countries', documents=mongo_countries.find())
+    ```
+
+    Supported are inserts, `find`/`find_one` with projections (including
+    `$slice`), `sort`, `skip` and `limit`, updates with the common update
+    operators, `find_one_and_*`, deletes, `bulk_write`, `count_documents`
+    and `distinct`.
+    Filters support dotted paths, comparison, `$in`/`$nin`, `$exists`,
+    `$size`, `$all`, `$regex`, `$elemMatch` and logical operators.
+
+    Indexes are hash indexes: they enforce uniqueness and serve lookups with
+    equality or `$in` conditions on all index fields (and on `_id`), other
+    queries scan the collection. TTL indexes do not expire documents,
+    sessions are accepted and ignored. Documents are copied when they are
+    written and read, stored documents are never shared with callers.
+
+    """
+
+    def __init__(
+        self, name: str = 'collection', documents: Iterable[Mapping[str, Any]] | None = None,
+    ) -> None:
+        """
+        Args:
+            name: collection name.
+            documents: initial documents of the collection.
+
+        """
+        self.name = name
+        self.full_name = f'memory.{name}'
+        self._documents: dict[Any, dict[str, Any]] = {}
+        # Insertion order of documents, results of index lookups are returned in it
+        self._positions: dict[Any, int] = {}
+        self._counter = count()
+        self._indexes: dict[str, MemoryIndex] = {}
+        self._lock = threading.RLock()
+        self._sub_collections: dict[str, MemoryCollection] = {}
+        if documents is not None:
+            self.insert_many(dict(document) for document in documents)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __getitem__(self, name: str) -> 'MemoryCollection':
+        """Returns sub-collection `{self.name}.{name}`, like `collection[name]`
+        of pymongo."""
+        with self._lock:
+            if (sub_collection := self._sub_collections.get(name, None)) is None:
+                sub_collection = self._sub_collections[name] = MemoryCollection(
+                    f'{self.name}.{name}',
+                )
+        return sub_collection
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.name!r}, documents={len(self)})'
+
+    def create_index(self, keys: Any, session: Any = None, **kwargs) -> str:
+        """Creates index of `keys` (field name or list of `(field, direction)`
+        pairs), `unique`, `sparse`, `partialFilterExpression` and
+        `expireAfterSeconds` options are kept."""
+        index_keys = _normalize_sort(keys)
+        name = kwargs.pop('name', None) or '_'.join(f'{k}_{d}' for k, d in index_keys)
+        options = {
+            option: kwargs[option] for option in _INDEX_OPTIONS
+            if kwargs.get(option, None) not in (None, False)
+        }
+        if name == '_id_':
+            return name
+        with self._lock:
+            if (existing := self._indexes.get(name, None)) is not None:
+                if existing.keys == index_keys and existing.options == options:
+                    return name
+                raise OperationFailure(
+                    f'An existing index has the same name as the requested index: {name}', 85,
+                )
+            index = MemoryIndex(name, index_keys, options)
+            for document in self._documents.values():
+                if (key := index.find_conflict(document)) is not None:
+                    raise self._duplicate_key_error(index, key)
+                index.add(document)
+            self._indexes[name] = index
+        return name
+
+    def create_indexes(
+        self, indexes: Iterable[IndexModel], session: Any = None, **kwargs,
+    ) -> list[str]:
+        names = []
+        for model in indexes:
+            options = dict(model.document)
+            keys = options.pop('key')
+            names.append(self.create_index(list(keys.items()), **options))
+        return names
+
+    def list_indexes(self, session: Any = None, **kwargs) -> MemoryCursor:
+        indexes = [{'v': 2, 'key': SON([('_id', 1)]), 'name': '_id_'}]
+        indexes.extend(index.info() for index in self._indexes.values())
+        return _ListCursor(self, indexes)
+
+    def index_information(self, session: Any = None, **kwargs) -> dict[str, Any]:
+        return {
+            index['name']: {'key': list(index['key'].items())} | {
+                k: v for k, v in index.items() if k not in ('key', 'name', 'v')
+            }
+            for index in self.list_indexes()
+        }
+
+    def drop_index(self, index_or_name: Any, session: Any = None, **kwargs) -> None:
+        name = index_or_name if isinstance(index_or_name, str) else '_'.join(
+            f'{k}_{d}' for k, d in _normalize_sort(index_or_name)
+        )
+        with self._lock:
+            if self._indexes.pop(name, None) is None:
+                raise OperationFailure(f'index not found with name [{name}]', 27)
+
+    def drop_indexes(self, session: Any = None, **kwargs) -> None:
+        with self._lock:
+            self._indexes.clear()
+
+    def _duplicate_key_error(self, index: MemoryIndex, key: tuple[Any, ...]) -> DuplicateKeyError:
+        key_value = {field: value for (field, _), (_, value) in zip(index.keys, key)}
+        return DuplicateKeyError(
+            f'E11000 duplicate key error collection: {self.full_name} index: {index.name} '
+            f'dup key: {key_value}',
+            11000,
+            {'keyPattern': dict(index.keys), 'keyValue': key_value},
+        )
+
+    def _check_unique(self, document: dict[str, Any]) -> None:
+        for index in self._indexes.values():
+            if (key := index.find_conflict(document)) is not None:
+                raise self._duplicate_key_error(index, key)
+
+    def _candidates(self, filters: Mapping[str, Any] | None) -> list[dict[str, Any]]:
+        """Returns documents that may match `filters`, equality and `$in`
+        conditions on `_id` and on indexed fields are looked up."""
+        with self._lock:
+            if not filters:
+                return list(self._documents.values())
+            if '_id' in filters and (ids := _lookup_values(filters['_id'])) is not None:
+                documents = (self._documents.get(i, None) for i in dict.fromkeys(ids))
+                return [d for d in documents if d is not None]
+            for index in self._indexes.values():
+                if (ids := index.lookup(filters)) is not None:
+                    if len(ids) > 1:
+                        ids.sort(key=self._positions.__getitem__)
+                    return [self._documents[i] for i in ids]
+            return list(self._documents.values())
+
+    def _find(self, filters: Mapping[str, Any] | None) -> Iterator[dict[str, Any]]:
+        # Stored documents are replaced, not modified, so they are matched without lock
+        for document in self._candidates(filters):
+            if match(document, filters):
+                yield document
+
+    def _find_first(self, filters: Mapping[str, Any] | None, sort: Any = None) -> Any:
+        if sort:
+            documents = sort_documents(list(self._find(filters)), _normalize_sort(sort))
+            return documents[0] if documents else None
+        return next(self._find(filters), None)
+
+    def _insert(self, document: dict[str, Any]) -> Any:
+        if '_id' not in document:
+            document['_id'] = ObjectId()
+        stored = copy_document(document)
+        with self._lock:
+            if stored['_id'] in self._documents:
+                raise DuplicateKeyError(
+                    f'E11000 duplicate key error collection: {self.full_name} index: _id_ '
+                    f'dup key: {{_id: {stored["_id"]!r}}}',
+                    11000,
+                    {'keyPattern': {'_id': 1}, 'keyValue': {'_id': stored['_id']}},
+                )
+            self._check_unique(stored)
+            for index in self._indexes.values():
+                index.add(stored)
+            self._documents[stored['_id']] = stored
+            self._positions[stored['_id']] = next(self._counter)
+        return stored['_id']
+
+    def _replace(self, document: dict[str, Any], updated: dict[str, Any]) -> None:
+        if updated.get('_id', None) != document['_id']:
+            raise OperationFailure(
+                "Performing an update on the path '_id' would modify the immutable field '_id'",
+                66,
+            )
+        with self._lock:
+            for index in self._indexes.values():
+                index.remove(document)
+            try:
+                self._check_unique(updated)
+            except DuplicateKeyError:
+                for index in self._indexes.values():
+                    index.add(document)
+                raise
+            for index in self._indexes.values():
+                index.add(updated)
+            self._documents[document['_id']] = updated
+
+    def _remove(self, document: dict[str, Any]) -> None:
+        with self._lock:
+            if self._documents.pop(document['_id'], None) is None:
+                return
+            del self._positions[document['_id']]
+            for index in self._indexes.values():
+                index.remove(document)
+
+    def insert_one(
+        self, document: dict[str, Any], session: Any = None, **kwargs,
+    ) -> InsertOneResult:
+        return InsertOneResult(self._insert(document), acknowledged=True)
+
+    def insert_many(
+        self,
+        documents: Iterable[dict[str, Any]],
+        ordered: bool = True,
+        session: Any = None,
+        **kwargs,
+    ) -> InsertManyResult:
+        inserted_ids: list[Any] = []
+        errors: list[dict[str, Any]] = []
+        for index, document in enumerate(documents):
+            try:
+                inserted_ids.append(self._insert(document))
+            except DuplicateKeyError as e:
+                errors.append({'index': index, 'code': e.code, 'errmsg': str(e), 'op': document})
+                if ordered:
+                    break
+        if errors:
+            raise BulkWriteError({
+                'writeErrors': errors,
+                'writeConcernErrors': [],
+                'nInserted': len(inserted_ids),
+                'nUpserted': 0,
+                'nMatched': 0,
+                'nModified': 0,
+                'nRemoved': 0,
+                'upserted': [],
+            })
+        return InsertManyResult(inserted_ids, acknowledged=True)
+
+    def find(
+        self,
+        filter: Mapping[str, Any] | None = None,  # noqa: A002
+        projection: Any = None,
+        skip: int = 0,
+        limit: int = 0,
+        sort: Any = None,
+        session: Any = None,
+        **kwargs,
+    ) -> MemoryCursor:
+        return MemoryCursor(self, filter, projection, sort=sort, skip=skip, limit=limit)
+
+    def find_one(
+        self,
+        filter: Mapping[str, Any] | None = None,  # noqa: A002
+        projection: Any = None,
+        **kwargs,
+    ) -> dict[str, Any] | None:
+        kwargs['limit'] = 1
+        return next(self.find(filter, projection, **kwargs), None)
+
+    def count_documents(
+        self, filter: Mapping[str, Any], session: Any = None, **kwargs,  # noqa: A002
+    ) -> int:
+        documents = sum(1 for _ in self._find(filter)) - kwargs.get('skip', 0)
+        if limit := kwargs.get('limit', 0):
+            documents = min(documents, limit)
+        return max(documents, 0)
+
+    def estimated_document_count(self, **kwargs) -> int:
+        return len(self._documents)
+
+    def distinct(
+        self,
+        key: str,
+        filter: Mapping[str, Any] | None = None,  # noqa: A002
+        session: Any = None,
+        **kwargs,
+    ) -> list[Any]:
+        values: list[Any] = []
+        for document in self._find(filter):
+            for value in _expand(_get_values(document, key.split('.'))):
+                if not isinstance(value, list) and value not in values:
+                    values.append(value)
+        return values
+
+    def _update(
+        self,
+        filters: Mapping[str, Any],
+        update: Mapping[str, Any],
+        upsert: bool,
+        many: bool,
+        sort: Any = None,
+    ) -> tuple[int, int, Any, dict[str, Any] | None, dict[str, Any] | None]:
+        """Returns matched and modified counts, upserted id and the first
+        updated document before and after the update."""
+        with self._lock:
+            if many:
+                documents = list(self._find(filters))
+            else:
+                first = self._find_first(filters, sort)
+                documents = [first] if first is not None else []
+
+            if not documents:
+                if not upsert:
+                    return 0, 0, None, None, None
+                document = {
+                    k: copy_document(v) for k, v in filters.items()
+                    if not k.startswith('$') and not _is_operator_document(v) and '.' not in k
+                }
+                apply_update(document, update, inserted=True)
+                upserted_id = self._insert(document)
+                return 0, 0, upserted_id, None, self._documents[upserted_id]
+
+            modified = 0
+            before: dict[str, Any] | None = None
+            after: dict[str, Any] | None = None
+            for document in documents:
+                updated = copy_document(document)
+                apply_update(updated, update)
+                if updated != document:
+                    self._replace(document, updated)
+                    modified += 1
+                if before is None:
+                    before, after = document, updated
+            return len(documents), modified, None, before, after
+
+    @staticmethod
+    def _update_result(matched: int, modified: int, upserted_id: Any) -> UpdateResult:
+        raw_result: dict[str, Any] = {'n': matched or int(upserted_id is not None)}
+        raw_result['nModified'] = modified
+        if upserted_id is not None:
+            raw_result['upserted'] = upserted_id
+        return UpdateResult(raw_result, acknowledged=True)
+
+    def update_one(
+        self,
+        filter: Mapping[str, Any],  # noqa: A002
+        update: Mapping[str, Any],
+        upsert: bool = False,
+        session: Any = None,
+        **kwargs,
+    ) -> UpdateResult:
+        matched, modified, upserted_id, _, _ = self._update(filter, update, upsert, many=False)
+        return self._update_result(matched, modified, upserted_id)
+
+    def update_many(
+        self,
+        filter: Mapping[str, Any],  # noqa: A002
+        update: Mapping[str, Any],
+        upsert: bool = False,
+        session: Any = None,
+        **kwargs,
+    ) -> UpdateResult:
+        matched, modified, upserted_id, _, _ = self._update(filter, update, upsert, many=True)
+        return self._update_result(matched, modified, upserted_id)
+
+    def replace_one(
+        self,
+        filter: Mapping[str, Any],  # noqa: A002
+        replacement: Mapping[str, Any],
+        upsert: bool = False,
+        session: Any = None,
+        **kwargs,
+    ) -> UpdateResult:
+        return self.update_one(filter, replacement, upsert=upsert)
+
+    def find_one_and_update(
+        self,
+        filter: Mapping[str, Any],  # noqa: A002
+        update: Mapping[str, Any],
+        projection: Any = None,
+        sort: Any = None,
+        upsert: bool = False,
+        return_document: bool = False,
+        session: Any = None,
+        **kwargs,
+    ) -> dict[str, Any] | None:
+        _, _, _, before, after = self._update(filter, update, upsert, many=False, sort=sort)
+        document = after if return_document else before
+        return project(document, projection) if document is not None else None
+
+    def find_one_and_replace(
+        self,
+        filter: Mapping[str, Any],  # noqa: A002
+        replacement: Mapping[str, Any],
+        projection: Any = None,
+        sort: Any = None,
+        upsert: bool = False,
+        return_document: bool = False,
+        session: Any = None,
+        **kwargs,
+    ) -> dict[str, Any] | None:
+        return self.find_one_and_update(
+            filter, replacement, projection, sort, upsert, return_document,
+        )
+
+    def find_one_and_delete(
+        self,
+        filter: Mapping[str, Any],  # noqa: A002
+        projection: Any = None,
+        sort: Any = None,
+        session: Any = None,
+        **kwargs,
+    ) -> dict[str, Any] | None:
+        with self._lock:
+            document = self._find_first(filter, sort)
+            if document is None:
+                return None
+            self._remove(document)
+        return project(document, projection)
+
+    def delete_one(
+        self, filter: Mapping[str, Any], session: Any = None, **kwargs,  # noqa: A002
+    ) -> DeleteResult:
+        with self._lock:
+            document = self._find_first(filter)
+            if document is not None:
+                self._remove(document)
+        return DeleteResult({'n': int(document is not None)}, acknowledged=True)
+
+    def delete_many(
+        self, filter: Mapping[str, Any], session: Any = None, **kwargs,  # noqa: A002
+    ) -> DeleteResult:
+        with self._lock:
+            documents = list(self._find(filter))
+            for document in documents:
+                self._remove(document)
+        return DeleteResult({'n': len(documents)}, acknowledged=True)
+
+    def bulk_write(
+        self, requests: Iterable[Any], ordered: bool = True, session: Any = None, **kwargs,
+    ) -> BulkWriteResult:
+        """Executes `InsertOne`, `UpdateOne`, `UpdateMany`, `ReplaceOne`,
+        `DeleteOne` and `DeleteMany` requests, unlike MongoDB requests
+        are not applied atomically as a batch."""
+        result: dict[str, Any] = {
+            'writeErrors': [],
+            'writeConcernErrors': [],
+            'nInserted': 0,
+            'nUpserted': 0,
+            'nMatched': 0,
+            'nModified': 0,
+            'nRemoved': 0,
+            'upserted': [],
+        }
+        for index, request in enumerate(requests):
+            try:
+                if isinstance(request, InsertOne):
+                    self._insert(request._doc)
+                    result['nInserted'] += 1
+                elif isinstance(request, (UpdateOne, UpdateMany, ReplaceOne)):
+                    if not isinstance(update := request._doc, Mapping):
+                        raise OperationFailure(
+                            'Update pipelines are not supported by MemoryCollection', 2,
+                        )
+                    matched, modified, upserted_id, _, _ = self._update(
+                        request._filter,
+                        update,
+                        bool(request._upsert),
+                        many=isinstance(request, UpdateMany),
+                    )
+                    result['nMatched'] += matched
+                    result['nModified'] += modified
+                    if upserted_id is not None:
+                        result['nUpserted'] += 1
+                        result['upserted'].append({'index': index, '_id': upserted_id})
+                elif isinstance(request, (DeleteOne, DeleteMany)):
+                    many = isinstance(request, DeleteMany)
+                    delete = self.delete_many if many else self.delete_one
+                    result['nRemoved'] += delete(request._filter).deleted_count
+                else:
+                    raise TypeError(f'{request!r} is not a valid request')
+            except (DuplicateKeyError, OperationFailure) as e:
+                result['writeErrors'].append({
+                    'index': index, 'code': e.code, 'errmsg': str(e), 'op': request,
+                })
+                if ordered:
+                    break
+        if result['writeErrors']:
+            raise BulkWriteError(result)
+        return BulkWriteResult(result, acknowledged=True)
+
+    def drop(self, session: Any = None, **kwargs) -> None:
+        with self._lock:
+            self._documents.clear()
+            self._positions.clear()
+            self._indexes.clear()
+
+
+class AsyncMemoryCursor:
+    """Asynchronous cursor of :class:`AsyncMemoryCollection`."""
+
+    def __init__(self, cursor: MemoryCursor) -> None:
+        self.cursor = cursor
+
+    def sort(self, key_or_list: Any, direction: Any = None) -> 'AsyncMemoryCursor':
+        self.cursor.sort(key_or_list, direction)
+        return self
+
+    def skip(self, skip: int) -> 'AsyncMemoryCursor':
+        self.cursor.skip(skip)
+        return self
+
+    def limit(self, limit: int) -> 'AsyncMemoryCursor':
+        self.cursor.limit(limit)
+        return self
+
+    def batch_size(self, batch_size: int) -> 'AsyncMemoryCursor':
+        return self
+
+    def hint(self, index: Any) -> 'AsyncMemoryCursor':
+        return self
+
+    def max_time_ms(self, max_time_ms: int | None) -> 'AsyncMemoryCursor':
+        return self
+
+    def __aiter__(self) -> 'AsyncMemoryCursor':
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self.cursor)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+    async def to_list(self, length: int | None = None) -> list[dict[str, Any]]:
+        return self.cursor.to_list(length)
+
+    async def close(self) -> None:
+        self.cursor.close()
+
+
+class AsyncMemoryCollection:
+    """Asynchronous version of :class:`MemoryCollection` that implements the
+    part of :class:`motor.motor_asyncio.AsyncIOMotorCollection` API used by
+    mongorepo.
+
+    Documents are stored in :class:`MemoryCollection` available as
+    `collection`, pass `collection` to share documents with synchronous
+    repositories.
+    ### Usage example:
+    ```
+    @async_repository(
+        config=RepositoryConfig(entity_type=User, collection=AsyncMemoryCollection('users')),
+    )
+    class UserRepository:
+        ...
+    ```
+    """
+
+    def __init__(
+        self,
+        name: str = 'collection',
+        documents: Iterable[Mapping[str, Any]] | None = None,
+        collection: MemoryCollection | None = None,
+    ) -> None:
+        self.collection = collection if collection is not None else MemoryCollection(
+            name, documents,
+        )
+        self.name = self.collection.name
+        self.full_name = self.collection.full_name
+
+    def __len__(self) -> int:
+        return len(self.collection)
+
+    def __getitem__(self, name: str) -> 'AsyncMemoryCollection':
+        return AsyncMemoryCollection(collection=self.collection[name])
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.name!r}, documents={len(self)})'
+
+    def find(self, *args, **kwargs) -> AsyncMemoryCursor:
+        return AsyncMemoryCursor(self.collection.find(*args, **kwargs))
+
+    def list_indexes(self, *args, **kwargs) -> AsyncMemoryCursor:
+        return AsyncMemoryCursor(self.collection.list_indexes(*args, **kwargs))
+
+    async def find_one(self, *args, **kwargs) -> dict[str, Any] | None:
+        return self.collection.find_one(*args, **kwargs)
+
+    async def insert_one(self, *args, **kwargs) -> InsertOneResult:
+        return self.collection.insert_one(*args, **kwargs)
+
+    async def insert_many(self, *args, **kwargs) -> InsertManyResult:
+        return self.collection.insert_many(*args, **kwargs)
+
+    async def count_documents(self, *args, **kwargs) -> int:
+        return self.collection.count_documents(*args, **kwargs)
+
+    async def estimated_document_count(self, *args, **kwargs) -> int:
+        return self.collection.estimated_document_count(*args, **kwargs)
+
+    async def distinct(self, *args, **kwargs) -> list[Any]:
+        return self.collection.distinct(*args, **kwargs)
+
+    async def update_one(self, *args, **kwargs) -> UpdateResult:
+        return self.collection.update_one(*args, **kwargs)
+
+    async def update_many(self, *args, **kwargs) -> UpdateResult:
+        return self.collection.update_many(*args, **kwargs)
+
+    async def replace_one(self, *args, **kwargs) -> UpdateResult:
+        return self.collection.replace_one(*args, **kwargs)
+
+    async def find_one_and_update(self, *args, **kwargs) -> dict[str, Any] | None:
+        return self.collection.find_one_and_update(*args, **kwargs)
+
+    async def find_one_and_replace(self, *args, **kwargs) -> dict[str, Any] | None:
+        return self.collection.find_one_and_replace(*args, **kwargs)
+
+    async def find_one_and_delete(self, *args, **kwargs) -> dict[str, Any] | None:
+        return self.collection.find_one_and_delete(*args, **kwargs)
+
+    async def bulk_write(self, *args, **kwargs) -> BulkWriteResult:
+        return self.collection.bulk_write(*args, **kwargs)
+
+    async def delete_one(self, *args, **kwargs) -> DeleteResult:
+        return self.collection.delete_one(*args, **kwargs)
+
+    async def delete_many(self, *args, **kwargs) -> DeleteResult:
+        return self.collection.delete_many(*args, **kwargs)
+
+    async def create_index(self, *args, **kwargs) -> str:
+        return self.collection.create_index(*args, **kwargs)
+
+    async def create_indexes(self, *args, **kwargs) -> list[str]:
+        return self.collection.create_indexes(*args, **kwargs)
+
+    async def index_information(self, *args, **kwargs) -> dict[str, Any]:
+        return self.collection.index_information(*args, **kwargs)
+
+    async def drop_index(self, *args, **kwargs) -> None:
+        self.collection.drop_index(*args, **kwargs)
+
+    async def drop_indexes(self, *args, **kwargs) -> None:
+        self.collection.drop_indexes(*args, **kwargs)
+
+    async def drop(self, *args, **kwargs) -> None:
+        self.collection.drop(*args, **kwargs)
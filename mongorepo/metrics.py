@@ -0,0 +1,205 @@
+import bisect
+import math
+import threading
+from typing import Any, Callable, Iterator, Mapping
+
+PHASES = ('binding', 'modifiers_before', 'driver', 'conversion', 'modifiers_after')
+"""Phases of mongorepo method calls which latency is measured separately.
+
+`binding` is measured only for methods created with `implement`, `driver`
+is the time spent in collection commands and iterating their cursors.
+
+"""
+
+# Upper bounds of histogram buckets in seconds: 1us, 2us, 4us, ... ~137s
+_BUCKET_BOUNDS: tuple[float, ...] = tuple(1e-6 * 2 ** i for i in range(28))
+
+
+class LatencyHistogram:
+    """Histogram of latencies with logarithmic (power of two) buckets.
+
+    Percentiles are approximated by upper bounds of buckets, so they are
+    at most twice as large as the real ones.
+
+    """
+
+    __slots__ = ('count', 'total', 'min', 'max', '_buckets')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        # The last bucket counts latencies above the largest bound
+        self._buckets = [0] * (len(_BUCKET_BOUNDS) + 1)
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self._buckets[bisect.bisect_left(_BUCKET_BOUNDS, seconds)] += 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def buckets(self) -> Iterator[tuple[float, int]]:
+        """Yields `(upper bound in seconds, count)` of non-empty buckets."""
+        for i, count in enumerate(self._buckets):
+            if count:
+                yield (_BUCKET_BOUNDS[i] if i < len(_BUCKET_BOUNDS) else math.inf), count
+
+    def percentile(self, percent: float) -> float:
+        """Returns approximate latency (in seconds) that `percent` of recorded
+        latencies do not exceed."""
+        if not 0 <= percent <= 100:
+            raise ValueError('percent must be between 0 and 100')
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for bound, count in self.buckets():
+            seen += count
+            if seen >= rank:
+                # Bounds never exceed latencies that were really recorded
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            'count': self.count,
+            'total': self.total,
+            'min': self.min if self.count else 0.0,
+            'max': self.max,
+            'mean': self.mean,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'buckets': list(self.buckets()),
+        }
+
+
+class MethodMetrics:
+    """Counters and latency histograms of a single mongorepo method."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+        self.phases: dict[str, LatencyHistogram] = {phase: LatencyHistogram() for phase in PHASES}
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.errors = 0
+            self.latency = LatencyHistogram()
+            self.phases = {phase: LatencyHistogram() for phase in PHASES}
+
+    def record(self, seconds: float, phases: Mapping[str, float], error: bool = False) -> None:
+        """Records a call that took `seconds`, `phases` contains time spent in
+        each phase of the call, missing phases are not recorded."""
+        with self._lock:
+            self.calls += 1
+            if error:
+                self.errors += 1
+            self.latency.record(seconds)
+            for phase, phase_seconds in phases.items():
+                self.phases[phase].record(phase_seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'errors': self.errors,
+                'latency': self.latency.snapshot(),
+                'phases': {
+                    phase: histogram.snapshot()
+                    for phase, histogram in self.phases.items() if histogram.count
+                },
+            }
+
+
+class RepositoryMetrics:
+    """Call counters and latency histograms of methods of a mongorepo
+    repository.
+
+    Every method in `__mongorepo__['methods']` is instrumented, latency of
+    each call is also broken down into phases (see :data:`PHASES`).
+    ### Usage example:
+    ```
+    @repository(
+        config=RepositoryConfig(
+            entity_type=User,
+            collection=users,
+            metrics=RepositoryMetrics(),
+        ),
+    )
+    class UserRepository:
+        ...
+
+    repo = UserRepository()
+    repo.get(username='admin')
+    metrics = repo.__mongorepo__['metrics']
+    print(metrics['get'].calls, metrics['get'].latency.percentile(99))
+    print(json.dumps(metrics.snapshot()))
+    ```
+
+    Set `enabled` to `False` to stop recording, disabled instrumentation
+    is removed from methods (unless the repository has a slow query log),
+    so it adds no overhead to calls. Use separate metrics instance for every
+    repository.
+
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self._enabled = enabled
+        self._listeners: list[Callable[[bool], None]] = []
+        self.methods: dict[str, MethodMetrics] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        self._enabled = enabled
+        for listener in self._listeners:
+            listener(enabled)
+
+    def add_listener(self, listener: Callable[[bool], None]) -> None:
+        """Registers `listener` that is called with new value of `enabled`
+        whenever it is set."""
+        self._listeners.append(listener)
+
+    def __getitem__(self, name: str) -> MethodMetrics:
+        return self.methods[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.methods
+
+    def method(self, name: str) -> MethodMetrics:
+        """Returns metrics of method `name`, creates them if they do not
+        exist."""
+        if (metrics := self.methods.get(name, None)) is None:
+            with self._lock:
+                metrics = self.methods.setdefault(name, MethodMetrics(name))
+        return metrics
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Returns metrics of all methods as a dictionary of plain values.
+
+        Latencies are in seconds, `buckets` are `(upper bound, count)`
+        pairs of non-empty histogram buckets.
+
+        """
+        return {name: metrics.snapshot() for name, metrics in list(self.methods.items())}
+
+    def reset(self) -> None:
+        for metrics in list(self.methods.values()):
+            metrics.reset()
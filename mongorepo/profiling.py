@@ -0,0 +1,243 @@
+import asyncio
+import inspect
+import json
+import logging
+import threading
+from dataclasses import replace
+from typing import Any, Awaitable, Sequence
+
+from mongorepo.types.collection_observer import CommandEvent
+from mongorepo.types.profiling import QueryPlan, QueryShape, SlowQuery
+from mongorepo.utils.query_shapes import (
+    get_command_filter,
+    get_command_sort,
+    get_explain_command,
+    get_shape_key,
+    redact_filter,
+    summarize_plan,
+)
+
+logger = logging.getLogger('mongorepo.slow_queries')
+
+
+class SlowQueryLog:
+    """Log of repository method calls that take longer than `threshold`.
+
+    Every slow call is logged with the method name, its duration and shape
+    of the filter of its slowest collection command (field names and
+    operators, values are redacted). With `explain=True` each query shape
+    is explained with `explain('executionStats')` once, the plan is added
+    to log records of the shape and plans that scan the whole collection
+    are flagged with `COLLSCAN`.
+    ### Usage example:
+    ```
+    @repository(
+        config=RepositoryConfig(
+            entity_type=User,
+            collection=users,
+            slow_query_log=SlowQueryLog(threshold=0.05, explain=True),
+        ),
+    )
+    class UserRepository:
+        ...
+
+    # WARNING mongorepo.slow_queries: Slow query: get took 120.4 ms,
+    # find_one {"email": "?"}, COLLSCAN, 100000 documents examined
+    ```
+
+    Records are logged with `WARNING` level, :class:`SlowQuery` is available
+    as `slow_query` attribute of log records. Use separate log instance for
+    every repository.
+
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.1,
+        explain: bool = False,
+        logger: logging.Logger = logger,
+    ) -> None:
+        """
+        Args:
+            threshold: duration of method call in seconds, slower calls are logged.
+            explain: explain query shapes of slow calls.
+            logger: logger of slow calls.
+
+        """
+        if threshold < 0:
+            raise ValueError('threshold must not be negative')
+        self.threshold = threshold
+        self.explain = explain
+        self.logger = logger
+        self.plans: dict[str, QueryPlan | None] = {}
+        """Plans of explained query shapes by shape keys, `None` if shape is
+        being explained or cannot be explained."""
+
+        self._tasks: set[asyncio.Future] = set()
+        self._lock = threading.Lock()
+
+    def observe(
+        self,
+        method: str,
+        duration: float,
+        commands: Sequence[CommandEvent],
+        error: BaseException | None = None,
+    ) -> SlowQuery | None:
+        """Logs method call if it is slow, returns its :class:`SlowQuery`."""
+        if duration < self.threshold:
+            return None
+
+        query = SlowQuery(method=method, duration=duration, error=error)
+        if not commands:
+            self.log(query)
+            return query
+
+        # Commands with filters are preferred, they are the ones that can miss indexes
+        event = max(
+            commands, key=lambda e: (get_command_filter(e) is not None, e.duration),
+        )
+        query.command = event.command
+        if (filters := get_command_filter(event)) is not None:
+            query.shape = redact_filter(filters)
+        if not self.explain or query.shape is None:
+            self.log(query)
+            return query
+
+        key = get_shape_key(event.command, query.shape)
+        with self._lock:
+            explained = key in self.plans
+            if not explained:
+                self.plans[key] = None
+        if explained:
+            query.plan = self.plans[key]
+            self.log(query)
+            return query
+
+        try:
+            result = self._explain(event)
+        except Exception:
+            self.logger.debug('Cannot explain %s', event.command, exc_info=True)
+            self.log(query)
+            return query
+        if inspect.isawaitable(result):
+            # Asynchronous collections are explained in background, the call is not delayed
+            task = asyncio.ensure_future(self._explain_async(query, key, result))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            return query
+
+        query.plan = self.plans[key] = summarize_plan(result)
+        self.log(query)
+        return query
+
+    def _explain(self, event: CommandEvent) -> Any:
+        command = get_explain_command(event, event.collection.name)
+        return event.collection.database.command(command)
+
+    async def _explain_async(self, query: SlowQuery, key: str, result: Awaitable[Any]) -> None:
+        try:
+            query.plan = self.plans[key] = summarize_plan(await result)
+        except Exception:
+            self.logger.debug('Cannot explain %s', query.command, exc_info=True)
+        self.log(query)
+
+    def log(self, query: SlowQuery) -> None:
+        message = 'Slow query: %s took %.1f ms'
+        args: list[Any] = [query.method, query.duration * 1000]
+        if query.command is not None:
+            message += ', %s'
+            args.append(query.command)
+        if query.shape is not None:
+            message += ' %s'
+            args.append(json.dumps(query.shape))
+        if (plan := query.plan) is not None:
+            message += ', %s'
+            args.append('COLLSCAN' if plan.collscan else ' -> '.join(plan.stages))
+            if plan.index_names:
+                message += ' (%s)'
+                args.append(', '.join(plan.index_names))
+            if plan.docs_examined is not None:
+                message += ', %d documents examined'
+                args.append(plan.docs_examined)
+        if (error := query.error) is not None:
+            # Messages of driver errors contain values of documents, only the type is logged
+            message += ', failed with %s'
+            args.append(type(error).__name__)
+            if (code := getattr(error, 'code', None)) is not None:
+                message += ' (code %s)'
+                args.append(code)
+        self.logger.warning(message, *args, extra={'slow_query': query})
+
+
+class QueryShapeStats:
+    """Collection observer that aggregates query shapes of repository
+    commands.
+
+    Commands are grouped by command name, filter shape (field names and
+    operators, values are redacted) and sort keys. Frequency and cumulative
+    latency of every shape are counted, :func:`mongorepo.suggest_indexes`
+    recommends indexes for the observed shapes.
+    ### Usage example:
+    ```
+    @repository(
+        config=RepositoryConfig(entity_type=User, collection=users, query_shapes=QueryShapeStats()),
+    )
+    class UserRepository:
+        ...
+
+    for shape in repo.__mongorepo__['query_shapes'].shapes():
+        print(shape.command, shape.shape, shape.count, shape.total_duration)
+    for suggestion in suggest_indexes(repo):
+        print(suggestion.keys, suggestion.exists)
+    ```
+
+    Use separate instance for every repository.
+
+    """
+
+    def __init__(self, max_shapes: int = 1000) -> None:
+        """
+        Args:
+            max_shapes: maximum number of distinct shapes, commands of other
+                shapes are counted in `dropped`.
+
+        """
+        if max_shapes < 1:
+            raise ValueError('max_shapes must be positive')
+        self.max_shapes = max_shapes
+        self.dropped = 0
+        self._shapes: dict[str, QueryShape] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    def on_command(self, event: CommandEvent) -> None:
+        filters = get_command_filter(event)
+        if filters is None:
+            return
+        shape = redact_filter(filters)
+        sort = tuple(get_command_sort(event) or ())
+        key = f'{get_shape_key(event.command, shape)} {sort}'
+        with self._lock:
+            query_shape = self._shapes.get(key, None)
+            if query_shape is None:
+                if len(self._shapes) >= self.max_shapes:
+                    self.dropped += 1
+                    return
+                query_shape = self._shapes[key] = QueryShape(event.command, shape, sort)
+            query_shape.count += 1
+            query_shape.total_duration += event.duration
+            query_shape.max_duration = max(query_shape.max_duration, event.duration)
+
+    def shapes(self) -> list[QueryShape]:
+        """Returns observed shapes, shapes with the largest cumulative latency
+        go first."""
+        with self._lock:
+            shapes = [replace(shape) for shape in self._shapes.values()]
+        return sorted(shapes, key=lambda s: s.total_duration, reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._shapes.clear()
+            self.dropped = 0
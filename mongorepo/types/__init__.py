@@ -1,4 +1,6 @@
 from .base import (
+    AsyncCollectionType,
+    AsyncSessionType,
     CollectionType,
     Dataclass,
     Entity,
@@ -6,14 +8,33 @@ from .base import (
     ToDocumentConverter,
     ToEntityConverter,
 )
+from .batch import (
+    BatchInsert,
+    BatchInsertResult,
+    BulkIncrementResult,
+    ChunkError,
+)
+from .cache import CacheStats, EntityCache
+from .coalescing import Coalescing
+from .collection_observer import CollectionObserver, CommandEvent
 from .collection_provider import CollectionProvider
 from .field import Field
 from .field_alias import FieldAlias
+from .find_options import FindOptions
+from .index import Index, IndexDrift
+from .list_append import ListAppend
+from .list_buckets import ListBuckets
 from .method_access import MethodAccess, get_method_access_prefix
 from .mongorepo_dict import HasMongorepoDict, MongorepoDict
+from .pagination import Keyset, Page
+from .profiling import IndexSuggestion, QueryPlan, QueryShape, SlowQuery
+from .projection import Projection
 from .repository_config import RepositoryConfig
+from .write_behind import WriteBehind
 
 __all__ = [
+    "AsyncCollectionType",
+    "AsyncSessionType",
     "Dataclass",
     "Entity",
     "CollectionType",
@@ -24,8 +45,30 @@ __all__ = [
     "Field",
     "FieldAlias",
     "CollectionProvider",
+    "CollectionObserver",
+    "CommandEvent",
     "MethodAccess",
     "get_method_access_prefix",
     "MongorepoDict",
     "HasMongorepoDict",
+    "BatchInsert",
+    "BatchInsertResult",
+    "BulkIncrementResult",
+    "ChunkError",
+    "CacheStats",
+    "EntityCache",
+    "Coalescing",
+    "FindOptions",
+    "Index",
+    "IndexDrift",
+    "ListAppend",
+    "ListBuckets",
+    "Keyset",
+    "Page",
+    "Projection",
+    "IndexSuggestion",
+    "QueryPlan",
+    "QueryShape",
+    "SlowQuery",
+    "WriteBehind",
 ]
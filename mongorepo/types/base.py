@@ -5,6 +5,8 @@ from motor.motor_asyncio import (
     AsyncIOMotorClientSession,
     AsyncIOMotorCollection,
 )
+from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.asynchronous.collection import AsyncCollection
 from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
 
@@ -14,7 +16,17 @@ class Dataclass(Protocol):
 
 
 Entity = TypeVar("Entity")
-CollectionType = TypeVar('CollectionType', AsyncIOMotorCollection, Collection[Any])
-SessionType = TypeVar('SessionType', AsyncIOMotorClientSession, ClientSession)
+# Bounds instead of constraints, asynchronous methods are parametrized with unions of
+# `motor` and native `pymongo` types
+CollectionType = TypeVar(
+    'CollectionType', bound=AsyncIOMotorCollection | AsyncCollection[Any] | Collection[Any],
+)
+SessionType = TypeVar(
+    'SessionType', bound=AsyncIOMotorClientSession | AsyncClientSession | ClientSession,
+)
+# Asynchronous collections and sessions supported by asynchronous methods: `motor` and
+# native `pymongo` asynchronous API (`pymongo.AsyncMongoClient`)
+AsyncCollectionType = AsyncIOMotorCollection | AsyncCollection[Any]
+AsyncSessionType = AsyncIOMotorClientSession | AsyncClientSession
 ToEntityConverter = Callable[[dict[str, Any], type[Entity]], Entity]
 ToDocumentConverter = Callable[[Entity], dict[str, Any]]
@@ -0,0 +1,80 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True, frozen=True)
+class BatchInsert:
+    """Settings of streaming `add_batch` methods.
+
+    Entities are taken from any iterable (and asynchronous iterable for
+    asynchronous methods), converted and inserted by chunks of `chunk_size`
+    entities, so only the chunks being inserted are kept in memory. Write
+    errors of a chunk do not stop insertion of the next ones, they are
+    returned in :class:`BatchInsertResult`. Other errors (e.g. connection
+    errors) stop insertion, :class:`mongorepo.exceptions.BatchInsertException`
+    is raised with the result of the chunks inserted before.
+
+    """
+
+    chunk_size: int = 1000
+    """Number of entities inserted with one `insert_many` command."""
+
+    concurrency: int = 4
+    """Maximum number of chunks inserted concurrently by asynchronous methods,
+    synchronous methods and methods called in a session insert chunks one by
+    one."""
+
+    ordered: bool = False
+    """Insert documents of a chunk in order and stop the chunk at the first
+    error, by default all valid documents of a chunk are inserted."""
+
+    def __post_init__(self) -> None:
+        if self.chunk_size < 1:
+            raise ValueError('chunk_size must be positive')
+        if self.concurrency < 1:
+            raise ValueError('concurrency must be positive')
+
+
+@dataclass(slots=True)
+class ChunkError:
+    """Error of a chunk inserted by streaming `add_batch` method."""
+
+    chunk: int
+    """Index of the chunk."""
+
+    offset: int
+    """Index of the first entity of the chunk in the input."""
+
+    size: int
+    """Number of entities in the chunk."""
+
+    inserted_count: int
+    """Number of entities of the chunk that were inserted anyway."""
+
+    error: Exception
+
+
+@dataclass(slots=True)
+class BatchInsertResult:
+    """Result of streaming `add_batch` method."""
+
+    inserted_count: int = 0
+    chunk_count: int = 0
+    errors: list[ChunkError] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+@dataclass(slots=True)
+class BulkIncrementResult:
+    """Result of `incr_many` method."""
+
+    matched_count: int = 0
+    """Number of documents matched by filters of the increments."""
+
+    modified_count: int = 0
+    """Number of documents that were modified."""
+
+    chunk_count: int = 0
+    """Number of `bulk_write` commands sent to the server."""
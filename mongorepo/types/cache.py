@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Protocol
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters of a repository cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    """Number of entries removed to free space for new ones."""
+
+    expirations: int = 0
+    """Number of entries removed because their TTL expired."""
+
+    invalidations: int = 0
+    """Number of times entries were invalidated by repository writes."""
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class EntityCache(Protocol):
+    """Protocol of caches of mongorepo `get` methods.
+
+    Cache stores encoded documents by filters they were found with, `None`
+    value means that no document was found. `generation` must be increased
+    by every :meth:`clear` and :meth:`invalidate` call, values computed
+    before them are stale and must not be stored by :meth:`set`.
+
+    """
+
+    stats: CacheStats
+    generation: int
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Returns `(True, value)` if `key` is cached, `(False, None)`
+        otherwise."""
+        ...
+
+    def set(self, key: Hashable, value: Any, generation: int) -> None:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+    def invalidate(self, match: Callable[[Any], bool]) -> None:
+        """Removes cached misses and values for which `match` returns
+        `True`."""
+        ...
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class Coalescing:
+    """Settings of coalescing of concurrent calls of an asynchronous method
+    into a single database command.
+
+    Calls are collected until `max_batch_size` calls are pending or
+    `max_delay_ms` milliseconds passed since the first pending call, then
+    they are flushed together. With `max_delay_ms=0` calls are flushed on
+    the next iteration of the event loop, so only calls made concurrently
+    (e.g. with :func:`asyncio.gather`) are coalesced and latency of a single
+    call is not increased.
+
+    Calls made while a session is active (see :func:`mongorepo.set_session`)
+    are never coalesced.
+
+    """
+
+    max_batch_size: int = 100
+    """Maximum number of calls flushed together."""
+
+    max_delay_ms: float = 0
+    """Maximum time in milliseconds a call waits for other calls."""
+
+    def __post_init__(self) -> None:
+        if self.max_batch_size < 1:
+            raise ValueError('max_batch_size must be positive')
+        if self.max_delay_ms < 0:
+            raise ValueError('max_delay_ms cannot be negative')
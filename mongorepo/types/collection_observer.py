@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+
+@dataclass(slots=True)
+class CommandEvent:
+    """Collection command executed by a mongorepo method."""
+
+    command: str
+    """Name of the collection method, e.g. `find` or `update_one`."""
+
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+
+    duration: float
+    """Time in seconds spent waiting for the driver, for cursors it includes
+    iteration of the cursor."""
+
+    error: BaseException | None = None
+
+    collection: Any = None
+    """Collection that executed the command."""
+
+
+class CollectionObserver(Protocol):
+    """Protocol of observers of collection commands, observers are
+    registered in :attr:`CollectionProvider.observers`."""
+
+    def on_command(self, event: CommandEvent) -> None:
+        ...
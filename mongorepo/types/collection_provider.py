@@ -1,18 +1,37 @@
 from typing import Any, Generic
 
 from mongorepo import exceptions
+from mongorepo.utils.observed_collection import ObservedCollection
 
 from .base import CollectionType
+from .collection_observer import CollectionObserver
 
 
 class CollectionProvider(Generic[CollectionType]):
-    """Class that provides collections for mongorepo repositories."""
+    """Class that provides collections for mongorepo repositories.
+
+    If `observers` are registered, collections are provided wrapped in
+    :class:`mongorepo.utils.observed_collection.ObservedCollection` that
+    reports their commands to the observers.
+
+    """
 
     def __init__(self, obj: Any, collection: CollectionType | None = None):
         self.collection: CollectionType | None = collection
         self.obj = obj
+        self.observers: list[CollectionObserver] = []
+        self._observed: ObservedCollection | None = None
 
     def provide(self) -> CollectionType:
+        collection = self._provide()
+        if not self.observers:
+            return collection
+        observed = self._observed
+        if observed is None or observed.collection is not collection:
+            observed = self._observed = ObservedCollection(collection, self.observers)
+        return observed  # type: ignore[return-value]
+
+    def _provide(self) -> CollectionType:
         # First check if collection already provided
         if self.collection is not None:
             return self.collection
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterable
 
 from mongorepo.exceptions import MongorepoException
 
@@ -32,6 +32,13 @@ class Field[T]:
             value,
         )  # type: ignore[misc]
 
+    def to_documents(self, values: Iterable[Any]) -> list[Any]:
+        """Converts many values in one pass"""
+        if self._is_primitive:
+            return list(values)
+        to_document = self.to_document_converter
+        return [to_document(value) for value in values]  # type: ignore[misc]
+
     def to_value(self, doc: Any) -> Any:
         return doc if self._is_primitive else self.to_entity_converter(
             doc, self.field_type,  # type: ignore[misc, arg-type]
@@ -0,0 +1,80 @@
+from dataclasses import dataclass, fields
+from typing import Any, Sequence
+
+SortKey = str | tuple[str, int]
+
+
+@dataclass(slots=True, frozen=True)
+class FindOptions:
+    """Cursor options of `get_list`, `get_all` and `get_page` methods (pages
+    are always sorted by their keyset).
+
+    Options are resolved from :class:`RepositoryConfig` defaults, options of
+    the method (see `find_options` parameter of `GetListMethod` and
+    `GetAllMethod`) and options set for the current context with
+    :func:`mongorepo.find_options_context`, options that are not set (`None`)
+    do not override the previous ones.
+    ### Usage example:
+    ```
+    @repository(
+        config=RepositoryConfig(
+            entity_type=User,
+            find_options=FindOptions(sort=['username'], max_time_ms=2000),
+        ),
+    )
+    class UserRepository:
+        ...
+
+    with find_options_context(FindOptions(hint='company_1', batch_size=1000), repo):
+        for user in repo.get_all(company='mongorepo'):
+            ...
+    ```
+    """
+
+    sort: Sequence[SortKey] | None = None
+    """Sort keys as field names (ascending order) or `(field, direction)`
+    pairs."""
+
+    hint: str | Sequence[tuple[str, Any]] | None = None
+    """Index to use, its name or keys."""
+
+    batch_size: int | None = None
+    """Number of documents returned by the server in each batch."""
+
+    max_time_ms: int | None = None
+    """Time limit of the query on the server, exceeded queries raise
+    `pymongo.errors.ExecutionTimeout`."""
+
+    def __post_init__(self) -> None:
+        if isinstance(self.sort, str):
+            raise ValueError('sort must be a sequence of sort keys, e.g. ["field"]')
+        if self.batch_size is not None and self.batch_size < 0:
+            raise ValueError('batch_size cannot be negative')
+        if self.max_time_ms is not None and self.max_time_ms < 1:
+            raise ValueError('max_time_ms must be positive')
+
+    def merge(self, other: 'FindOptions | None') -> 'FindOptions':
+        """Returns options where options set in `other` override these
+        ones."""
+        if other is None:
+            return self
+        return FindOptions(
+            **{
+                f.name: value if (value := getattr(other, f.name)) is not None
+                else getattr(self, f.name)
+                for f in fields(self)
+            },
+        )
+
+    def to_kwargs(self) -> dict[str, Any]:
+        """Returns keyword arguments of `find()`"""
+        kwargs: dict[str, Any] = {}
+        if self.sort is not None:
+            kwargs['sort'] = [(key, 1) if isinstance(key, str) else key for key in self.sort]
+        if self.hint is not None:
+            kwargs['hint'] = self.hint if isinstance(self.hint, str) else list(self.hint)
+        if self.batch_size is not None:
+            kwargs['batch_size'] = self.batch_size
+        if self.max_time_ms is not None:
+            kwargs['max_time_ms'] = self.max_time_ms
+        return kwargs
@@ -0,0 +1,112 @@
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+from pymongo import IndexModel
+
+IndexKey = tuple[str, int | str]
+
+
+class Index:
+    """Class that declares index of a repository collection.
+
+    Keys are passed as field names (ascending order) or as `(field, direction)`
+    pairs, direction can be any pymongo index type (`pymongo.DESCENDING`,
+    `pymongo.TEXT`, `'hashed'`, ...)
+    ### Usage example:
+    ```
+    @repository(
+        config=RepositoryConfig(
+            entity_type=User,
+            indexes=[
+                Index('username', unique=True),
+                Index('company', ('created_at', pymongo.DESCENDING)),
+                Index('session_started_at', expire_after_seconds=3600),
+                Index('email', unique=True, partial_filter={'email': {'$exists': True}}),
+            ],
+        ),
+    )
+    class UserRepository:
+        ...
+
+    ensure_indexes(UserRepository())
+    ```
+    """
+
+    __slots__ = ('keys', 'name', 'unique', 'sparse', 'expire_after_seconds', 'partial_filter')
+
+    def __init__(
+        self,
+        *keys: str | IndexKey,
+        name: str | None = None,
+        unique: bool = False,
+        sparse: bool = False,
+        expire_after_seconds: int | None = None,
+        partial_filter: dict[str, Any] | None = None,
+    ) -> None:
+        if not keys:
+            raise ValueError('Index must contain at least one key')
+        if sparse and partial_filter is not None:
+            # Rejected by MongoDB, partial indexes supersede sparse ones
+            raise ValueError('Index cannot be both sparse and partial')
+        self.keys: tuple[IndexKey, ...] = tuple(
+            (key, 1) if isinstance(key, str) else (key[0], key[1]) for key in keys
+        )
+        self.name: str = name or '_'.join(f'{k}_{d}' for k, d in self.keys)
+        self.unique = unique
+        self.sparse = sparse
+        self.expire_after_seconds = expire_after_seconds
+        self.partial_filter = partial_filter
+
+    @property
+    def options(self) -> dict[str, Any]:
+        """Index options in MongoDB format, as they are returned by
+        `list_indexes()`"""
+        options: dict[str, Any] = {}
+        if self.unique:
+            options['unique'] = True
+        if self.sparse:
+            options['sparse'] = True
+        if self.expire_after_seconds is not None:
+            options['expireAfterSeconds'] = self.expire_after_seconds
+        if self.partial_filter is not None:
+            options['partialFilterExpression'] = self.partial_filter
+        return options
+
+    def to_index_model(self) -> IndexModel:
+        return IndexModel(list(self.keys), name=self.name, **self.options)
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.keys))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Index):
+            return (
+                self.name == other.name and self.keys == other.keys
+                and self.options == other.options
+            )
+        return False
+
+    def __repr__(self) -> str:
+        keys = ', '.join(repr(key) for key in self.keys)
+        options = ''.join(f', {k}={v!r}' for k, v in self.options.items())
+        return f'{self.__class__.__name__}({keys}, name={self.name!r}{options})'
+
+
+@dataclass(slots=True)
+class IndexDrift:
+    """Difference between indexes declared in :class:`RepositoryConfig` and
+    indexes that exist in the collection."""
+
+    missing: list[Index] = field(default_factory=list)
+    """Declared indexes that do not exist in the collection."""
+
+    changed: list[tuple[Index, Mapping[str, Any]]] = field(default_factory=list)
+    """Declared indexes and existing indexes with the same name, but different
+    keys or options."""
+
+    extra: list[Mapping[str, Any]] = field(default_factory=list)
+    """Existing indexes that are not declared (`_id_` index is ignored)."""
+
+    @property
+    def in_sync(self) -> bool:
+        return not (self.missing or self.changed or self.extra)
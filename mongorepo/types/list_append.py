@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True, frozen=True)
+class ListAppend:
+    """Settings of `{field}__append` methods of a list field.
+
+    Values are appended with `$push` and `$each`, so appending many values
+    costs one update. With `max_length` the array is capped (`$slice`) and
+    only the last `max_length` elements are kept, with `sort` the array is
+    sorted (`$sort`) before it is capped. With `unique=True` values are added
+    with `$addToSet` and values that are already in the array are skipped,
+    `$addToSet` cannot sort or cap the array.
+
+    """
+
+    max_length: int | None = None
+    """Maximum number of elements kept in the array, the oldest elements (or
+    the first elements in `sort` order) are removed."""
+
+    sort: Any = None
+    """`1`/`-1` to sort values, or a mapping of element fields to directions,
+    e.g. `{'created_at': 1}`."""
+
+    unique: bool = False
+    """Add only values that are not in the array yet."""
+
+    def __post_init__(self) -> None:
+        if self.max_length is not None and self.max_length < 1:
+            raise ValueError('max_length must be positive')
+        if self.unique and (self.max_length is not None or self.sort is not None):
+            raise ValueError('unique values cannot be sorted or capped')
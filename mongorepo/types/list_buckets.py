@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True, frozen=True)
+class ListBuckets:
+    """Bucketed storage of a list field (bucket pattern).
+
+    Elements are not stored in the array of the entity document, they are
+    stored in bucket documents of a side collection, every bucket holds up
+    to `bucket_size` elements:
+    `{'parent': <_id of the entity document>, 'seq': 0, 'count': 2, 'items': [...]}`.
+    Documents do not grow with the list and costs of `{field}__append`,
+    `{field}__pop` and `{field}__list` pages do not depend on the list
+    length. All buckets of a list but the last one are full, so a page of
+    `{field}__list(offset, limit)` is read from the buckets that hold it.
+
+    Bucket methods look up `_id` of the entity document by filters first,
+    they return `None` if it is not found. `{field}__remove` removes all
+    equal elements and rewrites buckets from the first one that holds the
+    value to the end of the list, it returns the number of removed elements.
+    Lookups of the last bucket skip empty buckets, so buckets left empty by
+    an interrupted pop do not break appends and paging. `delete` and
+    `delete_many` of the repository delete buckets of deleted documents.
+    Bucket methods do not read or write the field in the entity document:
+    elements passed to `add` or `update` stay there and are not seen by
+    `{field}__list` and `{field}__pop`, store an empty list in the field.
+    A unique index on `parent` and `seq` is created in the side collection
+    on first use.
+
+    """
+
+    bucket_size: int = 100
+    """Maximum number of elements in a bucket document."""
+
+    collection: Any = None
+    """Side collection of buckets, by default it is the `{collection}.{field}`
+    sub-collection of the repository collection."""
+
+    def __post_init__(self) -> None:
+        if self.bucket_size < 1:
+            raise ValueError('bucket_size must be positive')
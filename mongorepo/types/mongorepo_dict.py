@@ -1,16 +1,35 @@
-from typing import Generic, Protocol, TypedDict
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Generic, Protocol, TypedDict
 
 from mongorepo._methods.interfaces import MongorepoMethod
+from mongorepo.metrics import RepositoryMetrics
+from mongorepo.profiling import QueryShapeStats, SlowQueryLog
+from mongorepo.utils.change_tracking import SnapshotStore
 
 from .base import CollectionType, SessionType
+from .cache import EntityCache
 from .collection_provider import CollectionProvider
+from .find_options import FindOptions
 from .repository_config import RepositoryConfig
 
+if TYPE_CHECKING:
+    from mongorepo.utils.write_behind import AsyncCounterBuffer, CounterBuffer
+
 
 class MongorepoDict(Generic[SessionType, CollectionType], TypedDict, total=True):
     methods: dict[str, MongorepoMethod[SessionType]]
     repository_config: RepositoryConfig[CollectionType]
     collection_provider: CollectionProvider[CollectionType]
+    session: ContextVar[SessionType | None]
+    cache: EntityCache | None
+    snapshots: SnapshotStore | None
+    find_options: ContextVar[FindOptions | None]
+    metrics: RepositoryMetrics | None
+    slow_query_log: SlowQueryLog | None
+    query_shapes: QueryShapeStats | None
+    counters: 'CounterBuffer | AsyncCounterBuffer | None'
+    # Sessions of transactions that wrote through the repository and may not be committed yet
+    transactions: list[Any]
 
 
 class HasMongorepoDict(Generic[SessionType, CollectionType], Protocol):
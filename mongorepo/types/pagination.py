@@ -0,0 +1,36 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True, frozen=True)
+class Keyset:
+    """Settings of keyset (cursor-based) pagination.
+
+    Instead of skipping `offset` documents, every page continues right after
+    the last document of the previous page, so deep pages cost the same as
+    the first one. Documents are ordered by `sort_key` and `_id` is used as a
+    tie-breaker, for the best performance `sort_key` should be indexed
+    (`(sort_key, _id)` compound index).
+
+    """
+
+    sort_key: str = '_id'
+    """Document field used to order pages."""
+
+    descending: bool = False
+    """Order pages by `sort_key` in descending order."""
+
+
+@dataclass(slots=True)
+class Page[T]:
+    """Page of entities returned by keyset pagination methods."""
+
+    items: list[T] = field(default_factory=list)
+    """Entities of the page."""
+
+    next_token: str | None = None
+    """Opaque continuation token of the next page, `None` if there are no
+    more pages."""
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_token is not None
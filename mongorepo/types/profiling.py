@@ -0,0 +1,119 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from .index import Index, IndexKey
+
+
+@dataclass(slots=True, frozen=True)
+class QueryPlan:
+    """Summary of `explain('executionStats')` output."""
+
+    stages: tuple[str, ...]
+    """Stages of the winning plan from the root, e.g. `('FETCH', 'IXSCAN')`."""
+
+    index_names: tuple[str, ...] = ()
+    """Names of indexes used by the winning plan."""
+
+    docs_examined: int | None = None
+    keys_examined: int | None = None
+    returned: int | None = None
+
+    @property
+    def collscan(self) -> bool:
+        """Whether the plan scans the whole collection."""
+        return 'COLLSCAN' in self.stages
+
+
+@dataclass(slots=True)
+class SlowQuery:
+    """Call of a repository method that exceeded slow query threshold."""
+
+    method: str
+    duration: float
+    """Duration of the method call in seconds."""
+
+    command: str | None = None
+    """The slowest collection command made by the call."""
+
+    shape: dict[str, Any] | None = None
+    """Filter of the command with redacted values (see
+    :func:`mongorepo.utils.query_shapes.redact_filter`)."""
+
+    plan: QueryPlan | None = None
+    """Plan of the command if it was explained."""
+
+    error: BaseException | None = field(default=None, repr=False)
+    """Exception raised by the command, only its type and code are logged
+    since its message may contain values."""
+
+
+@dataclass(slots=True)
+class QueryShape:
+    """Statistics of collection commands with the same filter shape and
+    sort."""
+
+    command: str
+    shape: dict[str, Any]
+    """Filter with redacted values."""
+
+    sort: tuple[IndexKey, ...] = ()
+    count: int = 0
+    total_duration: float = 0.0
+    """Cumulative duration of commands in seconds."""
+
+    max_duration: float = 0.0
+
+    @property
+    def mean_duration(self) -> float:
+        return self.total_duration / self.count if self.count else 0.0
+
+    @property
+    def fields(self) -> dict[str, tuple[str, ...]]:
+        """Filtered fields and their operators, equality is `$eq`, fields of
+        `$and` are included, fields of `$or` and `$nor` are not."""
+        fields: dict[str, tuple[str, ...]] = {}
+        shapes = [self.shape]
+        while shapes:
+            for key, value in shapes.pop().items():
+                if key == '$and':
+                    shapes.extend(f for f in value if isinstance(f, dict))
+                elif key.startswith('$'):
+                    continue
+                else:
+                    operators = tuple(sorted(value)) if isinstance(value, dict) else ('$eq',)
+                    fields[key] = tuple(sorted({*fields.get(key, ()), *operators}))
+        return fields
+
+
+@dataclass(slots=True)
+class IndexSuggestion:
+    """Index recommended by :func:`mongorepo.suggest_indexes`."""
+
+    keys: tuple[IndexKey, ...]
+    """Keys in Equality, Sort, Range order."""
+
+    shapes: list[QueryShape] = field(default_factory=list)
+    """Query shapes the index would serve."""
+
+    existing_index: str | None = None
+    """Name of existing index that already serves the shapes."""
+
+    equality_fields: int = 0
+    """Number of leading keys that are matched by equality, their order does
+    not matter."""
+
+    @property
+    def exists(self) -> bool:
+        return self.existing_index is not None
+
+    @property
+    def count(self) -> int:
+        return sum(shape.count for shape in self.shapes)
+
+    @property
+    def total_duration(self) -> float:
+        return sum(shape.total_duration for shape in self.shapes)
+
+    def to_index(self) -> Index:
+        """Returns the index to declare in `RepositoryConfig.indexes`."""
+        return Index(*self.keys)
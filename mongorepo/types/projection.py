@@ -0,0 +1,64 @@
+import dataclasses
+from typing import Any
+
+
+class Projection:
+    """Class that declares fields returned by read methods.
+
+    Only `fields` (dotted paths are allowed) are sent by the server. Documents
+    are converted into `entity_type`, a lightweight entity that contains only
+    projected fields, or returned as dictionaries if it is not passed. Fields
+    of `entity_type` are projected if `fields` are not passed.
+    ### Usage example:
+    ```
+    @dataclass
+    class UserSummary:
+        id: str
+        username: str
+
+    @repository(
+        config=RepositoryConfig(entity_type=User),
+        projections={
+            'summary': Projection(entity_type=UserSummary),
+            'contacts': Projection('email', 'address.city'),
+        },
+    )
+    class UserRepository:
+        ...
+
+    repo = UserRepository()
+    repo.get_list__summary(offset=0, limit=50)  # [UserSummary(id='1', username='admin'), ...]
+    repo.get__contacts(id='1')  # {'email': '...', 'address': {'city': '...'}}
+    ```
+    """
+
+    __slots__ = ('fields', 'entity_type')
+
+    def __init__(self, *fields: str, entity_type: type | None = None) -> None:
+        if not fields:
+            if entity_type is None or not dataclasses.is_dataclass(entity_type):
+                raise ValueError('Projection must contain fields or dataclass entity_type')
+            fields = tuple(f.name for f in dataclasses.fields(entity_type))
+        self.fields: tuple[str, ...] = fields
+        self.entity_type = entity_type
+
+    @property
+    def spec(self) -> dict[str, Any]:
+        """Projection in MongoDB format, `_id` is excluded unless it is one of
+        `fields`"""
+        spec: dict[str, Any] = dict.fromkeys(self.fields, 1)
+        spec.setdefault('_id', 0)
+        return spec
+
+    def __hash__(self) -> int:
+        return hash((self.fields, self.entity_type))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Projection):
+            return self.fields == other.fields and self.entity_type is other.entity_type
+        return False
+
+    def __repr__(self) -> str:
+        fields = ', '.join(repr(field) for field in self.fields)
+        entity_type = self.entity_type.__name__ if self.entity_type else None
+        return f'{self.__class__.__name__}({fields}, entity_type={entity_type})'
@@ -1,6 +1,12 @@
-from dataclasses import dataclass
-from typing import Any, Callable
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
 
+from mongorepo.metrics import RepositoryMetrics
+from mongorepo.profiling import QueryShapeStats, SlowQueryLog
+
+from .cache import EntityCache
+from .find_options import FindOptions
+from .index import Index
 from .method_access import MethodAccess
 
 
@@ -19,7 +25,8 @@ class RepositoryConfig[CollectionType]:
 
     collection: CollectionType | None = None
     """The MongoDB collection instance used by the repository for database
-    operations."""
+    operations, in-memory collections of :mod:`mongorepo.memory` can be used
+    instead of MongoDB ones."""
 
     method_access: MethodAccess | None = None
     """Configuration defining access control and permissions for repository
@@ -44,3 +51,56 @@ class RepositoryConfig[CollectionType]:
     handles instantiation for both top-level and nested entities.
 
     """
+
+    indexes: Sequence[Index] = field(default_factory=tuple)
+    """Indexes of the collection.
+
+    Indexes are not created automatically, use
+    :func:`mongorepo.ensure_indexes` (:func:`mongorepo.async_ensure_indexes`)
+    on application startup and :func:`mongorepo.index_drift` to compare them
+    with indexes that exist in the collection.
+
+    """
+
+    cache: EntityCache | None = None
+    """Cache of documents found by `get` methods (see :class:`mongorepo.cache.LRUCache`).
+
+    Cache is cleared by every write made through the repository, reads in a
+    session bypass it. After a write in a transaction the cache is bypassed
+    until the transaction is committed or aborted and cleared again then,
+    so documents read before commit are not kept. The cache is available as
+    `__mongorepo__['cache']`, e.g. to read its `stats`.
+
+    """
+
+    track_changes: bool = False
+    """Update only changed fields of entities.
+
+    Entities loaded by `get`, `get_list`, `get_all`, `get_page` and `update`
+    methods are remembered together with their documents, when such entity
+    is passed to `update`, only changed dotted paths are sent with `$set`
+    (and `$unset`). Other entities are updated entirely.
+
+    """
+
+    find_options: FindOptions | None = None
+    """Default options (sort, index hint, batch size and time limit) of
+    `get_list`, `get_all` and `get_page` methods (see :class:`mongorepo.FindOptions`)."""
+
+    metrics: RepositoryMetrics | None = None
+    """Call counters and latency histograms of repository methods (see
+    :class:`mongorepo.metrics.RepositoryMetrics`).
+
+    Methods are instrumented only if metrics are set, the metrics are
+    available as `__mongorepo__['metrics']`.
+
+    """
+
+    slow_query_log: SlowQueryLog | None = None
+    """Log of method calls slower than a threshold, optionally with plans of
+    their queries (see :class:`mongorepo.profiling.SlowQueryLog`)."""
+
+    query_shapes: QueryShapeStats | None = None
+    """Statistics of query shapes of repository commands (see
+    :class:`mongorepo.profiling.QueryShapeStats`), they are available as
+    `__mongorepo__['query_shapes']` and used by :func:`mongorepo.suggest_indexes`."""
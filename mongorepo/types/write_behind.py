@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class WriteBehind:
+    """Settings of write-behind buffering of `incr__`/`decr__` methods.
+
+    Increments are not written when the method is called, they are summed in
+    memory per filter and field and flushed as a single unordered
+    `bulk_write` of `$inc` updates (one update per filter) every
+    `flush_interval` seconds, when `max_pending` counters are pending, on
+    explicit :func:`mongorepo.flush_counters` /
+    :func:`mongorepo.async_flush_counters` call and, for synchronous
+    repositories, at interpreter exit. Buffered calls return `None`.
+
+    Durability: buffered increments live only in process memory. Increments
+    of the last `flush_interval` seconds are lost if the process crashes or
+    is killed, asynchronous repositories also lose them on exit unless
+    `async_flush_counters` is awaited on shutdown. Until they are flushed,
+    increments are not visible to reads. If a flush fails with a connection
+    error the increments are put back and retried by the next flush (they
+    may be applied twice if the server applied them before the error),
+    updates rejected by the server (`BulkWriteError`) are dropped and logged.
+
+    Calls made while a session is active (see :func:`mongorepo.set_session`)
+    and calls with filters that cannot be used as dictionary keys (e.g.
+    `id__in=[...]`) are written immediately.
+
+    """
+
+    flush_interval: float = 1.0
+    """Maximum time in seconds an increment waits in the buffer, `0` disables
+    periodic flushes."""
+
+    max_pending: int = 1000
+    """Number of pending (filter, field) counters that triggers a flush."""
+
+    def __post_init__(self) -> None:
+        if self.flush_interval < 0:
+            raise ValueError('flush_interval cannot be negative')
+        if self.max_pending < 1:
+            raise ValueError('max_pending must be positive')
@@ -0,0 +1,129 @@
+import asyncio
+from itertools import islice
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Iterable,
+)
+
+from pymongo.errors import BulkWriteError, PyMongoError, WriteError
+
+from mongorepo.exceptions import BatchInsertException
+from mongorepo.types.batch import BatchInsert, BatchInsertResult, ChunkError
+
+Chunk = list[dict[str, Any]]
+
+# Errors of documents of a chunk, other errors (e.g. connection errors) would fail the next
+# chunks as well and stop insertion
+_CHUNK_ERRORS = (BulkWriteError, WriteError)
+
+
+def _add_chunk_result(
+    result: BatchInsertResult,
+    chunk: int,
+    offset: int,
+    size: int,
+    error: Exception | None,
+) -> None:
+    if error is None:
+        result.inserted_count += size
+        return
+    inserted = error.details.get('nInserted', 0) if isinstance(error, BulkWriteError) else 0
+    result.inserted_count += inserted
+    result.errors.append(
+        ChunkError(chunk=chunk, offset=offset, size=size, inserted_count=inserted, error=error),
+    )
+
+
+def insert_chunks(
+    entities: Iterable[Any],
+    to_document: Callable[[Any], dict[str, Any]],
+    insert_many: Callable[[Chunk], Any],
+    options: BatchInsert,
+) -> BatchInsertResult:
+    """Converts and inserts `entities` by chunks with `insert_many`"""
+    result = BatchInsertResult()
+    iterator = iter(entities)
+    offset = 0
+    while chunk := [to_document(entity) for entity in islice(iterator, options.chunk_size)]:
+        try:
+            insert_many(chunk)
+            error = None
+        except PyMongoError as e:
+            error = e
+        _add_chunk_result(result, result.chunk_count, offset, len(chunk), error)
+        result.chunk_count += 1
+        offset += len(chunk)
+        if error is not None and not isinstance(error, _CHUNK_ERRORS):
+            raise BatchInsertException(result) from error
+    return result
+
+
+async def _aiter_chunks(
+    entities: Iterable[Any] | AsyncIterable[Any],
+    to_document: Callable[[Any], dict[str, Any]],
+    size: int,
+) -> AsyncGenerator[Chunk, None]:
+    if not isinstance(entities, AsyncIterable):
+        iterator = iter(entities)
+        while chunk := [to_document(entity) for entity in islice(iterator, size)]:
+            yield chunk
+        return
+
+    chunk = []
+    async for entity in entities:
+        chunk.append(to_document(entity))
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def insert_chunks_async(
+    entities: Iterable[Any] | AsyncIterable[Any],
+    to_document: Callable[[Any], dict[str, Any]],
+    insert_many: Callable[[Chunk], Awaitable[Any]],
+    options: BatchInsert,
+) -> BatchInsertResult:
+    """Converts and inserts `entities` by chunks with `insert_many`, up to
+    `options.concurrency` chunks are inserted concurrently."""
+    result = BatchInsertResult()
+    in_flight: dict[asyncio.Task, tuple[int, int, int]] = {}
+
+    def collect(done: set[asyncio.Task]) -> None:
+        stop_error: BaseException | None = None
+        for task in done:
+            chunk, offset, size = in_flight.pop(task)
+            error = task.exception()
+            if error is not None and not isinstance(error, PyMongoError):
+                raise error
+            _add_chunk_result(result, chunk, offset, size, error)  # type: ignore[arg-type]
+            if error is not None and not isinstance(error, _CHUNK_ERRORS):
+                stop_error = error
+        if stop_error is not None:
+            result.errors.sort(key=lambda e: e.chunk)
+            raise BatchInsertException(result) from stop_error
+
+    offset = 0
+    try:
+        async for chunk in _aiter_chunks(entities, to_document, options.chunk_size):
+            if len(in_flight) >= options.concurrency:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                collect(done)
+            task = asyncio.ensure_future(insert_many(chunk))
+            in_flight[task] = (result.chunk_count, offset, len(chunk))
+            result.chunk_count += 1
+            offset += len(chunk)
+        if in_flight:
+            done, _ = await asyncio.wait(in_flight)
+            collect(done)
+    finally:
+        # Input or conversion failed, do not leave chunks inserting in background
+        for task in in_flight:
+            task.cancel()
+    result.errors.sort(key=lambda e: e.chunk)
+    return result
@@ -0,0 +1,80 @@
+from itertools import islice
+from typing import Any, Iterable, Iterator, Mapping
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+from pymongo.results import BulkWriteResult
+
+from mongorepo.exceptions import BulkIncrementException, MongorepoException
+from mongorepo.types.batch import BulkIncrementResult
+from mongorepo.utils.query_filters import compile_filters
+
+MAX_WRITE_BATCH_SIZE = 100_000
+"""Default `maxWriteBatchSize` of MongoDB, maximum number of operations of one
+`bulk_write` command. Larger batches would be split by the driver anyway,
+messages that exceed the size limit are still split by the driver."""
+
+type Increments = Mapping[Any, Mapping[str, int]] | Iterable[
+    tuple[Mapping[str, Any], Mapping[str, int]]
+]
+
+
+def _iter_increments(
+    increments: Increments, by: str | None,
+) -> Iterator[tuple[Mapping[str, Any], Mapping[str, int]]]:
+    if by is not None:
+        if not isinstance(increments, Mapping):
+            raise MongorepoException(
+                message=f'Increments must be a mapping of "{by}" values to deltas when "by" '
+                'is passed',
+            )
+        return (({by: value}, deltas) for value, deltas in increments.items())
+    if isinstance(increments, Mapping):
+        raise MongorepoException(
+            message='Pass "by" field to increment documents by mapping of its values, '
+            'otherwise increments must be (filters, deltas) pairs',
+        )
+    return iter(increments)
+
+
+def iter_increment_chunks(
+    method: Any,
+    increments: Increments,
+    by: str | None,
+    fields: frozenset[str],
+    chunk_size: int = MAX_WRITE_BATCH_SIZE,
+) -> Iterator[list[UpdateOne]]:
+    """Yields `$inc` updates of `increments` by chunks of `chunk_size`,
+    increments are converted lazily chunk by chunk."""
+    def to_update(filters: Mapping[str, Any], deltas: Mapping[str, int]) -> UpdateOne | None:
+        if invalid := deltas.keys() - fields:
+            raise MongorepoException(
+                message=f'Cannot increment {sorted(invalid)}: not integer fields of repository, '
+                f'integer fields: {sorted(fields)}',
+            )
+        if not (update := {field: delta for field, delta in deltas.items() if delta}):
+            return None
+        return UpdateOne(compile_filters(method, dict(filters)), {'$inc': update})
+
+    updates = (
+        update for filters, deltas in _iter_increments(increments, by)
+        if (update := to_update(filters, deltas)) is not None
+    )
+    while chunk := list(islice(updates, chunk_size)):
+        yield chunk
+
+
+def add_bulk_result(result: BulkIncrementResult, bulk_result: BulkWriteResult) -> None:
+    result.matched_count += bulk_result.matched_count
+    result.modified_count += bulk_result.modified_count
+    result.chunk_count += 1
+
+
+def get_bulk_error(result: BulkIncrementResult, error: PyMongoError) -> BulkIncrementException:
+    """Returns exception for the failed chunk that carries `result` of the
+    previous chunks, increments of the chunk that were applied despite
+    write errors are added to it."""
+    if isinstance(error, BulkWriteError):
+        result.matched_count += error.details.get('nMatched', 0)
+        result.modified_count += error.details.get('nModified', 0)
+    return BulkIncrementException(result)
@@ -0,0 +1,145 @@
+import weakref
+from dataclasses import asdict
+from typing import Any, Callable, Iterable
+
+from mongorepo.exceptions import MongorepoException
+from mongorepo.memory import copy_document
+
+
+class SnapshotStore:
+    """Stores documents of entities as they were loaded from the database.
+
+    Snapshots are removed together with their entities, entities that do
+    not support weak references (e.g. dataclasses with `slots=True` and
+    without `weakref_slot=True`) are not tracked.
+
+    """
+
+    __slots__ = ('to_document', '_copy', '_snapshots')
+
+    def __init__(self, to_document: Callable[[Any], dict[str, Any]]) -> None:
+        self.to_document = to_document
+        # Custom converters may return lists and dicts shared with entities, their mutations
+        # would change snapshots too, `asdict` copies them
+        self._copy = to_document is not asdict
+        self._snapshots: dict[int, tuple[weakref.ref, dict[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def track(self, entity: Any, document: dict[str, Any] | None = None) -> None:
+        """Saves snapshot of `entity`, `document` must be returned by
+        `to_document` for `entity` if it is passed."""
+        key = id(entity)
+        try:
+            ref = weakref.ref(entity, lambda _: self._snapshots.pop(key, None))
+        except TypeError:
+            return
+        if document is None:
+            document = self.to_document(entity)
+        self._snapshots[key] = (ref, copy_document(document) if self._copy else document)
+
+    def track_all(self, entities: Iterable[Any]) -> None:
+        for entity in entities:
+            self.track(entity)
+
+    def get(self, entity: Any) -> dict[str, Any] | None:
+        """Returns snapshot of `entity` or `None` if it is not tracked."""
+        entry = self._snapshots.get(id(entity), None)
+        # Identity check protects from ids reused by new objects
+        if entry is None or entry[0]() is not entity:
+            return None
+        return entry[1]
+
+
+def _is_path_key(key: Any) -> bool:
+    return isinstance(key, str) and bool(key) and '.' not in key and not key.startswith('$')
+
+
+def get_document_changes(
+    old: dict[str, Any], new: dict[str, Any], prefix: str = '',
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Returns `($set, $unset)` specifications that turn `old` document into
+    `new` one.
+
+    Nested documents are compared recursively and only changed dotted paths
+    are returned, other values (including lists) are replaced entirely if
+    they differ. `_id` of the top-level document is ignored.
+
+    """
+    to_set: dict[str, Any] = {}
+    to_unset: dict[str, Any] = {}
+    for key, value in new.items():
+        if not prefix and key == '_id':
+            continue
+        path = f'{prefix}{key}'
+        if key not in old:
+            to_set[path] = value
+            continue
+        old_value = old[key]
+        if (
+            isinstance(value, dict) and isinstance(old_value, dict)
+            and value and old_value and all(_is_path_key(k) for k in (*value, *old_value))
+        ):
+            nested_set, nested_unset = get_document_changes(old_value, value, f'{path}.')
+            to_set.update(nested_set)
+            to_unset.update(nested_unset)
+        # Type is compared since `1 == 1.0 == True`
+        elif type(value) is not type(old_value) or value != old_value:
+            to_set[path] = value
+
+    for key in old:
+        if key not in new and (prefix or key != '_id'):
+            to_unset[f'{prefix}{key}'] = ''
+    return to_set, to_unset
+
+
+def get_document_fields(document: dict[str, Any], fields: Iterable[str]) -> dict[str, Any]:
+    """Returns `$set` specification of `fields` (dotted paths) of
+    `document`"""
+    to_set: dict[str, Any] = {}
+    for path in fields:
+        value: Any = document
+        for key in path.split('.'):
+            if not isinstance(value, dict) or key not in value:
+                raise MongorepoException(f'Cannot update "{path}": field does not exist')
+            value = value[key]
+        to_set[path] = value
+    return to_set
+
+
+def get_update(
+    document: dict[str, Any],
+    snapshot: dict[str, Any] | None = None,
+    update_fields: Iterable[str] | None = None,
+) -> dict[str, Any]:
+    """Returns update specification for `document`.
+
+    Only `update_fields` are updated if they are passed, otherwise only
+    changes made since `snapshot` was taken, otherwise all fields.
+
+    """
+    if update_fields is not None:
+        to_set = get_document_fields(document, update_fields)
+        return {'$set': to_set} if to_set else {}
+    if snapshot is None:
+        return {'$set': dict(document)}
+
+    to_set, to_unset = get_document_changes(snapshot, document)
+    update: dict[str, Any] = {}
+    if to_set:
+        update['$set'] = to_set
+    if to_unset:
+        update['$unset'] = to_unset
+    return update
+
+
+def get_snapshots(method: Any) -> SnapshotStore | None:
+    """Returns snapshots of repository that owns `method`, `None` if changes
+    are not tracked."""
+    return method.owner.__mongorepo__['snapshots']
+
+
+def track_entities(method: Any, entities: Iterable[Any]) -> None:
+    if (snapshots := method.owner.__mongorepo__['snapshots']) is not None:
+        snapshots.track_all(entities)
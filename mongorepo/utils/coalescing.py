@@ -0,0 +1,131 @@
+import asyncio
+import uuid
+from typing import Any, Awaitable, Callable, Mapping
+
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError, WriteConcernError, WriteError
+
+from mongorepo.types.coalescing import Coalescing
+
+# Types of values that are matched by `$in` exactly as by equality filter and can be matched
+# back by python equality. `bool` is excluded since `True == 1`, `datetime` since MongoDB
+# truncates it to milliseconds
+_LOOKUP_KEY_TYPES = frozenset({str, int, float, ObjectId, uuid.UUID})
+
+
+class Coalescer[I, R]:
+    """Collects items submitted by concurrent coroutines and passes them to
+    `flush` in batches.
+
+    `flush` must return a result or an exception for every item in the
+    same order, each submitter receives only its own result.
+
+    """
+
+    __slots__ = ('_flush', 'options', '_pending', '_handle', '_loop', '_tasks')
+
+    def __init__(
+        self,
+        flush: Callable[[list[I]], Awaitable[list[R | BaseException]]],
+        options: Coalescing,
+    ) -> None:
+        self._flush = flush
+        self.options = options
+        self._pending: list[tuple[I, asyncio.Future[R]]] = []
+        self._handle: asyncio.Handle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Strong references to running flushes, event loop keeps only weak ones
+        self._tasks: set[asyncio.Task] = set()
+
+    def submit(self, item: I) -> asyncio.Future[R]:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Pending items of another (closed) event loop cannot be flushed anymore
+            self._loop, self._pending, self._handle = loop, [], None
+
+        future: asyncio.Future[R] = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.options.max_batch_size:
+            self.flush()
+        elif self._handle is None:
+            if self.options.max_delay_ms:
+                self._handle = loop.call_later(self.options.max_delay_ms / 1000, self.flush)
+            else:
+                self._handle = loop.call_soon(self.flush)
+        return future
+
+    def flush(self) -> None:
+        """Starts flush of pending items."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[I, asyncio.Future[R]]]) -> None:
+        try:
+            results = await self._flush([item for item, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+        except BaseException as e:
+            # Submitters must not wait forever for a cancelled or interrupted flush
+            for _, future in batch:
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            raise
+        for (_, future), result in zip(batch, results):
+            # Future is done if its caller was cancelled
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def get_bulk_write_errors(
+    details: Mapping[str, Any], size: int,
+) -> list[BaseException | None]:
+    """Returns exception for every operation of an unordered bulk write
+    using `BulkWriteError.details`, `None` means that operation succeeded.
+
+    Exceptions are the same as single operation would raise.
+
+    """
+    errors: list[BaseException | None] = [None] * size
+    for error in details.get('writeErrors', []):
+        exc_type = DuplicateKeyError if error.get('code') == 11000 else WriteError
+        errors[error['index']] = exc_type(error.get('errmsg'), error.get('code'), error)
+
+    if write_concern_errors := details.get('writeConcernErrors'):
+        error = write_concern_errors[0]
+        exc = WriteConcernError(error.get('errmsg'), error.get('code'), error)
+        errors = [exc if e is None else e for e in errors]
+    return errors
+
+
+def get_lookup_key(filters: dict[str, Any]) -> tuple[str, Any] | None:
+    """Returns `(field, value)` if `filters` is a single-key lookup that can
+    be batched with `$in`, otherwise `None`."""
+    if len(filters) != 1:
+        return None
+    ((field, value),) = filters.items()
+    if type(value) not in _LOOKUP_KEY_TYPES or '.' in field or field.startswith('$'):
+        return None
+    return field, value
+
+
+def get_matched_lookups(value: Any, lookups: set[Any]) -> list[Any]:
+    """Returns lookup values of `lookups` matched by `value` of the lookup
+    field of a found document, equality filter on an array field matches its
+    elements."""
+    values = value if isinstance(value, list) else [value]
+    return [v for v in values if type(v) in _LOOKUP_KEY_TYPES and v in lookups]
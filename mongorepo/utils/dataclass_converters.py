@@ -1,62 +1,109 @@
 from dataclasses import is_dataclass
-from functools import partial
 from typing import Any, Callable
 
-from mongorepo.types import Dataclass, Entity, ToEntityConverter
-from mongorepo.utils.type_hints import get_entity_type_hints, has_entity_fields
+from mongorepo.types import Dataclass, ToEntityConverter
+from mongorepo.utils.type_hints import get_entity_type_hints
 
+Decoder = Callable[[dict[str, Any]], Any]
 
-def _convert_to_dataclass[D: Dataclass](data: dict[str, Any], entity_type: type[D]) -> D:
-    """Converts document to entity, does not include mongodb `_id`"""
-    data.pop('_id') if data.get('_id', None) else ...
-    return entity_type(**data)
 
+def _has_nested_entities(entity_type: type) -> bool:
+    return any(
+        isinstance(hint, type) and is_dataclass(hint)
+        for hint in get_entity_type_hints(entity_type).values()
+    )
 
-def _convert_to_dataclass_with_id(
-    id_field: str,
-) -> Callable:
-    """Converts document to entity, includes mongodb `_id` allows to set
-    specific field where to store `_id`"""
-    def wrapper(data: dict[str, Any], entity_type: type[Entity]) -> Entity:
-        data[id_field] = str(data.pop('_id'))
-        return entity_type(**data)
-    return wrapper
 
+def _compile_fields_decoder(entity_type: type, compiled: dict[type, Decoder]) -> Decoder:
+    """Builds decoding plan for `entity_type` once.
 
-def _nested_convert_to_dataclass[T: Dataclass](
-    data: dict[str, Any], dataclass_type: type[T], id_field: str | None = None,
-) -> T:
-    def convert(
-        data: dict[str, Any], dataclass_type: type[T], as_dataclass: bool = True,
-    ) -> dict[str, Any] | T:
-        type_hints = get_entity_type_hints(dataclass_type)
-        result = {}
-        for key, value in data.items():
-            is_dtcls = is_dataclass(h := type_hints[key])
-
-            if is_dtcls and isinstance(value, list):
-                result[key] = [convert(v, h, True) for v in value]
-            elif is_dtcls:
-                result[key] = convert(value, h, True)  # type: ignore
+    The plan is a flat tuple of `(field name, nested decoder)` pairs that covers only fields
+    annotated with a dataclass or a list of dataclasses, all other values are passed to the
+    entity as is. Decoders of nested entities are compiled recursively and shared through
+    `compiled`, which also makes self-referencing entities possible.
+
+    """
+    if (decoder := compiled.get(entity_type, None)) is not None:
+        return decoder
+
+    nested: list[tuple[str, Decoder]] = []
+
+    def decode(data: dict[str, Any]) -> Any:
+        if not nested:
+            return entity_type(**data)
+        kwargs = dict(data)
+        for name, decode_nested in nested:
+            value = kwargs.get(name, None)
+            if value is None:
+                continue
+            if isinstance(value, list):
+                kwargs[name] = [None if v is None else decode_nested(v) for v in value]
             else:
-                result[key] = value
+                kwargs[name] = decode_nested(value)
+        return entity_type(**kwargs)
 
-        return dataclass_type(**result) if as_dataclass else result
+    # Register decoder before resolving fields, so recursive entities can refer to it
+    compiled[entity_type] = decode
+    for field_name, hint in get_entity_type_hints(entity_type).items():
+        if isinstance(hint, type) and is_dataclass(hint):
+            nested.append((field_name, _compile_fields_decoder(hint, compiled)))
+    return decode
 
-    result = {}
-    if id_field is not None:
-        result[id_field] = str(data.pop('_id'))
+
+def _compile_decoder(entity_type: type, id_field: str | None = None) -> Decoder:
+    """Returns decoder of MongoDB documents into `entity_type` instances.
+
+    If `id_field` is provided, document `_id` is stored as string in this
+    field, otherwise `_id` is dropped. In both cases `_id` is popped from
+    the document.
+
+    """
+    if _has_nested_entities(entity_type):
+        decode_fields: Decoder | None = _compile_fields_decoder(entity_type, {})
     else:
-        data.pop('_id') if data.get('_id', None) else ...
+        decode_fields = None
+
+    if id_field is not None:
+        def decode_with_id(data: dict[str, Any]) -> Any:
+            data[id_field] = str(data.pop('_id'))
+            return entity_type(**data) if decode_fields is None else decode_fields(data)
+        return decode_with_id
 
-    result.update(convert(data, dataclass_type, False))  # type: ignore[arg-type]
-    return dataclass_type(**result)
+    if decode_fields is None:
+        def decode_flat(data: dict[str, Any]) -> Any:
+            if data.get('_id', None):
+                del data['_id']
+            return entity_type(**data)
+        return decode_flat
+
+    def decode(data: dict[str, Any]) -> Any:
+        if data.get('_id', None):
+            del data['_id']
+        return decode_fields(data)
+    return decode
+
+
+def _nested_convert_to_dataclass[T: Dataclass](
+    data: dict[str, Any], dataclass_type: type[T], id_field: str | None = None,
+) -> T:
+    """Converts document to entity of `dataclass_type` including nested
+    entities.
+
+    Compiles decoding plan on every call, use :func:`get_converter` to
+    convert many documents.
+
+    """
+    return _compile_decoder(dataclass_type, id_field=id_field)(data)
 
 
 def get_converter[D: Dataclass](
     entity_type: type[D], id_field: str | None = None,
 ) -> ToEntityConverter[D]:
-    """Returns proper dataclass converter based on type hints of the dataclass.
+    """Returns converter of MongoDB documents into `entity_type` entities.
+
+    Decoding plan (nested entities, `list[Entity]` fields and `id_field`) is built
+    once, when the converter is created, and reused for every converted document,
+    so type hints are not resolved while converting.
 
     ## Usage example::
 
@@ -92,11 +139,29 @@ def get_converter[D: Dataclass](
         #                 friends=[User(id=4, username='top_1', friends=[])])])
 
     """
-
-    converter: ToEntityConverter[D] | partial = _convert_to_dataclass
-    r = has_entity_fields(entity_type=entity_type)
-    if r:
-        converter = partial(_nested_convert_to_dataclass, id_field=id_field)
-    elif id_field is not None:
-        converter = _convert_to_dataclass_with_id(id_field=id_field)
-    return converter
+    decoders: dict[type, Decoder] = {}
+
+    def convert_other(data: dict[str, Any], target_type: type) -> Any:
+        # Other types are passed by entity fields (see `Field.to_value`), `id_field` is not
+        # applied to them
+        if (decode := decoders.get(target_type, None)) is None:
+            decode = decoders[target_type] = _compile_decoder(target_type)
+        return decode(data)
+
+    if id_field is None and not _has_nested_entities(entity_type):
+        # Most common case, decoded inline to avoid an extra call per document
+        def convert_flat(data: dict[str, Any], target_type: type[D]) -> D:
+            if target_type is not entity_type:
+                return convert_other(data, target_type)
+            if data.get('_id', None):
+                del data['_id']
+            return entity_type(**data)
+        return convert_flat
+
+    decode_root = _compile_decoder(entity_type, id_field=id_field)
+
+    def convert(data: dict[str, Any], target_type: type[D]) -> D:
+        if target_type is entity_type:
+            return decode_root(data)
+        return convert_other(data, target_type)
+    return convert
@@ -0,0 +1,61 @@
+from contextlib import contextmanager
+from contextvars import Token
+from typing import Any
+
+from mongorepo.types import HasMongorepoDict, MongorepoDict
+from mongorepo.types.find_options import FindOptions
+from mongorepo.utils.mongo_session import _get_mongorepo_dict
+
+
+def get_find_options(method: Any, sort: bool = True) -> dict[str, Any]:
+    """Returns `find()` keyword arguments of `method` in the current context.
+
+    Repository defaults (`RepositoryConfig.find_options`) are overridden by
+    options of the method itself and then by options set with
+    :func:`find_options_context`. Sort is omitted if `sort` is `False`, e.g.
+    when order is defined by keyset pagination.
+
+    """
+    __mongorepo__ = method.owner.__mongorepo__
+    options: FindOptions | None = __mongorepo__['repository_config'].find_options
+    for override in (method.find_options, __mongorepo__['find_options'].get()):
+        if override is not None:
+            options = override if options is None else options.merge(override)
+    if options is None:
+        return {}
+    kwargs = options.to_kwargs()
+    if not sort:
+        kwargs.pop('sort', None)
+    return kwargs
+
+
+@contextmanager
+def find_options_context(options: FindOptions, *mongorepo_repositories: HasMongorepoDict | Any):
+    """Context manager that overrides find options (sort, hint, batch size, time
+    limit) of `get_list`, `get_all` and `get_page` methods of repositories.
+
+    Like :func:`mongorepo.session_context`, options are set only for the
+    current context (see :mod:`contextvars`), nested contexts override options
+    of outer ones.
+
+    Usage example::
+
+        with find_options_context(FindOptions(max_time_ms=500), repo):
+            users = repo.get_list(offset=0, limit=100, company='mongorepo')
+
+    """
+    tokens: list[tuple[MongorepoDict, Token]] = []
+    try:
+        for repo in mongorepo_repositories:
+            __mongorepo__ = _get_mongorepo_dict(repo)
+            current = __mongorepo__['find_options'].get()
+            tokens.append((
+                __mongorepo__,
+                __mongorepo__['find_options'].set(
+                    options if current is None else current.merge(options),
+                ),
+            ))
+        yield
+    finally:
+        for __mongorepo__, token in reversed(tokens):
+            __mongorepo__['find_options'].reset(token)
@@ -0,0 +1,131 @@
+import inspect
+from collections import Counter
+from typing import Any, Iterable, Mapping
+
+from mongorepo.exceptions import MongorepoException
+from mongorepo.types import AsyncCollectionType, HasMongorepoDict
+from mongorepo.types.index import IndexKey
+from mongorepo.types.profiling import IndexSuggestion, QueryShape
+from mongorepo.utils.mongo_indexes import _get_collection, _get_keys
+from mongorepo.utils.mongo_session import _get_mongorepo_dict
+
+EQUALITY_OPERATORS = frozenset({'$eq', '$in'})
+
+
+def _get_shapes(repository: HasMongorepoDict | Any) -> list[QueryShape]:
+    query_shapes = _get_mongorepo_dict(repository)['query_shapes']
+    if query_shapes is None:
+        raise MongorepoException(
+            'Query shapes are not collected, set `RepositoryConfig.query_shapes` '
+            'to get index suggestions',
+        )
+    return query_shapes.shapes()
+
+
+def _get_equality_fields(shape: QueryShape) -> list[str]:
+    return [f for f, ops in shape.fields.items() if EQUALITY_OPERATORS.issuperset(ops)]
+
+
+def get_index_keys(shape: QueryShape, ranks: Mapping[str, int]) -> tuple[int, tuple[IndexKey, ...]]:
+    """Returns number of equality keys and keys of index for `shape`.
+
+    Keys follow the Equality, Sort, Range rule, equality fields are ordered
+    by `ranks` (descending) so that shapes with common equality fields share
+    index prefixes.
+
+    """
+    fields = shape.fields
+    equality = sorted(_get_equality_fields(shape), key=lambda f: (-ranks.get(f, 0), f))
+    keys: list[IndexKey] = [(f, 1) for f in equality]
+    # Sorting by fields matched by equality does not need index keys
+    keys.extend((f, d) for f, d in shape.sort if f not in equality)
+    used = {f for f, _ in keys}
+    keys.extend((f, 1) for f in sorted(fields) if f not in used)
+    return len(equality), tuple(keys)
+
+
+def _serves(index_keys: tuple[IndexKey, ...], suggestion: IndexSuggestion) -> bool:
+    keys = suggestion.keys
+    if len(index_keys) < len(keys):
+        return False
+    equality = suggestion.equality_fields
+    if {f for f, _ in index_keys[:equality]} != {f for f, _ in keys[:equality]}:
+        return False
+    rest, index_rest = keys[equality:], index_keys[equality:len(keys)]
+    if rest == index_rest:
+        return True
+    # Indexes can be traversed in both directions
+    return all(
+        f == index_f and isinstance(d, int) and isinstance(index_d, int) and d == -index_d
+        for (f, d), (index_f, index_d) in zip(rest, index_rest)
+    )
+
+
+def get_index_suggestions(
+    shapes: Iterable[QueryShape], existing_indexes: Iterable[Mapping[str, Any]],
+) -> list[IndexSuggestion]:
+    """Recommends indexes for query `shapes` and marks the ones that are
+    served by `existing_indexes` (result of `list_indexes()`).
+
+    Indexes which keys are prefixes of other suggested indexes are merged
+    into them. Missing indexes go first, then suggestions are ordered by
+    cumulative latency of their shapes.
+
+    """
+    shapes = list(shapes)
+    ranks: Counter[str] = Counter()
+    for shape in shapes:
+        for f in _get_equality_fields(shape):
+            ranks[f] += shape.count
+
+    by_keys: dict[tuple[IndexKey, ...], IndexSuggestion] = {}
+    for shape in shapes:
+        equality, keys = get_index_keys(shape, ranks)
+        if not keys:
+            continue
+        suggestion = by_keys.setdefault(keys, IndexSuggestion(keys, equality_fields=equality))
+        suggestion.shapes.append(shape)
+
+    suggestions: list[IndexSuggestion] = []
+    for suggestion in sorted(by_keys.values(), key=lambda s: len(s.keys), reverse=True):
+        for longer in suggestions:
+            if _serves(longer.keys, suggestion):
+                longer.shapes.extend(suggestion.shapes)
+                break
+        else:
+            suggestions.append(suggestion)
+
+    existing = [(info['name'], _get_keys(info)) for info in existing_indexes]
+    for suggestion in suggestions:
+        for name, index_keys in existing:
+            if _serves(index_keys, suggestion):
+                suggestion.existing_index = name
+                break
+    return sorted(suggestions, key=lambda s: (s.exists, -s.total_duration))
+
+
+def suggest_indexes(repository: HasMongorepoDict | Any) -> list[IndexSuggestion]:
+    """Recommends indexes for query shapes observed by repository (see
+    :class:`mongorepo.profiling.QueryShapeStats`) and compares them with
+    indexes of repository collection.
+
+    ### Usage example:
+    ```
+    for suggestion in suggest_indexes(repo):
+        if not suggestion.exists:
+            logger.info('Missing index %s: %d queries', suggestion.keys, suggestion.count)
+    ```
+    """
+    shapes = _get_shapes(repository)
+    return get_index_suggestions(shapes, _get_collection(repository).list_indexes())
+
+
+async def async_suggest_indexes(repository: HasMongorepoDict | Any) -> list[IndexSuggestion]:
+    """Asynchronous version of :func:`suggest_indexes`"""
+    shapes = _get_shapes(repository)
+    collection: AsyncCollectionType = _get_collection(repository)
+    cursor: Any = collection.list_indexes()
+    # `pymongo` asynchronous collections return cursor from coroutine, `motor` ones directly
+    if inspect.isawaitable(cursor):
+        cursor = await cursor
+    return get_index_suggestions(shapes, await cursor.to_list(None))
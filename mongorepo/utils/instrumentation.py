@@ -0,0 +1,393 @@
+import inspect
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+from typing import Any, AsyncIterator, Callable, Iterator
+
+from mongorepo.metrics import RepositoryMetrics
+from mongorepo.modifiers.base import ModifierAfter, ModifierBefore
+from mongorepo.profiling import SlowQueryLog
+from mongorepo.types import MongorepoDict
+from mongorepo.types.collection_observer import CommandEvent
+
+_CONVERTERS = ('to_document_converter', 'to_entity_converter', 'to_entity', 'field_converter')
+
+
+class MethodCall:
+    """Time spent in phases and collection commands of a running mongorepo
+    method call."""
+
+    __slots__ = ('name', 'phases', 'commands')
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.phases: dict[str, float] = {}
+        self.commands: list[CommandEvent] = []
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+
+_current_call: ContextVar[MethodCall | None] = ContextVar('mongorepo_method_call', default=None)
+
+
+def get_current_call() -> MethodCall | None:
+    """Returns instrumented mongorepo method call running in the current
+    context."""
+    return _current_call.get()
+
+
+def timed[**P, R](func: Callable[P, R], phase: str) -> Callable[P, R]:
+    """Returns `func` that adds time of its calls to `phase` of the current
+    method call."""
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if (call := _current_call.get()) is None:
+            return func(*args, **kwargs)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            call.add(phase, perf_counter() - start)
+
+    wrapper.mongorepo_timed = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+class TimedModifier:
+    """Proxy of a modifier that adds time of its `modify` calls to `phase` of
+    the current method call."""
+
+    def __init__(self, modifier: ModifierBefore | ModifierAfter, phase: str) -> None:
+        self.modifier = modifier
+        self.modify = timed(modifier.modify, phase)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.modifier, name)
+
+
+class MethodCallObserver:
+    """Collection observer that adds commands to the current method call,
+    their duration is added to `driver` phase."""
+
+    def on_command(self, event: CommandEvent) -> None:
+        if (call := _current_call.get()) is not None:
+            call.add('driver', event.duration)
+            call.commands.append(event)
+
+
+class MethodInstrument:
+    """Records finished calls of a mongorepo method in repository metrics and
+    slow query log."""
+
+    __slots__ = ('name', 'metrics', 'stats', 'slow_query_log')
+
+    def __init__(
+        self,
+        name: str,
+        metrics: RepositoryMetrics | None,
+        slow_query_log: SlowQueryLog | None,
+    ) -> None:
+        self.name = name
+        self.metrics = metrics
+        self.stats = metrics.method(name) if metrics is not None else None
+        self.slow_query_log = slow_query_log
+
+    @property
+    def active(self) -> bool:
+        return self.slow_query_log is not None or (
+            self.metrics is not None and self.metrics.enabled
+        )
+
+    def finish(self, call: MethodCall, seconds: float, error: Exception | None = None) -> None:
+        if self.stats is not None and self.metrics.enabled:  # type: ignore[union-attr]
+            self.stats.record(seconds, call.phases, error=error is not None)
+        if self.slow_query_log is not None:
+            self.slow_query_log.observe(call.name, seconds, call.commands, error)
+
+
+def _bind(call: MethodCall, bind: Callable, args: tuple, kwargs: dict) -> dict[str, Any]:
+    start = perf_counter()
+    try:
+        return bind(args, kwargs)
+    finally:
+        call.add('binding', perf_counter() - start)
+
+
+def _call(
+    instrument: MethodInstrument, func: Callable, args: tuple, kwargs: dict, bind: Callable | None,
+) -> Any:
+    call = MethodCall(instrument.name)
+    token = _current_call.set(call)
+    start = perf_counter()
+    try:
+        if bind is not None:
+            args, kwargs = (), _bind(call, bind, args, kwargs)
+        result = func(*args, **kwargs)
+    except Exception as e:
+        instrument.finish(call, perf_counter() - start, e)
+        raise
+    finally:
+        _current_call.reset(token)
+    instrument.finish(call, perf_counter() - start)
+    return result
+
+
+async def _call_async(
+    instrument: MethodInstrument, func: Callable, args: tuple, kwargs: dict, bind: Callable | None,
+) -> Any:
+    call = MethodCall(instrument.name)
+    token = _current_call.set(call)
+    start = perf_counter()
+    try:
+        if bind is not None:
+            args, kwargs = (), _bind(call, bind, args, kwargs)
+        result = await func(*args, **kwargs)
+    except Exception as e:
+        instrument.finish(call, perf_counter() - start, e)
+        raise
+    finally:
+        _current_call.reset(token)
+    instrument.finish(call, perf_counter() - start)
+    return result
+
+
+def _call_generator(
+    instrument: MethodInstrument, func: Callable, args: tuple, kwargs: dict, bind: Callable | None,
+) -> Iterator[Any]:
+    call = MethodCall(instrument.name)
+    token = _current_call.set(call)
+    start = perf_counter()
+    try:
+        if bind is not None:
+            args, kwargs = (), _bind(call, bind, args, kwargs)
+        generator = func(*args, **kwargs)
+    except Exception as e:
+        instrument.finish(call, perf_counter() - start, e)
+        raise
+    finally:
+        _current_call.reset(token)
+    return _iterate(instrument, call, generator, perf_counter() - start)
+
+
+def _iterate(
+    instrument: MethodInstrument, call: MethodCall, generator: Iterator[Any], duration: float,
+) -> Iterator[Any]:
+    # Only time spent producing items is measured, not time spent by the consumer
+    error: Exception | None = None
+    try:
+        while True:
+            token = _current_call.set(call)
+            start = perf_counter()
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                duration += perf_counter() - start
+                _current_call.reset(token)
+            yield item
+    finally:
+        instrument.finish(call, duration, error)
+
+
+def _call_async_generator(
+    instrument: MethodInstrument, func: Callable, args: tuple, kwargs: dict, bind: Callable | None,
+) -> AsyncIterator[Any]:
+    call = MethodCall(instrument.name)
+    token = _current_call.set(call)
+    start = perf_counter()
+    try:
+        if bind is not None:
+            args, kwargs = (), _bind(call, bind, args, kwargs)
+        generator = func(*args, **kwargs)
+    except Exception as e:
+        instrument.finish(call, perf_counter() - start, e)
+        raise
+    finally:
+        _current_call.reset(token)
+    return _aiterate(instrument, call, generator, perf_counter() - start)
+
+
+async def _aiterate(
+    instrument: MethodInstrument, call: MethodCall, generator: AsyncIterator[Any], duration: float,
+) -> AsyncIterator[Any]:
+    error: Exception | None = None
+    try:
+        while True:
+            token = _current_call.set(call)
+            start = perf_counter()
+            try:
+                item = await generator.__anext__()
+            except StopAsyncIteration:
+                return
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                duration += perf_counter() - start
+                _current_call.reset(token)
+            yield item
+    finally:
+        instrument.finish(call, duration, error)
+
+
+def _get_runner(method: Any) -> Callable:
+    call = type(method).__call__
+    if inspect.isasyncgenfunction(call):
+        return _call_async_generator
+    if inspect.iscoroutinefunction(call):
+        return _call_async
+    if inspect.isgeneratorfunction(call):
+        return _call_generator
+    return _call
+
+
+def _instrument_phases(method: Any) -> None:
+    """Makes converters and modifiers of mongorepo method object report
+    time of their calls."""
+    for attr in _CONVERTERS:
+        converter = getattr(method, attr, None)
+        if converter is not None and not getattr(converter, 'mongorepo_timed', False):
+            setattr(method, attr, timed(converter, 'conversion'))
+    for attr, phase in (
+        ('modifiers_before', 'modifiers_before'), ('modifiers_after', 'modifiers_after'),
+    ):
+        modifiers = getattr(method, attr, None)
+        if modifiers:
+            setattr(method, attr, [
+                m if isinstance(m, TimedModifier) else TimedModifier(m, phase) for m in modifiers
+            ])
+
+
+def _uninstrument_phases(method: Any) -> None:
+    """Restores converters and modifiers of mongorepo method object
+    instrumented by :func:`_instrument_phases`."""
+    for attr in _CONVERTERS:
+        converter = getattr(method, attr, None)
+        if getattr(converter, 'mongorepo_timed', False):
+            setattr(method, attr, converter.__wrapped__)  # type: ignore[union-attr]
+    for attr in ('modifiers_before', 'modifiers_after'):
+        modifiers = getattr(method, attr, None)
+        if modifiers:
+            setattr(method, attr, [
+                m.modifier if isinstance(m, TimedModifier) else m for m in modifiers
+            ])
+
+
+class InstrumentedMethod:
+    """Proxy of mongorepo method object that records its calls with
+    :class:`MethodInstrument`."""
+
+    def __init__(self, method: Any, instrument: MethodInstrument) -> None:
+        self.mongorepo_method = method
+        self.instrument = instrument
+        self._run = _get_runner(method)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if not self.instrument.active:
+            return self.mongorepo_method(*args, **kwargs)
+        return self._run(self.instrument, self.mongorepo_method, args, kwargs, None)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.mongorepo_method, name)
+
+
+def _instrument_function(func: Any, instrument: MethodInstrument) -> Any:
+    # Functions created by `implement` bind arguments of the source method and call
+    # mongorepo method object with them
+    method = func.mongorepo_method
+    bind = func.mongorepo_binder.bind
+    run = _get_runner(method)
+
+    if run is _call_async:
+        async def async_wrapper(self, *args, **kwargs):
+            if not instrument.active:
+                return await func(self, *args, **kwargs)
+            return await _call_async(instrument, method, args, kwargs, bind)
+        wrapper: Any = async_wrapper
+    else:
+        def wrapper(self, *args, **kwargs):
+            if not instrument.active:
+                return func(self, *args, **kwargs)
+            return run(instrument, method, args, kwargs, bind)
+
+    wrapper.__annotations__ = func.__annotations__
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__wrapped__ = func
+    wrapper.mongorepo_method = method
+    wrapper.mongorepo_binder = func.mongorepo_binder
+    wrapper.instrument = instrument
+    return wrapper
+
+
+def _register_observer(__mongorepo__: MongorepoDict) -> None:
+    observers = __mongorepo__['collection_provider'].observers
+    if any(isinstance(o, MethodCallObserver) for o in observers):
+        return
+    observer = MethodCallObserver()
+    metrics, slow_query_log = __mongorepo__['metrics'], __mongorepo__['slow_query_log']
+
+    # Collections are not wrapped at all while instrumentation is inactive
+    def toggle_observer(enabled: bool) -> None:
+        if (enabled or slow_query_log is not None) and observer not in observers:
+            observers.append(observer)
+        elif not (enabled or slow_query_log is not None) and observer in observers:
+            observers.remove(observer)
+
+    if metrics is not None:
+        metrics.add_listener(toggle_observer)
+    toggle_observer(metrics is not None and metrics.enabled)
+
+
+def _register_toggle(
+    cls: type, __mongorepo__: MongorepoDict, methods: list[tuple[str, Any, Any, Any]],
+) -> None:
+    metrics, slow_query_log = __mongorepo__['metrics'], __mongorepo__['slow_query_log']
+
+    # Inactive instrumentation does not wrap anything: original methods are set on the class
+    # and their converters and modifiers are restored
+    def toggle(enabled: bool) -> None:
+        active = enabled or slow_query_log is not None
+        for name, original, instrumented, phase_method in methods:
+            if active:
+                _instrument_phases(phase_method)
+            else:
+                _uninstrument_phases(phase_method)
+            setattr(cls, name, instrumented if active else original)
+
+    if metrics is not None:
+        metrics.add_listener(toggle)
+    toggle(metrics is not None and metrics.enabled)
+
+
+def instrument_methods(cls: type, __mongorepo__: MongorepoDict) -> None:
+    """Instruments methods in `__mongorepo__['methods']` of `cls` if
+    repository has metrics or slow query log, methods that are already
+    instrumented are skipped."""
+    metrics, slow_query_log = __mongorepo__['metrics'], __mongorepo__['slow_query_log']
+    if metrics is None and slow_query_log is None:
+        return
+
+    _register_observer(__mongorepo__)
+    toggled: list[tuple[str, Any, Any, Any]] = []
+    for name, method in __mongorepo__['methods'].items():
+        if isinstance(method, InstrumentedMethod) or hasattr(method, 'instrument'):
+            continue
+        instrument = MethodInstrument(name, metrics, slow_query_log)
+        instrumented: Any
+        if inspect.isfunction(method):
+            if not hasattr(method, 'mongorepo_method'):
+                continue
+            phase_method = method.mongorepo_method  # type: ignore[attr-defined]
+            instrumented = _instrument_function(method, instrument)
+        else:
+            phase_method = method
+            instrumented = InstrumentedMethod(method, instrument)
+        __mongorepo__['methods'][name] = instrumented
+        toggled.append((name, method, instrumented, phase_method))
+    _register_toggle(cls, __mongorepo__, toggled)
@@ -0,0 +1,21 @@
+from typing import Any, Iterable
+
+from mongorepo.types.field import Field
+from mongorepo.types.list_append import ListAppend
+
+
+def get_append_update(
+    field: Field, values: Iterable[Any], options: ListAppend | None,
+) -> dict[str, Any]:
+    """Returns update that appends `values` to list `field` with `$each`"""
+    documents = field.to_documents(values)
+    if options is not None and options.unique:
+        return {'$addToSet': {field.name: {'$each': documents}}}
+
+    push: dict[str, Any] = {'$each': documents}
+    if options is not None:
+        if options.sort is not None:
+            push['$sort'] = options.sort
+        if options.max_length is not None:
+            push['$slice'] = -options.max_length
+    return {'$push': {field.name: push}}
@@ -0,0 +1,136 @@
+from typing import Any, Iterable
+
+from pymongo import DeleteOne, UpdateOne
+
+from mongorepo.types.field import Field
+from mongorepo.types.list_buckets import ListBuckets
+
+PARENT = 'parent'
+SEQ = 'seq'
+COUNT = 'count'
+ITEMS = 'items'
+
+BUCKETS_INDEX = [(PARENT, 1), (SEQ, 1)]
+
+
+def get_buckets_collection(collection: Any, options: ListBuckets, field: Field) -> Any:
+    """Returns side collection of buckets of list `field`"""
+    return options.collection if options.collection is not None else collection[field.name]
+
+
+def get_last_bucket_query(parent_id: Any) -> dict[str, Any]:
+    """Returns arguments of `find_one` that finds sequence number and size of
+    the last bucket of a list, empty buckets at the end of the list are
+    skipped."""
+    return {
+        'filter': {PARENT: parent_id, COUNT: {'$gt': 0}},
+        'projection': {SEQ: 1, COUNT: 1},
+        'sort': [(SEQ, -1)],
+    }
+
+
+def get_length(last_bucket: dict[str, Any] | None, size: int) -> int:
+    """Returns length of a list, every bucket except the last one is full."""
+    return last_bucket[SEQ] * size + last_bucket[COUNT] if last_bucket is not None else 0
+
+
+def get_next_bucket(last_bucket: dict[str, Any] | None, size: int) -> tuple[int, int]:
+    """Returns sequence number of the bucket new elements are appended to and
+    number of elements that fit into it."""
+    if last_bucket is None:
+        return 0, size
+    if last_bucket[COUNT] < size:
+        return last_bucket[SEQ], size - last_bucket[COUNT]
+    return last_bucket[SEQ] + 1, size
+
+
+def get_append_bucket_update(
+    parent_id: Any, seq: int, size: int, documents: list[Any],
+) -> dict[str, Any]:
+    """Returns arguments of `update_one` that appends `documents` to bucket
+    `seq` or creates it, the update does not match if the bucket has no room
+    for all `documents`."""
+    return {
+        'filter': {PARENT: parent_id, SEQ: seq, COUNT: {'$lte': size - len(documents)}},
+        'update': {'$push': {ITEMS: {'$each': documents}}, '$inc': {COUNT: len(documents)}},
+        'upsert': True,
+    }
+
+
+def get_bucket_page_query(parent_id: Any, offset: int, limit: int, size: int) -> dict[str, Any]:
+    """Returns arguments of `find` that finds buckets with elements of the
+    page, `offset` is not negative and `limit` is positive."""
+    return {
+        'filter': {
+            PARENT: parent_id,
+            SEQ: {'$gte': offset // size, '$lte': (offset + limit - 1) // size},
+        },
+        'projection': {ITEMS: 1, '_id': 0},
+        'sort': [(SEQ, 1)],
+    }
+
+
+def get_bucket_page(
+    buckets: Iterable[dict[str, Any]], offset: int, limit: int, size: int,
+) -> list[Any]:
+    """Returns elements of the page from buckets found by `get_bucket_page_query`"""
+    items = [item for bucket in buckets for item in bucket[ITEMS]]
+    start = offset % size
+    return items[start:start + limit]
+
+
+def get_pop_query(parent_id: Any) -> dict[str, Any]:
+    """Returns arguments of `find_one_and_update` that removes the last
+    element of the last bucket and returns the bucket as it was before."""
+    return {
+        'filter': {PARENT: parent_id, COUNT: {'$gt': 0}},
+        'update': {'$pop': {ITEMS: 1}, '$inc': {COUNT: -1}},
+        'projection': {ITEMS: {'$slice': -1}, SEQ: 1, COUNT: 1},
+        'sort': [(SEQ, -1)],
+    }
+
+
+def get_empty_buckets_filter(parent_id: Any, seq: int) -> dict[str, Any]:
+    """Returns filter of empty buckets of a list starting from bucket `seq`"""
+    return {PARENT: parent_id, SEQ: {'$gte': seq}, COUNT: 0}
+
+
+def get_remove_query(parent_id: Any, document: Any) -> dict[str, Any]:
+    """Returns arguments of `find_one` that finds sequence number of the first
+    bucket that holds `document`."""
+    return {
+        'filter': {PARENT: parent_id, ITEMS: document},
+        'projection': {SEQ: 1},
+        'sort': [(SEQ, 1)],
+    }
+
+
+def get_tail_query(parent_id: Any, seq: int) -> dict[str, Any]:
+    """Returns arguments of `find` that finds buckets of a list starting from
+    bucket `seq`."""
+    return {
+        'filter': {PARENT: parent_id, SEQ: {'$gte': seq}},
+        'projection': {ITEMS: 1},
+        'sort': [(SEQ, 1)],
+    }
+
+
+def get_remove_requests(
+    buckets: Iterable[dict[str, Any]], document: Any, size: int,
+) -> tuple[int, list[UpdateOne | DeleteOne]]:
+    """Returns number of elements equal to `document` in buckets found by
+    `get_tail_query` and requests of `bulk_write` that write the rest of the
+    elements back, so every bucket but the last one stays full. Buckets left
+    without elements are deleted."""
+    buckets = list(buckets)
+    items = [item for bucket in buckets for item in bucket[ITEMS]]
+    kept = [item for item in items if item != document]
+    requests: list[UpdateOne | DeleteOne] = []
+    for i, bucket in enumerate(buckets):
+        if chunk := kept[i * size:(i + 1) * size]:
+            requests.append(
+                UpdateOne({'_id': bucket['_id']}, {'$set': {ITEMS: chunk, COUNT: len(chunk)}}),
+            )
+        else:
+            requests.append(DeleteOne({'_id': bucket['_id']}))
+    return len(items) - len(kept), requests
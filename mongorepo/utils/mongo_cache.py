@@ -0,0 +1,142 @@
+import threading
+import uuid
+from typing import Any, Hashable, Iterable, Mapping
+
+import bson
+from bson import ObjectId
+from bson.codec_options import DEFAULT_CODEC_OPTIONS, CodecOptions
+from bson.raw_bson import RawBSONDocument
+
+from mongorepo._methods.interfaces import MongorepoMethod
+from mongorepo.types.cache import EntityCache
+from mongorepo.utils.mongo_session import get_session
+
+_transactions_lock = threading.Lock()
+# Types of filter values whose equality is the same in python and MongoDB, `bool` is
+# excluded since `True == 1`, `datetime` since MongoDB truncates it to milliseconds
+_COMPARABLE_TYPES = frozenset({str, int, float, ObjectId, uuid.UUID})
+_UNKNOWN: Any = object()
+
+
+def _in_transaction(session: Any) -> bool:
+    return bool(getattr(session, 'in_transaction', False))
+
+
+def get_cache(method: MongorepoMethod) -> EntityCache | None:
+    """Returns cache of repository that owns `method`, `None` while a
+    transaction that wrote through the repository is not finished."""
+    __mongorepo__ = method.owner.__mongorepo__
+    cache = __mongorepo__['cache']
+    if cache is None or not __mongorepo__['transactions']:
+        return cache
+    with _transactions_lock:
+        transactions = __mongorepo__['transactions']
+        if any(_in_transaction(session) for session in transactions):
+            # Documents read now become stale when the transaction is committed
+            return None
+        transactions.clear()
+    # Transactions were committed or aborted after their writes cleared the cache
+    cache.clear()
+    return cache
+
+
+def clear_cache(
+    method: MongorepoMethod,
+    filters: Mapping[str, Any] | None = None,
+    ids: Iterable[Any] | None = None,
+) -> None:
+    """Invalidates cache of repository that owns `method`, must be called
+    after every write.
+
+    Cached misses are always removed, cached documents only if the write may
+    have modified them: documents with `_id` in `ids` or, if `ids` are not
+    known, documents that may match `filters`. `ids=()` means that no
+    existing document was modified (inserts), without `ids` and `filters`
+    the whole cache is cleared.
+
+    """
+    __mongorepo__ = method.owner.__mongorepo__
+    if (cache := __mongorepo__['cache']) is None:
+        return
+    if _in_transaction(session := get_session(method)):
+        with _transactions_lock:
+            if not any(s is session for s in __mongorepo__['transactions']):
+                __mongorepo__['transactions'].append(session)
+    if (ids is None and filters is None) or getattr(cache, 'invalidate', None) is None:
+        cache.clear()
+        return
+
+    collection = __mongorepo__['collection_provider'].provide()
+    codec_options = _get_codec_options(collection).with_options(document_class=RawBSONDocument)
+    modified_ids = None if ids is None else set(ids)
+
+    def match(data: bytes) -> bool:
+        # Only the fields that are compared are decoded
+        document = bson.decode(data, codec_options=codec_options)
+        if modified_ids is not None:
+            return '_id' not in document or document['_id'] in modified_ids
+        return may_match(document, filters)  # type: ignore[arg-type]
+
+    cache.invalidate(match)
+
+
+def _get_path(document: Mapping[str, Any], path: str) -> Any:
+    value: Any = document
+    for key in path.split('.'):
+        if not isinstance(value, Mapping) or key not in value:
+            return _UNKNOWN
+        value = value[key]
+    return value
+
+
+def may_match(document: Mapping[str, Any], filters: Mapping[str, Any]) -> bool:
+    """Returns `False` if `document` does not match `filters` for sure.
+
+    Only equality conditions on values of the same type are compared, other
+    conditions, array fields and fields missing in (projected) `document`
+    are assumed to match. Strings are compared without collation of the
+    collection.
+
+    """
+    for path, condition in filters.items():
+        if type(condition) not in _COMPARABLE_TYPES:
+            continue
+        value = _get_path(document, path)
+        if value is None or (type(value) is type(condition) and value != condition):
+            return False
+    return True
+
+
+def get_cache_key(
+    filters: dict[str, Any], projection: dict[str, Any] | None = None,
+) -> Hashable | None:
+    """Returns cache key of `filters` (and `projection` of found document) or
+    `None` if they cannot be cached."""
+    # Type is a part of the key since `True == 1` and `1 == 1.0` that are different filters
+    key: Hashable = tuple(sorted((k, type(v), v) for k, v in filters.items()))
+    if projection is not None:
+        key = (key, tuple(projection.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _get_codec_options(collection: Any) -> CodecOptions:
+    codec_options = getattr(collection, 'codec_options', None)
+    # Collection-like objects may not have codec options
+    return codec_options if isinstance(codec_options, CodecOptions) else DEFAULT_CODEC_OPTIONS
+
+
+def encode_document(document: dict[str, Any] | None, collection: Any) -> bytes | None:
+    """Encodes `document` for cache using codec options of `collection`"""
+    # Documents are cached as BSON, so entities returned from cache never share state
+    if document is None:
+        return None
+    return bson.encode(document, codec_options=_get_codec_options(collection))
+
+
+def decode_document(data: bytes | None, collection: Any) -> dict[str, Any] | None:
+    """Decodes cached document using codec options of `collection`"""
+    return None if data is None else bson.decode(data, codec_options=_get_codec_options(collection))
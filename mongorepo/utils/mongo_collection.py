@@ -1,9 +1,11 @@
 from typing import Any, overload
 
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.asynchronous.collection import AsyncCollection
 from pymongo.collection import Collection
 
 from mongorepo.exceptions import MongorepoDictNotFound
+from mongorepo.memory import AsyncMemoryCollection, MemoryCollection
 from mongorepo.types.collection_provider import CollectionProvider
 from mongorepo.types.mongorepo_dict import HasMongorepoDict
 
@@ -13,11 +15,26 @@ def provide_collection(repository: Any, collection: AsyncIOMotorCollection) -> N
     ...
 
 
+@overload
+def provide_collection(repository: Any, collection: AsyncCollection[Any]) -> None:
+    ...
+
+
 @overload
 def provide_collection(repository: Any, collection: Collection[Any]) -> None:
     ...
 
 
+@overload
+def provide_collection(repository: Any, collection: MemoryCollection) -> None:
+    ...
+
+
+@overload
+def provide_collection(repository: Any, collection: AsyncMemoryCollection) -> None:
+    ...
+
+
 def provide_collection(repository: Any, collection) -> None:
     """Provides collection to a mongorepo repository."""
     __mongorepo__ = getattr(repository, '__mongorepo__', None)
@@ -28,4 +45,5 @@ def provide_collection(repository: Any, collection) -> None:
             "Recheck if the repository decorated with any mongorepo decorator",
         )
     provider = CollectionProvider(repository, collection)
+    provider.observers = __mongorepo__['collection_provider'].observers
     __mongorepo__['collection_provider'] = provider
@@ -0,0 +1,110 @@
+import inspect
+from typing import Any, Iterable, Mapping
+
+from pymongo.collection import Collection
+
+from mongorepo.types import AsyncCollectionType, HasMongorepoDict
+from mongorepo.types.index import Index, IndexDrift
+from mongorepo.utils.mongo_session import _get_mongorepo_dict
+
+_ID_INDEX_NAME = '_id_'
+_COMPARED_OPTIONS = ('unique', 'sparse', 'expireAfterSeconds', 'partialFilterExpression')
+
+
+def _get_indexes(repository: HasMongorepoDict | Any) -> list[Index]:
+    return list(_get_mongorepo_dict(repository)['repository_config'].indexes)
+
+
+def _get_collection(repository: HasMongorepoDict | Any) -> Any:
+    return _get_mongorepo_dict(repository)['collection_provider'].provide()
+
+
+def _get_options(index_info: Mapping[str, Any]) -> dict[str, Any]:
+    options = {k: index_info[k] for k in _COMPARED_OPTIONS if k in index_info}
+    # `unique: false` and `sparse: false` are equal to absent options
+    return {k: v for k, v in options.items() if v is not False}
+
+
+def _get_keys(index_info: Mapping[str, Any]) -> tuple[tuple[str, Any], ...]:
+    # Servers may return directions as floats (`1.0`)
+    return tuple(
+        (k, int(v) if isinstance(v, float) else v) for k, v in index_info['key'].items()
+    )
+
+
+def get_index_drift(
+    indexes: Iterable[Index], existing_indexes: Iterable[Mapping[str, Any]],
+) -> IndexDrift:
+    """Compares declared `indexes` with `existing_indexes` (result of
+    `list_indexes()`)"""
+    existing = {
+        info['name']: info for info in existing_indexes if info['name'] != _ID_INDEX_NAME
+    }
+    drift = IndexDrift()
+    for index in indexes:
+        info = existing.pop(index.name, None)
+        if info is None:
+            drift.missing.append(index)
+        elif _get_keys(info) != index.keys or _get_options(info) != index.options:
+            drift.changed.append((index, info))
+    drift.extra.extend(existing.values())
+    return drift
+
+
+def ensure_indexes(*repositories: HasMongorepoDict | Any) -> list[str]:
+    """Creates indexes declared in `RepositoryConfig.indexes` of mongorepo
+    repositories.
+
+    Indexes of each repository are created with a single `create_indexes`
+    command, existing indexes with the same specification are left untouched.
+    Returns names of declared indexes.
+
+    """
+    names: list[str] = []
+    for repository in repositories:
+        indexes = _get_indexes(repository)
+        if not indexes:
+            continue
+        collection: Collection = _get_collection(repository)
+        names.extend(collection.create_indexes([index.to_index_model() for index in indexes]))
+    return names
+
+
+async def async_ensure_indexes(*repositories: HasMongorepoDict | Any) -> list[str]:
+    """Asynchronous version of :func:`ensure_indexes`"""
+    names: list[str] = []
+    for repository in repositories:
+        indexes = _get_indexes(repository)
+        if not indexes:
+            continue
+        collection: AsyncCollectionType = _get_collection(repository)
+        names.extend(
+            await collection.create_indexes([index.to_index_model() for index in indexes]),
+        )
+    return names
+
+
+def index_drift(repository: HasMongorepoDict | Any) -> IndexDrift:
+    """Returns difference between indexes declared in
+    `RepositoryConfig.indexes` and indexes of repository collection.
+
+    ### Usage example:
+    ```
+    drift = index_drift(repo)
+    if not drift.in_sync:
+        logger.warning('Indexes are out of sync: %s', drift)
+    ```
+    """
+    collection: Collection = _get_collection(repository)
+    return get_index_drift(_get_indexes(repository), collection.list_indexes())
+
+
+async def async_index_drift(repository: HasMongorepoDict | Any) -> IndexDrift:
+    """Asynchronous version of :func:`index_drift`"""
+    collection: AsyncCollectionType = _get_collection(repository)
+    cursor: Any = collection.list_indexes()
+    # `pymongo` asynchronous collections return cursor from coroutine, `motor` ones directly
+    if inspect.isawaitable(cursor):
+        cursor = await cursor
+    existing_indexes = await cursor.to_list(None)
+    return get_index_drift(_get_indexes(repository), existing_indexes)
@@ -1,8 +1,13 @@
 from contextlib import contextmanager
-from typing import Any
+from contextvars import Token
+from typing import Any, overload
 
+from pymongo.client_session import ClientSession
+
+from mongorepo._methods.interfaces import MongorepoMethod
 from mongorepo.exceptions import MongorepoException
 from mongorepo.types import (
+    AsyncSessionType,
     CollectionType,
     HasMongorepoDict,
     MongorepoDict,
@@ -10,41 +15,71 @@ from mongorepo.types import (
 )
 
 
+def _get_mongorepo_dict(
+    repo: HasMongorepoDict[SessionType, CollectionType] | Any,
+) -> MongorepoDict[SessionType, CollectionType]:
+    __mongorepo__: MongorepoDict[SessionType, CollectionType] | None = getattr(
+        repo, '__mongorepo__', None,
+    )
+    if not __mongorepo__:
+        raise MongorepoException(
+            f'Invalid class for mongorepo repository: {type(repo)}: '
+            f'"{type(repo).__name__}" does not implement {str(HasMongorepoDict)} protocol',
+        )
+    return __mongorepo__
+
+
+@overload
+def get_session(method: MongorepoMethod[ClientSession]) -> ClientSession | None:
+    ...
+
+
+# `motor` and native `pymongo` sessions are accepted only by collections of the same driver,
+# asynchronous methods get the session of their collection's driver at runtime
+@overload
+def get_session(method: MongorepoMethod[AsyncSessionType]) -> Any:
+    ...
+
+
+@overload
+def get_session(method: MongorepoMethod[SessionType]) -> SessionType | None:
+    ...
+
+
+def get_session(method: MongorepoMethod[Any]) -> Any:
+    """Returns session that `method` should use in the current context.
+
+    Session set with :func:`set_session` or :func:`session_context` takes
+    precedence over session bound to the method itself.
+
+    """
+    session = method.owner.__mongorepo__['session'].get()
+    return method.session if session is None else session
+
+
 def set_session(
     session: SessionType,
     *mongorepo_repositories: HasMongorepoDict[SessionType, CollectionType] | Any,
 ):
-    """Function to make mongorepo methods use session."""
-    for repo in mongorepo_repositories:
-        __mongorepo__: MongorepoDict[SessionType, CollectionType] | None = getattr(
-            repo, '__mongorepo__', None,
-        )
-        if not __mongorepo__:
-            raise MongorepoException(
-                f'Invalid class for mongorepo repository: {type(repo)}: '
-                f'"{type(repo).__name__}" does not implement {str(HasMongorepoDict)} protocol',
-            )
+    """Function to make mongorepo methods use session.
 
-        for method in __mongorepo__['methods'].values():
-            method.session = session
+    Session is set only for the current context (see :mod:`contextvars`),
+    so concurrent asyncio tasks and threads using the same repository do
+    not share sessions. asyncio tasks inherit session that was set before
+    they were created, new threads do not.
+
+    """
+    for repo in mongorepo_repositories:
+        _get_mongorepo_dict(repo)['session'].set(session)
 
 
 def unset_session(
     *mongorepo_repositories: HasMongorepoDict[SessionType, CollectionType] | Any,
 ):
-    """Function to remove session from mongorepo methods."""
+    """Function to remove session from mongorepo methods in the current
+    context."""
     for repo in mongorepo_repositories:
-        __mongorepo__: MongorepoDict[SessionType, CollectionType] | None = getattr(
-            repo, '__mongorepo__', None,
-        )
-        if not __mongorepo__:
-            raise MongorepoException(
-                f'Invalid class for mongorepo repository: {type(repo)}: '
-                f'"{type(repo).__name__}" does not implement {str(HasMongorepoDict)} protocol',
-            )
-
-        for method in __mongorepo__['methods'].values():
-            method.session = None
+        _get_mongorepo_dict(repo)['session'].set(None)
 
 
 @contextmanager
@@ -56,7 +91,11 @@ def session_context(
 
     This ensures that all methods in the provided mongorepo repositories
     use the given session during the execution of the context. Once the
-    context exits, the session is removed from the methods.
+    context exits, the previous session of the current context is restored.
+
+    Session is assigned only for the current context (see :mod:`contextvars`),
+    so it is safe to run transactions concurrently with the same repositories
+    in different asyncio tasks or threads.
 
     Usage example::
 
@@ -71,11 +110,15 @@ def session_context(
             protocol, allowing them to have session-managed methods.
 
     Yields:
-        None: The context executes with the assigned session, then removes it upon exit.
+        None: The context executes with the assigned session, then restores previous one upon exit.
 
     """
+    tokens: list[tuple[MongorepoDict, Token]] = []
     try:
-        set_session(session, *mongorepo_repositories)
+        for repo in mongorepo_repositories:
+            __mongorepo__ = _get_mongorepo_dict(repo)
+            tokens.append((__mongorepo__, __mongorepo__['session'].set(session)))
         yield
     finally:
-        unset_session(*mongorepo_repositories)
+        for __mongorepo__, token in reversed(tokens):
+            __mongorepo__['session'].reset(token)
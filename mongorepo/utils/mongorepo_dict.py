@@ -1,7 +1,11 @@
+from contextvars import ContextVar
+from dataclasses import asdict
+
 from mongorepo.exceptions import MongorepoException
 from mongorepo.types import CollectionType, RepositoryConfig, SessionType
 from mongorepo.types.collection_provider import CollectionProvider
 from mongorepo.types.mongorepo_dict import MongorepoDict
+from mongorepo.utils.change_tracking import SnapshotStore
 
 
 def get_or_create_mongorepo_dict(
@@ -21,9 +25,24 @@ def get_or_create_mongorepo_dict(
                 message="Cannot create MongorepoDict instance without "
                 "collection_provider or repository_config",
             )
+        if repository_config.query_shapes is not None:
+            collection_provider.observers.append(repository_config.query_shapes)
         __mongorepo__ = MongorepoDict(
             collection_provider=collection_provider,
             methods={},
             repository_config=repository_config,
+            session=ContextVar(f'mongorepo_session_{cls.__qualname__}', default=None),
+            cache=repository_config.cache,
+            snapshots=SnapshotStore(
+                repository_config.to_document_converter or asdict,
+            ) if repository_config.track_changes else None,
+            find_options=ContextVar(
+                f'mongorepo_find_options_{cls.__qualname__}', default=None,
+            ),
+            metrics=repository_config.metrics,
+            slow_query_log=repository_config.slow_query_log,
+            query_shapes=repository_config.query_shapes,
+            counters=None,
+            transactions=[],
         )
     return __mongorepo__
@@ -0,0 +1,198 @@
+import inspect
+from functools import partial
+from time import perf_counter
+from typing import Any, Sequence
+
+from mongorepo.types.collection_observer import (
+    CollectionObserver,
+    CommandEvent,
+)
+
+OBSERVED_COMMANDS = frozenset({
+    'find',
+    'find_one',
+    'aggregate',
+    'count_documents',
+    'distinct',
+    'insert_one',
+    'insert_many',
+    'update_one',
+    'update_many',
+    'replace_one',
+    'delete_one',
+    'delete_many',
+    'find_one_and_delete',
+    'find_one_and_update',
+    'find_one_and_replace',
+    'bulk_write',
+})
+_CURSOR_COMMANDS = frozenset({'find', 'aggregate'})
+
+
+class ObservedCollection:
+    """Proxy of a collection that reports its commands to `observers`.
+
+    Commands of synchronous and asynchronous collections are supported,
+    cursors returned by `find` and `aggregate` are reported once they are
+    exhausted or closed, together with time spent iterating them.
+
+    """
+
+    __slots__ = ('collection', 'observers')
+
+    def __init__(self, collection: Any, observers: Sequence[CollectionObserver]) -> None:
+        self.collection = collection
+        self.observers = observers
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.collection, name)
+        if name in OBSERVED_COMMANDS:
+            return partial(self._execute, name, attr)
+        return attr
+
+    def __getitem__(self, name: str) -> Any:
+        return self.collection[name]
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.collection!r})'
+
+    def emit(
+        self,
+        command: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        duration: float,
+        error: BaseException | None = None,
+    ) -> None:
+        event = CommandEvent(command, args, kwargs, duration, error, self.collection)
+        for observer in self.observers:
+            observer.on_command(event)
+
+    def _execute(self, command: str, func: Any, *args: Any, **kwargs: Any) -> Any:
+        start = perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self.emit(command, args, kwargs, perf_counter() - start, e)
+            raise
+        if inspect.isawaitable(result):
+            return self._await(command, args, kwargs, result, start)
+        if command in _CURSOR_COMMANDS:
+            return ObservedCursor(self, command, args, kwargs, result, perf_counter() - start)
+        self.emit(command, args, kwargs, perf_counter() - start)
+        return result
+
+    async def _await(
+        self,
+        command: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        result: Any,
+        start: float,
+    ) -> Any:
+        try:
+            result = await result
+        except Exception as e:
+            self.emit(command, args, kwargs, perf_counter() - start, e)
+            raise
+        if command in _CURSOR_COMMANDS:
+            return ObservedCursor(self, command, args, kwargs, result, perf_counter() - start)
+        self.emit(command, args, kwargs, perf_counter() - start)
+        return result
+
+
+class ObservedCursor:
+    """Proxy of a cursor of :class:`ObservedCollection`."""
+
+    __slots__ = ('collection', 'command', 'args', 'kwargs', 'cursor', 'duration', '_done')
+
+    def __init__(
+        self,
+        collection: ObservedCollection,
+        command: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        cursor: Any,
+        duration: float,
+    ) -> None:
+        self.collection = collection
+        self.command = command
+        self.args = args
+        self.kwargs = kwargs
+        self.cursor = cursor
+        self.duration = duration
+        self._done = False
+
+    def _finish(self, error: BaseException | None = None) -> None:
+        if not self._done:
+            self._done = True
+            self.collection.emit(self.command, self.args, self.kwargs, self.duration, error)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.cursor, name)
+        if not callable(attr):
+            return attr
+
+        def method(*args: Any, **kwargs: Any) -> Any:
+            result = attr(*args, **kwargs)
+            # Cursor modifiers (`sort`, `limit`, ...) return the cursor itself
+            return self if result is self.cursor else result
+
+        return method
+
+    def __iter__(self) -> 'ObservedCursor':
+        return self
+
+    def __next__(self) -> Any:
+        start = perf_counter()
+        try:
+            document = next(self.cursor)
+        except StopIteration:
+            self.duration += perf_counter() - start
+            self._finish()
+            raise
+        except Exception as e:
+            self.duration += perf_counter() - start
+            self._finish(e)
+            raise
+        self.duration += perf_counter() - start
+        return document
+
+    def __aiter__(self) -> 'ObservedCursor':
+        return self
+
+    async def __anext__(self) -> Any:
+        start = perf_counter()
+        try:
+            document = await self.cursor.__anext__()
+        except StopAsyncIteration:
+            self.duration += perf_counter() - start
+            self._finish()
+            raise
+        except Exception as e:
+            self.duration += perf_counter() - start
+            self._finish(e)
+            raise
+        self.duration += perf_counter() - start
+        return document
+
+    def to_list(self, *args: Any, **kwargs: Any) -> Any:
+        start = perf_counter()
+        result = self.cursor.to_list(*args, **kwargs)
+        if inspect.isawaitable(result):
+            return self._await_list(result, start)
+        self.duration += perf_counter() - start
+        self._finish()
+        return result
+
+    async def _await_list(self, result: Any, start: float) -> Any:
+        try:
+            documents = await result
+        finally:
+            self.duration += perf_counter() - start
+            self._finish()
+        return documents
+
+    def close(self) -> Any:
+        self._finish()
+        return self.cursor.close()
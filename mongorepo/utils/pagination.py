@@ -0,0 +1,76 @@
+import base64
+import binascii
+from typing import Any
+
+from bson import json_util
+
+from mongorepo.exceptions import InvalidPageTokenException
+from mongorepo.types.pagination import Keyset
+
+
+def get_sort(keyset: Keyset) -> list[tuple[str, int]]:
+    """Returns sort specification for keyset pagination."""
+    direction = -1 if keyset.descending else 1
+    if keyset.sort_key == '_id':
+        return [('_id', direction)]
+    return [(keyset.sort_key, direction), ('_id', direction)]
+
+
+def _get_value(document: dict[str, Any], path: str) -> Any:
+    value: Any = document
+    for key in path.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key, None)
+    return value
+
+
+def encode_page_token(keyset: Keyset, last_document: dict[str, Any]) -> str:
+    """Returns opaque token that points right after `last_document`."""
+    data = {'k': keyset.sort_key, 'id': last_document['_id']}
+    if keyset.sort_key != '_id':
+        data['v'] = _get_value(last_document, keyset.sort_key)
+    return base64.urlsafe_b64encode(json_util.dumps(data).encode()).decode()
+
+
+def get_seek_filter(keyset: Keyset, token: str) -> dict[str, Any]:
+    """Returns filter that selects documents placed after the document
+    `token` points to."""
+    try:
+        data = json_util.loads(base64.urlsafe_b64decode(token.encode()))
+        last_id = data['id']
+        token_sort_key = data['k']
+        last_value = data.get('v', None)
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise InvalidPageTokenException(token) from e
+
+    if token_sort_key != keyset.sort_key:
+        raise InvalidPageTokenException(
+            token, message=f'Page token was issued for "{token_sort_key}" sort key, '
+            f'expected: "{keyset.sort_key}"',
+        )
+
+    operator = '$lt' if keyset.descending else '$gt'
+    if keyset.sort_key == '_id':
+        return {'_id': {operator: last_id}}
+
+    key = keyset.sort_key
+    same_value = {key: {'$eq': last_value}, '_id': {operator: last_id}}
+    # Null and missing values are sorted before all other values but comparison operators do
+    # not match them (type bracketing), the null bracket is selected with `$ne`/`$eq` instead
+    if last_value is None:
+        return same_value if keyset.descending else {'$or': [{key: {'$ne': None}}, same_value]}
+    after = [{key: {operator: last_value}}, same_value]
+    if keyset.descending:
+        after.append({key: {'$eq': None}})
+    return {'$or': after}
+
+
+def get_page_query(
+    keyset: Keyset, filters: dict[str, Any], token: str | None,
+) -> dict[str, Any]:
+    """Returns query of the page for `filters` that continues after `token`"""
+    if token is None:
+        return filters
+    seek = get_seek_filter(keyset, token)
+    return {'$and': [filters, seek]} if filters else seek
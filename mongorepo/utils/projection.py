@@ -0,0 +1,27 @@
+from functools import cache
+from typing import Any
+
+from mongorepo.types.base import ToEntityConverter
+from mongorepo.types.projection import Projection
+from mongorepo.utils.dataclass_converters import get_converter
+
+# Converter is compiled once per projected entity type and shared by all methods
+_get_converter = cache(get_converter)
+
+
+def _to_dict(document: dict[str, Any], _: type) -> dict[str, Any]:
+    return document
+
+
+def get_projection_converter(projection: Projection) -> ToEntityConverter[Any]:
+    """Returns converter of documents projected with `projection`, it ignores
+    target type passed by methods."""
+    entity_type = projection.entity_type
+    if entity_type is None:
+        return _to_dict
+
+    convert = _get_converter(entity_type)
+
+    def to_entity(document: dict[str, Any], _: type) -> Any:
+        return convert(document, entity_type)
+    return to_entity
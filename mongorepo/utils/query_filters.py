@@ -0,0 +1,155 @@
+import dataclasses
+from functools import cache
+from typing import Any, Final, Mapping
+
+from mongorepo.exceptions import InvalidFilterException
+from mongorepo.queries import Condition
+from mongorepo.utils.type_hints import get_entity_type_hints
+
+FILTER_SEPARATOR: Final = '__'
+
+FILTER_OPERATORS: Final[dict[str, Condition]] = {
+    'eq': '$eq',
+    'ne': '$ne',
+    'gt': '$gt',
+    'gte': '$gte',
+    'lt': '$lt',
+    'lte': '$lte',
+    'in': '$in',
+    'nin': '$nin',
+    'all': '$all',
+    'exists': '$exists',
+    'size': '$size',
+    'regex': '$regex',
+}
+"""Suffixes of filter keys and MongoDB operators they are compiled into."""
+
+_ARRAY_OPERATORS = frozenset(('$in', '$nin', '$all'))
+_MAX_PLANS = 1024
+
+# (filter key, dotted path, operator), operator is `None` for equality
+FilterPlan = tuple[tuple[str, str, Condition | None], ...]
+
+
+def _get_field_hints(type_hint: Any) -> dict[str, Any] | None:
+    if isinstance(type_hint, type) and dataclasses.is_dataclass(type_hint):
+        return get_entity_type_hints(type_hint)
+    return None
+
+
+def _validate_path(key: str, parts: list[str], entity_type: type) -> None:
+    current: Any = entity_type
+    for i, part in enumerate(parts):
+        if not part:
+            raise InvalidFilterException(key, f'Invalid filter {key!r}: empty field name')
+        if i == 0 and part == '_id':
+            return
+        hints = _get_field_hints(current)
+        if hints is None:
+            # Fields of dictionaries and values of unknown types cannot be validated
+            if current in (str, int, float, bool, bytes):
+                raise InvalidFilterException(
+                    key, f'Invalid filter {key!r}: "{parts[i - 1]}" has no fields',
+                )
+            return
+        if part not in hints:
+            raise InvalidFilterException(
+                key,
+                f'Invalid filter {key!r}: {current.__name__} has no field named "{part}", '
+                f'actual fields: {list(hints)}',
+            )
+        current = hints[part]
+
+
+def parse_filter_key(key: str, entity_type: type) -> tuple[str, Condition | None]:
+    """Returns `(dotted path, operator)` of `key` of keyword filters.
+
+    Keys are field names, optionally followed by `__`-separated nested field
+    names and an operator suffix (see :data:`FILTER_OPERATORS`), e.g.
+    `age__gte`, `address__city`, `tags__in`. Names of existing fields always
+    take precedence, so a field named `price__in` is matched by equality.
+
+    """
+    if FILTER_SEPARATOR not in key or key.startswith('$'):
+        return key, None
+    if key in get_entity_type_hints(entity_type):
+        return key, None
+
+    parts = key.split(FILTER_SEPARATOR)
+    operator: Condition | None = None
+    if len(parts) > 1 and parts[-1] in FILTER_OPERATORS:
+        operator = FILTER_OPERATORS[parts.pop()]
+    _validate_path(key, parts, entity_type)
+    return '.'.join(parts), operator
+
+
+class FilterCompiler:
+    """Compiles keyword filters of mongorepo methods into MongoDB queries.
+
+    Plan of every set of filter keys is built and validated once, filters
+    that contain only field names are returned as they are.
+    ### Usage example:
+    ```
+    compiler = FilterCompiler(User)
+    compiler.compile({'age__gte': 18, 'age__lt': 30, 'address__city': 'Paris'})
+    # {'age': {'$gte': 18, '$lt': 30}, 'address.city': 'Paris'}
+    ```
+    """
+
+    __slots__ = ('entity_type', 'plans')
+
+    def __init__(self, entity_type: type) -> None:
+        self.entity_type = entity_type
+        self.plans: dict[tuple[str, ...], FilterPlan | None] = {}
+
+    def _get_plan(self, keys: tuple[str, ...]) -> FilterPlan | None:
+        if not any(FILTER_SEPARATOR in key for key in keys):
+            return None
+        parsed = [(key, *parse_filter_key(key, self.entity_type)) for key in keys]
+        if all(path == key and operator is None for key, path, operator in parsed):
+            return None
+        # Equality on a path that has operators is combined with them as `$eq`
+        paths_with_operators = {path for _, path, operator in parsed if operator is not None}
+        return tuple(
+            (key, path, '$eq' if operator is None and path in paths_with_operators else operator)
+            for key, path, operator in parsed
+        )
+
+    def compile(self, filters: dict[str, Any]) -> dict[str, Any]:
+        keys = tuple(filters)
+        try:
+            plan = self.plans[keys]
+        except KeyError:
+            plan = self._get_plan(keys)
+            if len(self.plans) < _MAX_PLANS:
+                self.plans[keys] = plan
+        if plan is None:
+            return filters
+
+        query: dict[str, Any] = {}
+        for key, path, operator in plan:
+            value = filters[key]
+            if operator is None:
+                query[path] = value
+                continue
+            if operator in _ARRAY_OPERATORS and not isinstance(value, list):
+                # Strings and mappings are iterable, but they are not lists of values
+                if isinstance(value, (str, bytes, Mapping)):
+                    raise InvalidFilterException(
+                        key, f'Invalid filter {key!r}: {operator} expects a list of values, '
+                        f'got {type(value).__name__}',
+                    )
+                value = list(value)
+            query.setdefault(path, {})[operator] = value
+        return query
+
+
+@cache
+def get_filter_compiler(entity_type: type) -> FilterCompiler:
+    """Returns filter compiler shared by all methods of `entity_type`"""
+    return FilterCompiler(entity_type)
+
+
+def compile_filters(method: Any, filters: dict[str, Any]) -> dict[str, Any]:
+    """Compiles keyword `filters` of `method` into MongoDB query"""
+    return get_filter_compiler(method.entity_type).compile(filters)
@@ -0,0 +1,175 @@
+import json
+from typing import Any, Mapping
+
+from mongorepo.types.collection_observer import CommandEvent
+from mongorepo.types.profiling import QueryPlan
+
+REDACTED = '?'
+
+# Commands that accept filter as the first argument and names of their filter parameters
+_FILTER_PARAMETERS = {
+    'find': 'filter',
+    'find_one': 'filter',
+    'count_documents': 'filter',
+    'update_one': 'filter',
+    'update_many': 'filter',
+    'replace_one': 'filter',
+    'delete_one': 'filter',
+    'delete_many': 'filter',
+    'find_one_and_delete': 'filter',
+    'find_one_and_update': 'filter',
+    'find_one_and_replace': 'filter',
+    'distinct': 'filter',
+}
+_LOGICAL_OPERATORS = frozenset({'$and', '$or', '$nor'})
+
+
+def _is_operator_document(value: Any) -> bool:
+    return isinstance(value, Mapping) and bool(value) and all(
+        isinstance(k, str) and k.startswith('$') for k in value
+    )
+
+
+def _redact_value(value: Any) -> Any:
+    if not _is_operator_document(value):
+        return REDACTED
+    redacted: dict[str, Any] = {}
+    for operator, operand in value.items():
+        if operator in ('$elemMatch', '$not'):
+            redacted[operator] = (
+                _redact_value(operand) if _is_operator_document(operand)
+                else redact_filter(operand) if isinstance(operand, Mapping) else REDACTED
+            )
+        else:
+            redacted[operator] = REDACTED
+    return redacted
+
+
+def redact_filter(filters: Mapping[str, Any]) -> dict[str, Any]:
+    """Returns shape of `filters`: field names and operators are kept, values
+    are replaced with `'?'`.
+
+    ```
+    redact_filter({'age': {'$gte': 18}, 'name': 'admin'})
+    # {'age': {'$gte': '?'}, 'name': '?'}
+    ```
+    """
+    shape: dict[str, Any] = {}
+    for key, value in filters.items():
+        if key in _LOGICAL_OPERATORS and isinstance(value, (list, tuple)):
+            shape[key] = [redact_filter(f) if isinstance(f, Mapping) else REDACTED for f in value]
+        else:
+            shape[key] = _redact_value(value)
+    return shape
+
+
+def get_shape_key(command: str, shape: Mapping[str, Any] | None) -> str:
+    """Returns key that identifies query shape of `command`."""
+    return f'{command} {json.dumps(shape, sort_keys=True)}'
+
+
+def get_command_filter(event: CommandEvent) -> Mapping[str, Any] | None:
+    """Returns filter of collection command, `None` if command does not have
+    filter."""
+    parameter = _FILTER_PARAMETERS.get(event.command, None)
+    if parameter is None:
+        return None
+    if event.command == 'distinct':
+        # `distinct(key, filter=None, ...)`
+        filters = event.args[1] if len(event.args) > 1 else event.kwargs.get(parameter, None)
+    else:
+        filters = event.args[0] if event.args else event.kwargs.get(parameter, None)
+    return filters if isinstance(filters, Mapping) else {} if filters is None else None
+
+
+def get_command_sort(event: CommandEvent) -> list[tuple[str, Any]] | None:
+    """Returns sort specification of collection command, `None` if command
+    is not sorted."""
+    sort = event.kwargs.get('sort', None)
+    if not sort:
+        return None
+    if isinstance(sort, str):
+        return [(sort, 1)]
+    if isinstance(sort, Mapping):
+        return list(sort.items())
+    return [(key, 1) if isinstance(key, str) else (key[0], key[1]) for key in sort]
+
+
+def _get_argument(event: CommandEvent, position: int, name: str) -> Any:
+    return event.args[position] if len(event.args) > position else event.kwargs.get(name, None)
+
+
+def get_explain_command(event: CommandEvent, collection_name: str) -> dict[str, Any] | None:
+    """Returns `explain` command of collection command, `None` if it cannot
+    be explained."""
+    filters = get_command_filter(event)
+    if filters is None:
+        return None
+    command = event.command
+    explained: dict[str, Any]
+    if command in ('find', 'find_one'):
+        explained = {'find': collection_name, 'filter': filters}
+        if (sort := get_command_sort(event)) is not None:
+            explained['sort'] = dict(sort)
+        if command == 'find_one':
+            explained['limit'] = 1
+        elif limit := event.kwargs.get('limit', None):
+            explained['limit'] = limit
+    elif command == 'count_documents':
+        explained = {'count': collection_name, 'query': filters}
+    elif command == 'distinct':
+        explained = {
+            'distinct': collection_name, 'key': _get_argument(event, 0, 'key'), 'query': filters,
+        }
+    elif command in ('update_one', 'update_many', 'replace_one'):
+        update = _get_argument(event, 1, 'replacement' if command == 'replace_one' else 'update')
+        explained = {
+            'update': collection_name,
+            'updates': [{'q': filters, 'u': update, 'multi': command == 'update_many'}],
+        }
+    elif command in ('delete_one', 'delete_many'):
+        explained = {
+            'delete': collection_name,
+            'deletes': [{'q': filters, 'limit': 1 if command == 'delete_one' else 0}],
+        }
+    elif command == 'find_one_and_delete':
+        explained = {'findAndModify': collection_name, 'query': filters, 'remove': True}
+    else:
+        name = 'replacement' if command == 'find_one_and_replace' else 'update'
+        explained = {
+            'findAndModify': collection_name,
+            'query': filters,
+            'update': _get_argument(event, 1, name),
+        }
+    return {'explain': explained, 'verbosity': 'executionStats'}
+
+
+def summarize_plan(explain: Mapping[str, Any]) -> QueryPlan:
+    """Returns summary of the winning plan of `explain` command output."""
+    plan: Any = explain.get('queryPlanner', {}).get('winningPlan', {})
+    # Plans of slot based execution engine are nested
+    plan = plan.get('queryPlan', plan)
+
+    stages: list[str] = []
+    index_names: list[str] = []
+    nodes = [plan]
+    while nodes:
+        node = nodes.pop(0)
+        if not isinstance(node, Mapping):
+            continue
+        if 'stage' in node:
+            stages.append(node['stage'])
+        if 'indexName' in node:
+            index_names.append(node['indexName'])
+        if 'inputStage' in node:
+            nodes.append(node['inputStage'])
+        nodes.extend(node.get('inputStages', ()))
+
+    stats = explain.get('executionStats', {})
+    return QueryPlan(
+        stages=tuple(stages),
+        index_names=tuple(index_names),
+        docs_examined=stats.get('totalDocsExamined', None),
+        keys_examined=stats.get('totalKeysExamined', None),
+        returned=stats.get('nReturned', None),
+    )
@@ -0,0 +1,283 @@
+import asyncio
+import atexit
+import logging
+import threading
+import weakref
+from typing import Any, Hashable
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from mongorepo._methods.interfaces import MongorepoMethod
+from mongorepo.exceptions import MongorepoException
+from mongorepo.types import HasMongorepoDict
+from mongorepo.types.write_behind import WriteBehind
+from mongorepo.utils.mongo_cache import get_cache_key
+from mongorepo.utils.mongo_session import _get_mongorepo_dict, get_session
+
+logger = logging.getLogger('mongorepo.write_behind')
+
+# Pending counters: filters and summed deltas of their fields by cache key of filters
+type _Pending = dict[Hashable, tuple[dict[str, Any], dict[str, int]]]
+
+_buffers_lock = threading.Lock()
+
+
+class _Counters:
+    """Increments summed per filter and field, base of counter buffers."""
+
+    def __init__(self, owner: HasMongorepoDict, options: WriteBehind) -> None:
+        self.owner = owner
+        self.options = options
+        self._pending: _Pending = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns number of pending (filter, field) counters."""
+        return self._size
+
+    def _add(self, key: Hashable, filters: dict[str, Any], field: str, delta: int) -> bool:
+        """Adds increment, returns whether buffer should be flushed."""
+        entry = self._pending.get(key, None)
+        if entry is None:
+            entry = self._pending[key] = (filters, {})
+        deltas = entry[1]
+        if field not in deltas:
+            deltas[field] = 0
+            self._size += 1
+        deltas[field] += delta
+        return self._size >= self.options.max_pending
+
+    def _take(self) -> list[tuple[dict[str, Any], dict[str, int]]]:
+        with self._lock:
+            pending, self._pending, self._size = self._pending, {}, 0
+        return list(pending.values())
+
+    def _put_back(self, counters: list[tuple[dict[str, Any], dict[str, int]]]) -> None:
+        with self._lock:
+            for filters, deltas in counters:
+                key = get_cache_key(filters)
+                for field, delta in deltas.items():
+                    self._add(key, filters, field, delta)
+
+    def _get_requests(
+        self, counters: list[tuple[dict[str, Any], dict[str, int]]],
+    ) -> tuple[list[tuple[dict[str, Any], dict[str, int]]], list[UpdateOne]]:
+        # Increments and decrements of a counter may cancel each other out
+        counters = [
+            (filters, non_zero) for filters, deltas in counters
+            if (non_zero := {f: d for f, d in deltas.items() if d})
+        ]
+        return counters, [UpdateOne(filters, {'$inc': deltas}) for filters, deltas in counters]
+
+    def _handle_error(
+        self, counters: list[tuple[dict[str, Any], dict[str, int]]], error: Exception,
+    ) -> None:
+        if isinstance(error, BulkWriteError):
+            # Updates that are not reported as failed are applied, failed ones would fail again
+            failed = error.details.get('writeErrors', [])
+            logger.error(
+                'Dropped %d of %d buffered counter updates rejected by server: %s',
+                len(failed), len(counters), [e.get('errmsg') for e in failed],
+            )
+            return
+        self._put_back(counters)
+        raise error
+
+    def _clear_cache(self) -> None:
+        if (cache := self.owner.__mongorepo__['cache']) is not None:
+            cache.clear()
+
+
+class CounterBuffer(_Counters):
+    """Write-behind buffer of increments of synchronous repository, flushed
+    by a timer thread, at size threshold and at interpreter exit."""
+
+    def __init__(self, owner: HasMongorepoDict, options: WriteBehind) -> None:
+        super().__init__(owner, options)
+        self._timer: threading.Timer | None = None
+        atexit.register(_flush_at_exit, weakref.ref(self))
+
+    def add(self, filters: dict[str, Any], field: str, delta: int) -> bool:
+        """Buffers increment, returns `False` if `filters` cannot be
+        buffered."""
+        if (key := get_cache_key(filters)) is None:
+            return False
+        with self._lock:
+            full = self._add(key, filters, field, delta)
+            if not full:
+                self._schedule()
+        if full:
+            self.flush()
+        return True
+
+    def _schedule(self) -> None:
+        if self._timer is None and self.options.flush_interval:
+            self._timer = threading.Timer(self.options.flush_interval, self._flush_by_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_by_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+        try:
+            self.flush()
+        except Exception:
+            logger.exception('Cannot flush buffered counters, they will be retried')
+            with self._lock:
+                self._schedule()
+
+    def flush(self) -> int:
+        """Writes pending increments, returns number of updated counters
+        documents (filters)."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        counters, requests = self._get_requests(self._take())
+        if not requests:
+            return 0
+        collection = self.owner.__mongorepo__['collection_provider'].provide()
+        try:
+            collection.bulk_write(requests, ordered=False)
+        except Exception as e:
+            self._handle_error(counters, e)
+        finally:
+            self._clear_cache()
+        return len(requests)
+
+
+class AsyncCounterBuffer(_Counters):
+    """Write-behind buffer of increments of asynchronous repository, flushed
+    by event loop timer and at size threshold."""
+
+    def __init__(self, owner: HasMongorepoDict, options: WriteBehind) -> None:
+        super().__init__(owner, options)
+        self._handle: asyncio.TimerHandle | None = None
+        self._handle_loop: asyncio.AbstractEventLoop | None = None
+        # Strong references to running flushes, event loop keeps only weak ones
+        self._tasks: set[asyncio.Task] = set()
+
+    def add(self, filters: dict[str, Any], field: str, delta: int) -> bool:
+        """Buffers increment, returns `False` if `filters` cannot be
+        buffered."""
+        if (key := get_cache_key(filters)) is None:
+            return False
+        with self._lock:
+            full = self._add(key, filters, field, delta)
+        if full:
+            self._start_flush()
+        else:
+            self._schedule()
+        return True
+
+    def _schedule(self) -> None:
+        if not self.options.flush_interval:
+            return
+        loop = asyncio.get_running_loop()
+        # Timer of a closed event loop (e.g. of previous `asyncio.run`) never fires
+        if self._handle is None or self._handle_loop is not loop:
+            self._handle = loop.call_later(self.options.flush_interval, self._start_flush)
+            self._handle_loop = loop
+
+    def _start_flush(self) -> None:
+        task = asyncio.ensure_future(self._flush_in_background())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_in_background(self) -> None:
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception('Cannot flush buffered counters, they will be retried')
+            self._schedule()
+
+    async def flush(self) -> int:
+        """Writes pending increments, returns number of updated counters
+        documents (filters)."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        counters, requests = self._get_requests(self._take())
+        if not requests:
+            return 0
+        collection = self.owner.__mongorepo__['collection_provider'].provide()
+        try:
+            await collection.bulk_write(requests, ordered=False)
+        except Exception as e:
+            self._handle_error(counters, e)
+        finally:
+            self._clear_cache()
+        return len(requests)
+
+
+def _flush_at_exit(buffer_ref: weakref.ref[CounterBuffer]) -> None:
+    if (buffer := buffer_ref()) is not None and len(buffer):
+        try:
+            buffer.flush()
+        except Exception:
+            logger.exception('Cannot flush buffered counters at exit, %d are lost', len(buffer))
+
+
+def buffer_increment[B: (CounterBuffer, AsyncCounterBuffer)](
+    method: MongorepoMethod,
+    buffer_type: type[B],
+    options: WriteBehind,
+    filters: dict[str, Any],
+    field: str,
+    delta: int,
+) -> bool:
+    """Adds increment to write-behind buffer of repository that owns
+    `method`, returns `False` if it must be written immediately."""
+    if get_session(method) is not None:
+        return False
+    __mongorepo__ = method.owner.__mongorepo__
+    buffer = __mongorepo__['counters']
+    if buffer is None:
+        # All counters of a repository share one buffer (with options of the method that
+        # created it), so they are flushed together
+        with _buffers_lock:
+            if (buffer := __mongorepo__['counters']) is None:
+                buffer = __mongorepo__['counters'] = buffer_type(method.owner, options)
+    return buffer.add(filters, field, delta)
+
+
+def flush_counters(repository: HasMongorepoDict | Any) -> int:
+    """Writes increments buffered by write-behind `incr__`/`decr__` methods
+    of a mongorepo repository, returns number of updated counter documents
+    (`0` if there are no buffered increments).
+
+    ### Usage example:
+    ```
+    @repository(
+        integer_fields=['views'],
+        write_behind=WriteBehind(flush_interval=5),
+        config=RepositoryConfig(entity_type=Post, collection=posts),
+    )
+    class PostRepository:
+        ...
+
+    repo = PostRepository()
+    repo.incr__views(id='1')
+    repo.incr__views(id='1')
+    flush_counters(repo)  # update_one({'id': '1'}, {'$inc': {'views': 2}})
+    ```
+    """
+    buffer = _get_mongorepo_dict(repository)['counters']
+    if buffer is None:
+        return 0
+    if isinstance(buffer, AsyncCounterBuffer):
+        raise MongorepoException(message='Use async_flush_counters for asynchronous repositories')
+    return buffer.flush()
+
+
+async def async_flush_counters(repository: HasMongorepoDict | Any) -> int:
+    """Asynchronous version of :func:`flush_counters`, await it on shutdown
+    of the application, buffered increments are lost otherwise."""
+    buffer = _get_mongorepo_dict(repository)['counters']
+    if buffer is None:
+        return 0
+    if isinstance(buffer, CounterBuffer):
+        raise MongorepoException(message='Use flush_counters for synchronous repositories')
+    return await buffer.flush()
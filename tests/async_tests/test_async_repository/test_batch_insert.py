@@ -0,0 +1,123 @@
+# mypy: disable-error-code="attr-defined"
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from pymongo.errors import AutoReconnect
+
+from mongorepo import (
+    BatchInsert,
+    RepositoryConfig,
+    async_repository,
+    session_context,
+)
+from mongorepo.exceptions import BatchInsertException
+from tests.common import RecordingCollection, SimpleEntity, in_async_collection
+
+
+class SlowInsertsSpy(RecordingCollection):
+    """Collection proxy that delays `insert_many` and records the largest
+    number of concurrent calls."""
+
+    def __init__(self, collection: Any) -> None:
+        super().__init__(collection)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def insert_many(self, documents: list[dict[str, Any]], **kwargs) -> Any:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return await self.__getattr__('insert_many')(documents, **kwargs)
+        finally:
+            self.in_flight -= 1
+
+
+async def test_add_batch_inserts_async_iterator_concurrently() -> None:
+    async with in_async_collection(SimpleEntity) as cl:
+        spy = SlowInsertsSpy(cl)
+
+        @async_repository(
+            add_batch=BatchInsert(chunk_size=3, concurrency=2),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=spy),
+        )
+        class Repository:
+            ...
+
+        async def entities():
+            for i in range(20):
+                yield SimpleEntity(x=str(i), y=i)
+
+        result = await Repository().add_batch(entities())
+
+        assert result.ok
+        assert result.inserted_count == 20
+        assert result.chunk_count == 7
+        assert spy.max_in_flight == 2
+        assert await cl.count_documents({}) == 20
+
+
+async def test_add_batch_inserts_chunks_of_session_one_by_one() -> None:
+    async with in_async_collection(SimpleEntity) as cl:
+        spy = SlowInsertsSpy(cl)
+
+        @async_repository(
+            add_batch=BatchInsert(chunk_size=3, concurrency=4),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=spy),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        session = object()
+        with session_context(session, repo):  # type: ignore[arg-type]
+            result = await repo.add_batch(SimpleEntity(x=str(i), y=i) for i in range(10))
+
+        assert result.inserted_count == 10
+        assert [call.kwargs['session'] for call in spy.calls] == [session] * 4
+        assert spy.max_in_flight == 1
+
+
+async def test_add_batch_reports_failed_chunks() -> None:
+    async with in_async_collection(SimpleEntity) as cl:
+        await cl.create_index('x', unique=True)
+
+        @async_repository(
+            add_batch=BatchInsert(chunk_size=2, ordered=True),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class Repository:
+            ...
+
+        entities = [SimpleEntity(x=x, y=0) for x in ('a', 'b', 'c', 'a', 'd', 'e')]
+        result = await Repository().add_batch(entities)
+
+        assert result.inserted_count == 5
+        assert [(e.chunk, e.inserted_count) for e in result.errors] == [(1, 1)]
+        assert await cl.count_documents({}) == 5
+
+
+async def test_add_batch_stops_at_connection_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    async with in_async_collection(SimpleEntity) as cl:
+        spy = SlowInsertsSpy(cl)
+
+        @async_repository(
+            add_batch=BatchInsert(chunk_size=2, concurrency=2),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=spy),
+        )
+        class Repository:
+            ...
+
+        async def disconnected(*args, **kwargs) -> Any:
+            raise AutoReconnect('connection closed')
+
+        monkeypatch.setattr(spy, 'collection', SimpleNamespace(insert_many=disconnected))
+
+        with pytest.raises(BatchInsertException) as exc_info:
+            await Repository().add_batch(SimpleEntity(x=str(i), y=i) for i in range(100))
+
+        # Insertion stops at the first failed chunks instead of draining the input
+        assert len(spy.calls) <= 3
+        assert exc_info.value.result.inserted_count == 0
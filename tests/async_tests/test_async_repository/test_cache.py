@@ -0,0 +1,26 @@
+# mypy: disable-error-code="attr-defined"
+from mongorepo import RepositoryConfig, async_repository
+from mongorepo.cache import LRUCache
+from tests.common import SimpleEntity, in_async_collection
+
+
+async def test_async_get_reads_through_cache() -> None:
+    async with in_async_collection(SimpleEntity) as cl:
+        @async_repository(
+            integer_fields=['y'],
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl, cache=LRUCache()),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        await repo.add(SimpleEntity(x='1', y=1))
+
+        assert await repo.get(x='1') == SimpleEntity(x='1', y=1)
+        assert await repo.get(x='1') == SimpleEntity(x='1', y=1)
+
+        await repo.incr__y(x='1')
+        assert await repo.get(x='1') == SimpleEntity(x='1', y=2)
+
+        stats = repo.__mongorepo__['cache'].stats
+        assert (stats.hits, stats.misses, stats.invalidations) == (1, 2, 2)
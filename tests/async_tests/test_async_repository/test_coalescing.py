@@ -0,0 +1,191 @@
+# mypy: disable-error-code="attr-defined"
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from pymongo.errors import DuplicateKeyError
+
+from mongorepo import (
+    Coalescing,
+    RepositoryConfig,
+    async_repository,
+    session_context,
+)
+from tests.common import (
+    MultiFieldEntity,
+    RecordingCollection,
+    SimpleEntity,
+    in_async_collection,
+)
+
+
+def commands(collection: RecordingCollection) -> list[tuple[str, Any]]:
+    """Returns names and sessions of called insert and find commands."""
+    calls = collection.called('insert_', 'find')
+    return [(call.name, call.kwargs.get('session')) for call in calls]
+
+
+async def test_concurrent_add_calls_are_coalesced() -> None:
+    async with in_async_collection(SimpleEntity) as cl:
+        spy = RecordingCollection(cl)
+
+        @async_repository(
+            add=Coalescing(max_batch_size=4),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=spy),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        entities = await asyncio.gather(*(repo.add(SimpleEntity(x=str(i), y=i)) for i in range(10)))
+
+        assert [e.y for e in entities] == list(range(10))
+        assert commands(spy) == [('insert_many', None)] * 3
+        assert await cl.count_documents({}) == 10
+
+
+async def test_coalesced_add_fails_only_conflicting_calls() -> None:
+    async with in_async_collection(SimpleEntity) as cl:
+        await cl.create_index('x', unique=True)
+
+        @async_repository(
+            add=Coalescing(max_delay_ms=5),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        results = await asyncio.gather(
+            repo.add(SimpleEntity(x='1', y=1)),
+            repo.add(SimpleEntity(x='1', y=2)),
+            repo.add(SimpleEntity(x='2', y=3)),
+            return_exceptions=True,
+        )
+
+        assert results[0] == SimpleEntity(x='1', y=1)
+        assert isinstance(results[1], DuplicateKeyError)
+        assert results[2] == SimpleEntity(x='2', y=3)
+
+        with pytest.raises(DuplicateKeyError):
+            await repo.add(SimpleEntity(x='2', y=4))
+
+
+async def test_add_is_not_coalesced_in_session() -> None:
+    async with in_async_collection(SimpleEntity) as cl:
+        spy = RecordingCollection(cl)
+
+        @async_repository(
+            add=Coalescing(),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=spy),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        session = object()
+        with session_context(session, repo):  # type: ignore[arg-type]
+            await repo.add(SimpleEntity(x='1', y=1))
+        await repo.add(SimpleEntity(x='2', y=2))
+        assert commands(spy) == [('insert_one', session), ('insert_many', None)]
+
+
+async def test_concurrent_get_calls_are_coalesced() -> None:
+    async with in_async_collection(SimpleEntity) as cl:
+        spy = RecordingCollection(cl)
+
+        @async_repository(
+            get=Coalescing(),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=spy),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        await repo.add_batch([SimpleEntity(x=str(i), y=i) for i in range(5)])
+        spy.calls.clear()
+
+        results = await asyncio.gather(
+            repo.get(x='1'), repo.get(x='3'), repo.get(x='1'), repo.get(x='missing'),
+            repo.get(y=4), repo.get(x='3', y=3),
+        )
+
+        assert results == [
+            SimpleEntity(x='1', y=1), SimpleEntity(x='3', y=3), SimpleEntity(x='1', y=1), None,
+            SimpleEntity(x='4', y=4), SimpleEntity(x='3', y=3),
+        ]
+        # Lookups by "x" and by "y" are batched separately, multi-field filters are not batched
+        assert sorted(name for name, _ in commands(spy)) == ['find', 'find', 'find_one']
+        # Deduplicated lookups do not share entity instances
+        assert results[0] is not results[2]
+
+
+async def test_coalesced_get_matches_elements_of_list_fields() -> None:
+    async with in_async_collection(MultiFieldEntity) as cl:
+        @async_repository(
+            get=Coalescing(),
+            config=RepositoryConfig(entity_type=MultiFieldEntity, collection=cl),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        await repo.add(MultiFieldEntity(x='1', skills=['python', 'go']))
+        await repo.add(MultiFieldEntity(x='2', skills=['rust']))
+
+        assert (await repo.get(skills='go')).x == '1'
+        results = await asyncio.gather(
+            repo.get(skills='python'), repo.get(skills='go'), repo.get(skills='rust'),
+            repo.get(skills='java'),
+        )
+        assert [r and r.x for r in results] == ['1', '1', '2', None]
+
+
+async def test_cancelled_get_does_not_cancel_shared_lookup() -> None:
+    async with in_async_collection(SimpleEntity) as cl:
+        @async_repository(
+            get=Coalescing(max_delay_ms=5),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        await repo.add(SimpleEntity(x='1', y=1))
+
+        cancelled = asyncio.ensure_future(repo.get(x='1'))
+        waiting = asyncio.ensure_future(repo.get(x='1'))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await waiting == SimpleEntity(x='1', y=1)
+        assert cancelled.cancelled()
+
+
+async def test_cancelled_flush_does_not_leave_add_calls_pending() -> None:
+    async with in_async_collection(SimpleEntity) as cl:
+        spy = RecordingCollection(cl)
+
+        @async_repository(
+            add=Coalescing(),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=spy),
+        )
+        class Repository:
+            ...
+
+        async def hanging(*args, **kwargs) -> Any:
+            await asyncio.Event().wait()
+
+        spy.collection = SimpleNamespace(insert_many=hanging)
+        repo = Repository()
+        calls = asyncio.gather(
+            *(repo.add(SimpleEntity(x=str(i), y=i)) for i in range(3)), return_exceptions=True,
+        )
+        await asyncio.sleep(0.01)
+        coalescer = Repository.__mongorepo__['methods']['add'].coalescer
+        for task in coalescer._tasks:
+            task.cancel()
+
+        results = await asyncio.wait_for(calls, timeout=1)
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
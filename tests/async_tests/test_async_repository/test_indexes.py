@@ -0,0 +1,55 @@
+# mypy: disable-error-code="attr-defined"
+from mongorepo import (
+    Index,
+    RepositoryConfig,
+    async_ensure_indexes,
+    async_index_drift,
+    async_repository,
+    async_suggest_indexes,
+)
+from mongorepo.profiling import QueryShapeStats
+from tests.common import SimpleEntity, in_async_collection
+
+
+async def test_async_ensure_indexes_and_drift() -> None:
+    async with in_async_collection(SimpleEntity) as cl:
+        @async_repository(
+            config=RepositoryConfig(
+                entity_type=SimpleEntity,
+                collection=cl,
+                indexes=[Index('x', unique=True), Index('y', expire_after_seconds=60)],
+            ),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        drift = await async_index_drift(repo)
+        assert len(drift.missing) == 2
+
+        assert await async_ensure_indexes(repo) == ['x_1', 'y_1']
+        assert (await async_index_drift(repo)).in_sync
+
+
+async def test_async_suggest_indexes() -> None:
+    async with in_async_collection(SimpleEntity) as cl:
+        @async_repository(
+            config=RepositoryConfig(
+                entity_type=SimpleEntity,
+                collection=cl,
+                indexes=[Index('x')],
+                query_shapes=QueryShapeStats(),
+            ),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        await async_ensure_indexes(repo)
+        await repo.get(x='1')
+        await repo.get(y=1)
+
+        suggestions = await async_suggest_indexes(repo)
+        assert [(s.keys, s.existing_index) for s in suggestions] == [
+            ((('y', 1),), None), ((('x', 1),), 'x_1'),
+        ]
@@ -1,5 +1,17 @@
 # mypy: disable-error-code="attr-defined"
-from mongorepo import RepositoryConfig, async_repository
+import asyncio
+
+import pytest
+
+from mongorepo import (
+    RepositoryConfig,
+    WriteBehind,
+    async_flush_counters,
+    async_repository,
+    flush_counters,
+)
+from mongorepo.exceptions import BulkIncrementException, MongorepoException
+from mongorepo.memory import AsyncMemoryCollection
 from tests.common import SimpleEntity, in_async_collection
 
 
@@ -25,3 +37,78 @@ async def test_can_increment_and_decrement_field_with_decorator() -> None:
 
         entity = await repo.get(x='admin')
         assert entity.y == 13
+
+
+async def test_write_behind_flushes_increments_in_background() -> None:
+    async with in_async_collection(SimpleEntity) as cl:
+        @async_repository(
+            integer_fields=['y'],
+            write_behind=WriteBehind(flush_interval=0.01),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        await repo.add(SimpleEntity(x='admin', y=10))
+
+        for _ in range(4):
+            assert await repo.incr__y(x='admin') is None
+        await repo.decr__y(x='admin')
+        assert (await repo.get(x='admin')).y == 10
+
+        await asyncio.sleep(0.05)
+        assert (await repo.get(x='admin')).y == 13
+
+        await repo.incr__y(x='admin', weight=7)
+        assert await async_flush_counters(repo) == 1
+        assert (await repo.get(x='admin')).y == 20
+        with pytest.raises(MongorepoException):
+            flush_counters(repo)
+
+
+def test_write_behind_flushes_after_event_loop_is_replaced() -> None:
+    @async_repository(
+        integer_fields=['y'],
+        write_behind=WriteBehind(flush_interval=0.01),
+        config=RepositoryConfig(entity_type=SimpleEntity, collection=AsyncMemoryCollection()),
+    )
+    class Repository:
+        ...
+
+    repo = Repository()
+
+    async def increment(wait: float) -> None:
+        await repo.incr__y(x='admin')
+        await asyncio.sleep(wait)
+
+    asyncio.run(repo.add(SimpleEntity(x='admin', y=0)))
+    # Timer of the first event loop is never fired
+    asyncio.run(increment(0))
+    asyncio.run(increment(0.05))
+    assert asyncio.run(repo.get(x='admin')).y == 2
+
+
+async def test_can_increment_many_documents() -> None:
+    async with in_async_collection(SimpleEntity) as cl:
+        @async_repository(
+            integer_fields=['y'],
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        for i in range(3):
+            await repo.add(SimpleEntity(x=str(i), y=10))
+
+        result = await repo.incr_many(({'x': str(i)}, {'y': i}) for i in range(3))
+        # Zero deltas are not sent
+        assert (result.matched_count, result.modified_count) == (2, 2)
+        assert [e.y async for e in repo.get_all()] == [10, 11, 12]
+
+        await cl.create_index('y', unique=True)
+        with pytest.raises(BulkIncrementException) as exc_info:
+            await repo.incr_many(({'x': str(i)}, {'y': 1}) for i in range(3))
+        # Only the increment of the last document does not conflict
+        assert (exc_info.value.result.matched_count, exc_info.value.result.chunk_count) == (1, 0)
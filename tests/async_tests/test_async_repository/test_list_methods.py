@@ -1,5 +1,5 @@
 # mypy: disable-error-code="attr-defined"
-from mongorepo import RepositoryConfig, async_repository
+from mongorepo import ListBuckets, RepositoryConfig, async_repository
 from tests.common import NestedListEntity, SimpleEntity, in_async_collection
 
 
@@ -56,3 +56,63 @@ async def test_can_use_array_methods_with_dto_fields() -> None:
         assert entity
         for simple_dto in entity.dtos:
             assert simple_dto.x != '4' and simple_dto.y != 4
+
+
+async def test_can_store_list_in_buckets() -> None:
+    async with in_async_collection(NestedListEntity) as cl:
+        @async_repository(
+            list_fields={'dtos': ListBuckets(bucket_size=2)},
+            config=RepositoryConfig(entity_type=NestedListEntity, collection=cl),
+        )
+        class MongoRepository:
+            ...
+
+        repo = MongoRepository()
+        try:
+            await repo.add(NestedListEntity(title='Test', dtos=[]))
+
+            await repo.dtos__append(
+                values=[SimpleEntity(x=str(i), y=i) for i in range(1, 6)], title='Test',
+            )
+            assert [dto.y for dto in await repo.dtos__list(offset=1, limit=3, title='Test')] == [
+                2, 3, 4,
+            ]
+            assert [dto.y for dto in await repo.dtos__list(offset=-1, title='Test')] == [5]
+
+            assert (await repo.dtos__pop(title='Test')).y == 5
+            assert await repo.dtos__pop(title='Missing') is None
+            assert await cl['dtos'].count_documents({}) == 2
+        finally:
+            await cl['dtos'].drop()
+
+
+async def test_can_remove_elements_and_delete_buckets() -> None:
+    async with in_async_collection(NestedListEntity) as cl:
+        @async_repository(
+            delete_many=True,
+            list_fields={'dtos': ListBuckets(bucket_size=2)},
+            config=RepositoryConfig(entity_type=NestedListEntity, collection=cl),
+        )
+        class MongoRepository:
+            ...
+
+        repo = MongoRepository()
+        try:
+            await repo.add(NestedListEntity(title='A', dtos=[]))
+            await repo.add(NestedListEntity(title='B', dtos=[]))
+            await repo.dtos__append(
+                values=[SimpleEntity(x=str(y), y=y) for y in (1, 2, 3, 1, 4)], title='A',
+            )
+            await repo.dtos__append(SimpleEntity(x='7', y=7), title='B')
+
+            assert await repo.dtos__remove(SimpleEntity(x='1', y=1), title='A') == 2
+            assert await repo.dtos__remove(SimpleEntity(x='1', y=1), title='Missing') is None
+            assert [dto.y for dto in await repo.dtos__list(offset=1, title='A')] == [3, 4]
+            assert await cl['dtos'].count_documents({}) == 3
+
+            assert await repo.delete(title='A')
+            assert await cl['dtos'].count_documents({}) == 1
+            assert await repo.delete_many(title='B') == 1
+            assert await cl['dtos'].count_documents({}) == 0
+        finally:
+            await cl['dtos'].drop()
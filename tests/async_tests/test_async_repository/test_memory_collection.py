@@ -0,0 +1,49 @@
+# mypy: disable-error-code="attr-defined"
+import pytest
+from pymongo.errors import DuplicateKeyError
+
+from mongorepo import (
+    Index,
+    RepositoryConfig,
+    async_ensure_indexes,
+    async_index_drift,
+    async_repository,
+    repository,
+)
+from mongorepo.memory import AsyncMemoryCollection
+from tests.common import SimpleEntity
+
+
+async def test_async_repository_with_memory_collection() -> None:
+    collection = AsyncMemoryCollection('simple')
+
+    @async_repository(
+        config=RepositoryConfig(
+            entity_type=SimpleEntity, collection=collection, indexes=[Index('x', unique=True)],
+        ),
+    )
+    class Repository:
+        ...
+
+    repo = Repository()
+    assert await async_ensure_indexes(repo) == ['x_1']
+    assert (await async_index_drift(repo)).in_sync
+
+    for i in range(5):
+        await repo.add(SimpleEntity(x=str(i), y=i))
+    with pytest.raises(DuplicateKeyError):
+        await repo.add(SimpleEntity(x='1', y=10))
+
+    assert await repo.get(x='3') == SimpleEntity(x='3', y=3)
+    assert [e.x async for e in repo.get_all(y__lt=2)] == ['0', '1']
+    assert [e.x for e in await repo.get_list(offset=3, limit=10)] == ['3', '4']
+    await repo.update(SimpleEntity(x='3', y=30), x='3')
+    assert await repo.delete(x='4') is True
+
+    # Documents are shared with synchronous repositories of the same collection
+    @repository(config=RepositoryConfig(entity_type=SimpleEntity, collection=collection.collection))
+    class SyncRepository:
+        ...
+
+    assert SyncRepository().get(x='3') == SimpleEntity(x='3', y=30)
+    assert len(collection) == 4
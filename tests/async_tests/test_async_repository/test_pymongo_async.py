@@ -0,0 +1,68 @@
+# mypy: disable-error-code="attr-defined, empty-body"
+from mongorepo import (
+    Index,
+    RepositoryConfig,
+    async_ensure_indexes,
+    async_index_drift,
+    async_repository,
+)
+from mongorepo.implement import implement
+from mongorepo.implement.methods import GetListMethod, GetMethod
+from tests.common import (
+    MultiFieldEntity,
+    SimpleEntity,
+    in_pymongo_async_collection,
+)
+
+
+async def test_async_repository_with_native_pymongo_collection() -> None:
+    async with in_pymongo_async_collection(MultiFieldEntity) as cl:
+        @async_repository(
+            list_fields=['skills'],
+            config=RepositoryConfig(
+                entity_type=MultiFieldEntity, collection=cl, indexes=[Index('x', unique=True)],
+            ),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        await async_ensure_indexes(repo)
+        assert (await async_index_drift(repo)).in_sync
+
+        await repo.add(MultiFieldEntity(x='1'))
+        await repo.add_batch([MultiFieldEntity(x='2'), MultiFieldEntity(x='3')])
+        await repo.skills__append(value='python', x='1')
+
+        assert await repo.get(x='1') == MultiFieldEntity(x='1', skills=['python'])
+        assert len(await repo.get_list(offset=1, limit=5)) == 2
+        assert [e.x async for e in repo.get_all()] == ['1', '2', '3']
+        assert await repo.skills__pop(x='1') == 'python'
+
+        updated = await repo.update(MultiFieldEntity(x='1', name='updated'), x='1')
+        assert updated is not None and updated.name == 'updated'
+        assert await repo.delete(x='1') is True
+
+
+async def test_implement_with_native_pymongo_collection() -> None:
+    class IRepo:
+        async def get_by_x(self, x: str) -> SimpleEntity | None:
+            ...
+
+        async def get_by_y(self, y: int, limit: int) -> list[SimpleEntity]:
+            ...
+
+    async with in_pymongo_async_collection(SimpleEntity) as cl:
+        @implement(
+            GetMethod(IRepo.get_by_x, filters=['x']),
+            GetListMethod(IRepo.get_by_y, filters=['y'], limit='limit'),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class MongoRepo:
+            ...
+
+        await cl.insert_many([{'x': '1', 'y': 1}, {'x': '2', 'y': 1}])
+        repo: IRepo = MongoRepo()  # type: ignore
+
+        assert await repo.get_by_x(x='2') == SimpleEntity(x='2', y=1)
+        assert len(await repo.get_by_y(y=1, limit=10)) == 2
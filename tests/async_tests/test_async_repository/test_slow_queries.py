@@ -0,0 +1,52 @@
+# mypy: disable-error-code="attr-defined"
+import asyncio
+import logging
+from typing import Any
+
+import pytest
+
+from mongorepo import RepositoryConfig, async_repository
+from mongorepo.profiling import SlowQueryLog
+from tests.common import (
+    RecordedCall,
+    RecordingCollection,
+    SimpleEntity,
+    in_async_collection,
+)
+
+
+class AsyncExplainedCollection(RecordingCollection):
+    """Collection proxy that answers `explain` commands with a collection scan."""
+
+    def __init__(self, collection: Any) -> None:
+        super().__init__(collection)
+        self.database = self
+
+    async def command(self, command: dict[str, Any]) -> dict[str, Any]:
+        self.calls.append(RecordedCall('command', (command,), {}))
+        return {'queryPlanner': {'winningPlan': {'stage': 'COLLSCAN'}}}
+
+
+async def test_async_slow_calls_are_explained_in_background(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    async with in_async_collection(SimpleEntity) as cl:
+        collection = AsyncExplainedCollection(cl)
+        slow_query_log = SlowQueryLog(threshold=0, explain=True)
+
+        @async_repository(
+            config=RepositoryConfig(
+                entity_type=SimpleEntity, collection=collection, slow_query_log=slow_query_log,
+            ),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        with caplog.at_level(logging.WARNING, logger='mongorepo.slow_queries'):
+            assert await repo.get(x='1') is None
+            await asyncio.gather(*slow_query_log._tasks)
+            assert await repo.get(x='2') is None
+
+        assert len(collection.called('command')) == 1
+        assert [r.slow_query.plan.collscan for r in caplog.records] == [True, True]
@@ -1,11 +1,22 @@
 # mypy: disable-error-code="empty-body"
 from typing import AsyncGenerator
 
-from mongorepo import RepositoryConfig
+import pytest
+
+from mongorepo import (
+    FindOptions,
+    Keyset,
+    ListAppend,
+    Page,
+    Projection,
+    RepositoryConfig,
+)
 from mongorepo.implement import implement
+from mongorepo.implement.exceptions import FieldDoesNotExist
 from mongorepo.implement.methods import (
     AddBatchMethod,
     AddMethod,
+    DeleteManyMethod,
     DeleteMethod,
     GetAllMethod,
     GetListMethod,
@@ -17,6 +28,8 @@ from mongorepo.implement.methods import (
     ListRemoveMethod,
     UpdateMethod,
 )
+from mongorepo.metrics import RepositoryMetrics
+from mongorepo.types import FieldAlias
 from tests.common import (
     Box,
     MixedEntity,
@@ -124,6 +137,9 @@ async def test_implement_list_methods_with_specific_method_protocol():
         async def remove_dto_by_title(self, entity: SimpleEntity, title: str) -> None:
             ...
 
+        async def extend_dtos(self, title: str, entities: list[SimpleEntity]) -> None:
+            ...
+
     async with in_async_collection(NestedListEntity) as cl:
 
         @implement(
@@ -137,6 +153,10 @@ async def test_implement_list_methods_with_specific_method_protocol():
             ListPopMethod(IRepo.pop_dto_by_title, 'dtos', filters=['title']),
             ListAppendMethod(IRepo.append_dto_by_title, 'dtos', value='entity', filters=['title']),
             ListRemoveMethod(IRepo.remove_dto_by_title, 'dtos', value='entity', filters=['title']),
+            ListAppendMethod(
+                IRepo.extend_dtos, 'dtos', value='entities', filters=['title'], many=True,
+                append=ListAppend(max_length=4),
+            ),
             config=RepositoryConfig(entity_type=NestedListEntity, collection=cl),
         )
         class MongoRepo:
@@ -164,7 +184,10 @@ async def test_implement_list_methods_with_specific_method_protocol():
         await r.remove_dto_by_title(SimpleEntity(x='1', y=3), title)
         await r.remove_dto_by_title(SimpleEntity(x='1', y=1), title=title)
 
-        assert True
+        await r.extend_dtos(title, [SimpleEntity(x=str(i), y=i) for i in range(10, 13)])
+        assert [dto.y for dto in await r.get_simple_dto_list_by_title(0, title)] == [
+            3, 10, 11, 12,
+        ]
 
 
 async def test_implement_integer_methods_with_specific_method_protocol() -> None:
@@ -181,6 +204,9 @@ async def test_implement_integer_methods_with_specific_method_protocol() -> None
         async def update_year(self, id: str) -> None:
             ...
 
+        async def next_year(self, id: str) -> int | None:
+            ...
+
     async with in_async_collection(MixedEntity) as cl:
         @implement(
             AddMethod(IRepo.add, entity='entity'),
@@ -191,6 +217,9 @@ async def test_implement_integer_methods_with_specific_method_protocol() -> None
             IncrementIntegerFieldMethod(
                 IRepo.update_year, field='year', filters=['id'], default_weight_value=-1,
             ),
+            IncrementIntegerFieldMethod(
+                IRepo.next_year, field='year', filters=['id'], return_value=True,
+            ),
             config=RepositoryConfig(entity_type=MixedEntity, collection=cl),
         )
         class MongoRepo:
@@ -218,3 +247,208 @@ async def test_implement_integer_methods_with_specific_method_protocol() -> None
     updated_dto = await repo.get(id='1')
     assert updated_dto is not None
     assert updated_dto.year == 2029
+
+    assert await repo.next_year(id='1') == 2030
+    assert await repo.next_year(id='2') is None
+
+
+async def test_implement_get_list_method_with_keyset_pagination():
+
+    class IRepo:
+        async def add_batch(self, entities: list[SimpleEntity]) -> None:
+            ...
+
+        async def get_page_by_x(
+            self, x: str, limit: int, page_token: str | None = None,
+        ) -> Page[SimpleEntity]:
+            ...
+
+    async with in_async_collection(SimpleEntity) as cl:
+        @implement(
+            AddBatchMethod(IRepo.add_batch, entity_list='entities'),
+            GetListMethod(
+                IRepo.get_page_by_x,
+                filters=['x'],
+                limit='limit',
+                token='page_token',
+                keyset=Keyset(sort_key='y', descending=True),
+            ),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class MongoRepo:
+            ...
+
+        r: IRepo = MongoRepo()  # type: ignore
+        await r.add_batch([SimpleEntity(x='a', y=i) for i in range(5)])
+
+        page = await r.get_page_by_x(x='a', limit=3)
+        assert [e.y for e in page.items] == [4, 3, 2]
+
+        page = await r.get_page_by_x(x='a', limit=3, page_token=page.next_token)
+        assert [e.y for e in page.items] == [1, 0]
+        assert not page.has_next
+
+
+async def test_implement_update_method_with_update_fields():
+
+    class IRepo:
+        async def add(self, entity: SimpleEntity) -> None:
+            ...
+
+        async def update_fields(
+            self, x: str, entity: SimpleEntity, fields: list[str],
+        ) -> SimpleEntity | None:
+            ...
+
+    async with in_async_collection(SimpleEntity) as cl:
+        @implement(
+            AddMethod(IRepo.add, entity='entity'),
+            UpdateMethod(IRepo.update_fields, entity='entity', filters=['x'], update_fields='fields'),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class MongoRepo:
+            ...
+
+        r: IRepo = MongoRepo()  # type: ignore
+        await r.add(SimpleEntity(x='1', y=1))
+
+        updated = await r.update_fields(x='1', entity=SimpleEntity(x='2', y=2), fields=['y'])
+        assert updated == SimpleEntity(x='1', y=2)
+
+
+async def test_implement_delete_many_method():
+    class IRepo:
+        async def remove_all(self, name: str) -> int:
+            ...
+
+    async with in_async_collection(SimpleEntity) as cl:
+        @implement(
+            DeleteManyMethod(IRepo.remove_all, filters=[FieldAlias('x', 'name')]),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class MongoRepo:
+            ...
+
+        await cl.insert_many([{'x': 'a', 'y': 1}, {'x': 'a', 'y': 2}, {'x': 'b', 'y': 3}])
+        r: IRepo = MongoRepo()  # type: ignore
+
+        assert await r.remove_all(name='a') == 2
+        assert await cl.count_documents({}) == 1
+
+
+async def test_implement_get_methods_with_projection():
+    class IRepo:
+        async def get_title(self, title: str) -> dict:
+            ...
+
+        async def get_titles(self, offset: int, limit: int) -> list[dict]:
+            ...
+
+    async with in_async_collection(NestedListEntity) as cl:
+        @implement(
+            GetMethod(IRepo.get_title, filters=['title'], projection=Projection('title')),
+            GetListMethod(
+                IRepo.get_titles,
+                filters=[],
+                offset='offset',
+                limit='limit',
+                projection=Projection('title'),
+            ),
+            config=RepositoryConfig(entity_type=NestedListEntity, collection=cl),
+        )
+        class MongoRepo:
+            ...
+
+        await cl.insert_many([{'title': str(i), 'dtos': [{'x': '1', 'y': 1}]} for i in range(3)])
+        r: IRepo = MongoRepo()  # type: ignore
+
+        assert await r.get_title(title='1') == {'title': '1'}
+        assert await r.get_titles(offset=1, limit=5) == [{'title': '1'}, {'title': '2'}]
+
+
+async def test_implement_get_list_method_with_find_options():
+    class IRepo:
+        async def get_latest(self, x: str) -> list[SimpleEntity]:
+            ...
+
+    async with in_async_collection(SimpleEntity) as cl:
+        @implement(
+            GetListMethod(
+                IRepo.get_latest,
+                filters=['x'],
+                find_options=FindOptions(sort=[('y', -1)], batch_size=10),
+            ),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class MongoRepo:
+            ...
+
+        await cl.insert_many([{'x': '1', 'y': y} for y in (2, 3, 1)])
+        r: IRepo = MongoRepo()  # type: ignore
+
+        assert [e.y for e in await r.get_latest(x='1')] == [3, 2, 1]
+
+
+async def test_implement_methods_with_filter_operators():
+    class IRepo:
+        async def get_between(self, y__gte: int, max_y: int) -> list[SimpleEntity]:
+            ...
+
+    async with in_async_collection(SimpleEntity) as cl:
+        @implement(
+            GetListMethod(
+                IRepo.get_between, filters=['y__gte', FieldAlias('y__lte', 'max_y')],
+            ),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class MongoRepo:
+            ...
+
+        await cl.insert_many([{'x': str(y), 'y': y} for y in range(5)])
+        r: IRepo = MongoRepo()  # type: ignore
+
+        assert [e.y for e in await r.get_between(1, max_y=3)] == [1, 2, 3]
+
+    with pytest.raises(FieldDoesNotExist):
+        @implement(
+            GetListMethod(IRepo.get_between, filters=['z__gte']),
+            config=RepositoryConfig(entity_type=SimpleEntity),
+        )
+        class InvalidRepo:
+            ...
+
+
+async def test_implement_methods_record_metrics():
+    class IRepo:
+        async def add(self, entity: SimpleEntity) -> None:
+            ...
+
+        async def get(self, x: str) -> SimpleEntity | None:
+            ...
+
+        async def get_all(self) -> AsyncGenerator[SimpleEntity, None]:
+            ...
+
+    async with in_async_collection(SimpleEntity) as cl:
+        @implement(
+            AddMethod(IRepo.add, entity='entity'),
+            GetMethod(IRepo.get, filters=['x']),
+            GetAllMethod(IRepo.get_all, filters=[]),
+            config=RepositoryConfig(
+                entity_type=SimpleEntity, collection=cl, metrics=RepositoryMetrics(),
+            ),
+        )
+        class MongoRepo:
+            ...
+
+        r: IRepo = MongoRepo()  # type: ignore
+        await r.add(SimpleEntity(x='1', y=1))
+        assert await r.get('1') == SimpleEntity(x='1', y=1)
+        assert [e async for e in r.get_all()] == [SimpleEntity(x='1', y=1)]
+
+        metrics: RepositoryMetrics = MongoRepo.__mongorepo__['metrics']  # type: ignore
+        assert {name: m.calls for name, m in metrics.methods.items()} == {
+            'add': 1, 'get': 1, 'get_all': 1,
+        }
+        assert set(metrics.snapshot()['get']['phases']) == {'binding', 'driver', 'conversion'}
+        assert metrics['get_all'].phases['driver'].count == 1
@@ -3,9 +3,9 @@ from typing import cast
 
 import pytest
 
-from mongorepo import RepositoryConfig
+from mongorepo import ListAppend, RepositoryConfig
 from mongorepo.implement import AddMethod, GetMethod, implement
-from mongorepo.implement.methods import UpdateMethod
+from mongorepo.implement.methods import ListAppendMethod, UpdateMethod
 from mongorepo.modifiers.base import (
     ModifierAfter,
     ModifierBefore,
@@ -13,7 +13,12 @@ from mongorepo.modifiers.base import (
     UpdateSkipModifier,
 )
 from mongorepo.types import FieldAlias
-from tests.common import Box, SimpleEntity, in_async_collection
+from tests.common import (
+    Box,
+    MultiFieldEntity,
+    SimpleEntity,
+    in_async_collection,
+)
 
 
 async def test_after_modifiers() -> None:
@@ -127,3 +132,39 @@ async def test_before_modifiers() -> None:
 
         with pytest.raises(TypeError):
             _ = await repo.get(box_id=1)  # type: ignore[arg-type]
+
+
+async def test_append_modifiers_receive_single_value_with_append_options() -> None:
+    class UpperCaseModifier(ModifierBefore):
+        def modify(self, value, **filters):
+            return value.upper(), filters
+
+    class Repo:
+        async def add(self, entity: MultiFieldEntity) -> None:  # type: ignore[empty-body]
+            ...
+
+        async def add_skill(self, x: str, skill: str) -> None:  # type: ignore[empty-body]
+            ...
+
+        async def get(self, x: str) -> MultiFieldEntity:  # type: ignore[empty-body]
+            ...
+
+    async with in_async_collection(MultiFieldEntity) as cl:
+        @implement(
+            AddMethod(Repo.add, entity='entity'),
+            GetMethod(Repo.get, filters=['x']),
+            ListAppendMethod(
+                Repo.add_skill, 'skills', value='skill', filters=['x'],
+                modifiers=[UpperCaseModifier()], append=ListAppend(max_length=2),
+            ),
+            config=RepositoryConfig(entity_type=MultiFieldEntity, collection=cl),
+        )
+        class Mongorepo:
+            ...
+
+        repo = cast(Repo, Mongorepo())
+        await repo.add(MultiFieldEntity(x='1', skills=['GO']))
+        for skill in ('python', 'rust'):
+            await repo.add_skill(x='1', skill=skill)
+
+        assert (await repo.get(x='1')).skills == ['PYTHON', 'RUST']
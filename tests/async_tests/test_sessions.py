@@ -0,0 +1,65 @@
+# mypy: disable-error-code="attr-defined"
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from mongorepo import (
+    RepositoryConfig,
+    async_repository,
+    repository,
+    session_context,
+    set_session,
+    unset_session,
+)
+from mongorepo.utils.mongo_session import get_session
+from tests.common import SimpleEntity, custom_collection
+
+
+async def test_concurrent_tasks_do_not_share_sessions() -> None:
+    @async_repository(
+        config=RepositoryConfig(
+            entity_type=SimpleEntity, collection=custom_collection(SimpleEntity, async_client=True),
+        ),
+    )
+    class Repository:
+        ...
+
+    methods = Repository.__mongorepo__['methods'].values()
+
+    async def transaction(session: object) -> None:
+        with session_context(session, Repository):
+            await asyncio.sleep(0)
+            assert all(get_session(m) is session for m in methods)
+            with session_context(session_2 := object(), Repository):
+                await asyncio.sleep(0)
+                assert all(get_session(m) is session_2 for m in methods)
+            assert all(get_session(m) is session for m in methods)
+
+    await asyncio.gather(*(transaction(object()) for _ in range(10)))
+
+    assert all(get_session(m) is None for m in methods)
+
+
+def test_threads_do_not_share_sessions() -> None:
+    @repository(
+        config=RepositoryConfig(entity_type=SimpleEntity, collection=custom_collection(SimpleEntity)),
+    )
+    class Repository:
+        ...
+
+    method = Repository.__mongorepo__['methods']['get']
+    # Every thread reads its session only after all threads have set theirs
+    barrier = threading.Barrier(4, timeout=5)
+
+    def transaction(session: object) -> bool:
+        set_session(session, Repository())
+        try:
+            barrier.wait()
+            return get_session(method) is session
+        finally:
+            unset_session(Repository())
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert all(executor.map(transaction, [object() for _ in range(20)]))
+
+    assert get_session(method) is None
@@ -1,3 +1,4 @@
+import inspect
 import random
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
@@ -6,6 +7,7 @@ from typing import Any, AsyncGenerator, Generator
 import pymongo
 import pymongo.collection
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo.asynchronous.collection import AsyncCollection
 
 
 def mongo_client(mongo_uri: str = 'mongodb://mongodb:27017/') -> pymongo.MongoClient:
@@ -18,6 +20,11 @@ def async_mongo_client(mongo_uri: str = 'mongodb://mongodb:27017/') -> AsyncIOMo
     return async_client
 
 
+def pymongo_async_client(mongo_uri: str = 'mongodb://mongodb:27017/') -> pymongo.AsyncMongoClient:
+    async_client: pymongo.AsyncMongoClient = pymongo.AsyncMongoClient(mongo_uri)
+    return async_client
+
+
 @dataclass
 class SimpleEntity:
     x: str
@@ -88,6 +95,20 @@ async def in_async_collection(entity: str | type) -> AsyncGenerator[AsyncIOMotor
         await collection.drop()
 
 
+@asynccontextmanager
+async def in_pymongo_async_collection(
+    entity: str | type,
+) -> AsyncGenerator[AsyncCollection[Any], None]:
+    entity_name = entity if isinstance(entity, str) else entity.__name__
+    client = pymongo_async_client()
+    try:
+        collection = client[f'{entity_name}_db'][entity_name]
+        yield collection
+    finally:
+        await collection.drop()
+        await client.close()
+
+
 @contextmanager
 def in_collection(entity_type: str | type) -> Generator[pymongo.collection.Collection, None, None]:
     entity_name = entity_type if isinstance(entity_type, str) else entity_type.__name__
@@ -103,3 +124,37 @@ def custom_collection(entity: str | type, async_client: bool = False):
     if async_client:
         return async_mongo_client()[f'{entity_name}_db'][entity_name]
     return mongo_client()[f'{entity_name}_db'][entity_name]
+
+
+@dataclass
+class RecordedCall:
+    name: str
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+
+
+class RecordingCollection:
+    """Collection proxy that records called commands with their arguments.
+
+    Sessions are recorded but not passed to the collection, test collections
+    do not support them.
+    """
+
+    def __init__(self, collection: Any) -> None:
+        self.collection = collection
+        self.calls: list[RecordedCall] = []
+
+    def __getattr__(self, name: str) -> Any:
+        command = getattr(self.collection, name)
+        if not inspect.isroutine(command):
+            return command
+
+        def record(*args, **kwargs) -> Any:
+            self.calls.append(RecordedCall(name, args, dict(kwargs)))
+            kwargs.pop('session', None)
+            return command(*args, **kwargs)
+        return record
+
+    def called(self, *names: str) -> list[RecordedCall]:
+        """Returns calls of commands whose names start with any of `names`."""
+        return [call for call in self.calls if call.name.startswith(names)]
@@ -1,8 +1,14 @@
 # mypy: disable-error-code="attr-defined"
+import inspect
+
+import pytest
+
 from mongorepo import RepositoryConfig
+from mongorepo.exceptions import MongorepoException
 from mongorepo.implement import implement
 from mongorepo.implement.methods import (
     AddMethod,
+    GetListMethod,
     ListAppendMethod,
     ListItemsMethod,
     ListPopMethod,
@@ -76,3 +82,41 @@ def test_can_change_order_of_repo_parameters_and_passed_arguments() -> None:
         r.remove_dto_by_title(SimpleEntity(x='1', y=1), title=title)
 
     assert True
+
+
+def test_binds_arguments_without_inspecting_signature_on_call(monkeypatch) -> None:
+
+    class IRepo:
+        def add(self, entity: SimpleEntity) -> None:
+            ...
+
+        # Falsy default values are used as any other default value
+        def get_list(  # type: ignore[empty-body]
+            self, x: str, offset: int = 0, limit: int = 2,
+        ) -> list[SimpleEntity]:
+            ...
+
+    with in_collection(SimpleEntity) as cl:
+        @implement(
+            AddMethod(IRepo.add, entity='entity'),
+            GetListMethod(IRepo.get_list, filters=['x'], offset='offset', limit='limit'),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class MongoRepo:
+            ...
+
+        def fail(*args, **kwargs):
+            raise AssertionError('signature must be inspected only when class is decorated')
+
+        monkeypatch.setattr(inspect, 'signature', fail)
+
+        r: IRepo = MongoRepo()  # type: ignore
+        for y in range(3):
+            r.add(SimpleEntity(x='x', y=y))
+
+        assert [e.y for e in r.get_list('x')] == [0, 1]
+        assert [e.y for e in r.get_list(x='x', offset=1)] == [1, 2]
+        assert [e.y for e in r.get_list('x', 2, limit=5)] == [2]
+
+        with pytest.raises(MongorepoException):
+            r.get_list(offset=0)
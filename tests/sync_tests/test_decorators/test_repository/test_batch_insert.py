@@ -0,0 +1,86 @@
+# mypy: disable-error-code="attr-defined"
+from typing import Any
+
+import pytest
+from pymongo.errors import AutoReconnect, BulkWriteError
+
+from mongorepo import BatchInsert, RepositoryConfig, repository
+from mongorepo.exceptions import BatchInsertException
+from tests.common import SimpleEntity, in_collection
+
+
+def test_add_batch_inserts_iterator_by_chunks() -> None:
+    with in_collection(SimpleEntity) as cl:
+        @repository(
+            add_batch=BatchInsert(chunk_size=4),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class Repository:
+            ...
+
+        converted: list[int] = []
+
+        def entities():
+            for i in range(10):
+                converted.append(i)
+                yield SimpleEntity(x=str(i), y=i)
+
+        result = Repository().add_batch(entities())
+
+        assert result.ok
+        assert result.inserted_count == 10
+        assert result.chunk_count == 3
+        assert converted == list(range(10))
+        assert cl.count_documents({}) == 10
+
+
+def test_add_batch_reports_failed_chunks_and_continues() -> None:
+    with in_collection(SimpleEntity) as cl:
+        cl.create_index('x', unique=True)
+        cl.insert_one({'x': '5', 'y': 5})
+
+        @repository(
+            add_batch=BatchInsert(chunk_size=4),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class Repository:
+            ...
+
+        result = Repository().add_batch(SimpleEntity(x=str(i), y=i) for i in range(10))
+
+        assert not result.ok
+        assert result.chunk_count == 3
+        assert result.inserted_count == 9
+        [error] = result.errors
+        assert (error.chunk, error.offset, error.size, error.inserted_count) == (1, 4, 4, 3)
+        assert isinstance(error.error, BulkWriteError)
+        assert cl.count_documents({}) == 10
+
+
+def test_add_batch_stops_at_connection_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    with in_collection(SimpleEntity) as cl:
+        @repository(
+            add_batch=BatchInsert(chunk_size=2),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class Repository:
+            ...
+
+        insert_many = cl.insert_many
+        calls: list[int] = []
+
+        def insert_until_disconnected(documents: list[dict[str, Any]], **kwargs) -> Any:
+            calls.append(len(documents))
+            if len(calls) > 1:
+                raise AutoReconnect('connection closed')
+            return insert_many(documents, **kwargs)
+
+        monkeypatch.setattr(cl, 'insert_many', insert_until_disconnected)
+
+        with pytest.raises(BatchInsertException) as exc_info:
+            Repository().add_batch(SimpleEntity(x=str(i), y=i) for i in range(10))
+
+        assert calls == [2, 2]
+        result = exc_info.value.result
+        assert (result.inserted_count, result.chunk_count) == (2, 2)
+        assert isinstance(result.errors[0].error, AutoReconnect)
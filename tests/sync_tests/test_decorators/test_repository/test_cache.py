@@ -0,0 +1,144 @@
+# mypy: disable-error-code="attr-defined"
+import time
+
+from mongorepo import RepositoryConfig, repository, session_context
+from mongorepo.cache import LRUCache
+from mongorepo.memory import MemoryCollection
+from tests.common import DictEntity, MultiFieldEntity, in_collection
+
+
+def test_get_reads_through_cache_and_writes_invalidate_it() -> None:
+    with in_collection(MultiFieldEntity) as cl:
+        @repository(
+            list_fields=['skills'],
+            config=RepositoryConfig(entity_type=MultiFieldEntity, collection=cl, cache=LRUCache()),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        stats = repo.__mongorepo__['cache'].stats
+
+        # Missing entities are cached too, until something is added
+        assert repo.get(x='1') is None
+        assert repo.get(x='1') is None
+        assert (stats.hits, stats.misses) == (1, 1)
+
+        repo.add(MultiFieldEntity(x='1', skills=['python']))
+        assert repo.get(x='1') == MultiFieldEntity(x='1', skills=['python'])
+
+        # Documents changed outside of the repository are served from cache
+        cl.update_one({'x': '1'}, {'$set': {'name': 'changed outside'}})
+        entity = repo.get(x='1')
+        assert entity.name == 'Hello World!'
+        assert (stats.hits, stats.misses) == (2, 2)
+
+        repo.skills__append(value='go', x='1')
+        entity = repo.get(x='1')
+        assert entity.skills == ['python', 'go'] and entity.name == 'changed outside'
+
+        repo.delete(x='1')
+        assert repo.get(x='1') is None
+
+
+def test_writes_invalidate_only_documents_they_may_modify() -> None:
+    with in_collection(MultiFieldEntity) as cl:
+        @repository(
+            list_fields=['skills'],
+            config=RepositoryConfig(entity_type=MultiFieldEntity, collection=cl, cache=LRUCache()),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        stats = repo.__mongorepo__['cache'].stats
+        repo.add(MultiFieldEntity(x='hot', name='hot'))
+        repo.add(MultiFieldEntity(x='cold'))
+        assert repo.get(x='hot').name == 'hot'
+        assert repo.get(name='hot').x == 'hot'
+
+        # Inserts and writes of other documents keep cached documents
+        repo.add(MultiFieldEntity(x='new'))
+        repo.skills__append(value='go', x='cold')
+        repo.update(MultiFieldEntity(x='cold', name='cold'), x='cold')
+        repo.delete(x='new')
+        assert repo.get(x='hot').name == 'hot'
+        assert repo.get(name='hot').x == 'hot'
+        assert (stats.hits, stats.misses) == (2, 2)
+
+        # Entries of the modified document are removed whatever filters they were found with
+        repo.update(MultiFieldEntity(x='hot', name='renamed'), x='hot')
+        assert repo.get(name='hot') is None
+        repo.skills__append(value='go', name='renamed')
+        assert repo.get(x='hot').skills == ['go']
+        assert (stats.hits, stats.misses) == (2, 4)
+
+
+def test_cached_entities_do_not_share_state() -> None:
+    with in_collection(DictEntity) as cl:
+        @repository(config=RepositoryConfig(entity_type=DictEntity, collection=cl, cache=LRUCache()))
+        class Repository:
+            ...
+
+        repo = Repository()
+        repo.add(DictEntity(oid='1', records={'a': [1]}))
+
+        entity = repo.get(oid='1')
+        entity.records['a'].append(2)
+
+        assert repo.get(oid='1').records == {'a': [1]}
+
+
+def test_lru_cache_eviction_and_ttl() -> None:
+    cache = LRUCache(max_size=2, ttl=0.05)
+    cache.set('a', b'a', cache.generation)
+    cache.set('b', b'b', cache.generation)
+    cache.get('a')
+    cache.set('c', b'c', cache.generation)
+
+    # "b" is the least recently used entry
+    assert cache.get('b') == (False, None)
+    assert cache.get('a') == (True, b'a')
+    assert cache.stats.evictions == 1
+
+    time.sleep(0.06)
+    assert cache.get('c') == (False, None)
+    assert cache.stats.expirations == 1
+
+    # Values read before invalidation are not stored
+    generation = cache.generation
+    cache.clear()
+    cache.set('d', b'd', generation)
+    assert cache.get('d') == (False, None)
+
+
+def test_cache_is_bypassed_until_transaction_is_finished() -> None:
+    class Transaction:
+        in_transaction = True
+
+    @repository(
+        list_fields=['skills'],
+        config=RepositoryConfig(
+            entity_type=MultiFieldEntity, collection=MemoryCollection(), cache=LRUCache(),
+        ),
+    )
+    class Repository:
+        ...
+
+    repo = Repository()
+    stats = repo.__mongorepo__['cache'].stats
+    repo.add(MultiFieldEntity(x='1'))
+
+    transaction = Transaction()
+    with session_context(transaction, repo):
+        repo.skills__append(value='go', x='1')
+    # Documents read before commit are not cached
+    repo.get(x='1')
+    repo.get(x='1')
+    assert (stats.hits, stats.misses) == (0, 0)
+
+    transaction.in_transaction = False
+    assert repo.get(x='1').skills == ['go']
+    assert repo.get(x='1').skills == ['go']
+    assert (stats.hits, stats.misses) == (1, 1)
+    assert repo.__mongorepo__['transactions'] == []
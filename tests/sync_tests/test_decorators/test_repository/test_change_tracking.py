@@ -0,0 +1,126 @@
+# mypy: disable-error-code="attr-defined"
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+from mongorepo import RepositoryConfig, repository
+from mongorepo.exceptions import MongorepoException
+from tests.common import (
+    MultiFieldEntity,
+    RecordingCollection,
+    SimpleEntity,
+    in_collection,
+)
+
+
+@dataclass
+class Profile:
+    bio: str
+    links: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Account:
+    login: str
+    profile: Profile
+    tags: list[str] = field(default_factory=list)
+    score: int = 0
+
+
+def updates(collection: RecordingCollection) -> list[dict[str, Any]]:
+    return [call.kwargs['update'] for call in collection.called('find_one_and_update')]
+
+
+def test_update_sends_only_changed_paths_of_loaded_entities() -> None:
+    with in_collection(Account) as cl:
+        spy = RecordingCollection(cl)
+
+        @repository(
+            config=RepositoryConfig(entity_type=Account, collection=spy, track_changes=True),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        repo.add(Account(login='admin', profile=Profile(bio='...'), tags=['a'] * 100))
+
+        account = repo.get(login='admin')
+        account.profile.bio = 'Administrator'
+        account.score = 10
+        updated = repo.update(account, login='admin')
+
+        assert updates(spy)[-1] == {'$set': {'profile.bio': 'Administrator', 'score': 10}}
+        assert updated == account
+
+        # The updated entity and the returned one are tracked too
+        account.tags.append('b')
+        repo.update(account, login='admin')
+        assert updates(spy)[-1] == {'$set': {'tags': ['a'] * 100 + ['b']}}
+
+        updated.profile.links.append('https://example.com')
+        repo.update(updated, login='admin')
+        assert updates(spy)[-1] == {'$set': {'profile.links': ['https://example.com']}}
+
+        # Nothing changed in `account`, no write is sent and changes made by others are kept
+        updates_count = len(updates(spy))
+        assert repo.update(account, login='admin').profile.links == ['https://example.com']
+        assert len(updates(spy)) == updates_count
+
+        # Entities that were not loaded are updated entirely
+        repo.update(Account(login='admin', profile=Profile(bio='new')), login='admin')
+        assert set(updates(spy)[-1]['$set']) == {'login', 'profile', 'tags', 'score'}
+
+        for entity in repo.get_all():
+            entity.score = 1
+            repo.update(entity, login=entity.login)
+        assert updates(spy)[-1] == {'$set': {'score': 1}}
+
+
+def test_update_with_field_mask() -> None:
+    with in_collection(SimpleEntity) as cl:
+        spy = RecordingCollection(cl)
+
+        @repository(config=RepositoryConfig(entity_type=SimpleEntity, collection=spy))
+        class Repository:
+            ...
+
+        repo = Repository()
+        repo.add(SimpleEntity(x='1', y=1))
+
+        updated = repo.update(SimpleEntity(x='ignored', y=2), update_fields=['y'], x='1')
+
+        assert updates(spy)[-1] == {'$set': {'y': 2}}
+        assert updated == SimpleEntity(x='1', y=2)
+
+        with pytest.raises(MongorepoException):
+            repo.update(SimpleEntity(x='1', y=3), update_fields=['z'], x='1')
+
+
+def test_snapshots_do_not_share_state_with_entities() -> None:
+    with in_collection(MultiFieldEntity) as cl:
+        spy = RecordingCollection(cl)
+
+        @repository(
+            config=RepositoryConfig(
+                entity_type=MultiFieldEntity,
+                collection=spy,
+                track_changes=True,
+                # Shallow converter returns the list of the entity itself
+                to_document_converter=lambda entity: dict(vars(entity)),
+            ),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        repo.add(MultiFieldEntity(x='1', skills=['python']))
+
+        entity = repo.get(x='1')
+        entity.skills.append('go')
+        repo.update(entity, x='1')
+        assert updates(spy)[-1] == {'$set': {'skills': ['python', 'go']}}
+
+        entity.skills.append('rust')
+        repo.update(entity, x='1')
+        assert updates(spy)[-1] == {'$set': {'skills': ['python', 'go', 'rust']}}
@@ -1,10 +1,15 @@
 # mypy: disable-error-code="attr-defined"
 import random
 
+import pytest
+
 from mongorepo import repository
+from mongorepo.exceptions import InvalidFilterException
 from mongorepo.types import MethodAccess, RepositoryConfig
 from tests.common import (
+    Box,
     EntityWithID,
+    MixedEntity,
     MultiFieldEntity,
     SimpleEntity,
     in_collection,
@@ -197,3 +202,48 @@ def test_get_list_with_add_batch_methods_with_decorator() -> None:
         for entity in entity_list:
             assert entity
             assert isinstance(entity, SimpleEntity)
+
+
+def test_delete_many_method() -> None:
+
+    with in_collection(SimpleEntity) as cl:
+        @repository(
+            delete_many=True, config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class TestMongoRepository:
+            ...
+
+        repo = TestMongoRepository()
+        repo.add_batch(
+            [SimpleEntity(x='a', y=1), SimpleEntity(x='a', y=2), SimpleEntity(x='b', y=3)],
+        )
+
+        assert repo.delete_many(x='a') == 2
+        assert repo.delete_many(x='a') == 0
+        assert repo.delete(x='b') is True
+        assert repo.delete(x='b') is False
+
+
+def test_filters_with_operators() -> None:
+
+    with in_collection('FilteredMixedEntity') as cl:
+        @repository(
+            delete_many=True, config=RepositoryConfig(entity_type=MixedEntity, collection=cl),
+        )
+        class TestMongoRepository:
+            ...
+
+        repo = TestMongoRepository()
+        repo.add_batch([
+            MixedEntity(id=str(i), name='name', year=2000 + i, main_box=Box(id=str(i), value='v'))
+            for i in range(5)
+        ])
+
+        assert [e.id for e in repo.get_all(year__gte=2001, year__lt=2003)] == ['1', '2']
+        assert repo.get(main_box__id='4').year == 2004
+        assert repo.delete_many(id__in=['0', '1', '9']) == 2
+        with pytest.raises(InvalidFilterException):
+            repo.get(age__gt=1)
+        assert [e.id for e in repo.get_all(id__in=('2', '3'))] == ['2', '3']
+        with pytest.raises(InvalidFilterException):
+            repo.get(id__in='23')
@@ -0,0 +1,57 @@
+# mypy: disable-error-code="attr-defined"
+from typing import Any
+
+import pymongo
+import pytest
+
+from mongorepo import (
+    FindOptions,
+    RepositoryConfig,
+    find_options_context,
+    repository,
+)
+from tests.common import RecordingCollection, SimpleEntity, in_collection
+
+
+def find_options(collection: RecordingCollection) -> dict[str, Any]:
+    names = ('sort', 'hint', 'batch_size', 'max_time_ms')
+    kwargs = collection.called('find')[-1].kwargs
+    return {k: kwargs[k] for k in names if k in kwargs}
+
+
+def test_find_options_are_resolved_from_config_and_context() -> None:
+    with in_collection(SimpleEntity) as cl:
+        cl.create_index('x')
+        spy = RecordingCollection(cl)
+
+        @repository(
+            config=RepositoryConfig(
+                entity_type=SimpleEntity,
+                collection=spy,
+                find_options=FindOptions(sort=[('y', pymongo.DESCENDING)], max_time_ms=1000),
+            ),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        repo.add_batch([SimpleEntity(x='a', y=i) for i in range(5)])
+
+        assert [e.y for e in repo.get_list(offset=1, limit=2)] == [3, 2]
+        assert find_options(spy) == {'sort': [('y', -1)], 'max_time_ms': 1000}
+
+        with find_options_context(FindOptions(sort=['y'], hint='x_1'), repo):
+            with find_options_context(FindOptions(batch_size=2), repo):
+                assert [e.y for e in repo.get_all(x='a')] == [0, 1, 2, 3, 4]
+                assert find_options(spy) == {
+                    'sort': [('y', 1)], 'hint': 'x_1', 'batch_size': 2, 'max_time_ms': 1000,
+                }
+        repo.get_list()
+        assert find_options(spy) == {'sort': [('y', -1)], 'max_time_ms': 1000}
+
+
+def test_find_options_validation() -> None:
+    with pytest.raises(ValueError):
+        FindOptions(sort='y')  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        FindOptions(max_time_ms=0)
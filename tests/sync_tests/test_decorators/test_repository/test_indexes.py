@@ -0,0 +1,73 @@
+# mypy: disable-error-code="attr-defined"
+import pymongo
+import pytest
+
+from mongorepo import (
+    Index,
+    RepositoryConfig,
+    ensure_indexes,
+    index_drift,
+    repository,
+)
+from tests.common import SimpleEntity, in_collection
+
+
+def test_ensure_indexes_creates_declared_indexes() -> None:
+    with in_collection(SimpleEntity) as cl:
+        @repository(
+            config=RepositoryConfig(
+                entity_type=SimpleEntity,
+                collection=cl,
+                indexes=[
+                    Index('x', unique=True),
+                    Index('x', ('y', pymongo.DESCENDING), name='x_y'),
+                    Index('y', sparse=True),
+                ],
+            ),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        assert not index_drift(repo).in_sync
+        assert [i.name for i in index_drift(repo).missing] == ['x_1', 'x_y', 'y_1']
+
+        assert ensure_indexes(repo) == ['x_1', 'x_y', 'y_1']
+        # Ensuring the same indexes twice is a no-op
+        ensure_indexes(repo)
+
+        info = cl.index_information()
+        assert info['x_1']['unique'] is True
+        assert list(info['x_y']['key']) == [('x', 1), ('y', -1)]
+        assert index_drift(repo).in_sync
+
+        repo.add(SimpleEntity(x='1', y=1))
+        with pytest.raises(pymongo.errors.DuplicateKeyError):
+            repo.add(SimpleEntity(x='1', y=2))
+
+
+def test_index_drift_reports_changed_and_extra_indexes() -> None:
+    with in_collection(SimpleEntity) as cl:
+        cl.create_index('x', unique=True)
+        cl.create_index('y')
+
+        @repository(
+            config=RepositoryConfig(
+                entity_type=SimpleEntity,
+                collection=cl,
+                indexes=[Index('x'), Index('x', 'y')],
+            ),
+        )
+        class Repository:
+            ...
+
+        drift = index_drift(Repository())
+
+        assert [i.name for i in drift.missing] == ['x_1_y_1']
+        assert [(i.name, info['name']) for i, info in drift.changed] == [('x_1', 'x_1')]
+        assert [info['name'] for info in drift.extra] == ['y_1']
+
+
+def test_index_cannot_be_sparse_and_partial() -> None:
+    with pytest.raises(ValueError):
+        Index('x', sparse=True, partial_filter={'x': {'$exists': True}})
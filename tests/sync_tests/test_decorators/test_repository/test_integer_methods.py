@@ -1,8 +1,29 @@
 # mypy: disable-error-code="attr-defined"
-from mongorepo import RepositoryConfig, repository
+from dataclasses import dataclass
+
+import pytest
+
+from mongorepo import (
+    BulkIncrementResult,
+    RepositoryConfig,
+    WriteBehind,
+    flush_counters,
+    repository,
+)
+from mongorepo.exceptions import BulkIncrementException, MongorepoException
+from mongorepo.types import CommandEvent
 from tests.common import SimpleEntity, in_collection
 
 
+@dataclass
+class Score:
+    player: str
+    team: str
+    wins: int = 0
+    games: int = 0
+    points: int = 0
+
+
 def test_can_increment_and_decrement_field_with_decorator() -> None:
 
     with in_collection(SimpleEntity) as coll:
@@ -23,3 +44,136 @@ def test_can_increment_and_decrement_field_with_decorator() -> None:
 
         entity = repo.get(x='admin')
         assert entity.y == 13
+
+
+def test_write_behind_buffers_increments() -> None:
+    commands: list[str] = []
+
+    class Observer:
+        def on_command(self, event: CommandEvent) -> None:
+            commands.append(event.command)
+
+    with in_collection(SimpleEntity) as coll:
+        @repository(
+            integer_fields=['y'],
+            write_behind=WriteBehind(flush_interval=0, max_pending=2),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=coll),
+        )
+        class Repository:
+            ...
+
+        Repository.__mongorepo__['collection_provider'].observers.append(Observer())
+        repo = Repository()
+        repo.add(SimpleEntity(x='a', y=0))
+        repo.add(SimpleEntity(x='b', y=0))
+        assert flush_counters(repo) == 0
+
+        assert repo.incr__y(x='a') is None
+        repo.incr__y(x='a', weight=5)
+        repo.decr__y(x='a')
+        # Increments are not visible until they are flushed
+        assert repo.get(x='a').y == 0
+        assert flush_counters(repo) == 1
+        assert repo.get(x='a').y == 5
+
+        # Second pending counter reaches `max_pending`
+        repo.incr__y(x='a')
+        repo.incr__y(x='b')
+        assert repo.get(x='a').y == 6
+        assert repo.get(x='b').y == 1
+        assert commands.count('bulk_write') == 2
+        assert 'update_one' not in commands
+
+        # Increments that cancel each other out are not written
+        repo.incr__y(x='a')
+        repo.decr__y(x='a')
+        assert flush_counters(repo) == 0
+        # Filters that cannot be buffered are written immediately
+        assert repo.incr__y(x__in=['a', 'b']).modified_count == 1
+
+
+def test_can_increment_many_fields_of_many_documents() -> None:
+    with in_collection(Score) as coll:
+        @repository(
+            integer_fields=['wins', 'games'],
+            config=RepositoryConfig(entity_type=Score, collection=coll),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        for i in range(5):
+            repo.add(Score(player=str(i), team=f'team {i % 2}'))
+        Repository.incr_many.chunk_size = 2
+
+        result = repo.incr_many(
+            {str(i): {'wins': i, 'games': 1} for i in range(5)}, by='player',
+        )
+        assert result == BulkIncrementResult(matched_count=5, modified_count=5, chunk_count=3)
+        assert [(s.wins, s.games) for s in repo.get_all()] == [(i, 1) for i in range(5)]
+
+        result = repo.incr_many([
+            ({'team': 'team 1'}, {'wins': -1}),
+            ({'player': '2'}, {'wins': 0}),
+            ({'player': 'missing'}, {'games': 1}),
+        ])
+        assert result == BulkIncrementResult(matched_count=1, modified_count=1, chunk_count=1)
+        assert repo.get(player='1').wins == 0
+
+        with pytest.raises(MongorepoException):
+            repo.incr_many({'1': {'points': 1}}, by='player')
+
+
+def test_failed_increments_report_applied_chunks() -> None:
+    with in_collection(Score) as coll:
+        @repository(
+            integer_fields=['wins'],
+            config=RepositoryConfig(entity_type=Score, collection=coll),
+        )
+        class Repository:
+            ...
+
+        coll.create_index('wins', unique=True)
+        repo = Repository()
+        for i in range(4):
+            repo.add(Score(player=str(i), team='team', wins=i * 10))
+        repo.add(Score(player='4', team='team', wins=31))
+        Repository.incr_many.chunk_size = 2
+
+        with pytest.raises(BulkIncrementException) as exc_info:
+            repo.incr_many({str(i): {'wins': 1} for i in range(5)}, by='player')
+
+        # Increment of player "3" conflicts with wins of player "4", the first chunk and
+        # the valid increment of the failed one were applied
+        assert exc_info.value.result == BulkIncrementResult(
+            matched_count=3, modified_count=3, chunk_count=1,
+        )
+        assert [s.wins for s in repo.get_all()] == [1, 11, 21, 30, 31]
+
+
+def test_increment_can_return_new_value() -> None:
+    with in_collection(SimpleEntity) as coll:
+        @repository(
+            integer_fields=['y'],
+            return_incremented=True,
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=coll),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        repo.add(SimpleEntity(x='sequence', y=0))
+
+        assert [repo.incr__y(x='sequence') for _ in range(3)] == [1, 2, 3]
+        assert repo.decr__y(x='sequence') == 2
+        assert repo.incr__y(x='missing') is None
+
+        with pytest.raises(MongorepoException):
+            @repository(
+                integer_fields=['y'],
+                return_incremented=True,
+                write_behind=WriteBehind(),
+                config=RepositoryConfig(entity_type=SimpleEntity, collection=coll),
+            )
+            class BufferedRepository:
+                ...
@@ -2,7 +2,13 @@
 from dataclasses import dataclass, field
 from typing import List
 
-from mongorepo import MethodAccess, RepositoryConfig, repository
+from mongorepo import (
+    ListAppend,
+    ListBuckets,
+    MethodAccess,
+    RepositoryConfig,
+    repository,
+)
 from tests.common import (
     MultiFieldEntity,
     NestedListEntity,
@@ -158,3 +164,123 @@ def test_can_get_list_of_dto_field_values() -> None:
         last: SimpleEntity | None = repo.dtos__pop(title='Test')
         assert last
         assert last.y == 5
+
+
+def test_can_append_many_values_with_one_update() -> None:
+
+    with in_collection(NestedListEntity) as cl:
+        @repository(
+            list_fields={'dtos': ListAppend(max_length=3, sort={'y': 1})},
+            config=RepositoryConfig(entity_type=NestedListEntity, collection=cl),
+        )
+        class MongoRepository:
+            ...
+
+        @repository(
+            list_fields={'skills': ListAppend(unique=True)},
+            config=RepositoryConfig(entity_type=MultiFieldEntity, collection=cl),
+        )
+        class SkillsRepository:
+            ...
+
+        repo = MongoRepository()
+        repo.add(NestedListEntity(title='Test', dtos=[SimpleEntity(x='5', y=5)]))
+
+        repo.dtos__append(values=(SimpleEntity(x=str(i), y=i) for i in (4, 1, 3)), title='Test')
+        # Array is sorted by `y` and capped to the last 3 elements
+        assert [dto.y for dto in repo.dtos__list(title='Test')] == [3, 4, 5]
+        repo.dtos__append(SimpleEntity(x='9', y=9), title='Test')
+        assert [dto.y for dto in repo.dtos__list(title='Test')] == [4, 5, 9]
+
+        skills = SkillsRepository()
+        skills.add(MultiFieldEntity(x='me', skills=['python']))
+        skills.skills__append(values=['python', 'go', 'rust'], x='me')
+        assert skills.get(x='me').skills == ['python', 'go', 'rust']
+
+
+def test_can_store_list_in_buckets() -> None:
+
+    with in_collection(NestedListEntity) as cl:
+        @repository(
+            list_fields={'dtos': ListBuckets(bucket_size=2)},
+            config=RepositoryConfig(entity_type=NestedListEntity, collection=cl),
+        )
+        class MongoRepository:
+            ...
+
+        repo = MongoRepository()
+        try:
+            repo.add(NestedListEntity(title='Test', dtos=[]))
+
+            repo.dtos__append(SimpleEntity(x='1', y=1), title='Test')
+            repo.dtos__append(
+                values=[SimpleEntity(x=str(i), y=i) for i in range(2, 6)], title='Test',
+            )
+            assert repo.dtos__append(SimpleEntity(x='0', y=0), title='Missing') is None
+            # Elements are not stored with the entity document
+            assert repo.get(title='Test').dtos == []
+            assert [b['count'] for b in cl['dtos'].find(sort=[('seq', 1)])] == [2, 2, 1]
+
+            assert [dto.y for dto in repo.dtos__list(title='Test')] == [1, 2, 3, 4, 5]
+            assert [dto.y for dto in repo.dtos__list(offset=1, limit=3, title='Test')] == [2, 3, 4]
+            assert [dto.y for dto in repo.dtos__list(offset=-2, limit=5, title='Test')] == [4, 5]
+            assert repo.dtos__list(offset=5, title='Test') == []
+
+            assert repo.dtos__pop(title='Test').y == 5
+            assert repo.dtos__pop(title='Test').y == 4
+            # Emptied bucket is removed
+            assert cl['dtos'].count_documents({}) == 2
+            repo.dtos__append(SimpleEntity(x='6', y=6), title='Test')
+            assert [dto.y for dto in repo.dtos__list(title='Test')] == [1, 2, 3, 6]
+        finally:
+            cl['dtos'].drop()
+
+
+def test_can_remove_elements_and_delete_buckets() -> None:
+
+    with in_collection(NestedListEntity) as cl:
+        @repository(
+            delete_many=True,
+            list_fields={'dtos': ListBuckets(bucket_size=2)},
+            config=RepositoryConfig(entity_type=NestedListEntity, collection=cl),
+        )
+        class MongoRepository:
+            ...
+
+        repo = MongoRepository()
+        try:
+            repo.add(NestedListEntity(title='A', dtos=[]))
+            repo.add(NestedListEntity(title='B', dtos=[]))
+            parent = cl.find_one({'title': 'A'})['_id']
+            repo.dtos__append(
+                values=[SimpleEntity(x=str(y), y=y) for y in (1, 2, 3, 1, 4)], title='A',
+            )
+            repo.dtos__append(SimpleEntity(x='7', y=7), title='B')
+
+            # Buckets after the removed elements are shifted, so paging still works
+            assert repo.dtos__remove(SimpleEntity(x='1', y=1), title='A') == 2
+            assert repo.dtos__remove(SimpleEntity(x='9', y=9), title='A') == 0
+            assert repo.dtos__remove(SimpleEntity(x='1', y=1), title='Missing') is None
+            assert [dto.y for dto in repo.dtos__list(title='A')] == [2, 3, 4]
+            assert [dto.y for dto in repo.dtos__list(offset=1, limit=2, title='A')] == [3, 4]
+            buckets = cl['dtos'].find({'parent': parent}, sort=[('seq', 1)])
+            assert [b['count'] for b in buckets] == [2, 1]
+
+            # Empty buckets left at the end of the list by failed pops are skipped
+            cl['dtos'].update_one(
+                {'parent': parent, 'seq': 1}, {'$set': {'count': 0, 'items': []}},
+            )
+            cl['dtos'].insert_one({'parent': parent, 'seq': 2, 'count': 0, 'items': []})
+            assert [dto.y for dto in repo.dtos__list(offset=-1, title='A')] == [3]
+            repo.dtos__append(SimpleEntity(x='5', y=5), title='A')
+            assert [dto.y for dto in repo.dtos__list(title='A')] == [2, 3, 5]
+            assert repo.dtos__pop(title='A').y == 5
+            assert cl['dtos'].count_documents({'parent': parent}) == 1
+
+            assert repo.delete(title='A')
+            assert cl['dtos'].count_documents({'parent': parent}) == 0
+            assert cl['dtos'].count_documents({}) == 1
+            assert repo.delete_many(title='B') == 1
+            assert cl['dtos'].count_documents({}) == 0
+        finally:
+            cl['dtos'].drop()
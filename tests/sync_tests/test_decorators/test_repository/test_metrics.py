@@ -0,0 +1,85 @@
+# mypy: disable-error-code="attr-defined"
+import pytest
+
+from mongorepo import RepositoryConfig, provide_collection, repository
+from mongorepo.metrics import LatencyHistogram, RepositoryMetrics
+from tests.common import SimpleEntity, in_collection
+
+
+def test_metrics_count_calls_and_phases_of_methods() -> None:
+    with in_collection(SimpleEntity) as cl:
+        @repository(
+            add_batch=False,
+            config=RepositoryConfig(
+                entity_type=SimpleEntity, collection=cl, metrics=RepositoryMetrics(),
+            ),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        repo.add(SimpleEntity(x='1', y=1))
+        repo.add(SimpleEntity(x='2', y=2))
+        assert repo.get(x='1') == SimpleEntity(x='1', y=1)
+        assert list(repo.get_all()) == [SimpleEntity(x='1', y=1), SimpleEntity(x='2', y=2)]
+        with pytest.raises(TypeError):
+            repo.get(1, 2)
+
+        metrics: RepositoryMetrics = repo.__mongorepo__['metrics']
+        assert (metrics['add'].calls, metrics['add'].errors) == (2, 0)
+        assert (metrics['get'].calls, metrics['get'].errors) == (2, 1)
+        assert metrics['get_all'].calls == 1
+        assert metrics['update'].calls == 0
+
+        get_all = metrics['get_all']
+        assert get_all.phases['driver'].count == 1
+        assert get_all.phases['conversion'].count == 1
+        assert get_all.phases['driver'].total + get_all.phases['conversion'].total <= (
+            get_all.latency.total
+        )
+
+        snapshot = metrics.snapshot()
+        assert snapshot['add']['calls'] == 2
+        assert set(snapshot['add']['phases']) == {'driver', 'conversion'}
+        assert snapshot['get']['latency']['count'] == 2
+
+        metrics.enabled = False
+        repo.get(x='1')
+        assert metrics['get'].calls == 2
+        # Disabled metrics do not wrap methods and their converters
+        get = repo.__mongorepo__['methods']['get'].mongorepo_method
+        assert type(repo).get is get
+        assert not hasattr(get.to_entity_converter, 'mongorepo_timed')
+        metrics.enabled = True
+        assert type(repo).get.mongorepo_method is get
+        assert get.to_entity_converter.mongorepo_timed
+        metrics.enabled = False
+
+        metrics.reset()
+        assert metrics['add'].calls == 0
+        assert metrics.snapshot()['add']['phases'] == {}
+
+
+def test_metrics_follow_provided_collection() -> None:
+    @repository(config=RepositoryConfig(entity_type=SimpleEntity, metrics=RepositoryMetrics()))
+    class Repository:
+        ...
+
+    with in_collection(SimpleEntity) as cl:
+        repo = Repository()
+        provide_collection(repo, cl)
+        repo.add(SimpleEntity(x='1', y=1))
+
+        assert repo.__mongorepo__['metrics']['add'].phases['driver'].count == 1
+
+
+def test_latency_histogram_percentiles() -> None:
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 1000)
+
+    assert histogram.count == 100
+    assert histogram.min == 0.001 and histogram.max == 0.1
+    assert 0.05 <= histogram.percentile(50) < 0.1
+    assert histogram.percentile(100) == 0.1
+    assert sum(count for _, count in histogram.buckets()) == 100
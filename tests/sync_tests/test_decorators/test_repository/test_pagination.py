@@ -0,0 +1,129 @@
+# mypy: disable-error-code="attr-defined"
+import base64
+from typing import Any
+
+import pytest
+from bson import json_util
+
+from mongorepo import Keyset, Page, RepositoryConfig, repository
+from mongorepo.exceptions import InvalidPageTokenException, MongorepoException
+from tests.common import SimpleEntity, in_collection
+
+
+def test_get_page_iterates_over_all_entities() -> None:
+    with in_collection(SimpleEntity) as cl:
+        @repository(get_page=True, config=RepositoryConfig(entity_type=SimpleEntity, collection=cl))
+        class Repository:
+            ...
+
+        repo = Repository()
+        repo.add_batch([SimpleEntity(x=str(i), y=i) for i in range(7)])
+
+        page: Page[SimpleEntity] = repo.get_page(limit=3)
+        seen = list(page.items)
+        assert len(page.items) == 3 and page.has_next
+
+        while page.next_token is not None:
+            page = repo.get_page(limit=3, token=page.next_token)
+            seen.extend(page.items)
+
+        assert [e.y for e in seen] == list(range(7))
+        assert len(page.items) == 1 and not page.has_next
+
+
+def test_get_page_with_sort_key_and_filters() -> None:
+    with in_collection(SimpleEntity) as cl:
+        @repository(
+            get_page=Keyset(sort_key='y', descending=True),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        # Duplicated sort key values are ordered by `_id`
+        repo.add_batch([SimpleEntity(x='a', y=i // 2) for i in range(6)])
+        repo.add(SimpleEntity(x='b', y=100))
+
+        first = repo.get_page(limit=4, x='a')
+        second = repo.get_page(limit=4, token=first.next_token, x='a')
+
+        assert [e.y for e in first.items] == [2, 2, 1, 1]
+        assert [e.y for e in second.items] == [0, 0]
+        assert second.next_token is None
+
+
+def test_get_page_with_invalid_token() -> None:
+    with in_collection(SimpleEntity) as cl:
+        @repository(get_page=True, config=RepositoryConfig(entity_type=SimpleEntity, collection=cl))
+        class Repository:
+            ...
+
+        @repository(
+            get_page=Keyset(sort_key='y'),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class SortedRepository:
+            ...
+
+        repo = Repository()
+        repo.add_batch([SimpleEntity(x='a', y=i) for i in range(3)])
+
+        with pytest.raises(InvalidPageTokenException):
+            repo.get_page(token='not a token')
+
+        token = repo.get_page(limit=1).next_token
+        with pytest.raises(InvalidPageTokenException):
+            SortedRepository().get_page(token=token)
+
+
+def test_get_page_token_values_are_not_used_as_operators() -> None:
+    with in_collection(SimpleEntity) as cl:
+        @repository(
+            get_page=Keyset(sort_key='y'),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        repo.add_batch([SimpleEntity(x='a', y=i) for i in range(3)])
+
+        data = {'k': 'y', 'id': cl.find_one({'y': 0})['_id'], 'v': {'$ne': None}}
+        token = base64.urlsafe_b64encode(json_util.dumps(data).encode()).decode()
+        assert repo.get_page(token=token).items == []
+
+
+def test_get_page_iterates_over_null_sort_values() -> None:
+    with in_collection(SimpleEntity) as cl:
+        @repository(
+            get_page=Keyset(sort_key='y'),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class Repository:
+            ...
+
+        @repository(
+            get_page=Keyset(sort_key='y', descending=True),
+            config=RepositoryConfig(entity_type=SimpleEntity, collection=cl),
+        )
+        class DescendingRepository:
+            ...
+
+        repo = Repository()
+        values: list[Any] = [None if i % 2 else i for i in range(6)]
+        repo.add_batch([SimpleEntity(x=str(i), y=y) for i, y in enumerate(values)])
+
+        for repository_type, expected in (
+            (Repository, ['1', '3', '5', '0', '2', '4']),
+            (DescendingRepository, ['4', '2', '0', '5', '3', '1']),
+        ):
+            page = repository_type().get_page(limit=2)
+            seen = [e.x for e in page.items]
+            while page.next_token is not None:
+                page = repository_type().get_page(limit=2, token=page.next_token)
+                seen.extend(e.x for e in page.items)
+            assert seen == expected
+
+        with pytest.raises(MongorepoException):
+            repo.get_page(limit=-1)
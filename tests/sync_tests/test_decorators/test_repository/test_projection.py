@@ -0,0 +1,63 @@
+# mypy: disable-error-code="attr-defined"
+from dataclasses import dataclass
+
+from mongorepo import Projection, RepositoryConfig, repository
+from mongorepo.cache import LRUCache
+from tests.common import (
+    MultiFieldEntity,
+    NestedEntity,
+    RecordingCollection,
+    SimpleEntity,
+    in_collection,
+)
+
+
+@dataclass
+class Skills:
+    x: str
+    skills: list[str]
+
+
+def test_projected_methods_fetch_only_projected_fields() -> None:
+    with in_collection(MultiFieldEntity) as cl:
+        spy = RecordingCollection(cl)
+
+        @repository(
+            projections={'skills': Projection(entity_type=Skills), 'name': Projection('name')},
+            config=RepositoryConfig(
+                entity_type=MultiFieldEntity, collection=spy, track_changes=True,
+            ),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        repo.add_batch([MultiFieldEntity(x=str(i), skills=['python'] * i) for i in range(3)])
+
+        assert repo.get__skills(x='2') == Skills(x='2', skills=['python', 'python'])
+        assert repo.get__name(x='2') == {'name': 'Hello World!'}
+        assert repo.get_list__skills(offset=1, limit=1) == [Skills(x='1', skills=['python'])]
+        assert [s.x for s in repo.get_all__skills()] == ['0', '1', '2']
+        assert [call.args[1] for call in spy.called('find')[:2]] == [
+            {'x': 1, 'skills': 1, '_id': 0}, {'name': 1, '_id': 0},
+        ]
+        # Partial entities cannot be used to compute changes
+        assert len(repo.__mongorepo__['snapshots']) == 0
+
+
+def test_projection_of_nested_fields() -> None:
+    with in_collection(NestedEntity) as cl:
+        @repository(
+            projections={'y': Projection('title', 'simple.y')},
+            config=RepositoryConfig(entity_type=NestedEntity, collection=cl, cache=LRUCache()),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        repo.add(NestedEntity(title='1', simple=SimpleEntity(x='x', y=1)))
+
+        # Projected and full documents are cached separately
+        assert repo.get__y(title='1') == {'title': '1', 'simple': {'y': 1}}
+        assert repo.get(title='1') == NestedEntity(title='1', simple=SimpleEntity(x='x', y=1))
+        assert repo.get__y(title='1') == {'title': '1', 'simple': {'y': 1}}
@@ -0,0 +1,93 @@
+# mypy: disable-error-code="attr-defined"
+import pymongo
+import pytest
+
+from mongorepo import (
+    FindOptions,
+    Index,
+    RepositoryConfig,
+    ensure_indexes,
+    find_options_context,
+    repository,
+    suggest_indexes,
+)
+from mongorepo.exceptions import MongorepoException
+from mongorepo.profiling import QueryShapeStats
+from tests.common import MixedEntity, SimpleEntity, in_collection
+
+
+def test_query_shapes_are_aggregated_and_indexes_suggested() -> None:
+    with in_collection('QueryShapesEntity') as cl:
+        @repository(
+            config=RepositoryConfig(
+                entity_type=MixedEntity,
+                collection=cl,
+                indexes=[Index('name')],
+                query_shapes=QueryShapeStats(),
+            ),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        ensure_indexes(repo)
+        for i in range(3):
+            repo.get(name=str(i))
+        repo.get(name='0', year__gte=2000)
+        with find_options_context(FindOptions(sort=[('year', pymongo.DESCENDING)]), repo):
+            repo.get_list(id__in=['1', '2'], main_box__value='a')
+        repo.delete(id='1')
+
+        shapes = {
+            (s.command, str(s.shape), s.sort): s.count
+            for s in repo.__mongorepo__['query_shapes'].shapes()
+        }
+        assert shapes == {
+            ('find_one', "{'name': '?'}", ()): 3,
+            ('find_one', "{'name': '?', 'year': {'$gte': '?'}}", ()): 1,
+            ('find', "{'id': {'$in': '?'}, 'main_box.value': '?'}", (('year', -1),)): 1,
+            ('delete_one', "{'id': '?'}", ()): 1,
+        }
+
+        suggestions = {s.keys: (s.existing_index, s.count) for s in suggest_indexes(repo)}
+        assert suggestions == {
+            # `id` is matched by equality more often than `main_box.value`
+            (('id', 1), ('main_box.value', 1), ('year', -1)): (None, 2),
+            (('name', 1), ('year', 1)): (None, 4),
+        }
+
+
+def test_existing_indexes_serve_suggestions() -> None:
+    with in_collection(SimpleEntity) as cl:
+        @repository(
+            config=RepositoryConfig(
+                entity_type=SimpleEntity,
+                collection=cl,
+                indexes=[Index('y', 'x')],
+                query_shapes=QueryShapeStats(),
+            ),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        ensure_indexes(repo)
+        repo.get(x='1', y=1)
+        repo.get(y__lt=1)
+
+        suggestions = suggest_indexes(repo)
+        # Order of equality keys does not matter, ranges can use index prefixes
+        assert {s.keys: s.existing_index for s in suggestions} == {
+            (('x', 1), ('y', 1)): 'y_1_x_1',
+            (('y', 1),): 'y_1_x_1',
+        }
+        assert Index('x', 'y') in [s.to_index() for s in suggestions]
+
+
+def test_suggest_indexes_requires_query_shapes() -> None:
+    @repository(config=RepositoryConfig(entity_type=SimpleEntity))
+    class Repository:
+        ...
+
+    with pytest.raises(MongorepoException):
+        suggest_indexes(Repository())
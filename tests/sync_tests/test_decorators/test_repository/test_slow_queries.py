@@ -0,0 +1,111 @@
+# mypy: disable-error-code="attr-defined"
+import logging
+from typing import Any
+
+import pytest
+from pymongo.errors import DuplicateKeyError
+
+from mongorepo import RepositoryConfig, repository
+from mongorepo.profiling import SlowQueryLog
+from tests.common import (
+    RecordedCall,
+    RecordingCollection,
+    SimpleEntity,
+    in_collection,
+)
+
+COLLSCAN_EXPLAIN = {
+    'queryPlanner': {'winningPlan': {'stage': 'COLLSCAN'}},
+    'executionStats': {'totalDocsExamined': 2, 'totalKeysExamined': 0, 'nReturned': 1},
+}
+
+
+class ExplainedCollection(RecordingCollection):
+    """Collection proxy that answers `explain` commands with a fixed plan."""
+
+    def __init__(self, collection: Any, explain: dict[str, Any]) -> None:
+        super().__init__(collection)
+        self.explain = explain
+        self.database = self
+
+    def command(self, command: dict[str, Any]) -> dict[str, Any]:
+        self.calls.append(RecordedCall('command', (command,), {}))
+        return self.explain
+
+
+def test_slow_calls_are_logged_with_redacted_filters_and_plans(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    with in_collection(SimpleEntity) as cl:
+        collection = ExplainedCollection(cl, COLLSCAN_EXPLAIN)
+
+        @repository(
+            config=RepositoryConfig(
+                entity_type=SimpleEntity,
+                collection=collection,
+                slow_query_log=SlowQueryLog(threshold=0, explain=True),
+            ),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        repo.add(SimpleEntity(x='secret', y=1))
+        caplog.clear()
+        with caplog.at_level(logging.WARNING, logger='mongorepo.slow_queries'):
+            repo.get(x='secret')
+            repo.get(x='other')
+            repo.get(y__gte=1)
+
+        assert [call.args[0]['explain'] for call in collection.called('command')] == [
+            {'find': cl.name, 'filter': {'x': 'secret'}, 'limit': 1},
+            {'find': cl.name, 'filter': {'y': {'$gte': 1}}, 'limit': 1},
+        ]
+        messages = [r.getMessage() for r in caplog.records]
+        assert len(messages) == 3
+        assert all('secret' not in m and 'COLLSCAN' in m for m in messages)
+        assert 'find_one {"x": "?"}' in messages[0]
+        assert 'find_one {"y": {"$gte": "?"}}' in messages[2]
+
+        query = caplog.records[0].slow_query
+        assert (query.method, query.command, query.plan.docs_examined) == ('get', 'find_one', 2)
+
+
+def test_fast_calls_are_not_logged(caplog: pytest.LogCaptureFixture) -> None:
+    with in_collection(SimpleEntity) as cl:
+        @repository(
+            config=RepositoryConfig(
+                entity_type=SimpleEntity, collection=cl, slow_query_log=SlowQueryLog(threshold=60),
+            ),
+        )
+        class Repository:
+            ...
+
+        with caplog.at_level(logging.WARNING, logger='mongorepo.slow_queries'):
+            Repository().get(x='1')
+
+        assert not caplog.records
+
+
+def test_failed_calls_are_logged_without_error_messages(caplog: pytest.LogCaptureFixture) -> None:
+    with in_collection(SimpleEntity) as cl:
+        cl.create_index('x', unique=True)
+
+        @repository(
+            config=RepositoryConfig(
+                entity_type=SimpleEntity, collection=cl, slow_query_log=SlowQueryLog(threshold=0),
+            ),
+        )
+        class Repository:
+            ...
+
+        repo = Repository()
+        repo.add(SimpleEntity(x='secret', y=1))
+        caplog.clear()
+        with caplog.at_level(logging.WARNING, logger='mongorepo.slow_queries'):
+            with pytest.raises(DuplicateKeyError):
+                repo.add(SimpleEntity(x='secret', y=2))
+
+        message = caplog.records[0].getMessage()
+        assert 'failed with DuplicateKeyError (code 11000)' in message
+        assert 'secret' not in message
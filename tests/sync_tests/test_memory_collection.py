@@ -0,0 +1,178 @@
+# mypy: disable-error-code="attr-defined"
+import datetime
+import uuid
+
+import pymongo
+import pytest
+from bson import Decimal128, ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+
+from mongorepo import (
+    Index,
+    RepositoryConfig,
+    ensure_indexes,
+    index_drift,
+    provide_collection,
+    repository,
+)
+from mongorepo.memory import MemoryCollection
+from tests.common import Box, MixedEntity, NestedListEntity, SimpleEntity
+
+
+def test_repository_with_memory_collection() -> None:
+    collection = MemoryCollection('simple')
+
+    @repository(
+        list_fields=['dtos'],
+        config=RepositoryConfig(entity_type=NestedListEntity, collection=collection),
+    )
+    class Repository:
+        ...
+
+    repo = Repository()
+    dtos = [SimpleEntity(x=str(i), y=i) for i in range(5)]
+    repo.add(NestedListEntity(title='first', dtos=dtos))
+    repo.add(NestedListEntity(title='second'))
+
+    assert repo.get(title='first') == NestedListEntity(title='first', dtos=dtos)
+    assert repo.get(title='missing') is None
+    assert [e.title for e in repo.get_list(offset=1, limit=10)] == ['second']
+    # `$slice` projection
+    assert repo.dtos__list(title='first', offset=1, limit=2) == dtos[1:3]
+
+    repo.dtos__append(SimpleEntity(x='5', y=5), title='second')
+    assert repo.get(title='second').dtos == [SimpleEntity(x='5', y=5)]
+    assert repo.delete(title='first') is True
+    assert len(collection) == 1
+
+    # Entities do not share state with stored documents
+    entity = repo.get(title='second')
+    entity.dtos.clear()
+    assert repo.get(title='second').dtos == [SimpleEntity(x='5', y=5)]
+
+    other = MemoryCollection('other', documents=[{'title': 'loaded', 'dtos': []}])
+    provide_collection(repo, other)
+    assert repo.get(title='loaded') == NestedListEntity(title='loaded')
+
+
+def test_memory_collection_filters_and_updates() -> None:
+    @repository(
+        integer_fields=['year'],
+        delete_many=True,
+        config=RepositoryConfig(entity_type=MixedEntity, collection=MemoryCollection()),
+    )
+    class Repository:
+        ...
+
+    repo = Repository()
+    for i in range(10):
+        repo.add(MixedEntity(
+            id=str(i), name=f'name {i % 3}', year=2000 + i, main_box=Box(id=str(i), value='box'),
+            records=[i],
+        ))
+
+    assert [e.id for e in repo.get_all(year__gte=2007)] == ['7', '8', '9']
+    assert [e.id for e in repo.get_all(id__in=['1', '3'], name='name 0')] == ['3']
+    assert repo.get(records=4).id == '4'
+    assert repo.get(main_box__id='5').id == '5'
+    repo.incr__year(id='1')
+    assert repo.get(id='1').year == 2002
+
+    entity = repo.get(id='2')
+    entity.name = 'renamed'
+    entity.year = 1999
+    repo.update(entity, id='2')
+    assert repo.get(id='2').year == 1999
+    assert repo.delete_many(name='name 0') == 4
+
+
+def test_memory_collection_indexes() -> None:
+    collection = MemoryCollection()
+
+    @repository(
+        config=RepositoryConfig(
+            entity_type=SimpleEntity,
+            collection=collection,
+            indexes=[Index('x', unique=True), Index('x', ('y', pymongo.DESCENDING), name='x_y')],
+        ),
+    )
+    class Repository:
+        ...
+
+    repo = Repository()
+    repo.add(SimpleEntity(x='1', y=1))
+    repo.add(SimpleEntity(x='2', y=2))
+
+    assert ensure_indexes(repo) == ['x_1', 'x_y']
+    assert index_drift(repo).in_sync
+    assert collection.index_information()['x_1'] == {'key': [('x', 1)], 'unique': True}
+
+    with pytest.raises(DuplicateKeyError):
+        repo.add(SimpleEntity(x='1', y=3))
+    # Updates that violate unique index are rolled back
+    with pytest.raises(DuplicateKeyError):
+        repo.update(SimpleEntity(x='1', y=2), x='2')
+    assert repo.get(x='2') == SimpleEntity(x='2', y=2)
+
+    # Index is kept in sync with updated and deleted documents
+    repo.update(SimpleEntity(x='3', y=3), x='2')
+    assert repo.get(x='2') is None
+    assert repo.get(x='3') == SimpleEntity(x='3', y=3)
+    assert [e.x for e in repo.get_all(x__in=['3', '1'])] == ['1', '3']
+    repo.delete(x='1')
+    repo.add(SimpleEntity(x='1', y=4))
+    assert repo.get(x='1', y=4) == SimpleEntity(x='1', y=4)
+
+
+def test_memory_collection_sorts_in_bson_order() -> None:
+    start = datetime.datetime(2024, 1, 1)
+    collection = MemoryCollection(documents=[
+        {'i': i, 'at': start + datetime.timedelta(days=i)} for i in range(12)
+    ])
+    assert [d['i'] for d in collection.find({}, sort=[('at', 1)])] == list(range(12))
+    assert [d['i'] for d in collection.find({'at': {'$gte': start}}, sort=[('at', -1)])][:2] == [
+        11, 10,
+    ]
+
+    collection = MemoryCollection(documents=[
+        {'v': True}, {'v': Decimal128('2.5')}, {'v': 'a'}, {'v': 3}, {'v': None},
+        {'v': ObjectId()}, {'v': uuid.UUID(int=1)}, {'v': start},
+    ])
+    assert [type(d['v']) for d in collection.find({}, sort=[('v', 1)])] == [
+        type(None), Decimal128, int, str, uuid.UUID, ObjectId, bool, datetime.datetime,
+    ]
+    # Comparison operators do not match values of other types
+    assert [d['v'] for d in collection.find({'v': {'$gte': 1}}, sort=[('v', 1)])] == [
+        Decimal128('2.5'), 3,
+    ]
+
+
+def test_memory_collection_does_not_treat_booleans_as_numbers() -> None:
+    collection = MemoryCollection()
+    collection.create_index('a', unique=True)
+    collection.insert_one({'_id': 'one', 'a': 1})
+    collection.insert_one({'_id': 'true', 'a': True})
+
+    assert collection.find_one({'a': True})['_id'] == 'true'
+    assert collection.find_one({'a': 1.0})['_id'] == 'one'
+    assert [d['_id'] for d in collection.find({'a': {'$in': [True, 2]}})] == ['true']
+    with pytest.raises(DuplicateKeyError):
+        collection.insert_one({'a': 1.0})
+
+
+def test_memory_collection_rejects_unsupported_operators_like_server() -> None:
+    collection = MemoryCollection(documents=[{'_id': 1, 'a': 'text', 'n': Decimal128('1.5')}])
+
+    with pytest.raises(OperationFailure):
+        collection.find_one({'a': {'$where': 'true'}})
+    with pytest.raises(OperationFailure):
+        collection.update_one({'_id': 1}, {'$rename': {'a': 'b'}})
+    with pytest.raises(OperationFailure):
+        collection.update_one({'_id': 1}, {'$inc': {'a': 1}})
+    with pytest.raises(BulkWriteError) as exc_info:
+        collection.bulk_write([UpdateOne({'_id': 1}, {'$push': {'a': 1}})])
+    assert exc_info.value.details['writeErrors'][0]['code'] == 2
+
+    collection.update_one({'_id': 1}, {'$inc': {'n': 1}})
+    assert collection.find_one({'_id': 1})['n'] == Decimal128('2.5')
@@ -93,3 +93,31 @@ dct = {
 user = convert(dct, User)
 
 assert user.friends[1].friends[0].id == 4
+
+
+def test_converter_does_not_resolve_type_hints_for_each_document(monkeypatch) -> None:
+    @dataclass
+    class Item:
+        sku: str
+
+    @dataclass
+    class Order:
+        id: str
+        item: Item
+        items: list[Item] = field(default_factory=list)
+
+    to_entity = get_converter(Order, id_field='id')
+    # Types of entity fields are converted without `id_field`, their plans are compiled lazily
+    assert to_entity({'sku': 'd'}, Item) == Item('d')
+
+    def fail(*args, **kwargs):
+        raise AssertionError('type hints must be resolved once, when converter is created')
+
+    monkeypatch.setattr('mongorepo.utils.type_hints.get_type_hints', fail)
+
+    for i in range(3):
+        order = to_entity(
+            {'_id': i, 'item': {'sku': 'a'}, 'items': [{'sku': 'b'}, {'sku': 'c'}]}, Order,
+        )
+        assert order == Order(id=str(i), item=Item('a'), items=[Item('b'), Item('c')])
+        assert to_entity({'sku': 'd'}, Item) == Item('d')
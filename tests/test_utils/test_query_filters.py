@@ -0,0 +1,56 @@
+from dataclasses import dataclass, field
+
+import pytest
+
+from mongorepo.exceptions import InvalidFilterException
+from mongorepo.utils.query_filters import FilterCompiler
+from tests.common import MixedEntity
+
+
+@dataclass
+class Price:
+    price__in: str
+    price: int = 0
+    tags: list[str] = field(default_factory=list)
+
+
+def test_compiles_operators_and_nested_paths() -> None:
+    compiler = FilterCompiler(MixedEntity)
+
+    assert compiler.compile({
+        'year__gte': 2000,
+        'year__lt': 2010,
+        'main_box__value': 'box',
+        'boxs__id__in': ('1', '2'),
+        'name__exists': True,
+    }) == {
+        'year': {'$gte': 2000, '$lt': 2010},
+        'main_box.value': 'box',
+        'boxs.id': {'$in': ['1', '2']},
+        'name': {'$exists': True},
+    }
+    assert compiler.compile({'year': 2000, 'year__ne': 2001}) == {
+        'year': {'$eq': 2000, '$ne': 2001},
+    }
+
+
+def test_equality_filters_are_returned_as_they_are() -> None:
+    compiler = FilterCompiler(MixedEntity)
+    filters = {'id': '1', 'year': 2000}
+
+    assert compiler.compile(filters) is filters
+    assert compiler.compile({'_id__in': [1]}) == {'_id': {'$in': [1]}}
+
+
+def test_existing_field_names_take_precedence() -> None:
+    compiler = FilterCompiler(Price)
+
+    assert compiler.compile({'price__in': 'usd', 'price__gt': 1}) == {
+        'price__in': 'usd', 'price': {'$gt': 1},
+    }
+
+
+@pytest.mark.parametrize('key', ['age__gt', 'main_box__weight', 'year__value', 'main_box____id'])
+def test_invalid_filters_are_rejected(key: str) -> None:
+    with pytest.raises(InvalidFilterException):
+        FilterCompiler(MixedEntity).compile({key: 1})
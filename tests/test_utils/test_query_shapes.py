@@ -0,0 +1,57 @@
+from mongorepo.types import CommandEvent
+from mongorepo.utils.query_shapes import (
+    get_command_filter,
+    get_explain_command,
+    redact_filter,
+    summarize_plan,
+)
+
+
+def test_redact_filter_keeps_fields_and_operators() -> None:
+    assert redact_filter({
+        'name': 'admin',
+        'age': {'$gte': 18, '$lt': 65},
+        'address': {'city': 'Paris'},
+        'tags': {'$in': ['a', 'b']},
+        '$or': [{'email': 'a@b.c'}, {'phone': {'$exists': True}}],
+        'items': {'$elemMatch': {'price': {'$gt': 10}}},
+    }) == {
+        'name': '?',
+        'age': {'$gte': '?', '$lt': '?'},
+        'address': '?',
+        'tags': {'$in': '?'},
+        '$or': [{'email': '?'}, {'phone': {'$exists': '?'}}],
+        'items': {'$elemMatch': {'price': {'$gt': '?'}}},
+    }
+
+
+def test_explain_commands_of_collection_commands() -> None:
+    update = CommandEvent('update_one', ({'x': '1'}, {'$set': {'y': 1}}), {}, 0.0)
+    assert get_explain_command(update, 'users') == {
+        'explain': {
+            'update': 'users',
+            'updates': [{'q': {'x': '1'}, 'u': {'$set': {'y': 1}}, 'multi': False}],
+        },
+        'verbosity': 'executionStats',
+    }
+
+    find = CommandEvent('find', (), {'filter': {'x': '1'}, 'sort': [('y', -1)]}, 0.0)
+    assert get_command_filter(find) == {'x': '1'}
+    assert get_explain_command(find, 'users')['explain'] == {  # type: ignore[index]
+        'find': 'users', 'filter': {'x': '1'}, 'sort': {'y': -1},
+    }
+    assert get_explain_command(CommandEvent('insert_one', ({},), {}, 0.0), 'users') is None
+
+
+def test_summarize_plan() -> None:
+    plan = summarize_plan({
+        'queryPlanner': {'winningPlan': {'queryPlan': {
+            'stage': 'FETCH', 'inputStage': {'stage': 'IXSCAN', 'indexName': 'x_1'},
+        }}},
+        'executionStats': {'totalDocsExamined': 1, 'totalKeysExamined': 1, 'nReturned': 1},
+    })
+
+    assert plan.stages == ('FETCH', 'IXSCAN')
+    assert plan.index_names == ('x_1',)
+    assert not plan.collscan
+    assert plan.docs_examined == 1